@@ -1,21 +1,26 @@
 """AI components for speech and language processing."""
 
-from phone_agent.ai.stt import SpeechToText, TranscriptionResult, SUPPORTED_LANGUAGES
-from phone_agent.ai.llm import LanguageModel
-from phone_agent.ai.tts import TextToSpeech
-from phone_agent.ai.language_detector import (
-    LanguageDetector,
-    LanguageDetectionResult,
-    detect_language_from_greeting,
-)
 from phone_agent.ai.dialect_detector import (
-    GermanDialectDetector,
+    DIALECT_MODELS,
     DialectResult,
+    GermanDialectDetector,
     detect_german_dialect,
     get_model_for_dialect,
-    DIALECT_MODELS,
 )
-from phone_agent.ai.stt_router import DialectAwareSTT
+from phone_agent.ai.language_detector import (
+    LanguageDetectionResult,
+    LanguageDetector,
+    detect_language_from_greeting,
+)
+from phone_agent.ai.llm import LanguageModel
+from phone_agent.ai.scheduler import (
+    InferencePriority,
+    InferenceScheduler,
+    SchedulerConfig,
+    get_inference_scheduler,
+    peek_inference_scheduler,
+    reset_inference_scheduler,
+)
 from phone_agent.ai.status import (
     AIModelRegistry,
     ModelInfo,
@@ -23,21 +28,64 @@ from phone_agent.ai.status import (
     get_model_registry,
     reset_registry,
 )
+from phone_agent.ai.streaming import iterate_in_thread
+from phone_agent.ai.stt import (
+    SUPPORTED_LANGUAGES,
+    SpeechToText,
+    StreamingConfig,
+    StreamingHypothesis,
+    STTStream,
+    TranscribedWord,
+    TranscriptionResult,
+)
+from phone_agent.ai.stt_router import DialectAwareSTT
+from phone_agent.ai.tts import TextToSpeech, pcm_to_wav
+from phone_agent.ai.tts_cache import (
+    TTSCache,
+    TTSCacheConfig,
+    create_tts_cache,
+    normalize_text,
+)
 from phone_agent.ai.vad import (
     BaseVAD,
-    SimpleVAD,
+    EndpointerConfig,
     SileroVAD,
-    VADSegment,
-    VADFrame,
+    SimpleVAD,
+    SpeechEndpointer,
     VADFactory,
+    VADFrame,
+    VADSegment,
     get_vad,
 )
+from phone_agent.ai.vad_service import (
+    OnnxSileroBackend,
+    VADBackend,
+    VADService,
+    VADServiceConfig,
+    VADStream,
+    get_vad_service,
+    peek_vad_service,
+    reset_vad_service,
+)
+from phone_agent.ai.warmup import ModelWarmPool, WarmupResult
 
 __all__ = [
+    # Inference Scheduling
+    "InferencePriority",
+    "InferenceScheduler",
+    "SchedulerConfig",
+    "get_inference_scheduler",
+    "peek_inference_scheduler",
+    "reset_inference_scheduler",
+    "iterate_in_thread",
     # STT
     "SpeechToText",
     "TranscriptionResult",
     "SUPPORTED_LANGUAGES",
+    "STTStream",
+    "StreamingConfig",
+    "StreamingHypothesis",
+    "TranscribedWord",
     # Dialect-Aware STT
     "DialectAwareSTT",
     "GermanDialectDetector",
@@ -49,6 +97,11 @@ __all__ = [
     "LanguageModel",
     # TTS
     "TextToSpeech",
+    "pcm_to_wav",
+    "TTSCache",
+    "TTSCacheConfig",
+    "create_tts_cache",
+    "normalize_text",
     # Language Detection
     "LanguageDetector",
     "LanguageDetectionResult",
@@ -59,6 +112,8 @@ __all__ = [
     "ModelStatus",
     "get_model_registry",
     "reset_registry",
+    "ModelWarmPool",
+    "WarmupResult",
     # Voice Activity Detection
     "BaseVAD",
     "SimpleVAD",
@@ -67,4 +122,14 @@ __all__ = [
     "VADFrame",
     "VADFactory",
     "get_vad",
+    "EndpointerConfig",
+    "SpeechEndpointer",
+    "VADBackend",
+    "OnnxSileroBackend",
+    "VADService",
+    "VADServiceConfig",
+    "VADStream",
+    "get_vad_service",
+    "peek_vad_service",
+    "reset_vad_service",
 ]
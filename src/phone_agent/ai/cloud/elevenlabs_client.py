@@ -9,12 +9,18 @@ from __future__ import annotations
 import asyncio
 import io
 import wave
+from collections.abc import AsyncIterator, Iterator
 from functools import partial
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 from itf_shared import get_logger
 
+from phone_agent.ai.streaming import iterate_in_thread
+
+if TYPE_CHECKING:
+    from phone_agent.ai.tts_cache import TTSCache
+
 log = get_logger(__name__)
 
 
@@ -49,6 +55,7 @@ class ElevenLabsTTS:
         voice_id: str = DEFAULT_VOICE_ID,
         model: str = "eleven_flash_v2_5",
         sample_rate: int = 22050,
+        cache: TTSCache | None = None,
     ) -> None:
         """Initialize ElevenLabs TTS client.
 
@@ -57,11 +64,13 @@ class ElevenLabsTTS:
             voice_id: Voice ID to use (see GERMAN_VOICES)
             model: Model name (eleven_flash_v2_5 for speed, eleven_multilingual_v2 for quality)
             sample_rate: Output audio sample rate
+            cache: Phrase audio cache; repeats skip the API call (None disables)
         """
         self.api_key = api_key
         self.voice_id = voice_id
         self.model = model
         self.sample_rate = sample_rate
+        self.cache = cache
 
         # Current language (for interface compatibility)
         self._current_language = "de"
@@ -141,6 +150,83 @@ class ElevenLabsTTS:
         Returns:
             Audio data as bytes
         """
+        if self.cache is None:
+            return self._synthesize(text, output_format, language)
+
+        return self.cache.get_or_synthesize(
+            self._cache_key(text, output_format, language),
+            lambda: self._synthesize(text, output_format, language),
+            text=text,
+        )
+
+    def synthesize_stream(
+        self, text: str, language: str | None = None
+    ) -> Iterator[bytes]:
+        """Synthesize speech as raw PCM chunks while ElevenLabs streams them.
+
+        Requests ElevenLabs' ``pcm_<rate>`` output, so no MP3 decoding is
+        needed. Chunks are mono 16-bit little-endian PCM at ``sample_rate``
+        (ElevenLabs supports 16000, 22050, 24000 and 44100 Hz).
+
+        Args:
+            text: Text to convert to speech
+            language: Language code (ignored, voice auto-detects from text)
+
+        Yields:
+            PCM chunks (int16 bytes)
+        """
+        if self.cache is None:
+            yield from self._stream_pcm(text, language)
+            return
+
+        yield from self.cache.get_or_stream(
+            self._cache_key(text, "raw", language),
+            lambda: self._stream_pcm(text, language),
+            text=text,
+        )
+
+    async def synthesize_stream_async(
+        self,
+        text: str,
+        language: str | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Async variant of synthesize_stream (HTTP reads run in a thread)."""
+        async for chunk in iterate_in_thread(self.synthesize_stream, text, language):
+            yield chunk
+
+    def _cache_key(self, text: str, output_format: str, language: str | None) -> str:
+        return self.cache.make_key(
+            f"elevenlabs:{self.voice_id}:{self.model}:{self.sample_rate}",
+            language or self._current_language,
+            text,
+            output_format,
+        )
+
+    def _stream_pcm(self, text: str, language: str | None) -> Iterator[bytes]:
+        """Stream PCM for one text from the API (no cache)."""
+        if not self._loaded:
+            self.load(language)
+
+        audio_stream = self._client.text_to_speech.convert(
+            voice_id=self.voice_id,
+            text=text,
+            model_id=self.model,
+            output_format=f"pcm_{self.sample_rate}",
+        )
+
+        # HTTP chunks can split a sample; carry the odd byte over
+        pending = b""
+        for chunk in audio_stream:
+            if not chunk:
+                continue
+            data = pending + chunk
+            cut = len(data) - len(data) % 2
+            pending = data[cut:]
+            if cut:
+                yield data[:cut]
+
+    def _synthesize(self, text: str, output_format: str, language: str | None) -> bytes:
+        """Call the ElevenLabs API for one text (no cache)."""
         if not self._loaded:
             self.load(language)
 
@@ -306,4 +392,5 @@ class ElevenLabsTTS:
             "current_language": self._current_language,
             "sample_rate": self.sample_rate,
             "loaded": self._loaded,
+            "phrase_cache": self.cache.statistics if self.cache else None,
         }
@@ -20,6 +20,7 @@ Usage:
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Protocol, runtime_checkable
@@ -55,6 +56,9 @@ class CloudAIConfig:
     elevenlabs_voice_id: str = "pNInz6obpgDQGcFmaJgB"  # Adam
     elevenlabs_model: str = "eleven_flash_v2_5"
 
+    # Phrase audio cache in front of either TTS (0 disables)
+    tts_phrase_cache_mb: int = 64
+
     # Fallback settings
     fallback_to_local: bool = True
 
@@ -127,6 +131,9 @@ class TTSProtocol(Protocol):
     ) -> bytes:
         ...
 
+    def synthesize_stream(self, text: str) -> Iterator[bytes]:
+        ...
+
     def load(self) -> None:
         ...
 
@@ -256,6 +263,14 @@ class AIFactory:
             and not force_local
         )
 
+        cache = None
+        if self.config.tts_phrase_cache_mb > 0:
+            from phone_agent.ai.tts_cache import TTSCache, TTSCacheConfig
+
+            cache = TTSCache(TTSCacheConfig(
+                memory_bytes=self.config.tts_phrase_cache_mb * 1024 * 1024,
+            ))
+
         if use_cloud:
             try:
                 from phone_agent.ai.cloud.elevenlabs_client import ElevenLabsTTS
@@ -269,6 +284,7 @@ class AIFactory:
                     api_key=self.config.elevenlabs_api_key,
                     voice_id=self.config.elevenlabs_voice_id,
                     model=self.config.elevenlabs_model,
+                    cache=cache,
                 )
                 return self._tts
             except Exception as e:
@@ -280,7 +296,7 @@ class AIFactory:
         from phone_agent.ai.tts import TextToSpeech
 
         log.info("Creating local TTS (Piper)")
-        self._tts = TextToSpeech()
+        self._tts = TextToSpeech(cache=cache)
         return self._tts
 
     def create_all(
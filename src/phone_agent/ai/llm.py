@@ -2,18 +2,195 @@
 
 Runs Llama 3.2 locally on Raspberry Pi 5 for German conversation.
 Supports CPU inference and optional NPU acceleration.
+
+Prompt evaluation of the long industry system prompts dominates
+time-to-first-token on CPU. Evaluated model state is therefore cached
+by token prefix: a new turn restores the state of its conversation's
+previous turn (or of the primed system prompt) and only evaluates the
+tokens appended since.
 """
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Generator, Sequence
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Generator
+from typing import Any
 
 from itf_shared import get_logger
 
 log = get_logger(__name__)
 
 
+@dataclass
+class PromptCacheStatistics:
+    """Prefix reuse counters of a prompt state cache."""
+
+    lookups: int = 0
+    hits: int = 0  # Loaded states reaching past the prefix shared with other entries
+    prompt_tokens: int = 0  # Tokens in looked-up prompts
+    reused_tokens: int = 0  # Prompt tokens restored beyond the model's own context
+    saves: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that restored a conversation's own state."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Fraction of prompt tokens whose evaluation was saved."""
+        return self.reused_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": round(self.hit_rate, 3),
+            "prompt_tokens": self.prompt_tokens,
+            "reused_tokens": self.reused_tokens,
+            "reuse_ratio": round(self.reuse_ratio, 3),
+            "saves": self.saves,
+            "evictions": self.evictions,
+        }
+
+
+class PromptStateCache:
+    """LRU of saved llama.cpp states keyed by token sequence, bounded by bytes.
+
+    Implements the cache protocol of ``llama_cpp.Llama.set_cache``: the
+    model looks up the entry sharing the longest token prefix with a new
+    prompt, restores it when that beats its current context, and stores
+    its state after each completion.
+
+    A conversation's new state supersedes its previous turn (whose key is
+    a prefix of the new one), so each active conversation holds one
+    entry. Pinned entries, such as primed system prompts, are never
+    evicted.
+
+    A lookup only counts as a hit when llama.cpp will load the state
+    (its prefix beats the tokens already in the model's context, read
+    through ``context_tokens``) and the state reaches past the prefix
+    the prompt shares with every other entry, i.e. the common system
+    prompt and chat template header.
+    """
+
+    def __init__(self, capacity_bytes: int = 256 * 1024 * 1024) -> None:
+        """Initialize prompt state cache.
+
+        Args:
+            capacity_bytes: Memory budget for saved states
+        """
+        self.capacity_bytes = capacity_bytes
+        self._entries: OrderedDict[tuple[int, ...], Any] = OrderedDict()
+        self._pinned: set[tuple[int, ...]] = set()
+        self._lock = threading.Lock()
+        self.last_key: tuple[int, ...] | None = None
+        self.stats = PromptCacheStatistics()
+        # Tokens evaluated in the model's context (None: assume empty)
+        self.context_tokens: Callable[[], Sequence[int]] | None = None
+
+    @property
+    def cache_size(self) -> int:
+        """Bytes held by saved states."""
+        return sum(_state_size(state) for state in self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        # llama.cpp checks "if self.cache:"; an empty cache must still be used
+        return True
+
+    def _find_longest_prefix_key(
+        self, key: Sequence[int]
+    ) -> tuple[tuple[int, ...] | None, int, int]:
+        """Entry sharing the longest prefix, its length and the runner-up's."""
+        best_key, best_len, shared_len = None, 0, 0
+        for candidate in self._entries:
+            length = _common_prefix_length(candidate, key)
+            if length > best_len:
+                best_key, best_len, shared_len = candidate, length, best_len
+            elif length > shared_len:
+                shared_len = length
+        return best_key, best_len, shared_len
+
+    def __getitem__(self, key: Sequence[int]) -> Any:
+        with self._lock:
+            best_key, length, shared = self._find_longest_prefix_key(key)
+            self.stats.lookups += 1
+            self.stats.prompt_tokens += len(key)
+            if best_key is None:
+                raise KeyError("No cached prefix")
+
+            # llama.cpp keeps its context unless the state beats it
+            evaluated = 0
+            if self.context_tokens is not None:
+                evaluated = _common_prefix_length(self.context_tokens(), key)
+            if length > evaluated:
+                self.stats.reused_tokens += length - evaluated
+                if length > shared:
+                    self.stats.hits += 1
+            self._entries.move_to_end(best_key)
+            return self._entries[best_key]
+
+    def __contains__(self, key: Sequence[int]) -> bool:
+        with self._lock:
+            return self._find_longest_prefix_key(key)[0] is not None
+
+    def __setitem__(self, key: Sequence[int], state: Any) -> None:
+        key = tuple(key)
+        with self._lock:
+            # Earlier turns of this conversation are prefixes of the new key
+            for old in [k for k in self._entries if k != key and key[:len(k)] == k]:
+                if old not in self._pinned:
+                    del self._entries[old]
+
+            self._entries[key] = state
+            self._entries.move_to_end(key)
+            self.last_key = key
+            self.stats.saves += 1
+
+            size = self.cache_size
+            for old in list(self._entries):
+                if size <= self.capacity_bytes:
+                    break
+                if old in self._pinned or old == key:
+                    continue
+                size -= _state_size(self._entries.pop(old))
+                self.stats.evictions += 1
+
+    def pin(self, key: Sequence[int]) -> None:
+        """Exempt an entry from eviction and supersession."""
+        with self._lock:
+            self._pinned.add(tuple(key))
+
+    def clear(self) -> None:
+        """Drop all saved states."""
+        with self._lock:
+            self._entries.clear()
+            self._pinned.clear()
+            self.last_key = None
+
+
+def _common_prefix_length(a: Sequence[int], b: Sequence[int]) -> int:
+    length = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        length += 1
+    return length
+
+
+def _state_size(state: Any) -> int:
+    """Memory held by a saved llama.cpp state."""
+    return getattr(state, "llama_state_size", 0)
+
+
 class LanguageModel:
     """Language Model engine using llama-cpp-python.
 
@@ -29,6 +206,7 @@ class LanguageModel:
         n_gpu_layers: int = 0,
         temperature: float = 0.7,
         max_tokens: int = 256,
+        prompt_cache_bytes: int = 256 * 1024 * 1024,
     ) -> None:
         """Initialize LLM engine.
 
@@ -40,6 +218,7 @@ class LanguageModel:
             n_gpu_layers: Layers to offload to GPU/NPU (0 = CPU only)
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            prompt_cache_bytes: Memory for cached prompt states (0 disables)
         """
         self.model_name = model
         self.model_path = Path(model_path)
@@ -51,6 +230,9 @@ class LanguageModel:
 
         self._llm: Any = None
         self._loaded = False
+        self.prompt_cache = (
+            PromptStateCache(prompt_cache_bytes) if prompt_cache_bytes > 0 else None
+        )
 
     def load(self) -> None:
         """Load the language model.
@@ -82,6 +264,9 @@ class LanguageModel:
                 n_gpu_layers=self.n_gpu_layers,
                 verbose=False,
             )
+            if self.prompt_cache is not None:
+                self._llm.set_cache(self.prompt_cache)
+                self.prompt_cache.context_tokens = lambda: self._llm._input_ids
             self._loaded = True
 
             log.info("LLM model loaded successfully")
@@ -303,8 +488,46 @@ class LanguageModel:
             if content := delta.get("content"):
                 yield content
 
+    def prime_prompt(self, system_prompt: str) -> None:
+        """Evaluate a system prompt once and keep its state.
+
+        New conversations with this system prompt then start from the
+        saved state instead of re-evaluating it.
+
+        Args:
+            system_prompt: System prompt shared by conversations
+        """
+        if self.prompt_cache is None:
+            return
+        if not self._loaded:
+            self.load()
+
+        self._llm.create_chat_completion(
+            messages=[{"role": "system", "content": system_prompt}],
+            max_tokens=1,
+        )
+        if self.prompt_cache.last_key is not None:
+            self.prompt_cache.pin(self.prompt_cache.last_key)
+            log.info("System prompt primed", tokens=len(self.prompt_cache.last_key))
+
+    @property
+    def cache_statistics(self) -> dict[str, Any]:
+        """Prefix hit rate and prompt-eval tokens saved."""
+        if self.prompt_cache is None:
+            return {"enabled": False}
+        return {
+            "enabled": True,
+            "entries": len(self.prompt_cache),
+            "bytes": self.prompt_cache.cache_size,
+            "capacity_bytes": self.prompt_cache.capacity_bytes,
+            **self.prompt_cache.stats.to_dict(),
+        }
+
     def unload(self) -> None:
         """Unload the model to free memory."""
+        if self.prompt_cache is not None:
+            # Saved states belong to this model instance
+            self.prompt_cache.clear()
         if self._llm is not None:
             del self._llm
             self._llm = None
@@ -0,0 +1,438 @@
+"""Shared inference scheduler for CPU-bound model calls.
+
+Every concurrent call used to hand its transcription straight to the
+default thread pool, so N calls meant N simultaneous Whisper decodes
+fighting for the same cores and all finishing late. The scheduler puts
+a bounded worker pool sized to the cores in front of the models:
+
+- Live call audio is served before batch/offline work
+- Short requests for the same backend can be micro-batched when the
+  backend can decode several inputs in one pass
+- Queue wait is measured so saturation is visible before callers notice
+
+Usage:
+    scheduler = get_inference_scheduler()
+    text = await scheduler.submit(stt.transcribe, audio, kind="stt")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from enum import IntEnum
+from functools import partial
+from typing import Any
+
+from itf_shared import get_logger
+
+log = get_logger(__name__)
+
+
+class InferencePriority(IntEnum):
+    """Request priority (lower value is served first)."""
+
+    LIVE = 0  # Caller waiting on the line
+    INTERACTIVE = 10  # User-facing but not real-time (demos, API)
+    BATCH = 20  # Offline work (voicemail, backfills, evaluations)
+
+
+@dataclass
+class SchedulerConfig:
+    """Inference scheduler configuration."""
+
+    # Worker threads; None sizes the pool to cores / threads_per_worker
+    max_workers: int | None = None
+    # Threads one model call uses internally (CTranslate2 defaults to 4)
+    threads_per_worker: int = 4
+    # Largest micro-batch handed to a batching backend
+    max_batch_size: int = 8
+    # Wait samples kept per priority for percentiles
+    wait_samples: int = 1000
+
+    def resolve_workers(self) -> int:
+        """Number of worker threads to start."""
+        if self.max_workers is not None:
+            return max(1, self.max_workers)
+        cores = os.cpu_count() or 1
+        return max(1, cores // max(1, self.threads_per_worker))
+
+
+@dataclass
+class SchedulerStatistics:
+    """Counters and queue-wait samples of a scheduler."""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    batches: int = 0
+    batched_requests: int = 0
+    queue_wait_ms: dict[str, deque[float]] = field(default_factory=dict)
+
+    def record_wait(
+        self, priority: InferencePriority, wait_ms: float, limit: int
+    ) -> None:
+        """Record how long a request waited for a worker."""
+        samples = self.queue_wait_ms.get(priority.name)
+        if samples is None:
+            samples = self.queue_wait_ms[priority.name] = deque(maxlen=limit)
+        samples.append(wait_ms)
+
+    def copy(self) -> SchedulerStatistics:
+        """Copy of the counters and wait samples."""
+        return replace(
+            self,
+            queue_wait_ms={
+                name: deque(samples) for name, samples in self.queue_wait_ms.items()
+            },
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarize counters and wait percentiles per priority."""
+        waits = {}
+        for name, samples in self.queue_wait_ms.items():
+            ordered = sorted(samples)
+            p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+            waits[name] = {
+                "count": len(ordered),
+                "mean_ms": round(sum(ordered) / len(ordered), 2),
+                "p95_ms": round(p95, 2),
+                "max_ms": round(ordered[-1], 2),
+            }
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "batches": self.batches,
+            "batched_requests": self.batched_requests,
+            "queue_wait": waits,
+        }
+
+
+@dataclass
+class _Request:
+    """One queued unit of work."""
+
+    priority: InferencePriority
+    kind: str
+    future: asyncio.Future[Any]
+    loop: asyncio.AbstractEventLoop
+    enqueued_at: float
+    call: Callable[[], Any] | None = None
+    batch_key: Hashable | None = None
+    batch_fn: Callable[[list[Any]], list[Any]] | None = None
+    item: Any = None
+    cancelled: bool = False
+    trace: Any = None  # Caller's turn trace, if any
+    parent_span: str | None = None
+
+
+class InferenceScheduler:
+    """Bounded, prioritized worker pool for model inference.
+
+    Requests run on at most ``max_workers`` threads. When every worker is
+    busy, requests queue by priority and then arrival order. Batchable
+    requests sharing a key are collected from the queue when a worker
+    frees up, so batches form only under load and an idle system adds no
+    batching delay.
+    """
+
+    def __init__(self, config: SchedulerConfig | None = None) -> None:
+        """Initialize inference scheduler.
+
+        Args:
+            config: Scheduler configuration
+        """
+        self.config = config or SchedulerConfig()
+        self.max_workers = self.config.resolve_workers()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="inference",
+        )
+        self._queue: list[tuple[int, int, _Request]] = []
+        self._sequence = itertools.count()
+        self._busy = 0
+        self._lock = threading.Lock()
+        self._stats = SchedulerStatistics()
+
+        log.info("Inference scheduler started", workers=self.max_workers)
+
+    async def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        priority: InferencePriority = InferencePriority.LIVE,
+        kind: str = "inference",
+        **kwargs: Any,
+    ) -> Any:
+        """Run a blocking model call on the worker pool.
+
+        Args:
+            fn: Blocking function to run
+            *args: Positional arguments for fn
+            priority: Queue priority
+            kind: Component name for metrics (stt, llm, tts, ...)
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Result of fn
+        """
+        request = self._new_request(priority, kind)
+        request.call = partial(fn, *args, **kwargs)
+        return await self._enqueue(request)
+
+    async def submit_batchable(
+        self,
+        batch_fn: Callable[[list[Any]], list[Any]],
+        item: Any,
+        batch_key: Hashable,
+        priority: InferencePriority = InferencePriority.LIVE,
+        kind: str = "inference",
+    ) -> Any:
+        """Run a request that may share a backend call with others.
+
+        Args:
+            batch_fn: Maps a list of items to a list of results, in order
+            item: This request's input
+            batch_key: Requests with equal keys may be batched together
+            priority: Queue priority
+            kind: Component name for metrics
+
+        Returns:
+            This item's result
+        """
+        request = self._new_request(priority, kind)
+        request.batch_fn = batch_fn
+        request.batch_key = batch_key
+        request.item = item
+        return await self._enqueue(request)
+
+    def _new_request(self, priority: InferencePriority, kind: str) -> _Request:
+        from phone_agent.core.tracing import current_span_id, current_trace
+
+        loop = asyncio.get_running_loop()
+        return _Request(
+            priority=priority,
+            kind=kind,
+            future=loop.create_future(),
+            loop=loop,
+            enqueued_at=time.perf_counter(),
+            trace=current_trace(),
+            parent_span=current_span_id(),
+        )
+
+    async def _enqueue(self, request: _Request) -> Any:
+        with self._lock:
+            heapq.heappush(
+                self._queue, (request.priority, next(self._sequence), request)
+            )
+            self._stats.submitted += 1
+        self._dispatch()
+
+        try:
+            return await request.future
+        except asyncio.CancelledError:
+            # Still queued: drop it. Already running: the result is discarded.
+            request.cancelled = True
+            with self._lock:
+                self._stats.cancelled += 1
+            raise
+
+    def _dispatch(self) -> None:
+        """Start queued work while workers are free."""
+        while True:
+            with self._lock:
+                if self._busy >= self.max_workers:
+                    return
+                batch = self._take_batch()
+                if not batch:
+                    return
+                self._busy += 1
+
+            now = time.perf_counter()
+            for request in batch:
+                self._record_wait(request, (now - request.enqueued_at) * 1000)
+
+            work = self._executor.submit(self._run, batch)
+            work.add_done_callback(lambda _: self._on_worker_free())
+
+    def _take_batch(self) -> list[_Request]:
+        """Pop the next request plus batchable companions (lock held)."""
+        while self._queue:
+            _, _, head = heapq.heappop(self._queue)
+            if not head.cancelled:
+                break
+        else:
+            return []
+
+        if head.batch_key is None:
+            return [head]
+
+        batch = [head]
+        remaining = []
+        for entry in sorted(self._queue):
+            request = entry[2]
+            if request.cancelled:
+                continue
+            if (
+                request.batch_key == head.batch_key
+                and len(batch) < self.config.max_batch_size
+            ):
+                batch.append(request)
+            else:
+                remaining.append(entry)
+        if len(batch) > 1:
+            self._queue = remaining
+            heapq.heapify(self._queue)
+            self._stats.batches += 1
+            self._stats.batched_requests += len(batch)
+        return batch
+
+    def _record_wait(self, request: _Request, wait_ms: float) -> None:
+        with self._lock:
+            self._stats.record_wait(request.priority, wait_ms, self.config.wait_samples)
+
+        from phone_agent.core.metrics import get_metrics
+
+        get_metrics().record(f"{request.kind}_queue", wait_ms / 1000)
+
+        if request.trace is not None:
+            from phone_agent.core.tracing import now
+
+            end = now()
+            request.trace.add_span(
+                f"{request.kind}.queue_wait",
+                end - wait_ms / 1000,
+                end,
+                parent_id=request.parent_span,
+            )
+
+    def _trace_compute(self, batch: list[_Request], start: float, end: float) -> None:
+        """Record the compute span on each traced request of a batch."""
+        for request in batch:
+            if request.trace is not None:
+                request.trace.add_span(
+                    f"{request.kind}.compute",
+                    start,
+                    end,
+                    parent_id=request.parent_span,
+                    batch_size=len(batch),
+                )
+
+    def _run(self, batch: list[_Request]) -> None:
+        """Worker thread: execute a request or batch and post results."""
+        from phone_agent.core.tracing import now
+
+        head = batch[0]
+        started = now()
+        try:
+            if head.batch_fn is not None:
+                results = head.batch_fn([request.item for request in batch])
+                if len(results) != len(batch):
+                    raise RuntimeError(
+                        f"Batch returned {len(results)} results for {len(batch)} inputs"
+                    )
+            else:
+                results = [head.call()]
+        except Exception as e:
+            self._trace_compute(batch, started, now())
+            for request in batch:
+                self._resolve(request, error=e)
+            return
+
+        self._trace_compute(batch, started, now())
+
+        for request, result in zip(batch, results):
+            self._resolve(request, result=result)
+
+    def _resolve(
+        self, request: _Request, result: Any = None, error: Exception | None = None
+    ) -> None:
+        with self._lock:
+            if error is None:
+                self._stats.completed += 1
+            else:
+                self._stats.failed += 1
+
+        def _set() -> None:
+            if request.future.done():
+                return
+            if error is not None:
+                request.future.set_exception(error)
+            else:
+                request.future.set_result(result)
+
+        try:
+            request.loop.call_soon_threadsafe(_set)
+        except RuntimeError:
+            pass  # Caller's event loop already closed
+
+    def _on_worker_free(self) -> None:
+        with self._lock:
+            self._busy -= 1
+        self._dispatch()
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests waiting for a worker."""
+        with self._lock:
+            return sum(1 for _, _, request in self._queue if not request.cancelled)
+
+    @property
+    def busy_workers(self) -> int:
+        """Workers currently running a request."""
+        return self._busy
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Counters, queue state and wait percentiles."""
+        # Copy under the lock, sort outside it: workers record waits under it
+        with self._lock:
+            stats = self._stats.copy()
+        data = stats.to_dict()
+        data["workers"] = self.max_workers
+        data["busy_workers"] = self.busy_workers
+        data["queue_depth"] = self.queue_depth
+        return data
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+# Global instance
+_scheduler: InferenceScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def get_inference_scheduler() -> InferenceScheduler:
+    """Get the process-wide inference scheduler."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = InferenceScheduler()
+    return _scheduler
+
+
+def peek_inference_scheduler() -> InferenceScheduler | None:
+    """Get the process-wide inference scheduler without creating it."""
+    return _scheduler
+
+
+def reset_inference_scheduler() -> None:
+    """Shut down and discard the global scheduler (for testing)."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is not None:
+            _scheduler.shutdown(wait=False)
+        _scheduler = None
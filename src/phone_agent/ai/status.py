@@ -6,6 +6,8 @@ Used by health checks and monitoring.
 
 from __future__ import annotations
 
+import asyncio
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -22,6 +24,7 @@ class ModelStatus(str, Enum):
 
     NOT_LOADED = "not_loaded"
     LOADING = "loading"
+    WARMING = "warming"  # Loaded, running a dummy inference
     LOADED = "loaded"
     ERROR = "error"
     UNLOADING = "unloading"
@@ -37,6 +40,8 @@ class ModelInfo:
     loaded_at: datetime | None = None
     error_message: str | None = None
     memory_mb: float = 0.0
+    load_seconds: float | None = None  # Startup load time (warm pool)
+    warmup_seconds: float | None = None  # Startup dummy inference time
 
     def to_dict(self) -> dict:
         """Convert to dictionary for API responses."""
@@ -47,6 +52,8 @@ class ModelInfo:
             "loaded_at": self.loaded_at.isoformat() if self.loaded_at else None,
             "error_message": self.error_message,
             "memory_mb": self.memory_mb,
+            "load_seconds": self.load_seconds,
+            "warmup_seconds": self.warmup_seconds,
         }
 
 
@@ -60,6 +67,7 @@ class AIModelRegistry:
     stt: ModelInfo = field(default_factory=lambda: ModelInfo(name="stt"))
     llm: ModelInfo = field(default_factory=lambda: ModelInfo(name="llm"))
     tts: ModelInfo = field(default_factory=lambda: ModelInfo(name="tts"))
+    warmup_enabled: bool = False  # Models are warmed at startup, not on first call
 
     def register_stt(self, stt: SpeechToText) -> None:
         """Register STT model and track its status."""
@@ -97,6 +105,55 @@ class AIModelRegistry:
             if status == ModelStatus.LOADED:
                 model_info.loaded_at = datetime.now(timezone.utc)
 
+    def record_startup(
+        self,
+        model_name: str,
+        load_seconds: float,
+        warmup_seconds: float,
+    ) -> None:
+        """Record how long a model took to load and warm at startup."""
+        model_info = getattr(self, model_name, None)
+        if model_info:
+            model_info.load_seconds = round(load_seconds, 3)
+            model_info.warmup_seconds = round(warmup_seconds, 3)
+
+    @property
+    def readiness(self) -> str:
+        """Readiness of the models for calls.
+
+        Returns:
+            "lazy" - No startup warmup; models load on first use
+            "warming" - Startup warmup still running
+            "ready" - All models loaded and warmed
+            "error" - Warmup finished with failures
+        """
+        if not self.warmup_enabled:
+            return "lazy"
+        models = [self.stt, self.llm, self.tts]
+        if all(m.status == ModelStatus.LOADED for m in models):
+            return "ready"
+        if any(m.status in (ModelStatus.LOADING, ModelStatus.WARMING) for m in models):
+            return "warming"
+        if any(m.status == ModelStatus.ERROR for m in models):
+            return "error"
+        return "warming"
+
+    async def wait_until_ready(self, timeout: float, poll_interval: float = 0.1) -> str:
+        """Wait while startup warmup is running.
+
+        Args:
+            timeout: Maximum seconds to wait
+            poll_interval: Seconds between checks
+
+        Returns:
+            Readiness when warmup finished or the timeout expired
+        """
+        deadline = time.monotonic() + timeout
+        while self.readiness == "warming" and time.monotonic() < deadline:
+            remaining = max(deadline - time.monotonic(), 0.0)
+            await asyncio.sleep(min(poll_interval, remaining))
+        return self.readiness
+
     def get_overall_status(self) -> str:
         """Get overall AI status for health checks.
 
@@ -125,6 +182,7 @@ class AIModelRegistry:
         """Get detailed status for all models."""
         return {
             "overall": self.get_overall_status(),
+            "readiness": self.readiness,
             "models": {
                 "stt": self.stt.to_dict(),
                 "llm": self.llm.to_dict(),
@@ -0,0 +1,92 @@
+"""Bridge blocking model generators onto the event loop.
+
+Piper, ElevenLabs and llama.cpp all produce output through synchronous
+generators. Iterating one directly inside a coroutine blocks the event
+loop for every item. ``iterate_in_thread`` runs the generator on a worker
+thread and hands items to the loop through a bounded queue, so the loop
+stays responsive and a slow consumer applies backpressure to the model.
+
+Usage:
+    async for chunk in iterate_in_thread(tts.synthesize_stream, "Hallo"):
+        await send(chunk)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+from collections.abc import AsyncIterator, Callable, Iterable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+async def iterate_in_thread(
+    fn: Callable[..., Iterable[T]],
+    *args: Any,
+    max_pending: int = 32,
+    **kwargs: Any,
+) -> AsyncIterator[T]:
+    """Iterate a blocking generator on a worker thread.
+
+    The generator is created and advanced on the thread. Items are queued
+    for the caller; when ``max_pending`` items are waiting the producer
+    blocks until the caller catches up. Closing the async iterator early
+    (e.g. on barge-in) stops the producer after its current item.
+
+    Args:
+        fn: Returns the blocking iterable
+        *args: Positional arguments for fn
+        max_pending: Items buffered between producer and consumer
+        **kwargs: Keyword arguments for fn
+
+    Yields:
+        Items of the iterable, in order
+
+    Raises:
+        Exception: Whatever the generator raised, re-raised in the caller
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[tuple[Any, BaseException | None]] = asyncio.Queue(max_pending)
+    stop = threading.Event()
+
+    def put(item: Any, error: BaseException | None = None) -> bool:
+        """Hand an item to the loop, blocking while the queue is full."""
+        future = asyncio.run_coroutine_threadsafe(queue.put((item, error)), loop)
+        while True:
+            try:
+                future.result(timeout=0.1)
+                return True
+            except concurrent.futures.TimeoutError:
+                if stop.is_set():
+                    future.cancel()
+                    return False
+
+    def produce() -> None:
+        try:
+            for item in fn(*args, **kwargs):
+                if stop.is_set() or not put(item):
+                    return
+        except BaseException as e:  # Delivered to the consumer
+            put(None, e)
+            return
+        put(_DONE)
+
+    producer = loop.run_in_executor(None, produce)
+    try:
+        while True:
+            item, error = await queue.get()
+            if error is not None:
+                raise error
+            if item is _DONE:
+                break
+            yield item
+    finally:
+        stop.set()
+        while not queue.empty():
+            queue.get_nowait()  # Unblock a producer waiting on a full queue
+        if producer.done() and not producer.cancelled():
+            producer.exception()  # Mark retrieved; errors were delivered above
@@ -3,20 +3,28 @@
 Supports multilingual transcription with Whisper Large v3.
 Handles German dialects (Schwäbisch, Bavarian, etc.) by normalizing to Standard German.
 Also supports Turkish, Russian, and 90+ other languages.
+Streaming sessions (open_stream) produce partial transcripts while the
+caller is still speaking.
 
 Optimized for CPU inference on Raspberry Pi 5 and optional NPU acceleration.
 """
 
 from __future__ import annotations
 
-import asyncio
+import threading
+from dataclasses import dataclass
 from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 from itf_shared import get_logger
 
+from .scheduler import InferencePriority, get_inference_scheduler
+
+if TYPE_CHECKING:
+    from .scheduler import InferenceScheduler
+
 log = get_logger(__name__)
 
 
@@ -55,13 +63,60 @@ class TranscriptionResult:
         return self.text
 
 
+@dataclass
+class TranscribedWord:
+    """A word with its time span in seconds."""
+
+    start: float
+    end: float
+    text: str
+
+
+@dataclass
+class StreamingHypothesis:
+    """Transcript state of a streaming session.
+
+    The committed part no longer changes; the tentative part may still
+    be revised by later audio.
+    """
+
+    committed: str
+    tentative: str = ""
+    is_final: bool = False
+    audio_seconds: float = 0.0
+
+    @property
+    def text(self) -> str:
+        """Committed and tentative text joined."""
+        return " ".join(part for part in (self.committed, self.tentative) if part)
+
+
+@dataclass
+class StreamingConfig:
+    """Streaming transcription configuration."""
+
+    sample_rate: int = 16000  # Rate of fed chunks
+    step_seconds: float = 0.5  # New audio needed before re-decoding
+    window_seconds: float = 12.0  # Buffer length that forces a trim
+    prompt_chars: int = 200  # Committed text carried over as decoder prompt
+
+
 class SpeechToText:
     """Speech-to-Text engine using faster-whisper.
 
     Supports multilingual transcription with automatic dialect handling.
     German dialects (Schwäbisch, Bavarian, etc.) are normalized to Standard German.
+
+    Async transcriptions run on the shared inference scheduler so
+    concurrent calls do not oversubscribe the CPU.
     """
 
+    # faster-whisper decodes one utterance per call; backends that can
+    # decode several in one pass set this and override transcribe_batch
+    supports_batching = False
+    # Only utterances up to this length are micro-batched
+    batch_max_seconds = 8.0
+
     def __init__(
         self,
         model: str = "openai/whisper-large-v3",
@@ -71,6 +126,7 @@ class SpeechToText:
         language: str | None = "de",
         beam_size: int = 5,
         vad_filter: bool = True,
+        scheduler: InferenceScheduler | None = None,
     ) -> None:
         """Initialize STT engine.
 
@@ -82,6 +138,7 @@ class SpeechToText:
             language: Target language code (None for auto-detection)
             beam_size: Beam search width
             vad_filter: Enable voice activity detection
+            scheduler: Inference scheduler (default: shared global scheduler)
         """
         self.model_name = model
         self.model_path = Path(model_path)
@@ -90,6 +147,7 @@ class SpeechToText:
         self.language = language
         self.beam_size = beam_size
         self.vad_filter = vad_filter
+        self.scheduler = scheduler
 
         self._model: Any = None
         self._loaded = False
@@ -184,12 +242,36 @@ class SpeechToText:
         Returns:
             TranscriptionResult with text and detected language info
         """
-        if not self._loaded:
-            self.load()
-
         # Use provided language or instance default
         transcribe_language = language if language is not None else self.language
+        audio = self._prepare_audio(audio, sample_rate)
+
+        log.debug(
+            "Starting transcription",
+            audio_length=len(audio) / 16000,
+            language=transcribe_language,
+        )
+
+        segments, info = self._run_model(audio, transcribe_language)
 
+        # Combine segments
+        text = " ".join(segment.text.strip() for segment in segments)
+
+        log.debug(
+            "Transcription complete",
+            text_length=len(text),
+            detected_language=info.language,
+            language_probability=info.language_probability,
+        )
+
+        return TranscriptionResult(
+            text=text,
+            language=info.language,
+            language_probability=info.language_probability,
+        )
+
+    def _prepare_audio(self, audio: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Convert audio to 16 kHz float32 in [-1, 1] for Whisper."""
         # Ensure correct sample rate
         if sample_rate != 16000:
             from scipy import signal
@@ -202,73 +284,157 @@ class SpeechToText:
             audio = audio.astype(np.float32)
 
         # Normalize if needed
-        if audio.max() > 1.0 or audio.min() < -1.0:
+        if len(audio) and (audio.max() > 1.0 or audio.min() < -1.0):
             audio = audio / max(abs(audio.max()), abs(audio.min()))
 
-        log.debug(
-            "Starting transcription",
-            audio_length=len(audio) / 16000,
-            language=transcribe_language,
-        )
+        return audio
+
+    def _run_model(
+        self, audio: np.ndarray, language: str | None, **options: Any
+    ) -> tuple[Any, Any]:
+        """Run Whisper on prepared audio, loading the model if needed."""
+        if not self._loaded:
+            self.load()
 
         # Transcribe with optimized VAD parameters for faster response
-        segments, info = self._model.transcribe(
+        return self._model.transcribe(
             audio,
-            language=transcribe_language,
+            language=language,
             beam_size=self.beam_size,
             vad_filter=self.vad_filter,
             vad_parameters=dict(
                 min_silence_duration_ms=300,  # Reduced from 500 for faster response
                 speech_pad_ms=100,  # Reduced from 200
             ),
+            **options,
         )
 
-        # Combine segments
-        text = " ".join(segment.text.strip() for segment in segments)
+    def transcribe_words(
+        self,
+        audio: np.ndarray,
+        language: str | None = None,
+        prompt: str | None = None,
+    ) -> tuple[list[TranscribedWord], str]:
+        """Transcribe 16 kHz audio into timestamped words.
 
-        log.debug(
-            "Transcription complete",
-            text_length=len(text),
-            detected_language=info.language,
-            language_probability=info.language_probability,
-        )
+        Used by streaming sessions, which re-decode a sliding window and
+        need word boundaries to decide what is stable.
 
-        return TranscriptionResult(
-            text=text,
-            language=info.language,
-            language_probability=info.language_probability,
+        Args:
+            audio: Audio samples at 16 kHz
+            language: Override language (optional)
+            prompt: Text preceding the audio, used as decoder context
+
+        Returns:
+            Words with times relative to the start of audio, and the
+            detected language
+        """
+        transcribe_language = language if language is not None else self.language
+        audio = self._prepare_audio(audio, 16000)
+
+        segments, info = self._run_model(
+            audio,
+            transcribe_language,
+            initial_prompt=prompt or None,
+            word_timestamps=True,
+            condition_on_previous_text=False,
         )
 
+        words = [
+            TranscribedWord(start=word.start, end=word.end, text=word.word.strip())
+            for segment in segments
+            for word in (segment.words or [])
+            if word.word.strip()
+        ]
+        return words, info.language
+
+    def open_stream(
+        self,
+        language: str | None = None,
+        config: StreamingConfig | None = None,
+    ) -> STTStream:
+        """Open a streaming session producing partial transcripts.
+
+        Args:
+            language: Override language for the session (optional)
+            config: Streaming configuration
+
+        Returns:
+            New streaming session
+        """
+        return STTStream(self, language=language, config=config)
+
+    def transcribe_batch(
+        self,
+        audios: list[np.ndarray],
+        sample_rate: int = 16000,
+        language: str | None = None,
+    ) -> list[TranscriptionResult]:
+        """Transcribe several utterances, returning results in order.
+
+        Args:
+            audios: Audio samples per utterance
+            sample_rate: Audio sample rate shared by all utterances
+            language: Override language for this batch (optional)
+
+        Returns:
+            One TranscriptionResult per utterance
+        """
+        return [
+            self.transcribe_with_info(audio, sample_rate, language) for audio in audios
+        ]
+
     async def transcribe_async(
         self,
         audio: np.ndarray,
         sample_rate: int = 16000,
         language: str | None = None,
+        priority: InferencePriority = InferencePriority.LIVE,
     ) -> str:
         """Async wrapper for transcription.
 
-        Runs transcription in a thread pool to avoid blocking.
+        Runs transcription on the inference scheduler to avoid blocking.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            partial(self.transcribe, audio, sample_rate, language),
+        result = await self.transcribe_with_info_async(
+            audio, sample_rate, language, priority
         )
+        return result.text
 
     async def transcribe_with_info_async(
         self,
         audio: np.ndarray,
         sample_rate: int = 16000,
         language: str | None = None,
+        priority: InferencePriority = InferencePriority.LIVE,
     ) -> TranscriptionResult:
         """Async wrapper for transcription with language info.
 
-        Runs transcription in a thread pool to avoid blocking.
+        Runs transcription on the inference scheduler to avoid blocking.
+        Short utterances are micro-batched when the backend supports it.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            partial(self.transcribe_with_info, audio, sample_rate, language),
+        scheduler = self.scheduler or get_inference_scheduler()
+
+        if (
+            self.supports_batching
+            and len(audio) <= self.batch_max_seconds * sample_rate
+        ):
+            return await scheduler.submit_batchable(
+                partial(
+                    self.transcribe_batch, sample_rate=sample_rate, language=language
+                ),
+                audio,
+                batch_key=(id(self), sample_rate, language),
+                priority=priority,
+                kind="stt",
+            )
+
+        return await scheduler.submit(
+            self.transcribe_with_info,
+            audio,
+            sample_rate,
+            language,
+            priority=priority,
+            kind="stt",
         )
 
     def unload(self) -> None:
@@ -283,3 +449,243 @@ class SpeechToText:
     def is_loaded(self) -> bool:
         """Check if model is currently loaded."""
         return self._loaded
+
+
+class STTStream:
+    """Streaming transcription session with partial results.
+
+    Audio is fed in chunks while the caller is still speaking. Every
+    ``step_seconds`` of new audio the buffered window is re-decoded, with
+    already-committed text passed as the decoder prompt. Words on which
+    two consecutive decodes agree are committed and never revised
+    (local agreement), and the buffer is trimmed behind the last
+    committed word so decode cost stays bounded by the window instead of
+    growing with the utterance.
+
+    Usage:
+        stream = stt.open_stream()
+        for chunk in chunks:
+            hypothesis = await stream.feed_async(chunk)
+            if hypothesis:
+                show_partial(hypothesis.text)
+        final = await stream.finish_async()
+    """
+
+    def __init__(
+        self,
+        stt: SpeechToText,
+        language: str | None = None,
+        config: StreamingConfig | None = None,
+    ) -> None:
+        """Initialize streaming session.
+
+        Args:
+            stt: Engine used for decoding
+            language: Override language for the session (optional)
+            config: Streaming configuration
+        """
+        self.stt = stt
+        self.language = language
+        self.config = config or StreamingConfig()
+
+        self._resampler = None
+        if self.config.sample_rate != 16000:
+            from phone_agent.telephony.codecs import StreamingResampler
+
+            self._resampler = StreamingResampler(self.config.sample_rate, 16000)
+
+        self._buffer = np.zeros(0, dtype=np.float32)
+        self._buffer_offset = 0.0  # Stream time of the first buffered sample
+        self._committed: list[TranscribedWord] = []
+        self._tentative: list[TranscribedWord] = []
+        self._pending_samples = 0
+        self._total_samples = 0
+        self._finished = False
+
+        self._buffer_lock = threading.Lock()  # Feeding vs trimming
+        self._decode_lock = threading.Lock()  # One decode at a time
+
+        self.decodes = 0
+
+    def feed(self, chunk: np.ndarray) -> StreamingHypothesis | None:
+        """Add audio and re-decode if enough new audio has arrived.
+
+        Args:
+            chunk: Audio samples (float32 in [-1, 1] or int16)
+
+        Returns:
+            Updated hypothesis, or None if no decode was due
+        """
+        if not self._append(chunk):
+            return None
+        return self._decode_step()
+
+    async def feed_async(
+        self,
+        chunk: np.ndarray,
+        priority: InferencePriority = InferencePriority.LIVE,
+    ) -> StreamingHypothesis | None:
+        """Add audio and re-decode on the inference scheduler if due.
+
+        The chunk is buffered immediately. If a decode is already running
+        the new audio is picked up by the next one.
+
+        Args:
+            chunk: Audio samples (float32 in [-1, 1] or int16)
+            priority: Scheduler priority
+
+        Returns:
+            Updated hypothesis, or None if no decode was due
+        """
+        if not self._append(chunk) or self._decode_lock.locked():
+            return None
+        scheduler = self.stt.scheduler or get_inference_scheduler()
+        return await scheduler.submit(self._decode_step, priority=priority, kind="stt")
+
+    def finish(self) -> StreamingHypothesis:
+        """Decode the remaining audio and commit everything.
+
+        Returns:
+            Final hypothesis for the utterance
+        """
+        with self._decode_lock:
+            self._finished = True
+            if self._buffer.size:
+                current = self._decode_window()
+                self._committed.extend(current)
+            else:
+                self._committed.extend(self._tentative)
+            self._tentative = []
+            return self._hypothesis(is_final=True)
+
+    async def finish_async(
+        self,
+        priority: InferencePriority = InferencePriority.LIVE,
+    ) -> StreamingHypothesis:
+        """Finish the stream on the inference scheduler.
+
+        Args:
+            priority: Scheduler priority
+
+        Returns:
+            Final hypothesis for the utterance
+        """
+        scheduler = self.stt.scheduler or get_inference_scheduler()
+        return await scheduler.submit(self.finish, priority=priority, kind="stt")
+
+    @property
+    def committed_text(self) -> str:
+        """Text that will not change any more."""
+        return " ".join(word.text for word in self._committed)
+
+    @property
+    def buffered_seconds(self) -> float:
+        """Audio currently held for re-decoding."""
+        return len(self._buffer) / 16000
+
+    def _append(self, chunk: np.ndarray) -> bool:
+        """Buffer a chunk; return whether a decode is due."""
+        if self._finished:
+            return False
+
+        if chunk.dtype == np.int16:
+            chunk = chunk.astype(np.float32) / 32768.0
+        elif chunk.dtype != np.float32:
+            chunk = chunk.astype(np.float32)
+        if self._resampler is not None:
+            chunk = self._resampler.process(chunk)
+
+        with self._buffer_lock:
+            self._buffer = np.concatenate([self._buffer, chunk])
+            self._pending_samples += len(chunk)
+            self._total_samples += len(chunk)
+            return self._pending_samples >= self.config.step_seconds * 16000
+
+    def _decode_step(self) -> StreamingHypothesis:
+        """Re-decode the window and commit the agreed prefix."""
+        with self._decode_lock:
+            if self._finished:
+                return self._hypothesis(is_final=True)
+
+            current = self._decode_window()
+
+            agreed = 0
+            for previous, word in zip(self._tentative, current):
+                if _normalize_word(previous.text) != _normalize_word(word.text):
+                    break
+                agreed += 1
+
+            self._committed.extend(current[:agreed])
+            self._tentative = current[agreed:]
+            self._trim()
+            return self._hypothesis()
+
+    def _decode_window(self) -> list[TranscribedWord]:
+        """Decode buffered audio into words not yet committed."""
+        with self._buffer_lock:
+            audio = self._buffer
+            offset = self._buffer_offset
+            self._pending_samples = 0
+
+        words, _ = self.stt.transcribe_words(
+            audio, self.language, prompt=self._prompt(offset)
+        )
+        self.decodes += 1
+
+        # Move to stream time and skip words already committed (timestamps
+        # jitter between decodes, so allow a small overlap)
+        last_end = self._committed[-1].end if self._committed else 0.0
+        words = [
+            TranscribedWord(start=w.start + offset, end=w.end + offset, text=w.text)
+            for w in words
+            if w.start + offset > last_end - 0.1
+        ]
+
+        # Drop a leading repeat of the committed tail
+        tail = [_normalize_word(w.text) for w in self._committed[-5:]]
+        for n in range(min(len(tail), len(words)), 0, -1):
+            if tail[-n:] == [_normalize_word(w.text) for w in words[:n]]:
+                return words[n:]
+        return words
+
+    def _prompt(self, offset: float) -> str:
+        """Committed text before the buffer, as decoder context."""
+        text = " ".join(w.text for w in self._committed if w.end <= offset)
+        return text[-self.config.prompt_chars:]
+
+    def _trim(self) -> None:
+        """Bound the buffer to the window by dropping committed audio."""
+        if self.buffered_seconds <= self.config.window_seconds:
+            return
+
+        if not self._committed or self._committed[-1].end <= self._buffer_offset:
+            # Nothing agreed within the window: commit what we have so the
+            # buffer cannot grow without bound
+            self._committed.extend(self._tentative)
+            self._tentative = []
+
+        if self._committed and self._committed[-1].end > self._buffer_offset:
+            cut_time = self._committed[-1].end
+        else:
+            # No speech decoded: keep only the most recent step
+            cut_time = (
+                self._buffer_offset + self.buffered_seconds - self.config.step_seconds
+            )
+
+        with self._buffer_lock:
+            cut = int((cut_time - self._buffer_offset) * 16000)
+            self._buffer = self._buffer[cut:]
+            self._buffer_offset += cut / 16000
+
+    def _hypothesis(self, is_final: bool = False) -> StreamingHypothesis:
+        return StreamingHypothesis(
+            committed=self.committed_text,
+            tentative=" ".join(word.text for word in self._tentative),
+            is_final=is_final,
+            audio_seconds=self._total_samples / 16000,
+        )
+
+
+def _normalize_word(word: str) -> str:
+    """Lowercase and strip punctuation for hypothesis comparison."""
+    return word.lower().strip(".,!?;:\"'()-")
@@ -6,10 +6,9 @@ Manages model lifecycle to balance accuracy vs memory usage.
 
 from __future__ import annotations
 
-import asyncio
-from functools import partial
+import threading
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 from itf_shared import get_logger
@@ -19,7 +18,11 @@ from .dialect_detector import (
     DialectResult,
     GermanDialectDetector,
 )
-from .stt import SpeechToText, TranscriptionResult
+from .scheduler import InferencePriority, get_inference_scheduler
+from .stt import SpeechToText, StreamingConfig, STTStream, TranscriptionResult
+
+if TYPE_CHECKING:
+    from .scheduler import InferenceScheduler
 
 log = get_logger(__name__)
 
@@ -54,6 +57,7 @@ class DialectAwareSTT:
         dialect_detection: bool = True,
         detection_mode: str = "text",
         probe_duration: float = 1.5,
+        scheduler: InferenceScheduler | None = None,
     ) -> None:
         """Initialize dialect-aware STT.
 
@@ -67,6 +71,7 @@ class DialectAwareSTT:
             dialect_detection: Enable dialect detection for German
             detection_mode: "text" (post-transcription) or "audio" (pre-transcription)
             probe_duration: Seconds of audio for dialect probe (audio mode only)
+            scheduler: Inference scheduler (default: shared global scheduler)
         """
         self.model_path = Path(model_path)
         self.device = device
@@ -76,6 +81,7 @@ class DialectAwareSTT:
         self.max_loaded_models = max_loaded_models
         self.dialect_detection = dialect_detection
         self.detection_mode = detection_mode
+        self.scheduler = scheduler
 
         # Dialect detector (only initialized with probe if audio mode)
         self._dialect_detector = GermanDialectDetector(
@@ -85,6 +91,8 @@ class DialectAwareSTT:
         # Model cache: model_name → SpeechToText instance
         self._models: dict[str, SpeechToText] = {}
         self._model_usage: list[str] = []  # LRU order (most recent last)
+        # Scheduler workers route concurrently; guard the cache
+        self._models_lock = threading.Lock()
 
         # Current language setting (for non-German)
         self._language: str | None = "de"
@@ -103,6 +111,10 @@ class DialectAwareSTT:
         Returns:
             Loaded SpeechToText instance
         """
+        with self._models_lock:
+            return self._get_or_load_model_locked(model_name)
+
+    def _get_or_load_model_locked(self, model_name: str) -> SpeechToText:
         # Check cache
         if model_name in self._models:
             # Update LRU order
@@ -268,13 +280,13 @@ class DialectAwareSTT:
         sample_rate: int = 16000,
         language: str | None = None,
         force_dialect: str | None = None,
+        priority: InferencePriority = InferencePriority.LIVE,
     ) -> str:
-        """Async wrapper for transcription."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            partial(self.transcribe, audio, sample_rate, language, force_dialect),
+        """Async wrapper for transcription (runs on the inference scheduler)."""
+        result = await self.transcribe_with_info_async(
+            audio, sample_rate, language, force_dialect, priority
         )
+        return result.text
 
     async def transcribe_with_info_async(
         self,
@@ -282,14 +294,47 @@ class DialectAwareSTT:
         sample_rate: int = 16000,
         language: str | None = None,
         force_dialect: str | None = None,
+        priority: InferencePriority = InferencePriority.LIVE,
     ) -> TranscriptionResult:
-        """Async wrapper for transcription with info."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            partial(self.transcribe_with_info, audio, sample_rate, language, force_dialect),
+        """Async wrapper for transcription with info (on the inference scheduler)."""
+        scheduler = self.scheduler or get_inference_scheduler()
+        return await scheduler.submit(
+            self.transcribe_with_info,
+            audio,
+            sample_rate,
+            language,
+            force_dialect,
+            priority=priority,
+            kind="stt",
         )
 
+    def open_stream(
+        self,
+        language: str | None = None,
+        config: StreamingConfig | None = None,
+    ) -> STTStream:
+        """Open a streaming session on the model for the target language.
+
+        Dialect routing needs the finished utterance, so streams use the
+        standard model for German (or the multilingual model otherwise).
+
+        Args:
+            language: Override language (de, tr, ru, en)
+            config: Streaming configuration
+
+        Returns:
+            New streaming session
+        """
+        target_language = language if language is not None else self._language
+        stt = self._get_or_load_model(self._default_model(target_language))
+        return stt.open_stream(language=target_language, config=config)
+
+    def _default_model(self, language: str | None) -> str:
+        """Model used for a language before any dialect is detected."""
+        if language == "de":
+            return DIALECT_MODELS["de_standard"]
+        return "openai/whisper-large-v3"
+
     @property
     def last_dialect(self) -> DialectResult | None:
         """Get the last detected dialect result."""
@@ -300,6 +345,23 @@ class DialectAwareSTT:
         """Get list of currently loaded models."""
         return list(self._models.keys())
 
+    @property
+    def is_loaded(self) -> bool:
+        """Check if any model is currently loaded."""
+        return bool(self._models)
+
+    def load(self) -> None:
+        """Load the model for the current language.
+
+        Mirrors ``SpeechToText.load`` so the router can be preloaded like
+        a single model; further dialect models load on demand.
+        """
+        self.preload_model(self._default_model(self._language))
+
+    def unload(self) -> None:
+        """Unload all models (alias of ``unload_all``)."""
+        self.unload_all()
+
     def preload_model(self, model_name: str) -> None:
         """Preload a model for faster first transcription.
 
@@ -13,14 +13,21 @@ from __future__ import annotations
 
 import asyncio
 import io
+import struct
 import wave
+from collections.abc import AsyncIterator, Iterator
 from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 from itf_shared import get_logger
 
+from .streaming import iterate_in_thread
+
+if TYPE_CHECKING:
+    from .tts_cache import TTSCache
+
 log = get_logger(__name__)
 
 
@@ -45,13 +52,34 @@ def get_voice_for_language(language: str) -> str:
     return VOICE_REGISTRY.get(language, VOICE_REGISTRY["de"])
 
 
+def pcm_to_wav(chunks: list[bytes], sample_rate: int) -> bytes:
+    """Wrap mono 16-bit PCM chunks in a single WAV container.
+
+    Args:
+        chunks: PCM chunks as yielded by synthesize_stream
+        sample_rate: Sample rate of the PCM
+
+    Returns:
+        WAV bytes (the chunks are copied exactly once)
+    """
+    size = sum(len(chunk) for chunk in chunks)
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + size, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", size,
+    )
+    return b"".join([header, *chunks])
+
+
 class TextToSpeech:
     """Text-to-Speech engine using Piper TTS.
 
     Supports multilingual speech synthesis with language-specific voices.
     Optimized for low-latency generation on Raspberry Pi 5.
 
-    Features LRU caching for voice models to avoid reloading on language switch.
+    Features LRU caching for voice models to avoid reloading on language switch,
+    and an optional phrase cache that replays audio for repeated texts.
     """
 
     def __init__(
@@ -62,6 +90,7 @@ class TextToSpeech:
         sample_rate: int = 22050,
         voices: dict[str, str] | None = None,
         max_cached_voices: int = 2,
+        cache: TTSCache | None = None,
     ) -> None:
         """Initialize TTS engine.
 
@@ -72,6 +101,7 @@ class TextToSpeech:
             sample_rate: Output audio sample rate
             voices: Language-to-voice mapping (optional)
             max_cached_voices: Maximum voice models to keep loaded (LRU eviction)
+            cache: Phrase audio cache (None disables)
         """
         self.model_name = model
         self.model_path = Path(model_path)
@@ -79,6 +109,7 @@ class TextToSpeech:
         self.sample_rate = sample_rate
         self.voices = voices or VOICE_REGISTRY.copy()
         self.max_cached_voices = max_cached_voices
+        self.cache = cache
 
         # Current language
         self._current_language = "de"
@@ -219,9 +250,72 @@ class TextToSpeech:
         Returns:
             Audio data as bytes
         """
-        # Load model for requested language
         target_lang = language or self._current_language
-        self.load(target_lang)
+        if self.cache is None:
+            return self._synthesize(text, output_format, target_lang)
+
+        return self.cache.get_or_synthesize(
+            self._cache_key(text, output_format, target_lang),
+            lambda: self._synthesize(text, output_format, target_lang),
+            text=text,
+        )
+
+    def synthesize_stream(
+        self, text: str, language: str | None = None
+    ) -> Iterator[bytes]:
+        """Synthesize speech as raw PCM chunks while Piper produces them.
+
+        Chunks are mono 16-bit little-endian PCM at ``sample_rate`` with no
+        container, so callers can frame and send the first 20 ms before the
+        rest of the sentence is synthesized.
+
+        Args:
+            text: Text to convert to speech
+            language: Language code (de, tr, ru) or None for current language
+
+        Yields:
+            PCM chunks (int16 bytes)
+        """
+        target_lang = language or self._current_language
+        if self.cache is None:
+            yield from self._stream_pcm(text, target_lang)
+            return
+
+        yield from self.cache.get_or_stream(
+            self._cache_key(text, "raw", target_lang),
+            lambda: self._stream_pcm(text, target_lang),
+            text=text,
+        )
+
+    async def synthesize_stream_async(
+        self,
+        text: str,
+        language: str | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Async variant of synthesize_stream (synthesis runs in a thread)."""
+        async for chunk in iterate_in_thread(self.synthesize_stream, text, language):
+            yield chunk
+
+    def _cache_key(self, text: str, output_format: str, language: str) -> str:
+        voice = self.voices.get(language, self.model_name)
+        return self.cache.make_key(
+            f"piper:{voice}:{self.speaker_id}:{self.sample_rate}",
+            language,
+            text,
+            output_format,
+        )
+
+    def _stream_pcm(self, text: str, language: str) -> Iterator[bytes]:
+        """Run Piper for one text, yielding its PCM chunks (no cache)."""
+        self.load(language)
+        log.debug("Streaming speech synthesis", text_length=len(text))
+        for audio_chunk in self._voice.synthesize(text):
+            yield audio_chunk.audio_int16_bytes
+
+    def _synthesize(self, text: str, output_format: str, language: str) -> bytes:
+        """Run Piper for one text (no cache)."""
+        # Load model for requested language
+        self.load(language)
 
         log.debug("Synthesizing speech", text_length=len(text))
 
@@ -266,19 +360,11 @@ class TextToSpeech:
         Returns:
             Audio samples as float32 numpy array (-1 to 1)
         """
-        # Load model for requested language
-        target_lang = language or self._current_language
-        self.load(target_lang)
-
-        # Collect raw audio chunks
-        audio_chunks = []
-        for audio_chunk in self._voice.synthesize(text):
-            # Convert bytes to int16 array
-            chunk = np.frombuffer(audio_chunk.audio_int16_bytes, dtype=np.int16)
-            audio_chunks.append(chunk)
-
-        # Combine chunks
-        audio = np.concatenate(audio_chunks)
+        # Raw PCM (through the phrase cache, if enabled)
+        audio = np.frombuffer(
+            self.synthesize(text, output_format="raw", language=language),
+            dtype=np.int16,
+        )
 
         # Convert to float32 normalized
         audio = audio.astype(np.float32) / 32768.0
@@ -358,6 +444,7 @@ class TextToSpeech:
             "max_cache_size": self.max_cached_voices,
             "current_language": self._current_language,
             "current_model": self._loaded_model,
+            "phrase_cache": self.cache.statistics if self.cache else None,
         }
 
 
@@ -0,0 +1,397 @@
+"""Content-addressed cache for synthesized speech.
+
+Greetings, fixed prompts and many LLM sentences ("Vielen Dank für Ihren
+Anruf.") are spoken again and again with the same voice. Synthesizing
+them once and replaying the audio saves the TTS time on every repeat.
+
+Entries are keyed by voice, language, normalized text and output
+format, so a voice or format change never serves stale audio. The
+memory tier is an LRU bounded by bytes; an optional disk tier keeps
+audio across restarts, also evicted least recently used first.
+
+Usage:
+    cache = TTSCache(TTSCacheConfig(disk_path=Path("data/tts_cache")))
+    tts = TextToSpeech(cache=cache)
+    tts.synthesize("Guten Morgen")  # synthesized
+    tts.synthesize("Guten  Morgen")  # served from cache
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from itf_shared import get_logger
+
+log = get_logger(__name__)
+
+
+@dataclass
+class TTSCacheConfig:
+    """TTS cache configuration."""
+
+    memory_bytes: int = 64 * 1024 * 1024  # Memory tier budget
+    disk_path: Path | None = None  # Disk tier directory (None disables)
+    disk_bytes: int = 512 * 1024 * 1024  # Disk tier budget
+    max_text_length: int = 500  # Longer texts are not cached
+
+
+@dataclass
+class TTSCacheStatistics:
+    """Hit counters of a TTS cache."""
+
+    lookups: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    stores: int = 0
+    evictions: int = 0
+    bytes_saved: int = 0  # Audio bytes served without synthesis
+
+    @property
+    def hits(self) -> int:
+        """Lookups served from either tier."""
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from cache."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "hit_ratio": round(self.hit_ratio, 3),
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "bytes_saved": self.bytes_saved,
+        }
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so trivially different spellings share an entry."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class TTSCache:
+    """Two-tier (memory LRU + optional disk) cache of synthesized audio."""
+
+    def __init__(self, config: TTSCacheConfig | None = None) -> None:
+        """Initialize TTS cache.
+
+        Args:
+            config: Cache configuration
+        """
+        self.config = config or TTSCacheConfig()
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_size = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()  # Per-thread prewarm state
+        self.stats = TTSCacheStatistics()
+
+        # Disk tier: file sizes in recency order and their running total
+        self._disk_index: OrderedDict[str, int] = OrderedDict()
+        self._disk_size = 0
+        self._disk_path = Path(self.config.disk_path) if self.config.disk_path else None
+        if self._disk_path is not None:
+            self._disk_path.mkdir(parents=True, exist_ok=True)
+            self._load_disk_index()
+
+    @staticmethod
+    def make_key(voice: str, language: str, text: str, output_format: str) -> str:
+        """Content address for an utterance.
+
+        Args:
+            voice: Voice model or provider voice ID
+            language: Language code
+            text: Text to speak
+            output_format: Audio format (wav, raw, ...)
+
+        Returns:
+            Hex digest identifying the audio
+        """
+        material = "\x1f".join((voice, language, output_format, normalize_text(text)))
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        """Look up audio by key.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Cached audio, or None on a miss
+        """
+        counted = not self._prewarming
+        with self._lock:
+            if counted:
+                self.stats.lookups += 1
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                if counted:
+                    self.stats.memory_hits += 1
+                    self.stats.bytes_saved += len(data)
+                return data
+
+        data = self._read_disk(key)
+        if data is None:
+            return None
+
+        with self._lock:
+            if counted:
+                self.stats.disk_hits += 1
+                self.stats.bytes_saved += len(data)
+            self._store_memory(key, data)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store audio under a key.
+
+        Args:
+            key: Key from make_key
+            data: Audio bytes
+        """
+        if not data:
+            return
+        if self._prewarming:
+            self._local.warmed += 1
+        with self._lock:
+            self.stats.stores += 1
+            self._store_memory(key, data)
+        self._write_disk(key, data)
+
+    def get_or_synthesize(
+        self,
+        key: str,
+        synthesize: Callable[[], bytes],
+        text: str | None = None,
+    ) -> bytes:
+        """Return cached audio or synthesize and store it.
+
+        Args:
+            key: Key from make_key
+            synthesize: Produces the audio on a miss
+            text: Source text (entries longer than max_text_length are not stored)
+
+        Returns:
+            Audio bytes
+        """
+        data = self.get(key)
+        if data is not None:
+            return data
+
+        data = synthesize()
+        if text is None or len(text) <= self.config.max_text_length:
+            self.put(key, data)
+        return data
+
+    def get_or_stream(
+        self,
+        key: str,
+        stream: Callable[[], Iterable[bytes]],
+        text: str | None = None,
+    ) -> Iterator[bytes]:
+        """Yield cached audio, or pass a live stream through and store it.
+
+        The entry is only stored once the stream has been consumed to the
+        end, so an interrupted sentence never leaves partial audio behind.
+
+        Args:
+            key: Key from make_key
+            stream: Produces the audio chunks on a miss
+            text: Source text (entries longer than max_text_length are not stored)
+
+        Yields:
+            Audio chunks
+        """
+        data = self.get(key)
+        if data is not None:
+            yield data
+            return
+
+        chunks = []
+        for chunk in stream():
+            chunks.append(chunk)
+            yield chunk
+        if text is None or len(text) <= self.config.max_text_length:
+            self.put(key, b"".join(chunks))
+
+    def prewarm(
+        self,
+        tts: Any,
+        phrases: Iterable[str],
+        language: str | None = None,
+        output_format: str = "wav",
+    ) -> int:
+        """Synthesize phrases ahead of time so first calls hit the cache.
+
+        Lookups made while prewarming are left out of the hit statistics.
+
+        Args:
+            tts: Engine whose synthesize() consults this cache
+            phrases: Texts to synthesize
+            language: Language code (None for the engine's current language)
+            output_format: Format the phrases will be requested in
+
+        Returns:
+            Number of phrases that were not cached yet
+        """
+        self._local.warmed = 0
+        try:
+            for phrase in dict.fromkeys(
+                normalize_text(p) for p in phrases if p.strip()
+            ):
+                try:
+                    tts.synthesize(
+                        phrase, output_format=output_format, language=language
+                    )
+                except Exception as e:
+                    log.warning("TTS prewarm failed", text=phrase[:40], error=str(e))
+            warmed = self._local.warmed
+        finally:
+            self._local.warmed = None
+        log.info("TTS cache prewarmed", phrases=warmed, language=language)
+        return warmed
+
+    @property
+    def _prewarming(self) -> bool:
+        """Whether the current thread is inside prewarm()."""
+        return getattr(self._local, "warmed", None) is not None
+
+    def _store_memory(self, key: str, data: bytes) -> None:
+        """Insert into the memory LRU and evict beyond budget (lock held)."""
+        if len(data) > self.config.memory_bytes:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_size -= len(old)
+        self._memory[key] = data
+        self._memory_size += len(data)
+
+        while self._memory_size > self.config.memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= len(evicted)
+            self.stats.evictions += 1
+
+    def _disk_file(self, key: str) -> Path:
+        return self._disk_path / f"{key}.audio"
+
+    def _load_disk_index(self) -> None:
+        """Index existing disk files by modification time (once, at start)."""
+        files = []
+        for path in self._disk_path.glob("*.audio"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime_ns, path.stem, stat.st_size))
+        for _, key, size in sorted(files):
+            self._disk_index[key] = size
+            self._disk_size += size
+
+    def _read_disk(self, key: str) -> bytes | None:
+        if self._disk_path is None:
+            return None
+        path = self._disk_file(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)  # Recency for eviction after a restart
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            log.warning("TTS cache read failed", error=str(e))
+            return None
+        with self._lock:
+            if key in self._disk_index:
+                self._disk_index.move_to_end(key)
+        return data
+
+    def _write_disk(self, key: str, data: bytes) -> None:
+        if self._disk_path is None:
+            return
+        path = self._disk_file(key)
+        # Unique per writer: concurrent stores of one key never share a file
+        tmp = path.with_name(f".{key}.{os.getpid()}.{uuid4().hex}.tmp")
+        try:
+            tmp.write_bytes(data)
+            tmp.replace(path)  # Atomic, readers never see partial files
+        except OSError as e:
+            tmp.unlink(missing_ok=True)
+            log.warning("TTS cache write failed", error=str(e))
+            return
+
+        with self._lock:
+            self._disk_size += len(data) - self._disk_index.pop(key, 0)
+            self._disk_index[key] = len(data)
+            victims = self._trim_disk()
+        for victim in victims:
+            self._disk_file(victim).unlink(missing_ok=True)
+
+    def _trim_disk(self) -> list[str]:
+        """Drop least recently used files beyond the disk budget (lock held).
+
+        Returns:
+            Keys whose files are to be deleted
+        """
+        victims = []
+        while self._disk_size > self.config.disk_bytes and len(self._disk_index) > 1:
+            key, size = self._disk_index.popitem(last=False)
+            self._disk_size -= size
+            victims.append(key)
+        return victims
+
+    @property
+    def memory_size(self) -> int:
+        """Bytes held in the memory tier."""
+        return self._memory_size
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Hit ratio, bytes saved and tier sizes."""
+        with self._lock:
+            data = self.stats.to_dict()
+            data["entries"] = len(self._memory)
+        data["memory_bytes"] = self._memory_size
+        data["disk_enabled"] = self._disk_path is not None
+        data["disk_bytes"] = self._disk_size
+        return data
+
+    def clear(self) -> None:
+        """Drop the memory tier (disk files are kept)."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+
+
+def create_tts_cache(settings: Any) -> TTSCache | None:
+    """Build a phrase cache from TTS settings.
+
+    Args:
+        settings: AITTSSettings (phrase_cache_mb, phrase_cache_path,
+            phrase_cache_disk_mb)
+
+    Returns:
+        Configured cache, or None if phrase_cache_mb is 0
+    """
+    if settings.phrase_cache_mb <= 0:
+        return None
+    disk_path = Path(settings.phrase_cache_path) if settings.phrase_cache_path else None
+    return TTSCache(
+        TTSCacheConfig(
+            memory_bytes=settings.phrase_cache_mb * 1024 * 1024,
+            disk_path=disk_path,
+            disk_bytes=settings.phrase_cache_disk_mb * 1024 * 1024,
+        )
+    )
@@ -3,6 +3,7 @@
 Provides multiple VAD backends:
 - SileroVAD: Neural network-based VAD (recommended, more accurate)
 - SimpleVAD: RMS energy-based VAD (fallback, faster but less accurate)
+- VADStream: per-call stream of the batched VADService (see vad_service.py)
 
 Silero VAD is a pre-trained model that provides accurate speech detection
 even in noisy environments, with low latency suitable for real-time use.
@@ -11,6 +12,7 @@ even in noisy environments, with low latency suitable for real-time use.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
 from typing import Iterator
 
@@ -64,6 +66,25 @@ class BaseVAD(ABC):
         """Reset VAD state for new utterance."""
         pass
 
+    async def classify_async(
+        self,
+        frames: list[np.ndarray],
+        sample_rate: int = 16000,
+    ) -> list[tuple[bool, float]]:
+        """Classify several frames (batched where the backend supports it).
+
+        Args:
+            frames: Consecutive audio frames
+            sample_rate: Sample rate of audio
+
+        Returns:
+            (is_speech, confidence) per frame
+        """
+        return [self.is_speech(frame, sample_rate) for frame in frames]
+
+    def close(self) -> None:
+        """Release resources held for this stream."""
+
 
 class SimpleVAD(BaseVAD):
     """Simple RMS energy-based VAD.
@@ -149,6 +170,7 @@ class SileroVAD(BaseVAD):
 
         self._model = None
         self._loaded = False
+        self._resampler = None
 
         # State tracking
         self._speech_frames = 0
@@ -199,25 +221,35 @@ class SileroVAD(BaseVAD):
 
         import torch
 
-        # Resample if needed
-        if sample_rate != self.SAMPLE_RATE:
-            from scipy import signal
-
-            samples = int(len(audio) * self.SAMPLE_RATE / sample_rate)
-            audio = signal.resample(audio, samples)
-
-        # Ensure correct frame size (pad or truncate)
-        if len(audio) < self.frame_size:
-            audio = np.pad(audio, (0, self.frame_size - len(audio)))
-        elif len(audio) > self.frame_size:
-            audio = audio[: self.frame_size]
+        audio = np.asarray(audio, dtype=np.float32)
 
-        # Convert to tensor
-        audio_tensor = torch.from_numpy(audio).float()
-
-        # Get speech probability
+        # Resample statefully, so consecutive frames join without edge artifacts
+        if sample_rate != self.SAMPLE_RATE:
+            if self._resampler is None or self._resampler.input_rate != sample_rate:
+                from phone_agent.telephony.codecs import StreamingResampler
+
+                self._resampler = StreamingResampler(sample_rate, self.SAMPLE_RATE)
+            audio = self._resampler.process(audio)
+
+        # Evaluate every window; a remainder is padded, or dropped if mostly padding
+        windows = [
+            audio[start:start + self.frame_size]
+            for start in range(0, max(len(audio), 1), self.frame_size)
+        ]
+        if len(windows[-1]) < self.frame_size:
+            if len(windows) > 1 and len(windows[-1]) < self.frame_size // 2:
+                windows.pop()  # Mostly padding; the full windows decide
+            else:
+                windows[-1] = np.pad(
+                    windows[-1], (0, self.frame_size - len(windows[-1]))
+                )
+
+        # Get speech probability (model state carries across windows)
         with torch.no_grad():
-            speech_prob = self._model(audio_tensor, self.SAMPLE_RATE).item()
+            speech_prob = max(
+                self._model(torch.from_numpy(window), self.SAMPLE_RATE).item()
+                for window in windows
+            )
 
         is_speech = speech_prob > self.threshold
 
@@ -304,6 +336,8 @@ class SileroVAD(BaseVAD):
         """Reset VAD state for new utterance."""
         if self._model is not None:
             self._model.reset_states()
+        if self._resampler is not None:
+            self._resampler.reset()
         self._speech_frames = 0
         self._silence_frames = 0
         self._is_speaking = False
@@ -314,6 +348,194 @@ class SileroVAD(BaseVAD):
         return self._loaded
 
 
+@dataclass
+class EndpointerConfig:
+    """Utterance endpointing configuration.
+
+    Durations are rounded to whole VAD frames.
+    """
+
+    sample_rate: int = 16000
+    frame_size: int = 512  # 32ms at 16kHz (a valid Silero frame)
+    min_speech_ms: int = 96  # Voiced audio needed to start an utterance
+    hangover_ms: int = 600  # Trailing silence that ends an utterance
+    preroll_ms: int = 192  # Audio kept from before speech onset
+    max_utterance_ms: int = 15000  # Force an end-of-utterance after this
+
+
+class SpeechEndpointer:
+    """Accumulate one caller utterance at a time using a VAD.
+
+    Audio is fed in arbitrary chunk sizes, classified frame by frame,
+    and only complete utterances are returned: from speech onset (plus
+    a short pre-roll) until the hangover period of silence has passed,
+    or until the maximum utterance length is reached. Silence and
+    isolated noise bursts never leave the endpointer.
+
+    One instance per call: it holds the VAD and the partial utterance.
+
+    Usage:
+        endpointer = SpeechEndpointer(get_vad("simple", threshold=0.02))
+        for utterance in endpointer.feed(audio_chunk):
+            text = stt.transcribe(utterance)
+    """
+
+    def __init__(self, vad: BaseVAD, config: EndpointerConfig | None = None) -> None:
+        """Initialize endpointer.
+
+        Args:
+            vad: VAD used to classify frames (owned by this endpointer)
+            config: Endpointing configuration
+        """
+        self.vad = vad
+        self.config = config or EndpointerConfig()
+
+        frame_ms = self.config.frame_size * 1000 / self.config.sample_rate
+        self._min_speech_frames = max(1, round(self.config.min_speech_ms / frame_ms))
+        self._hangover_frames = max(1, round(self.config.hangover_ms / frame_ms))
+        self._max_frames = max(
+            self._min_speech_frames, round(self.config.max_utterance_ms / frame_ms)
+        )
+        preroll_frames = round(self.config.preroll_ms / frame_ms)
+
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._preroll: deque[np.ndarray] = deque(
+            maxlen=preroll_frames + self._min_speech_frames
+        )
+        self._frames: list[np.ndarray] = []
+        self._onset_frames = 0
+        self._silence_frames = 0
+        self._in_speech = False
+
+        # Statistics
+        self.utterances = 0
+        self.forced_endpoints = 0
+        self.samples_discarded = 0
+
+    def feed(self, audio: np.ndarray) -> list[np.ndarray]:
+        """Feed audio and collect utterances completed by it.
+
+        Args:
+            audio: Float32 samples at the configured sample rate
+
+        Returns:
+            Completed utterances (usually empty, at most a few)
+        """
+        frame_size = self.config.frame_size
+        # Frames are kept as views, so never alias the caller's buffer
+        audio = np.concatenate((self._pending, np.asarray(audio, dtype=np.float32)))
+        usable = len(audio) - len(audio) % frame_size
+        self._pending = audio[usable:]
+
+        completed = []
+        for start in range(0, usable, frame_size):
+            frame = audio[start:start + frame_size]
+            is_speech, _ = self.vad.is_speech(frame, self.config.sample_rate)
+            utterance = self._process_frame(frame, is_speech)
+            if utterance is not None:
+                completed.append(utterance)
+        return completed
+
+    async def feed_async(self, audio: np.ndarray) -> list[np.ndarray]:
+        """Like feed, but classifies the chunk's frames in one VAD request.
+
+        With a batched VAD (VADStream) the frames of all calls share
+        forward passes; other VADs classify inline as in feed().
+
+        Args:
+            audio: Float32 samples at the configured sample rate
+
+        Returns:
+            Completed utterances
+        """
+        frame_size = self.config.frame_size
+        audio = np.concatenate((self._pending, np.asarray(audio, dtype=np.float32)))
+        usable = len(audio) - len(audio) % frame_size
+        self._pending = audio[usable:]
+
+        starts = range(0, usable, frame_size)
+        frames = [audio[start:start + frame_size] for start in starts]
+        if not frames:
+            return []
+        results = await self.vad.classify_async(frames, self.config.sample_rate)
+
+        completed = []
+        for frame, (is_speech, _) in zip(frames, results):
+            utterance = self._process_frame(frame, is_speech)
+            if utterance is not None:
+                completed.append(utterance)
+        return completed
+
+    def flush(self) -> np.ndarray | None:
+        """Return the utterance in progress, if any, and reset.
+
+        Returns:
+            Partial utterance audio, or None when not in speech
+        """
+        utterance = None
+        if self._in_speech and self._frames:
+            utterance = self._emit()
+        self.reset()
+        return utterance
+
+    def reset(self) -> None:
+        """Drop all buffered audio and reset the VAD."""
+        self.vad.reset()
+        buffered = sum(len(f) for f in self._preroll)
+        self.samples_discarded += len(self._pending) + buffered
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._preroll.clear()
+        self._frames = []
+        self._onset_frames = 0
+        self._silence_frames = 0
+        self._in_speech = False
+
+    @property
+    def in_speech(self) -> bool:
+        """Whether the caller is currently speaking."""
+        return self._in_speech
+
+    def _process_frame(self, frame: np.ndarray, is_speech: bool) -> np.ndarray | None:
+        """Advance the endpointing state by one classified frame."""
+        if not self._in_speech:
+            if len(self._preroll) == self._preroll.maxlen:
+                self.samples_discarded += len(self._preroll[0])
+            self._preroll.append(frame)
+            self._onset_frames = self._onset_frames + 1 if is_speech else 0
+            if self._onset_frames >= self._min_speech_frames:
+                self._in_speech = True
+                self._silence_frames = 0
+                self._frames = list(self._preroll)
+                self._preroll.clear()
+            return None
+
+        self._frames.append(frame)
+        if is_speech:
+            self._silence_frames = 0
+        else:
+            self._silence_frames += 1
+            if self._silence_frames >= self._hangover_frames:
+                utterance = self._emit()
+                self._in_speech = False
+                self._onset_frames = 0
+                self.vad.reset()
+                return utterance
+
+        if len(self._frames) >= self._max_frames:
+            # Keep listening: the caller is still talking
+            self.forced_endpoints += 1
+            return self._emit()
+        return None
+
+    def _emit(self) -> np.ndarray:
+        """Concatenate the buffered utterance and start a new one."""
+        utterance = np.concatenate(self._frames).astype(np.float32, copy=False)
+        self._frames = []
+        self._silence_frames = 0
+        self.utterances += 1
+        return utterance
+
+
 class VADFactory:
     """Factory for creating VAD instances."""
 
@@ -326,7 +548,7 @@ class VADFactory:
         """Create a VAD instance.
 
         Args:
-            backend: VAD backend ("silero" or "simple")
+            backend: VAD backend ("silero", "silero_batched" or "simple")
             threshold: Detection threshold
             **kwargs: Additional arguments for the backend
 
@@ -335,6 +557,10 @@ class VADFactory:
         """
         if backend == "silero":
             return SileroVAD(threshold=threshold, **kwargs)
+        elif backend == "silero_batched":
+            from phone_agent.ai.vad_service import get_vad_service
+
+            return get_vad_service().open_stream(threshold=threshold)
         elif backend == "simple":
             return SimpleVAD(threshold=threshold, **kwargs)
         else:
@@ -346,7 +572,7 @@ def get_vad(backend: str = "silero", **kwargs) -> BaseVAD:
     """Get a VAD instance.
 
     Args:
-        backend: VAD backend ("silero" or "simple")
+        backend: VAD backend ("silero", "silero_batched" or "simple")
         **kwargs: Arguments for the VAD
 
     Returns:
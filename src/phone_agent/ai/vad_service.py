@@ -0,0 +1,498 @@
+"""Batched Silero VAD inference shared by all active calls.
+
+Each call used to own a ``SileroVAD`` that classified one frame at a
+time, so N calls meant N tiny forward passes every 32 ms, each paying
+the full per-call framework overhead. The service instead keeps every
+call's recurrent state and 64-sample context outside the model and, once
+per tick, evaluates the pending windows of all calls in one batched
+forward pass.
+
+Input is resampled to 16 kHz with a per-stream ``StreamingResampler`` and
+sliced into exact 512-sample windows; a remainder waits for the next
+chunk instead of being padded or dropped.
+
+The backend is the ONNX export of Silero VAD (v5), whose recurrent state
+is an explicit model input. The torch.hub JIT module keeps that state
+inside the module, so it cannot serve several calls at once; per-call
+``SileroVAD`` instances remain available for it.
+
+Usage:
+    service = get_vad_service()
+    stream = service.open_stream(threshold=0.5)
+    probs = await stream.probabilities(audio_chunk, sample_rate=8000)
+    stream.close()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from itf_shared import get_logger
+
+from .vad import BaseVAD
+
+log = get_logger(__name__)
+
+
+# Silero VAD v5 at 16 kHz
+SILERO_SAMPLE_RATE = 16000
+SILERO_WINDOW = 512  # 32 ms
+SILERO_CONTEXT = 64  # Samples of the previous window prepended to each input
+SILERO_STATE_SHAPE = (2, 1, 128)
+
+
+class VADBackend(ABC):
+    """Batched Silero forward pass with explicit recurrent state."""
+
+    @abstractmethod
+    def infer(
+        self, inputs: np.ndarray, state: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Run one batched forward pass.
+
+        Args:
+            inputs: (batch, SILERO_CONTEXT + SILERO_WINDOW) float32 samples
+            state: (2, batch, 128) float32 recurrent state
+
+        Returns:
+            Tuple of (speech probabilities of shape (batch,), new state)
+        """
+
+
+class OnnxSileroBackend(VADBackend):
+    """Silero VAD via ONNX Runtime.
+
+    Cheaper per call than the torch model on CPU and, because its state is
+    an input, able to evaluate many independent streams in one pass.
+    """
+
+    def __init__(self, model_path: str | Path, threads: int = 1) -> None:
+        """Initialize ONNX backend.
+
+        Args:
+            model_path: Path to silero_vad.onnx (v5)
+            threads: Intra-op threads for the session
+        """
+        try:
+            import onnxruntime
+        except ImportError:
+            log.error(
+                "onnxruntime not installed. Install with: pip install onnxruntime"
+            )
+            raise
+
+        model_path = Path(model_path)
+        if not model_path.exists():
+            raise FileNotFoundError(
+                f"Silero VAD ONNX model not found at {model_path} "
+                "(download silero_vad.onnx from github.com/snakers4/silero-vad)"
+            )
+
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = threads
+        options.inter_op_num_threads = 1
+        self._session = onnxruntime.InferenceSession(
+            str(model_path),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        self._sr = np.array(SILERO_SAMPLE_RATE, dtype=np.int64)
+
+        log.info("Silero VAD ONNX model loaded", path=str(model_path), threads=threads)
+
+    def infer(
+        self, inputs: np.ndarray, state: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Run one batched forward pass."""
+        output, new_state = self._session.run(
+            None,
+            {"input": inputs, "state": state, "sr": self._sr},
+        )
+        return output.reshape(-1), new_state
+
+
+@dataclass
+class VADServiceConfig:
+    """VAD service configuration."""
+
+    model_path: str = "models/vad/silero_vad.onnx"
+    threads: int = 1  # ONNX Runtime intra-op threads
+    batch_wait_ms: float = 8.0  # Collect requests this long before a tick
+    max_batch_size: int = 256  # Streams per forward pass
+
+
+@dataclass
+class VADServiceStatistics:
+    """Counters of a VAD service."""
+
+    ticks: int = 0
+    passes: int = 0
+    windows: int = 0
+    max_batch: int = 0
+    inference_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        per_window = self.inference_seconds / self.windows if self.windows else 0.0
+        return {
+            "ticks": self.ticks,
+            "passes": self.passes,
+            "windows": self.windows,
+            "mean_batch": round(self.windows / self.passes, 2) if self.passes else 0.0,
+            "max_batch": self.max_batch,
+            "inference_ms_per_window": round(per_window * 1000, 4),
+        }
+
+
+@dataclass
+class _VADRequest:
+    """Windows of one stream waiting for a tick."""
+
+    stream: VADStream
+    windows: list[np.ndarray]
+    future: asyncio.Future[list[float]] | None = None
+    probs: list[float] = field(default_factory=list)
+
+
+class VADStream(BaseVAD):
+    """One call's view of the VAD service.
+
+    Holds the call's recurrent state, window context, resampler and
+    partial window. Implements BaseVAD, so it can be used wherever a VAD
+    is expected; ``classify_async`` goes through the batched tick while
+    ``is_speech`` runs the stream's windows immediately.
+    """
+
+    def __init__(self, service: VADService, threshold: float = 0.5) -> None:
+        """Initialize stream (use VADService.open_stream).
+
+        Args:
+            service: Owning service
+            threshold: Speech probability threshold (0-1)
+        """
+        self.service = service
+        self.threshold = threshold
+        self._resampler: Any = None
+        self._input_rate = SILERO_SAMPLE_RATE
+        self.closed = False
+        self.reset()
+
+    def windows(
+        self, audio: np.ndarray, sample_rate: int = SILERO_SAMPLE_RATE
+    ) -> list[np.ndarray]:
+        """Resample and slice audio into exact 512-sample windows.
+
+        Samples that do not fill a window are kept for the next call.
+
+        Args:
+            audio: Float32 samples
+            sample_rate: Sample rate of audio
+
+        Returns:
+            Complete windows at 16 kHz
+        """
+        audio = np.asarray(audio, dtype=np.float32)
+        if sample_rate != SILERO_SAMPLE_RATE:
+            if self._resampler is None or self._input_rate != sample_rate:
+                from phone_agent.telephony.codecs import StreamingResampler
+
+                self._resampler = StreamingResampler(sample_rate, SILERO_SAMPLE_RATE)
+                self._input_rate = sample_rate
+            audio = self._resampler.process(audio)
+
+        if len(self._pending):
+            audio = np.concatenate((self._pending, audio))
+        usable = len(audio) - len(audio) % SILERO_WINDOW
+        self._pending = audio[usable:].copy()
+        starts = range(0, usable, SILERO_WINDOW)
+        return [audio[start:start + SILERO_WINDOW] for start in starts]
+
+    async def probabilities(
+        self,
+        audio: np.ndarray,
+        sample_rate: int = SILERO_SAMPLE_RATE,
+    ) -> list[float]:
+        """Speech probability of every complete window in audio.
+
+        Args:
+            audio: Float32 samples
+            sample_rate: Sample rate of audio
+
+        Returns:
+            One probability per 32 ms window (may be empty)
+        """
+        windows = self.windows(audio, sample_rate)
+        if not windows:
+            return []
+        return await self.service.submit(self, windows)
+
+    async def classify_async(
+        self,
+        frames: list[np.ndarray],
+        sample_rate: int = SILERO_SAMPLE_RATE,
+    ) -> list[tuple[bool, float]]:
+        """Classify frames in one batched request.
+
+        A frame's probability is the highest of the windows it completed;
+        a frame too short to complete a window repeats the last one.
+        """
+        counts = []
+        windows: list[np.ndarray] = []
+        for frame in frames:
+            frame_windows = self.windows(frame, sample_rate)
+            counts.append(len(frame_windows))
+            windows.extend(frame_windows)
+        probs = await self.service.submit(self, windows) if windows else []
+        return self._per_frame(counts, probs)
+
+    def is_speech(
+        self, audio: np.ndarray, sample_rate: int = 16000
+    ) -> tuple[bool, float]:
+        """Classify audio immediately (unbatched)."""
+        windows = self.windows(audio, sample_rate)
+        if windows:
+            probs = self.service.run_now(self, windows)
+            self._last_prob = max(probs)
+        return self._last_prob > self.threshold, self._last_prob
+
+    def _per_frame(
+        self, counts: list[int], probs: list[float]
+    ) -> list[tuple[bool, float]]:
+        results = []
+        offset = 0
+        for count in counts:
+            if count:
+                self._last_prob = max(probs[offset:offset + count])
+                offset += count
+            results.append((self._last_prob > self.threshold, self._last_prob))
+        return results
+
+    def reset(self) -> None:
+        """Clear recurrent state, context and buffered samples."""
+        self.state = np.zeros(SILERO_STATE_SHAPE, dtype=np.float32)
+        self.context = np.zeros(SILERO_CONTEXT, dtype=np.float32)
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._last_prob = 0.0
+        if self._resampler is not None:
+            self._resampler.reset()
+
+    def close(self) -> None:
+        """Release the stream."""
+        if not self.closed:
+            self.closed = True
+            self.service.close_stream(self)
+
+
+class VADService:
+    """Evaluate Silero VAD windows of all active calls in batched passes.
+
+    Requests arriving within ``batch_wait_ms`` of each other form one tick.
+    A tick runs on a dedicated thread: each pass takes the next window of
+    every stream with pending audio, so a stream's windows are always
+    evaluated in order against its own state. While a tick runs, new
+    requests collect for the next one, so batches grow with load.
+    ``run_now`` evaluates on the caller's thread and waits for a running
+    tick, as both update stream state and counters.
+    """
+
+    def __init__(
+        self,
+        backend: VADBackend | None = None,
+        config: VADServiceConfig | None = None,
+    ) -> None:
+        """Initialize VAD service.
+
+        Args:
+            backend: Batched model (default: ONNX backend from config.model_path,
+                     loaded on first use)
+            config: Service configuration
+        """
+        self.config = config or VADServiceConfig()
+        self._backend = backend
+        self._backend_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vad")
+        self._process_lock = threading.Lock()  # Ticks and run_now calls
+        self._pending: list[_VADRequest] = []
+        self._tick_scheduled = False
+        self._streams: set[VADStream] = set()
+        self._stats = VADServiceStatistics()
+
+    @property
+    def backend(self) -> VADBackend:
+        """The model backend (loaded lazily)."""
+        if self._backend is None:
+            with self._backend_lock:
+                if self._backend is None:
+                    self._backend = OnnxSileroBackend(
+                        self.config.model_path, threads=self.config.threads
+                    )
+        return self._backend
+
+    def open_stream(self, threshold: float = 0.5) -> VADStream:
+        """Register a new call.
+
+        Args:
+            threshold: Speech probability threshold (0-1)
+
+        Returns:
+            Stream with its own recurrent state
+        """
+        stream = VADStream(self, threshold=threshold)
+        self._streams.add(stream)
+        return stream
+
+    def close_stream(self, stream: VADStream) -> None:
+        """Unregister a call."""
+        self._streams.discard(stream)
+
+    async def submit(self, stream: VADStream, windows: list[np.ndarray]) -> list[float]:
+        """Queue a stream's windows for the next tick.
+
+        Args:
+            stream: Requesting stream
+            windows: 512-sample windows at 16 kHz, in order
+
+        Returns:
+            One speech probability per window
+        """
+        loop = asyncio.get_running_loop()
+        request = _VADRequest(
+            stream=stream, windows=windows, future=loop.create_future()
+        )
+        self._pending.append(request)
+        if not self._tick_scheduled:
+            self._tick_scheduled = True
+            loop.call_later(self.config.batch_wait_ms / 1000, self._start_tick, loop)
+        return await request.future
+
+    def run_now(self, stream: VADStream, windows: list[np.ndarray]) -> list[float]:
+        """Evaluate one stream's windows on the calling thread."""
+        request = _VADRequest(stream=stream, windows=windows)
+        self._process([request])
+        return request.probs
+
+    def _start_tick(self, loop: asyncio.AbstractEventLoop) -> None:
+        requests, self._pending = self._pending, []
+        self._tick_scheduled = False
+        if requests:
+            loop.create_task(self._run_tick(requests))
+
+    async def _run_tick(self, requests: list[_VADRequest]) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._executor, self._process, requests)
+        except Exception as e:
+            for request in requests:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+        for request in requests:
+            if not request.future.done():
+                request.future.set_result(request.probs)
+
+    def _process(self, requests: list[_VADRequest]) -> None:
+        """Run batched passes until every request's windows are evaluated."""
+        backend = self.backend
+        with self._process_lock:
+            self._stats.ticks += 1
+
+            # Per stream, requests are served in submission order
+            queues: dict[int, list[_VADRequest]] = {}
+            for request in requests:
+                queues.setdefault(id(request.stream), []).append(request)
+
+            while True:
+                heads = []
+                for queue in queues.values():
+                    while queue and len(queue[0].probs) == len(queue[0].windows):
+                        queue.pop(0)
+                    if queue:
+                        heads.append(queue[0])
+                if not heads:
+                    return
+
+                size = self.config.max_batch_size
+                for start in range(0, len(heads), size):
+                    self._forward(backend, heads[start:start + size])
+
+    def _forward(self, backend: VADBackend, batch: list[_VADRequest]) -> None:
+        """One forward pass over the next window of each request."""
+        inputs = np.empty(
+            (len(batch), SILERO_CONTEXT + SILERO_WINDOW), dtype=np.float32
+        )
+        for i, request in enumerate(batch):
+            inputs[i, :SILERO_CONTEXT] = request.stream.context
+            inputs[i, SILERO_CONTEXT:] = request.windows[len(request.probs)]
+        state = np.concatenate([request.stream.state for request in batch], axis=1)
+
+        began = time.perf_counter()
+        probs, new_state = backend.infer(inputs, state)
+        self._stats.inference_seconds += time.perf_counter() - began
+
+        for i, request in enumerate(batch):
+            stream = request.stream
+            stream.state = np.ascontiguousarray(new_state[:, i:i + 1])
+            stream.context = inputs[i, -SILERO_CONTEXT:].copy()
+            request.probs.append(float(probs[i]))
+
+        self._stats.passes += 1
+        self._stats.windows += len(batch)
+        self._stats.max_batch = max(self._stats.max_batch, len(batch))
+
+    @property
+    def active_streams(self) -> int:
+        """Streams currently open."""
+        return len(self._streams)
+
+    @property
+    def pending_requests(self) -> int:
+        """Requests waiting for the next tick."""
+        return len(self._pending)
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Tick, pass and batch-size counters."""
+        data = self._stats.to_dict()
+        data["active_streams"] = self.active_streams
+        return data
+
+    def shutdown(self) -> None:
+        """Stop the tick thread."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global instance
+_service: VADService | None = None
+_service_lock = threading.Lock()
+
+
+def get_vad_service() -> VADService:
+    """Get the process-wide VAD service."""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = VADService()
+    return _service
+
+
+def peek_vad_service() -> VADService | None:
+    """Get the process-wide VAD service without creating it."""
+    return _service
+
+
+def reset_vad_service() -> None:
+    """Shut down and discard the global service (for testing)."""
+    global _service
+    with _service_lock:
+        if _service is not None:
+            _service.shutdown()
+        _service = None
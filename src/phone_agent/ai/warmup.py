@@ -0,0 +1,314 @@
+"""Parallel startup warmup of the STT, LLM and TTS models.
+
+Loading weights is only part of a cold start: the first inference also
+allocates buffers, compiles kernels and fills caches, and without
+warmup all of it lands on the first caller's turn. The warm pool loads
+each model in its own worker thread and then runs one dummy inference
+on it, recording progress and per-model startup times in the
+AIModelRegistry so health checks and the telephony service can tell
+when the models are ready.
+
+Usage:
+    pool = ModelWarmPool.for_engine(engine, voices=["tr"])
+    task = pool.start()  # runs in the background
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from itf_shared import get_logger
+
+from phone_agent.ai.status import AIModelRegistry, ModelStatus, get_model_registry
+
+if TYPE_CHECKING:
+    from phone_agent.core.conversation import ConversationEngine
+
+log = get_logger(__name__)
+
+
+# Short texts for the dummy TTS inference per voice language
+WARMUP_TEXTS: dict[str, str] = {
+    "de": "Guten Tag.",
+    "tr": "İyi günler.",
+    "ru": "Добрый день.",
+    "en": "Good day.",
+}
+
+
+@dataclass
+class WarmupResult:
+    """Startup timing of one model."""
+
+    name: str  # Registry slot: stt, llm or tts
+    model: str  # Model description for logs
+    load_seconds: float = 0.0
+    warmup_seconds: float = 0.0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the model loaded and warmed without errors."""
+        return self.error is None
+
+    @property
+    def total_seconds(self) -> float:
+        """Load plus warmup time."""
+        return self.load_seconds + self.warmup_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "name": self.name,
+            "model": self.model,
+            "load_seconds": round(self.load_seconds, 3),
+            "warmup_seconds": round(self.warmup_seconds, 3),
+            "error": self.error,
+        }
+
+
+@dataclass
+class _WarmupJob:
+    name: str
+    model: str
+    load: Callable[[], Any]
+    warm: Callable[[], Any] | None
+
+
+class ModelWarmPool:
+    """Loads and warms models in parallel worker threads."""
+
+    def __init__(self, registry: AIModelRegistry | None = None) -> None:
+        """Initialize warm pool.
+
+        Args:
+            registry: Registry to report status to (default: global registry)
+        """
+        self.registry = registry or get_model_registry()
+        self.results: list[WarmupResult] = []
+        self._jobs: list[_WarmupJob] = []
+        self._slots: dict[str, list[WarmupResult]] = {}  # Warm models per slot
+        self._failed: set[str] = set()
+        self._task: asyncio.Task[list[WarmupResult]] | None = None
+
+    def add(
+        self,
+        name: str,
+        model: str,
+        load: Callable[[], Any],
+        warm: Callable[[], Any] | None = None,
+    ) -> None:
+        """Add a model to warm.
+
+        Args:
+            name: Registry slot (stt, llm or tts)
+            model: Model description for logs
+            load: Blocking load function
+            warm: Blocking dummy inference run after loading
+        """
+        self._jobs.append(_WarmupJob(name=name, model=model, load=load, warm=warm))
+
+    async def run(self) -> list[WarmupResult]:
+        """Load and warm all models concurrently.
+
+        Failures are recorded per model and do not stop the others. A
+        registry slot holding several models (the telephony engine's and
+        the shared API instances) is loaded once all of them are, and
+        failed if any of them fails.
+
+        Returns:
+            Startup timing per model, in the order added
+        """
+        self.registry.warmup_enabled = True
+        self._slots = {}
+        self._failed = set()
+        for job in self._jobs:
+            self._slots.setdefault(job.name, [])
+            self.registry.update_status(job.name, ModelStatus.LOADING)
+
+        start = time.monotonic()
+        self.results = list(
+            await asyncio.gather(*(self._run_job(job) for job in self._jobs))
+        )
+        log.info(
+            "Model warmup complete",
+            seconds=round(time.monotonic() - start, 2),
+            readiness=self.registry.readiness,
+            models={r.name: round(r.total_seconds, 2) for r in self.results},
+        )
+        return self.results
+
+    async def _run_job(self, job: _WarmupJob) -> WarmupResult:
+        result = WarmupResult(name=job.name, model=job.model)
+        start = time.monotonic()
+        try:
+            await asyncio.to_thread(job.load)
+            result.load_seconds = time.monotonic() - start
+
+            if job.name not in self._failed:
+                self.registry.update_status(job.name, ModelStatus.WARMING)
+            if job.warm is not None:
+                start = time.monotonic()
+                await asyncio.to_thread(job.warm)
+                result.warmup_seconds = time.monotonic() - start
+        except Exception as e:
+            result.error = str(e)
+            self._failed.add(job.name)
+            self.registry.update_status(job.name, ModelStatus.ERROR, str(e))
+            log.error(
+                "Model warmup failed", model=job.name, name=job.model, error=str(e)
+            )
+            return result
+
+        log.info(
+            "Model warmed",
+            model=job.name,
+            name=job.model,
+            load_s=round(result.load_seconds, 2),
+            warmup_s=round(result.warmup_seconds, 2),
+        )
+        done = self._slots[job.name]
+        done.append(result)
+        slot_size = sum(1 for other in self._jobs if other.name == job.name)
+        if len(done) == slot_size:
+            # The slot is as ready as its slowest model
+            self.registry.record_startup(
+                job.name,
+                max(r.load_seconds for r in done),
+                max(r.warmup_seconds for r in done),
+            )
+            self.registry.update_status(job.name, ModelStatus.LOADED)
+        return result
+
+    def start(self) -> asyncio.Task[list[WarmupResult]]:
+        """Run the warmup as a background task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run(), name="model-warmup")
+        return self._task
+
+    async def stop(self) -> None:
+        """Cancel a running background warmup.
+
+        Worker threads already loading a model finish in the background.
+        """
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def add_models(
+        self,
+        stt: Any,
+        llm: Any,
+        tts: Any,
+        language: str = "de",
+        system_prompt: str | None = None,
+        voices: list[str] | None = None,
+        dialects: list[str] | None = None,
+        warm_cache: Callable[[], Any] | None = None,
+    ) -> None:
+        """Add one STT, LLM and TTS model to warm.
+
+        Args:
+            stt: Speech-to-text model
+            llm: Language model
+            tts: Text-to-speech model
+            language: Default language, always warmed on the TTS
+            system_prompt: System prompt to prime and warm the LLM with
+            voices: Extra TTS voice languages to load and warm
+            dialects: Extra dialect models to load (dialect-aware STT only)
+            warm_cache: Blocking TTS cache prewarm run after the voices
+        """
+
+        def load_stt() -> None:
+            stt.load()
+            if dialects and hasattr(stt, "preload_dialects"):
+                stt.preload_dialects(dialects)
+
+        def warm_stt() -> None:
+            from phone_agent.core.audio import speech_like_noise
+
+            # Voiced signal rather than silence so VAD filtering keeps it
+            stt.transcribe(speech_like_noise("warmup", 1.0), 16000)
+
+        def warm_llm() -> None:
+            if system_prompt and hasattr(llm, "prime_prompt"):
+                llm.prime_prompt(system_prompt)
+            llm.generate("Hallo", system_prompt=system_prompt, max_tokens=1)
+
+        languages = list(dict.fromkeys([language, *(voices or [])]))
+
+        def load_tts() -> None:
+            tts.load()
+            if voices:
+                tts.preload_voices(voices)
+
+        def warm_tts() -> None:
+            for language in languages:
+                tts.synthesize_to_array(
+                    WARMUP_TEXTS.get(language, "Hello."), language=language
+                )
+            if warm_cache is not None:
+                warm_cache()
+
+        self.add("stt", _describe(stt), load_stt, warm_stt)
+        self.add("llm", _describe(llm), llm.load, warm_llm)
+        self.add("tts", _describe(tts, languages), load_tts, warm_tts)
+
+    def add_engine(
+        self,
+        engine: ConversationEngine,
+        voices: list[str] | None = None,
+        dialects: list[str] | None = None,
+    ) -> None:
+        """Add the models of a conversation engine to warm.
+
+        Args:
+            engine: Engine whose STT, LLM and TTS serve calls
+            voices: Extra TTS voice languages to load and warm
+            dialects: Extra dialect models to load (dialect-aware STT only)
+        """
+        self.add_models(
+            engine.stt,
+            engine.llm,
+            engine.tts,
+            language=engine.language,
+            system_prompt=engine.system_prompt,
+            voices=voices,
+            dialects=dialects,
+            warm_cache=engine.warm_tts_cache,
+        )
+
+    @classmethod
+    def for_engine(
+        cls,
+        engine: ConversationEngine,
+        voices: list[str] | None = None,
+        dialects: list[str] | None = None,
+        registry: AIModelRegistry | None = None,
+    ) -> ModelWarmPool:
+        """Warm pool for the models of a conversation engine.
+
+        Args:
+            engine: Engine whose STT, LLM and TTS serve calls
+            voices: Extra TTS voice languages to load and warm
+            dialects: Extra dialect models to load (dialect-aware STT only)
+            registry: Registry to report status to (default: global registry)
+
+        Returns:
+            Pool with one job per model
+        """
+        pool = cls(registry)
+        pool.add_engine(engine, voices=voices, dialects=dialects)
+        return pool
+
+
+def _describe(model: Any, languages: list[str] | None = None) -> str:
+    name = str(getattr(model, "model_name", type(model).__name__))
+    return f"{name} ({', '.join(languages)})" if languages else name
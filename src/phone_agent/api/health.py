@@ -84,10 +84,14 @@ async def readiness_check() -> ReadinessResponse:
     Ready means:
     - Database is connected
     - Core services are initialized
+    - AI models are not still warming up at startup
     - Telephony is configured (if enabled)
     """
     checks: dict[str, str] = {}
 
+    # Calls are held back while the startup warmup runs
+    checks["ai_models"] = get_model_registry().readiness
+
     # Check database
     db_status = await _check_database()
     checks["database"] = db_status if isinstance(db_status, str) else db_status.get("status", "error")
@@ -104,8 +108,8 @@ async def readiness_check() -> ReadinessResponse:
     else:
         checks["telephony"] = "disabled"
 
-    # Ready if database is ok
-    if checks["database"] == "ok":
+    # Ready if database is ok and models are not warming
+    if checks["database"] == "ok" and checks["ai_models"] != "warming":
         return ReadinessResponse(status="ready", checks=checks)
     else:
         return ReadinessResponse(status="not_ready", checks=checks)
@@ -168,12 +172,21 @@ async def _check_database() -> str | dict[str, Any]:
 async def _check_ai_models() -> str | dict[str, Any]:
     """Check if AI models are loaded.
 
-    Returns overall status of STT/LLM/TTS models.
+    Returns overall status of STT/LLM/TTS models, or "warming" with
+    per-model status while the startup warmup runs.
     """
     try:
         registry = get_model_registry()
         overall = registry.get_overall_status()
 
+        if registry.readiness == "warming":
+            status = registry.get_detailed_status()
+            return {
+                "status": "warming",
+                "models": {
+                    name: info["status"] for name, info in status["models"].items()
+                },
+            }
         if overall == "ok":
             return "ok"
         elif overall == "partial":
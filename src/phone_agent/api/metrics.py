@@ -0,0 +1,19 @@
+"""Prometheus metrics endpoint.
+
+Scraped by Prometheus at ``/metrics`` (see monitoring/prometheus.yml).
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from phone_agent.core.prometheus import CONTENT_TYPE, collect
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Expose metrics in the Prometheus text format."""
+    return Response(content=collect(), media_type=CONTENT_TYPE)
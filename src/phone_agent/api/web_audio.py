@@ -35,6 +35,7 @@ from itf_shared import get_logger
 from phone_agent.telephony.websocket_audio import (
     WebSocketAudioHandler,
     WebSocketMessageType,
+    response_samples,
 )
 
 log = get_logger(__name__)
@@ -464,9 +465,43 @@ async def web_audio_websocket(websocket: WebSocket):
         "sample_rate": 16000,
     })
 
-    # Get services
-    from phone_agent.telephony.service import TelephonyService
-    service = TelephonyService()
+    # Sessions are calls of the shared telephony service
+    from phone_agent.dependencies import get_telephony_service
+    from phone_agent.telephony.audio_bridge import create_endpointer
+
+    service = get_telephony_service()
+    endpointer = create_endpointer(service.audio_bridge.config)
+    utterances: asyncio.Queue[np.ndarray] = asyncio.Queue()
+    turns: asyncio.Task[None] | None = None
+
+    async def play(audio: np.ndarray | bytes) -> None:
+        import base64
+
+        samples = response_samples(audio)
+        if len(samples) == 0:
+            return
+        audio_int16 = (samples * 32767).astype(np.int16)
+        await websocket.send_json({
+            "type": "audio",
+            "data": base64.b64encode(audio_int16.tobytes()).decode(),
+        })
+
+    async def run_turns(call_id: UUID) -> None:
+        await service.attach_media_stream(call_id, play)  # Plays the held greeting
+        while True:
+            utterance = await utterances.get()
+            if service.call_handler.get_call(call_id) is None:
+                continue
+            try:
+                response_text = await service.call_handler.handle_utterance(
+                    call_id, utterance
+                )
+                await websocket.send_json({
+                    "type": WebSocketMessageType.RESPONSE.value,
+                    "text": response_text or "",
+                })
+            except Exception:
+                log.exception("Audio processing error")
 
     audio_started = False
     frames_received = 0
@@ -484,11 +519,20 @@ async def web_audio_websocket(websocket: WebSocket):
                 msg_type = data.get("type", "")
 
                 if msg_type == "start":
+                    if turns is not None:
+                        continue
+                    # Create a virtual call for this session
+                    call = await service.start_virtual_call(str(session_id))
+                    if call is None:
+                        await websocket.send_json({
+                            "type": WebSocketMessageType.ERROR.value,
+                            "message": "Call rejected",
+                        })
+                        break
+
                     audio_started = True
                     log.debug(f"Audio stream started: {session_id}")
-
-                    # Create a virtual call for this session
-                    await service.start_virtual_call(str(session_id))
+                    turns = asyncio.create_task(run_turns(call.call_id))
 
                 elif msg_type == "stop":
                     audio_started = False
@@ -505,50 +549,13 @@ async def web_audio_websocket(websocket: WebSocket):
 
             # Handle binary messages (audio data)
             elif "bytes" in message and audio_started:
-                audio_bytes = message["bytes"]
                 frames_received += 1
 
-                # Convert to numpy float32
-                audio = np.frombuffer(audio_bytes, dtype=np.int16)
+                # Convert to numpy float32; complete utterances run as turns
+                audio = np.frombuffer(message["bytes"], dtype=np.int16)
                 audio_float = audio.astype(np.float32) / 32768.0
-
-                # Process through AI pipeline
-                try:
-                    if service.call_handler.is_in_call and service.call_handler.current_call:
-                        result = await service.conversation_engine.process_audio(
-                            audio_float,
-                            service.call_handler.current_call.conversation.id,
-                        )
-
-                        if result:
-                            response_text, response_audio = result
-
-                            # Send transcript
-                            if response_text:
-                                await websocket.send_json({
-                                    "type": "transcript",
-                                    "text": response_text,
-                                    "is_final": True,
-                                })
-
-                            # Send response text
-                            await websocket.send_json({
-                                "type": "response",
-                                "text": response_text or "",
-                            })
-
-                            # Send audio if available
-                            if response_audio is not None and len(response_audio) > 0:
-                                import base64
-                                audio_int16 = (response_audio * 32767).astype(np.int16)
-                                audio_b64 = base64.b64encode(audio_int16.tobytes()).decode()
-                                await websocket.send_json({
-                                    "type": "audio",
-                                    "data": audio_b64,
-                                })
-
-                except Exception:
-                    log.exception("Audio processing error")
+                for utterance in await endpointer.feed_async(audio_float):
+                    utterances.put_nowait(utterance)
 
     except WebSocketDisconnect:
         log.info(f"Web audio session disconnected: {session_id}")
@@ -556,6 +563,10 @@ async def web_audio_websocket(websocket: WebSocket):
         log.error(f"Web audio session error: {e}", session_id=str(session_id))
     finally:
         # Cleanup
+        if turns is not None:
+            turns.cancel()
+            await asyncio.gather(turns, return_exceptions=True)
+        endpointer.vad.close()
         await service.end_virtual_call(str(session_id))
         log.info(f"Web audio session ended: {session_id}")
 
@@ -15,8 +15,10 @@ Security:
 
 from __future__ import annotations
 
+import asyncio
 import base64
 from datetime import datetime
+from collections.abc import Callable
 from typing import Any
 from uuid import UUID
 
@@ -160,6 +162,7 @@ class WebhookResponse(BaseModel):
     call_id: str | None = None
     action: str | None = None
     audio_bridge: dict[str, Any] | None = None
+    rtp: dict[str, Any] | None = None  # Media address for trunks sending RTP directly
     message: str | None = None
 
 
@@ -195,6 +198,7 @@ async def handle_incoming_call(
             caller_id=payload.caller_id,
             callee_id=payload.callee_id,
             metadata=payload.metadata,
+            provider=payload.provider,
         )
 
         return WebhookResponse(
@@ -202,6 +206,7 @@ async def handle_incoming_call(
             call_id=result.get("internal_call_id"),
             action=result.get("action"),
             audio_bridge=result.get("audio_bridge"),
+            rtp=result.get("rtp"),
         )
 
     except Exception as e:
@@ -442,7 +447,6 @@ async def handle_audio_webhook(
     For providers that send audio via HTTP instead of streaming.
     Decodes audio and processes through AI pipeline.
     """
-    import base64
     import numpy as np
 
     log.debug("Audio webhook", call_id=payload.call_id)
@@ -455,12 +459,13 @@ async def handle_audio_webhook(
         audio = np.frombuffer(audio_bytes, dtype=np.int16)
         audio = audio.astype(np.float32) / 32768.0
 
-        # Process through AI
+        # Process through AI, in the conversation of the call it belongs to
         service = get_telephony_service()
-        if service.call_handler.is_in_call and service.call_handler.current_call:
+        call = service.get_external_call(payload.call_id)
+        if call is not None and call.conversation is not None:
             response_text, response_audio = await service.conversation_engine.process_audio(
                 audio,
-                service.call_handler.current_call.conversation.id,
+                call.conversation.id,
             )
 
             # Convert audio to bytes if it's a numpy array
@@ -742,95 +747,149 @@ async def twilio_media_stream(websocket: WebSocket, call_sid: str):
         await websocket.close(code=4001, reason="Invalid call ID")
         return
 
+    # The stream belongs to the call registered by the voice webhook
+    service = get_telephony_service()
+    call = service.get_external_call(call_sid)
+    if call is None or call.conversation is None:
+        log.warning("WebSocket rejected - unknown call", call_sid=call_sid)
+        await websocket.close(code=4004, reason="Unknown call")
+        return
+    call_id = call.call_id
+
     await websocket.accept()
     log.info("Twilio Media Stream connected", call_sid=call_sid)
 
     # Import telephony audio handler
-    from phone_agent.telephony.websocket_audio import TwilioMediaStreamHandler
+    from phone_agent.telephony.audio_bridge import create_endpointer
+    from phone_agent.telephony.websocket_audio import (
+        TwilioMediaStreamHandler,
+        response_samples,
+    )
 
     handler = TwilioMediaStreamHandler()
-    service = get_telephony_service()
-    stream_sid: str | None = None
-
-    try:
+    # Endpointed with the same VAD settings as audio bridge calls
+    endpointer = create_endpointer(service.audio_bridge.config)
+    utterances: asyncio.Queue[np.ndarray] = asyncio.Queue()
+    started: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+
+    async def on_window(stream_sid: str, audio_float: np.ndarray) -> None:
+        if not started.done():
+            started.set_result(stream_sid)
+
+        # Only complete utterances reach the AI pipeline
+        for utterance in await endpointer.feed_async(audio_float):
+            utterances.put_nowait(utterance)
+
+        # Barge-in: the caller talks over the response
+        stream = handler.get_stream(stream_sid)
+        if endpointer.in_speech and stream is not None and stream.playout.playing:
+            await handler.clear(stream_sid)
+
+    async def play(audio: np.ndarray | bytes) -> None:
+        # Sent back as paced 20 ms media events; Twilio's mark echo (or a
+        # barge-in clear) tells when the caller has heard it
+        stream_sid = started.result()
+        samples = response_samples(audio)
+        mark = await handler.send_audio(websocket, stream_sid, samples)
+        if mark is not None:
+            timeout = len(samples) / 16000 + 2.0
+            await handler.wait_for_playback(stream_sid, mark, timeout=timeout)
+
+    async def run_turns() -> None:
+        # Turns run here, in order, so serve() keeps reading media and marks
+        await started
+        await service.attach_media_stream(call_id, play)  # Plays the held greeting
         while True:
-            message = await websocket.receive_json()
-            event = message.get("event", "")
-
-            if event == "connected":
-                log.debug("Twilio stream connected event", call_sid=call_sid)
-
-            elif event == "start":
-                stream_sid = message.get("streamSid", "")
-                start_data = message.get("start", {})
-                log.info(
-                    "Twilio stream started",
-                    call_sid=call_sid,
-                    stream_sid=stream_sid,
-                    media_format=start_data.get("mediaFormat", {}),
+            utterance = await utterances.get()
+            if service.get_external_call(call_sid) is None:
+                continue
+            try:
+                # The call's own state machine runs the turn and plays the
+                # response via play()
+                response_text = await service.call_handler.handle_utterance(
+                    call_id, utterance
                 )
+                log.info("AI response", call_sid=call_sid, text=response_text[:50])
+            except Exception as e:
+                log.error("Twilio turn failed", call_sid=call_sid, error=str(e))
 
-            elif event == "media":
-                if stream_sid:
-                    media = message.get("media", {})
-                    payload = media.get("payload", "")
-
-                    # Decode μ-law audio
-                    mulaw_bytes = base64.b64decode(payload)
-
-                    # Process through AI pipeline
-                    # The handler will decode μ-law → PCM → 16kHz → float32
-                    from phone_agent.telephony.codecs import MuLawCodec, AudioResampler
-
-                    codec = MuLawCodec()
-                    resampler = AudioResampler(8000, 16000)
-
-                    # Decode and resample
-                    pcm_8k = codec.decode(mulaw_bytes)
-                    pcm_16k = resampler.resample(pcm_8k)
-                    audio_float = pcm_16k.astype(np.float32) / 32768.0
-
-                    # Process through AI if call is active
-                    if service.call_handler.is_in_call and service.call_handler.current_call:
-                        response_text, response_audio = await service.conversation_engine.process_audio(
-                            audio_float,
-                            service.call_handler.current_call.conversation.id,
-                        )
-
-                        if response_audio is not None and len(response_audio) > 0:
-                            # Resample and encode response
-                            down_resampler = AudioResampler(16000, 8000)
-                            response_8k = down_resampler.resample(
-                                (response_audio * 32767).astype(np.int16)
-                            )
-                            response_mulaw = codec.encode(response_8k)
-
-                            # Send back to Twilio
-                            await websocket.send_json({
-                                "event": "media",
-                                "streamSid": stream_sid,
-                                "media": {
-                                    "payload": base64.b64encode(response_mulaw).decode("utf-8")
-                                }
-                            })
-
-            elif event == "stop":
-                log.info("Twilio stream stopped", call_sid=call_sid)
-                break
-
-            elif event == "mark":
-                # Twilio mark event (for synchronization)
-                mark_name = message.get("mark", {}).get("name", "")
-                log.debug("Twilio mark received", mark=mark_name)
+    handler.on_audio(on_window)
+    turns = asyncio.create_task(run_turns())
+
+    try:
+        # Decodes μ-law → PCM → 16kHz → float32 and hands the audio to
+        # on_window in 100 ms windows until Twilio stops the stream
+        await handler.serve(websocket)
 
     except WebSocketDisconnect:
         log.info("Twilio Media Stream disconnected", call_sid=call_sid)
     except Exception as e:
         log.error("Twilio Media Stream error", call_sid=call_sid, error=str(e))
     finally:
+        turns.cancel()
+        await asyncio.gather(turns, return_exceptions=True)
+        endpointer.vad.close()
         await service.handle_webhook_hangup(call_sid)
 
 
+async def _serve_audio_socket(
+    websocket: WebSocket,
+    call_id: UUID,
+    decode: Callable[[bytes], np.ndarray],
+    encode: Callable[[np.ndarray], bytes],
+) -> None:
+    """Run a call's turns over a binary audio WebSocket.
+
+    Incoming frames are endpointed with the audio bridge's VAD settings
+    and each utterance runs as a turn of the call the socket belongs to;
+    responses go back as one binary frame each.
+
+    Args:
+        websocket: Accepted WebSocket carrying the call's audio
+        call_id: Internal call ID
+        decode: Converts a received frame to 16 kHz float32 samples
+        encode: Converts 16 kHz float32 response samples to a frame
+    """
+    from phone_agent.telephony.audio_bridge import create_endpointer
+    from phone_agent.telephony.websocket_audio import response_samples
+
+    service = get_telephony_service()
+    endpointer = create_endpointer(service.audio_bridge.config)
+    utterances: asyncio.Queue[np.ndarray] = asyncio.Queue()
+
+    async def play(audio: np.ndarray | bytes) -> None:
+        await websocket.send_bytes(encode(response_samples(audio)))
+
+    async def run_turns() -> None:
+        await service.attach_media_stream(call_id, play)  # Plays the held greeting
+        while True:
+            utterance = await utterances.get()
+            if service.call_handler.get_call(call_id) is None:
+                continue
+            try:
+                response_text = await service.call_handler.handle_utterance(
+                    call_id, utterance
+                )
+                log.info("AI response", call_id=str(call_id), text=response_text[:50])
+            except Exception as e:
+                log.error(
+                    "Audio socket turn failed", call_id=str(call_id), error=str(e)
+                )
+
+    turns = asyncio.create_task(run_turns())
+    try:
+        while True:
+            data = await websocket.receive_bytes()
+            if not data:
+                continue
+            for utterance in await endpointer.feed_async(decode(data)):
+                utterances.put_nowait(utterance)
+    finally:
+        turns.cancel()
+        await asyncio.gather(turns, return_exceptions=True)
+        endpointer.vad.close()
+
+
 @router.websocket("/webhooks/sipgate/audio/{call_id}")
 async def sipgate_audio_stream(websocket: WebSocket, call_id: str):
     """sipgate audio WebSocket endpoint.
@@ -839,6 +898,14 @@ async def sipgate_audio_stream(websocket: WebSocket, call_id: str):
 
     Audio format: G.711 A-law (PCMA), 8kHz, mono
     """
+    # The stream belongs to the call registered by the incoming webhook
+    service = get_telephony_service()
+    call = service.get_external_call(call_id)
+    if call is None or call.conversation is None:
+        log.warning("sipgate audio stream rejected - unknown call", call_id=call_id)
+        await websocket.close(code=4004, reason="Unknown call")
+        return
+
     await websocket.accept()
     log.info("sipgate audio stream connected", call_id=call_id)
 
@@ -847,39 +914,17 @@ async def sipgate_audio_stream(websocket: WebSocket, call_id: str):
     codec = ALawCodec()
     up_resampler = AudioResampler(8000, 16000)
     down_resampler = AudioResampler(16000, 8000)
-    service = get_telephony_service()
 
-    try:
-        while True:
-            # Receive binary audio data
-            data = await websocket.receive_bytes()
-
-            if not data:
-                continue
-
-            # Decode A-law to PCM
-            pcm_8k = codec.decode(data)
-
-            # Resample to 16kHz for AI
-            pcm_16k = up_resampler.resample(pcm_8k)
-            audio_float = pcm_16k.astype(np.float32) / 32768.0
-
-            # Process through AI
-            if service.call_handler.is_in_call and service.call_handler.current_call:
-                response_text, response_audio = await service.conversation_engine.process_audio(
-                    audio_float,
-                    service.call_handler.current_call.conversation.id,
-                )
+    def decode(data: bytes) -> np.ndarray:
+        # A-law → PCM → 16kHz float32 for the AI
+        pcm_16k = up_resampler.resample(codec.decode(data))
+        return pcm_16k.astype(np.float32) / 32768.0
 
-                if response_audio is not None and len(response_audio) > 0:
-                    # Resample to 8kHz and encode
-                    response_8k = down_resampler.resample(
-                        (response_audio * 32767).astype(np.int16)
-                    )
-                    response_alaw = codec.encode(response_8k)
+    def encode(audio: np.ndarray) -> bytes:
+        return codec.encode(down_resampler.resample((audio * 32767).astype(np.int16)))
 
-                    # Send back
-                    await websocket.send_bytes(response_alaw)
+    try:
+        await _serve_audio_socket(websocket, call.call_id, decode, encode)
 
     except WebSocketDisconnect:
         log.info("sipgate audio stream disconnected", call_id=call_id)
@@ -896,34 +941,24 @@ async def generic_audio_websocket(websocket: WebSocket, call_id: str):
     Used for development testing and generic integrations.
     Audio format: 16-bit PCM, 16kHz, mono (raw bytes)
     """
-    await websocket.accept()
-    log.info("Generic WebSocket audio connected", call_id=call_id)
-
     service = get_telephony_service()
+    call = service.get_external_call(call_id)
+    if call is None or call.conversation is None:
+        log.warning("Generic WebSocket rejected - unknown call", call_id=call_id)
+        await websocket.close(code=4004, reason="Unknown call")
+        return
 
-    try:
-        while True:
-            # Receive raw PCM audio
-            data = await websocket.receive_bytes()
-
-            if not data:
-                continue
+    await websocket.accept()
+    log.info("Generic WebSocket audio connected", call_id=call_id)
 
-            # Convert to numpy
-            audio = np.frombuffer(data, dtype=np.int16)
-            audio = audio.astype(np.float32) / 32768.0
+    def decode(data: bytes) -> np.ndarray:
+        return np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
 
-            # Process through AI
-            if service.call_handler.is_in_call and service.call_handler.current_call:
-                response_text, response_audio = await service.conversation_engine.process_audio(
-                    audio,
-                    service.call_handler.current_call.conversation.id,
-                )
+    def encode(audio: np.ndarray) -> bytes:
+        return (audio * 32767).astype(np.int16).tobytes()
 
-                if response_audio is not None and len(response_audio) > 0:
-                    # Send back as raw PCM
-                    response_bytes = (response_audio * 32767).astype(np.int16).tobytes()
-                    await websocket.send_bytes(response_bytes)
+    try:
+        await _serve_audio_socket(websocket, call.call_id, decode, encode)
 
     except WebSocketDisconnect:
         log.info("Generic WebSocket disconnected", call_id=call_id)
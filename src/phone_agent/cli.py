@@ -9,7 +9,7 @@ Usage:
     python -m phone_agent.cli chat            # Interactive text chat
     python -m phone_agent.cli voice-chat      # Interactive VOICE chat
     python -m phone_agent.cli list-devices    # List audio devices
-    python -m phone_agent.cli benchmark       # Benchmark latency
+    python -m phone_agent.cli benchmark       # Benchmark the voice pipeline
 """
 
 from __future__ import annotations
@@ -286,112 +286,91 @@ def interactive_chat(args: argparse.Namespace) -> int:
 
 
 def benchmark(args: argparse.Namespace) -> int:
-    """Benchmark latency of components."""
-    print("\n=== Latency Benchmark ===\n")
+    """Benchmark the full pipeline on the test corpus.
 
-    from phone_agent.ai import SpeechToText, LanguageModel, TextToSpeech
-    from phone_agent.config import get_settings
-    import numpy as np
-
-    settings = get_settings()
-    results = {}
+    Exits with 1 if a baseline is given and any metric regressed.
+    """
+    import json
 
-    # Benchmark STT
-    print("Benchmarking STT...")
-    stt = SpeechToText(
-        model=settings.ai.stt.model,
-        model_path=settings.ai.stt.model_path,
-        device=settings.ai.stt.device,
-        compute_type=settings.ai.stt.compute_type,
+    from phone_agent.ai import InferenceScheduler, SchedulerConfig
+    from phone_agent.core.benchmark import (
+        BenchmarkConfig,
+        PipelineBenchmark,
+        compare_reports,
+        format_report,
+        load_corpus,
     )
-    stt.load()
-
-    # Generate 5 seconds of random audio
-    audio = np.random.randn(16000 * 5).astype(np.float32) * 0.1
-
-    times = []
-    for i in range(args.iterations):
-        start = time.time()
-        stt.transcribe(audio, 16000)
-        times.append(time.time() - start)
-
-    results["STT (5s audio)"] = {
-        "mean": np.mean(times),
-        "std": np.std(times),
-        "min": np.min(times),
-        "max": np.max(times),
-    }
-    stt.unload()
-
-    # Benchmark LLM
-    print("Benchmarking LLM...")
-    llm = LanguageModel(
-        model=settings.ai.llm.model,
-        model_path=settings.ai.llm.model_path,
-        n_ctx=settings.ai.llm.n_ctx,
-        n_threads=settings.ai.llm.n_threads,
+    from phone_agent.core.conversation import ConversationEngine
+
+    languages = args.languages.split(",") if args.languages else None
+    concurrency = [int(level) for level in args.concurrency.split(",")]
+
+    # One set of models shared by the engines of all languages
+    scheduler = InferenceScheduler(SchedulerConfig(max_workers=args.workers))
+    base = ConversationEngine(dialect_aware=False, scheduler=scheduler)
+    engines = {base.language: base}
+
+    def engine_for(language: str) -> ConversationEngine:
+        if language not in engines:
+            engines[language] = ConversationEngine(
+                stt=base.stt,
+                llm=base.llm,
+                tts=base.tts,
+                language=language,
+                scheduler=scheduler,
+            )
+        return engines[language]
+
+    corpus = load_corpus(
+        args.corpus, languages=languages, tts=None if args.no_synthesize else base.tts
     )
-    llm.load()
+    print(f"Loaded {len(corpus)} utterances from {args.corpus}", file=sys.stderr)
 
-    prompt = "Ich möchte einen Termin vereinbaren."
-    system = "Du bist ein Telefonassistent. Antworte kurz."
-
-    times = []
-    for i in range(args.iterations):
-        start = time.time()
-        llm.generate(prompt, system_prompt=system, max_tokens=50)
-        times.append(time.time() - start)
-
-    results["LLM (50 tokens)"] = {
-        "mean": np.mean(times),
-        "std": np.std(times),
-        "min": np.min(times),
-        "max": np.max(times),
-    }
-    llm.unload()
-
-    # Benchmark TTS
-    print("Benchmarking TTS...")
-    tts = TextToSpeech(
-        model=settings.ai.tts.model,
-        model_path=settings.ai.tts.model_path,
+    config = BenchmarkConfig(
+        concurrency=concurrency,
+        passes=args.passes,
+        mode=args.mode,
+        warmup_turns=args.warmup,
     )
-    tts.load()
-
-    text = "Ich kann Ihnen einen Termin am Dienstag um zehn Uhr anbieten."
-
-    times = []
-    for i in range(args.iterations):
-        start = time.time()
-        tts.synthesize(text)
-        times.append(time.time() - start)
-
-    results["TTS (short)"] = {
-        "mean": np.mean(times),
-        "std": np.std(times),
-        "min": np.min(times),
-        "max": np.max(times),
-    }
-    tts.unload()
-
-    # Print results
-    print("\n" + "=" * 60)
-    print(f"{'Component':<20} {'Mean':>10} {'Std':>10} {'Min':>10} {'Max':>10}")
-    print("=" * 60)
-
-    total_mean = 0
-    for name, stats in results.items():
-        print(
-            f"{name:<20} {stats['mean']:>9.2f}s {stats['std']:>9.2f}s "
-            f"{stats['min']:>9.2f}s {stats['max']:>9.2f}s"
-        )
-        total_mean += stats["mean"]
+    try:
+        bench = PipelineBenchmark(engine_for, config)
+        report = asyncio.run(bench.run(corpus)).to_dict()
+    finally:
+        scheduler.shutdown(wait=False)
 
-    print("-" * 60)
-    print(f"{'Total Pipeline':<20} {total_mean:>9.2f}s")
-    print("=" * 60)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_report(report))
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Report written to {args.output}", file=sys.stderr)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        try:
+            regressions = compare_reports(
+                report,
+                baseline,
+                tolerance=args.tolerance,
+                min_delta_ms=args.min_delta_ms,
+            )
+        except ValueError as e:
+            print(f"[FAIL] Cannot compare with baseline: {e}", file=sys.stderr)
+            return 1
+        if regressions:
+            print(
+                f"\n[FAIL] {len(regressions)} regression(s) against {args.baseline}:",
+                file=sys.stderr,
+            )
+            for regression in regressions:
+                print(f"  {regression}", file=sys.stderr)
+            return 1
+        print(f"\n[OK] No regressions against {args.baseline}", file=sys.stderr)
 
-    print("\n[OK] Benchmark complete")
     return 0
 
 
@@ -746,7 +725,8 @@ def _voice_chat_with_engine(
                     if len(sentences_played) == 1:
                         print(f"\nAssistant: ", end="", flush=True)
                     print(f"{sentence} ", end="", flush=True)
-                    _play_audio(audio_bytes, output_device)
+                    # Off the event loop, so the next sentence is synthesized meanwhile
+                    await asyncio.to_thread(_play_audio, audio_bytes, output_device)
 
                 user_text, full_response, _ = await engine.process_audio_streaming(
                     audio,
@@ -903,9 +883,62 @@ def main() -> int:
     subparsers.add_parser("list-devices", help="List available audio devices")
 
     # benchmark
-    bench_parser = subparsers.add_parser("benchmark", help="Benchmark latency")
+    bench_parser = subparsers.add_parser(
+        "benchmark", help="Benchmark the full pipeline on the test corpus"
+    )
+    bench_parser.add_argument(
+        "--corpus", default="tests/load/corpus",
+        help="Corpus directory with manifest.json (default: tests/load/corpus)"
+    )
+    bench_parser.add_argument(
+        "--languages", default=None, help="Comma-separated languages (default: all)"
+    )
+    bench_parser.add_argument(
+        "--concurrency", default="1,2,4",
+        help="Comma-separated concurrent call levels (default: 1,2,4)"
+    )
+    bench_parser.add_argument(
+        "--mode", choices=["warm", "cold"], default="warm",
+        help="warm: load models once and warm up; cold: reload models per level"
+    )
+    bench_parser.add_argument(
+        "--passes",
+        type=int,
+        default=2,
+        help="Passes over the corpus per level (default: 2)",
+    )
+    bench_parser.add_argument(
+        "--warmup",
+        type=int,
+        default=2,
+        help="Unmeasured warm-up turns per level (default: 2)",
+    )
+    bench_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Inference worker threads (default: auto)",
+    )
+    bench_parser.add_argument(
+        "--no-synthesize", action="store_true",
+        help="Use synthetic noise instead of TTS for utterances without audio"
+    )
+    bench_parser.add_argument("--json", action="store_true", help="Output as JSON")
+    bench_parser.add_argument(
+        "--output", default=None, help="Write the JSON report to a file"
+    )
+    bench_parser.add_argument(
+        "--baseline",
+        default=None,
+        help="Baseline report; regressions exit with status 1",
+    )
+    bench_parser.add_argument(
+        "--tolerance", type=float, default=0.15,
+        help="Allowed relative slowdown against the baseline (default: 0.15)"
+    )
     bench_parser.add_argument(
-        "--iterations", type=int, default=3, help="Number of iterations"
+        "--min-delta-ms", type=float, default=5.0,
+        help="Latency increases below this are ignored (default: 5)"
     )
 
     # metrics
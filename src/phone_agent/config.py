@@ -67,6 +67,7 @@ class AILLMSettings(BaseModel):
     n_gpu_layers: int = 0
     temperature: float = 0.7
     max_tokens: int = 256
+    prompt_cache_mb: int = 256  # Cached prompt states (0 disables)
 
 
 class AITTSSettings(BaseModel):
@@ -90,6 +91,11 @@ class AITTSSettings(BaseModel):
     # Preload voices on startup (empty = lazy loading)
     preload_voices: list[str] = []
 
+    # Phrase audio cache (0 disables); disk tier keeps audio across restarts
+    phrase_cache_mb: int = 64
+    phrase_cache_path: str | None = None
+    phrase_cache_disk_mb: int = 512
+
 
 class CloudAISettings(BaseModel):
     """Cloud AI provider configuration.
@@ -218,6 +224,7 @@ class TelephonySettings(BaseModel):
     """Telephony subsystem configuration."""
 
     enabled: bool = False
+    max_concurrent_calls: int = 10
     sip: SIPSettings = Field(default_factory=SIPSettings)
     audio: AudioSettings = Field(default_factory=AudioSettings)
     freeswitch: FreeSwitchSettings = Field(default_factory=FreeSwitchSettings)
@@ -233,6 +240,15 @@ class DatabaseSettings(BaseModel):
     echo: bool = False
 
 
+class TracingSettings(BaseModel):
+    """Per-turn tracing configuration."""
+
+    enabled: bool = True
+    sample_rate: float = 0.01  # Share of turns exported regardless of speed
+    slow_turn_ms: float = 2000.0  # Slower turns are always exported
+    export_path: str | None = None  # JSON lines file, e.g. "data/traces.jsonl"
+
+
 class TriageLevel(BaseModel):
     """Triage urgency level definition."""
 
@@ -387,7 +403,8 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
 
     # AI Model Loading
-    preload_ai_models: bool = False  # Set to True to preload models at startup
+    preload_ai_models: bool = False  # True: warm models in the background at startup
+    model_warmup_wait_s: float = 10.0  # Max wait for warmup before a call is refused
 
     # Remote Management
     remote_enabled: bool = True
@@ -400,6 +417,7 @@ class Settings(BaseSettings):
     telephony: TelephonySettings = Field(default_factory=TelephonySettings)
     industry: IndustrySettings = Field(default_factory=IndustrySettings)
     integrations: IntegrationsSettings = Field(default_factory=IntegrationsSettings)
+    tracing: TracingSettings = Field(default_factory=TracingSettings)
 
     # Convenience properties for webhook security
     @property
@@ -2,14 +2,29 @@
 
 from phone_agent.core.audio import AudioPipeline, AudioConfig
 from phone_agent.core.conversation import ConversationEngine
-from phone_agent.core.call_handler import CallHandler, CallState
+from phone_agent.core.call_handler import CallContext, CallHandler, CallState
+from phone_agent.core.response_pipeline import (
+    PipelineConfig,
+    PipelineResult,
+    ResponsePipeline,
+    StageTimings,
+)
 from phone_agent.core.metrics import (
     LatencyMetrics,
     ComponentMetrics,
+    LatencyHistogram,
     TurnMetrics,
     get_metrics,
     reset_metrics,
 )
+from phone_agent.core.tracing import (
+    Trace,
+    Tracer,
+    TracingConfig,
+    get_tracer,
+    set_tracer,
+    span,
+)
 from phone_agent.core.exceptions import (
     PhoneAgentError,
     DatabaseError,
@@ -20,6 +35,8 @@ from phone_agent.core.exceptions import (
     SIPConnectionError,
     CallError,
     CallNotFoundError,
+    CallCapacityError,
+    ServiceNotReadyError,
     AIError,
     ModelNotLoadedError,
     IntegrationError,
@@ -52,14 +69,27 @@ __all__ = [
     "AudioPipeline",
     "AudioConfig",
     "ConversationEngine",
+    "CallContext",
     "CallHandler",
     "CallState",
+    "ResponsePipeline",
+    "PipelineConfig",
+    "PipelineResult",
+    "StageTimings",
     # Metrics
     "LatencyMetrics",
     "ComponentMetrics",
+    "LatencyHistogram",
     "TurnMetrics",
     "get_metrics",
     "reset_metrics",
+    # Tracing
+    "Trace",
+    "Tracer",
+    "TracingConfig",
+    "get_tracer",
+    "set_tracer",
+    "span",
     # Exceptions
     "PhoneAgentError",
     "DatabaseError",
@@ -70,6 +100,8 @@ __all__ = [
     "SIPConnectionError",
     "CallError",
     "CallNotFoundError",
+    "CallCapacityError",
+    "ServiceNotReadyError",
     "AIError",
     "ModelNotLoadedError",
     "IntegrationError",
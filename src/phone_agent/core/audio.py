@@ -10,6 +10,7 @@ Handles real-time audio I/O for the phone agent, including:
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import queue
 import threading
 from dataclasses import dataclass, field
@@ -72,6 +73,11 @@ class AudioPipeline:
         # Audio buffers
         self._capture_queue: queue.Queue[AudioChunk] = queue.Queue()
         self._playback_queue: queue.Queue[np.ndarray] = queue.Queue()
+        self._playback_lock = threading.Lock()
+        self._playback_pending = 0  # Queued or playing buffers
+        self._playback_idle = threading.Event()
+        self._playback_idle.set()
+        self._playback_available = True
         self._utterance_buffer: list[np.ndarray] = []
 
         # State
@@ -276,22 +282,51 @@ class AudioPipeline:
             while self._running:
                 try:
                     audio = self._playback_queue.get(timeout=0.5)
-                    sd.play(audio, self.config.sample_rate, device=self.config.output_device)
-                    sd.wait()
                 except queue.Empty:
                     continue
+                try:
+                    device = self.config.output_device
+                    sd.play(audio, self.config.sample_rate, device=device)
+                    sd.wait()
+                finally:
+                    self._playback_done(1)
 
         except ImportError:
             log.error("sounddevice not installed - audio playback disabled")
         except Exception as e:
             log.error("Audio playback error", error=str(e))
 
-    def play(self, audio: np.ndarray | bytes, sample_rate: int | None = None) -> None:
+        # Nothing will play any more: release waiters
+        self._playback_available = False
+        self._drain_playback_queue()
+
+    def _playback_done(self, count: int) -> None:
+        """Mark queued buffers as finished (played or discarded)."""
+        with self._playback_lock:
+            self._playback_pending = max(0, self._playback_pending - count)
+            if self._playback_pending == 0:
+                self._playback_idle.set()
+
+    def _drain_playback_queue(self) -> None:
+        """Discard all buffers that have not started playing."""
+        drained = 0
+        while True:
+            try:
+                self._playback_queue.get_nowait()
+            except queue.Empty:
+                break
+            drained += 1
+        self._playback_done(drained)
+
+    def play(self, audio: np.ndarray | bytes, sample_rate: int | None = None) -> float:
         """Queue audio for playback.
 
         Args:
             audio: Audio data as numpy array or WAV bytes
             sample_rate: Sample rate (required if audio is raw samples)
+
+        Returns:
+            Duration of the queued audio in seconds
         """
         if isinstance(audio, bytes):
             # Parse WAV
@@ -315,7 +350,38 @@ class AudioPipeline:
             samples = int(len(audio_array) * self.config.sample_rate / sample_rate)
             audio_array = signal.resample(audio_array, samples)
 
+        duration = len(audio_array) / self.config.sample_rate
+        if not self._playback_available:
+            return duration
+
+        with self._playback_lock:
+            self._playback_pending += 1
+            self._playback_idle.clear()
         self._playback_queue.put(audio_array)
+        return duration
+
+    def stop_playback(self) -> None:
+        """Stop the current playback and discard queued audio (barge-in)."""
+        self._drain_playback_queue()
+        try:
+            import sounddevice as sd
+
+            sd.stop()
+        except ImportError:
+            pass
+
+    async def wait_for_playback(self, timeout: float | None = None) -> bool:
+        """Wait until all queued audio has been played or stopped.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if playback finished, False on timeout
+        """
+        if self._playback_idle.is_set():
+            return True
+        return await asyncio.to_thread(self._playback_idle.wait, timeout)
 
     def on_utterance(self, callback: Callable[[np.ndarray], None]) -> None:
         """Set callback for when an utterance is detected.
@@ -368,3 +434,25 @@ class AudioPipeline:
     def is_speaking(self) -> bool:
         """Check if speech is currently detected."""
         return self._is_speaking
+
+
+def speech_like_noise(key: str, seconds: float, sample_rate: int = 16000) -> np.ndarray:
+    """Deterministic voiced-sounding signal (harmonics gated into syllables).
+
+    Args:
+        key: Seed (the same key always yields the same audio)
+        seconds: Duration
+        sample_rate: Sample rate
+
+    Returns:
+        float32 audio
+    """
+    seed = int.from_bytes(hashlib.sha256(key.encode()).digest()[:8], "little")
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    f0 = rng.uniform(90, 220) * (1 + 0.05 * np.sin(2 * np.pi * 0.7 * t))
+    phase = 2 * np.pi * np.cumsum(f0) / sample_rate
+    signal = sum(np.sin(k * phase) / k for k in range(1, 8))
+    syllables = np.clip(np.sin(2 * np.pi * rng.uniform(3.0, 5.0) * t), 0, None)
+    signal = signal * syllables + rng.standard_normal(len(t)) * 0.01
+    return (signal / np.abs(signal).max() * 0.4).astype(np.float32)
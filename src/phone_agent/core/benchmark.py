@@ -0,0 +1,619 @@
+"""Offline benchmark of the full voice pipeline.
+
+Replays a corpus of test utterances through ``ConversationEngine`` at
+increasing concurrency and reports, per concurrency level:
+
+- p50/p95/p99 of every pipeline stage (taken from the turn traces, see
+  ``phone_agent.core.tracing``), of time-to-first-audio and of the turn
+- realtime factors of STT (compute time / input audio) and TTS
+  (synthesis time / output audio)
+- CPU seconds, CPU utilisation, throughput and memory (RSS)
+
+Reports are JSON-serializable and can be compared against a stored
+baseline; any metric that got slower than the tolerance allows is a
+regression.
+
+Corpus layout (``manifest.json`` next to the audio files)::
+
+    {"utterances": [
+        {"id": "de-termin-1", "language": "de",
+         "text": "Ich hätte gern einen Termin.", "audio": "de/termin-1.wav"}
+    ]}
+
+Missing audio files are generated from ``text`` with the pipeline's own
+TTS (and written to ``audio`` so later runs use identical input), or,
+without a TTS, replaced by deterministic speech-like noise.
+
+Usage:
+    corpus = load_corpus("tests/load/corpus", tts=engine.tts)
+    config = BenchmarkConfig(concurrency=[1, 4])
+    bench = PipelineBenchmark(lambda language: engine, config)
+    report = await bench.run(corpus)
+    regressions = compare_reports(report.to_dict(), baseline)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import platform
+import time
+import wave
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from itf_shared import get_logger
+
+from phone_agent.core.audio import speech_like_noise
+from phone_agent.core.metrics import LatencyHistogram
+from phone_agent.core.tracing import (
+    Trace,
+    Tracer,
+    TracingConfig,
+    get_tracer,
+    set_tracer,
+)
+
+if TYPE_CHECKING:
+    from phone_agent.core.conversation import ConversationEngine
+
+log = get_logger(__name__)
+
+REPORT_VERSION = 1
+PERCENTILES = {"p50": 0.50, "p95": 0.95, "p99": 0.99}
+
+# Derived per-turn measurements reported next to the traced stages
+TURN = "turn"
+TIME_TO_FIRST_AUDIO = "time_to_first_audio"
+
+
+@dataclass
+class Utterance:
+    """One test utterance of the corpus."""
+
+    id: str
+    language: str
+    audio: np.ndarray  # float32, -1 to 1
+    sample_rate: int
+    text: str | None = None
+    source: str = "recorded"  # "recorded", "tts" or "noise"
+
+    @property
+    def duration(self) -> float:
+        """Audio duration in seconds."""
+        return len(self.audio) / self.sample_rate
+
+
+def read_wav(path: str | Path) -> tuple[np.ndarray, int]:
+    """Read a 16-bit PCM WAV file as mono float32."""
+    with wave.open(str(path), "rb") as wav:
+        channels = wav.getnchannels()
+        if wav.getsampwidth() != 2:
+            raise ValueError(f"{path}: only 16-bit PCM is supported")
+        audio = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+        sample_rate = wav.getframerate()
+    if channels > 1:
+        audio = audio.reshape(-1, channels).mean(axis=1)
+    return audio.astype(np.float32) / 32768.0, sample_rate
+
+
+def write_wav(path: str | Path, audio: np.ndarray, sample_rate: int) -> None:
+    """Write mono float32 audio as a 16-bit PCM WAV file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm.tobytes())
+
+
+def load_corpus(
+    path: str | Path,
+    languages: list[str] | None = None,
+    tts: Any = None,
+) -> list[Utterance]:
+    """Load the utterances listed in a corpus manifest.
+
+    Args:
+        path: Corpus directory (containing manifest.json) or manifest file
+        languages: Only load these languages (default: all)
+        tts: Engine used to generate missing audio from the text; the
+            result is written to the manifest's audio path
+
+    Returns:
+        Utterances in manifest order
+    """
+    manifest_path = Path(path)
+    if manifest_path.is_dir():
+        manifest_path = manifest_path / "manifest.json"
+    root = manifest_path.parent
+    entries = json.loads(manifest_path.read_text(encoding="utf-8"))["utterances"]
+
+    corpus = []
+    for entry in entries:
+        language = entry.get("language", "de")
+        if languages and language not in languages:
+            continue
+        audio_path = root / entry["audio"] if entry.get("audio") else None
+        text = entry.get("text")
+
+        if audio_path is not None and audio_path.exists():
+            audio, sample_rate = read_wav(audio_path)
+            source = entry.get("source", "recorded")
+        elif tts is not None and text:
+            audio = tts.synthesize_to_array(text, language=language)
+            sample_rate = tts.sample_rate
+            source = "tts"
+            if audio_path is not None:
+                write_wav(audio_path, audio, sample_rate)
+                log.info(
+                    "Synthesized corpus utterance", id=entry["id"], path=str(audio_path)
+                )
+        else:
+            # About 13 characters per second of speech
+            seconds = float(entry.get("seconds") or max(1.0, len(text or "") / 13))
+            sample_rate = 16000
+            audio = speech_like_noise(entry["id"], seconds, sample_rate)
+            source = "noise"
+
+        corpus.append(Utterance(
+            id=entry["id"],
+            language=language,
+            audio=audio,
+            sample_rate=sample_rate,
+            text=text,
+            source=source,
+        ))
+    return corpus
+
+
+def corpus_fingerprint(corpus: list[Utterance]) -> str:
+    """Hash of the corpus audio, so reports are only compared on equal input."""
+    digest = hashlib.sha256()
+    for utterance in corpus:
+        digest.update(utterance.id.encode())
+        digest.update(str(utterance.sample_rate).encode())
+        digest.update(np.ascontiguousarray(utterance.audio).tobytes())
+    return digest.hexdigest()[:16]
+
+
+@dataclass
+class BenchmarkConfig:
+    """Benchmark configuration."""
+
+    concurrency: list[int] = field(default_factory=lambda: [1])
+    passes: int = 2  # Passes over the corpus per concurrency level
+    mode: str = "warm"  # "warm": load once and warm up; "cold": reload per level
+    warmup_turns: int = 2  # Unmeasured turns per level (warm mode only)
+
+
+@dataclass
+class ResourceUsage:
+    """Process resources used while running one concurrency level."""
+
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    rss_mb: float | None = None
+    peak_rss_mb: float | None = None
+
+    @property
+    def cpu_utilization(self) -> float:
+        """CPU seconds per wall second (1.0 = one core busy)."""
+        return self.cpu_s / self.wall_s if self.wall_s > 0 else 0.0
+
+
+def rss_mb() -> tuple[float | None, float | None]:
+    """Current and peak resident set size in MB (None if unavailable)."""
+    current = peak = None
+    try:
+        import psutil
+
+        current = psutil.Process().memory_info().rss / 1e6
+    except ImportError:
+        pass
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3  # KB on Linux
+    except ImportError:
+        pass
+    return current, peak
+
+
+@dataclass
+class LevelResult:
+    """Measurements at one concurrency level."""
+
+    concurrency: int
+    turns: int = 0
+    errors: int = 0
+    audio_in_s: float = 0.0
+    audio_out_s: float = 0.0
+    stages: dict[str, LatencyHistogram] = field(
+        default_factory=lambda: defaultdict(LatencyHistogram)
+    )
+    stt_rtf: LatencyHistogram = field(default_factory=LatencyHistogram)
+    tts_rtf: LatencyHistogram = field(default_factory=LatencyHistogram)
+    resources: ResourceUsage = field(default_factory=ResourceUsage)
+
+    def record_turn(self, trace: Trace, audio_in_s: float, audio_out_s: float) -> None:
+        """Add one finished turn's trace to the level's distributions."""
+        per_stage: dict[str, float] = defaultdict(float)
+        first_audio = None
+        for span in trace.spans:
+            per_stage[span.name] += span.duration
+            if span.name == "tts.first_chunk":
+                first_audio = (
+                    span.end if first_audio is None else min(first_audio, span.end)
+                )
+
+        for name, seconds in per_stage.items():
+            self.stages[name].record(seconds)
+        self.stages[TURN].record(trace.duration)
+        if first_audio is not None:
+            self.stages[TIME_TO_FIRST_AUDIO].record(first_audio - trace.start)
+
+        stt_compute = per_stage.get("stt.compute", per_stage.get("stt"))
+        if stt_compute is not None and audio_in_s > 0:
+            self.stt_rtf.record(stt_compute / audio_in_s)
+        if "tts" in per_stage and audio_out_s > 0:
+            self.tts_rtf.record(per_stage["tts"] / audio_out_s)
+
+        self.turns += 1
+        self.audio_in_s += audio_in_s
+        self.audio_out_s += audio_out_s
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary (latencies in milliseconds)."""
+
+        def latency(hist: LatencyHistogram) -> dict[str, Any]:
+            stats = {
+                name: round(hist.percentile(q) * 1000, 2)
+                for name, q in PERCENTILES.items()
+            }
+            stats["mean"] = round(hist.mean * 1000, 2)
+            stats["count"] = hist.count
+            return stats
+
+        def ratio(hist: LatencyHistogram) -> dict[str, Any]:
+            stats = {
+                name: round(hist.percentile(q), 4) for name, q in PERCENTILES.items()
+            }
+            stats["mean"] = round(hist.mean, 4)
+            return stats
+
+        resources = self.resources
+        return {
+            "concurrency": self.concurrency,
+            "turns": self.turns,
+            "errors": self.errors,
+            "throughput_turns_per_s": (
+                round(self.turns / resources.wall_s, 3) if resources.wall_s > 0 else 0.0
+            ),
+            "stages_ms": {
+                name: latency(hist) for name, hist in sorted(self.stages.items())
+            },
+            "realtime_factor": {"stt": ratio(self.stt_rtf), "tts": ratio(self.tts_rtf)},
+            "resources": {
+                **asdict(resources),
+                "cpu_utilization": round(resources.cpu_utilization, 3),
+                "cpu_s_per_audio_s": (
+                    round(resources.cpu_s / self.audio_in_s, 4)
+                    if self.audio_in_s
+                    else None
+                ),
+            },
+        }
+
+
+@dataclass
+class BenchmarkReport:
+    """Result of a benchmark run."""
+
+    config: BenchmarkConfig
+    corpus: dict[str, Any]
+    levels: list[LevelResult] = field(default_factory=list)
+    model_load: LatencyHistogram = field(default_factory=LatencyHistogram)
+    created_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "version": REPORT_VERSION,
+            "created_at": self.created_at,
+            "environment": {
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "processor": platform.processor(),
+                "system": platform.system(),
+            },
+            "config": asdict(self.config),
+            "corpus": self.corpus,
+            "model_load_ms": (
+                round(self.model_load.mean * 1000, 1) if self.model_load.count else None
+            ),
+            "levels": [level.to_dict() for level in self.levels],
+        }
+
+
+class PipelineBenchmark:
+    """Replays a corpus through conversation engines at several concurrency levels."""
+
+    def __init__(
+        self,
+        engine_factory: Callable[[str], ConversationEngine],
+        config: BenchmarkConfig | None = None,
+    ) -> None:
+        """Initialize benchmark.
+
+        Args:
+            engine_factory: Returns the engine for a language; engines
+                should share their models
+            config: Benchmark configuration
+        """
+        self.config = config or BenchmarkConfig()
+        if self.config.mode not in ("warm", "cold"):
+            raise ValueError(f"Unknown benchmark mode: {self.config.mode}")
+        self._engine_factory = engine_factory
+        self._engines: dict[str, ConversationEngine] = {}
+
+    def engine(self, language: str) -> ConversationEngine:
+        """Engine for a language (created on first use)."""
+        if language not in self._engines:
+            self._engines[language] = self._engine_factory(language)
+        return self._engines[language]
+
+    async def run(self, corpus: list[Utterance]) -> BenchmarkReport:
+        """Run every configured concurrency level.
+
+        Args:
+            corpus: Utterances to replay
+
+        Returns:
+            Benchmark report
+        """
+        if not corpus:
+            raise ValueError("Benchmark corpus is empty")
+
+        sources: dict[str, int] = defaultdict(int)
+        for utterance in corpus:
+            sources[utterance.source] += 1
+        report = BenchmarkReport(
+            config=self.config,
+            corpus={
+                "fingerprint": corpus_fingerprint(corpus),
+                "utterances": len(corpus),
+                "languages": sorted({u.language for u in corpus}),
+                "audio_s": round(sum(u.duration for u in corpus), 2),
+                "sources": dict(sources),
+            },
+        )
+
+        # Keep every trace in memory; nothing is exported or logged as slow
+        engines = [self.engine(language) for language in report.corpus["languages"]]
+        previous = get_tracer()
+        set_tracer(Tracer(TracingConfig(sample_rate=0.0, slow_turn_ms=float("inf"))))
+        try:
+            if self.config.mode == "warm":
+                report.model_load.record(await self._load(engines))
+
+            for concurrency in self.config.concurrency:
+                if self.config.mode == "cold":
+                    for engine in engines:
+                        engine.unload_models()
+                    report.model_load.record(await self._load(engines))
+                elif self.config.warmup_turns:
+                    await self._run_level(
+                        corpus[: self.config.warmup_turns], concurrency
+                    )
+
+                jobs = corpus * self.config.passes
+                level = await self._run_level(jobs, concurrency)
+                report.levels.append(level)
+                log.info(
+                    "Benchmark level complete",
+                    concurrency=concurrency,
+                    turns=level.turns,
+                    errors=level.errors,
+                )
+        finally:
+            set_tracer(previous)
+        return report
+
+    async def _load(self, engines: list[ConversationEngine]) -> float:
+        """Load the engines' models off the event loop, returning the time taken."""
+        start = time.perf_counter()
+        for engine in engines:
+            await asyncio.to_thread(engine.preload_models)
+        return time.perf_counter() - start
+
+    async def _run_level(self, jobs: list[Utterance], concurrency: int) -> LevelResult:
+        """Process jobs with `concurrency` simultaneous calls."""
+        level = LevelResult(concurrency=concurrency)
+        queue: asyncio.Queue[Utterance] = asyncio.Queue()
+        for job in jobs:
+            queue.put_nowait(job)
+
+        async def caller() -> None:
+            while not queue.empty():
+                await self._turn(queue.get_nowait(), level)
+
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        await asyncio.gather(*(caller() for _ in range(min(concurrency, len(jobs)))))
+        level.resources.wall_s = time.perf_counter() - wall_start
+        level.resources.cpu_s = time.process_time() - cpu_start
+        level.resources.rss_mb, level.resources.peak_rss_mb = rss_mb()
+        return level
+
+    async def _turn(self, utterance: Utterance, level: LevelResult) -> None:
+        """Run one utterance as a fresh single-turn conversation."""
+        engine = self.engine(utterance.language)
+        state = engine.start_conversation()
+        output_bytes = 0
+
+        async def on_audio_chunk(chunk: bytes) -> None:
+            nonlocal output_bytes
+            output_bytes += len(chunk)
+
+        try:
+            with get_tracer().turn(
+                call_id=utterance.id, language=utterance.language
+            ) as trace:
+                await engine.process_audio_streaming(
+                    utterance.audio,
+                    state.id,
+                    sample_rate=utterance.sample_rate,
+                    on_audio_chunk=on_audio_chunk,
+                )
+        except Exception as e:
+            level.errors += 1
+            log.warning("Benchmark turn failed", utterance=utterance.id, error=str(e))
+            return
+        finally:
+            engine.end_conversation(state.id)
+
+        output_rate = getattr(engine.tts, "sample_rate", 22050)
+        level.record_turn(trace, utterance.duration, output_bytes / 2 / output_rate)
+
+
+@dataclass
+class Regression:
+    """A metric that got slower than the baseline allows."""
+
+    concurrency: int
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change (0.2 = 20% slower)."""
+        return self.current / self.baseline - 1 if self.baseline else float("inf")
+
+    def __str__(self) -> str:
+        return (
+            f"c={self.concurrency} {self.metric}: "
+            f"{self.baseline:g} -> {self.current:g} (+{self.change:.0%})"
+        )
+
+
+def compare_reports(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float = 0.15,
+    min_delta_ms: float = 5.0,
+) -> list[Regression]:
+    """Find metrics that regressed against a baseline report.
+
+    Latency percentiles must not grow by more than ``tolerance`` (and
+    by more than ``min_delta_ms``, which absorbs jitter on very fast
+    stages). Realtime factors and CPU per audio second use the same
+    tolerance; error counts must not grow at all.
+
+    Args:
+        current: Report dictionary of this run
+        baseline: Stored report dictionary
+        tolerance: Allowed relative slowdown
+        min_delta_ms: Allowed absolute slowdown of latencies
+
+    Returns:
+        Regressions, empty if the run is within tolerance
+
+    Raises:
+        ValueError: If the reports used different corpora or modes
+    """
+    for key, name in (("corpus", "fingerprint"), ("config", "mode")):
+        if current[key][name] != baseline[key][name]:
+            raise ValueError(
+                f"Baseline {key} {name} {baseline[key][name]!r} "
+                f"does not match {current[key][name]!r}"
+            )
+
+    regressions = []
+    baseline_levels = {level["concurrency"]: level for level in baseline["levels"]}
+    for level in current["levels"]:
+        base = baseline_levels.get(level["concurrency"])
+        if base is None:
+            continue
+        concurrency = level["concurrency"]
+
+        def check(
+            metric: str, now: float | None, before: float | None, slack: float
+        ) -> None:
+            if now is None or before is None:
+                return
+            if now > before * (1 + tolerance) and now - before > slack:
+                regressions.append(Regression(concurrency, metric, before, now))
+
+        for stage, stats in level["stages_ms"].items():
+            base_stats = base["stages_ms"].get(stage)
+            if base_stats is None:
+                continue
+            for name in PERCENTILES:
+                check(f"{stage}.{name}_ms", stats[name], base_stats[name], min_delta_ms)
+
+        for component, stats in level["realtime_factor"].items():
+            base_stats = base["realtime_factor"].get(component, {})
+            check(f"{component}.rtf_p95", stats["p95"], base_stats.get("p95"), 0.0)
+
+        check(
+            "cpu_s_per_audio_s",
+            level["resources"]["cpu_s_per_audio_s"],
+            base["resources"]["cpu_s_per_audio_s"],
+            0.0,
+        )
+        if level["errors"] > base["errors"]:
+            regressions.append(
+                Regression(concurrency, "errors", base["errors"], level["errors"])
+            )
+    return regressions
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Render a report dictionary as text tables."""
+    lines = ["=" * 78, "PIPELINE BENCHMARK", "=" * 78]
+    corpus = report["corpus"]
+    lines.append(
+        f"Corpus {corpus['fingerprint']}: {corpus['utterances']} utterances, "
+        f"{corpus['audio_s']}s audio, languages {', '.join(corpus['languages'])}, "
+        f"sources {corpus['sources']}"
+    )
+    lines.append(
+        f"Mode: {report['config']['mode']}, model load: {report['model_load_ms']} ms"
+    )
+
+    for level in report["levels"]:
+        resources = level["resources"]
+        lines.append("")
+        lines.append(
+            f"Concurrency {level['concurrency']}: {level['turns']} turns, "
+            f"{level['errors']} errors, {level['throughput_turns_per_s']} turns/s, "
+            f"CPU {resources['cpu_s']:.1f}s "
+            f"({resources['cpu_utilization']:.2f} cores), "
+            f"RSS {resources['rss_mb'] or '-'} MB "
+            f"(peak {resources['peak_rss_mb'] or '-'})"
+        )
+        lines.append(
+            f"  {'Stage':<24} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'n':>6}"
+        )
+        for stage, stats in level["stages_ms"].items():
+            lines.append(
+                f"  {stage:<24} {stats['p50']:>10.1f} {stats['p95']:>10.1f} "
+                f"{stats['p99']:>10.1f} {stats['count']:>6}"
+            )
+        rtf = level["realtime_factor"]
+        lines.append(
+            f"  Realtime factor p95: STT {rtf['stt']['p95']:.3f}, "
+            f"TTS {rtf['tts']['p95']:.3f}"
+        )
+    lines.append("=" * 78)
+    return "\n".join(lines)
@@ -5,21 +5,32 @@ Orchestrates the full call lifecycle:
 - Conversation management
 - Appointment scheduling
 - Call transfer and termination
+
+Calls are tracked in a registry keyed by call ID; each call has its own
+state machine, conversation and (optionally) audio pipeline.
 """
 
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
-from typing import Any, Callable
+from typing import Any
 from uuid import UUID, uuid4
 
 from itf_shared import get_logger
 
-from phone_agent.core.audio import AudioPipeline, AudioConfig
-from phone_agent.core.conversation import ConversationEngine, ConversationState
+from phone_agent.core.audio import AudioConfig, AudioPipeline
+from phone_agent.core.conversation import (
+    REPEAT_PROMPT,
+    ConversationEngine,
+    ConversationState,
+)
+from phone_agent.core.exceptions import CallCapacityError, CallNotFoundError
+from phone_agent.core.tracing import span
 
 log = get_logger(__name__)
 
@@ -68,6 +79,7 @@ class CallContext:
     transfer_target: str | None = None
     error: str | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    audio_pipeline: AudioPipeline | None = field(default=None, repr=False)
 
     @property
     def duration_seconds(self) -> float | None:
@@ -77,39 +89,62 @@ class CallContext:
         end = self.ended_at or datetime.now()
         return (end - self.started_at).total_seconds()
 
+    @property
+    def is_active(self) -> bool:
+        """Check if the call is still in progress."""
+        return self.state not in (CallState.IDLE, CallState.ENDED)
+
 
 class CallHandler:
     """Manages phone call lifecycle with state machine.
 
     Handles:
-    - Call state transitions
+    - Call registry (one state machine and conversation per call)
+    - Admission control (max concurrent calls)
     - Audio pipeline management
     - Conversation orchestration
     - Event callbacks
+
+    Methods taking an optional ``call_id`` fall back to the most recent
+    active call when it is omitted, which keeps single-line usage simple.
     """
 
     def __init__(
         self,
         conversation_engine: ConversationEngine | None = None,
         audio_pipeline: AudioPipeline | None = None,
+        max_concurrent_calls: int = 1,
+        audio_pipeline_factory: (
+            Callable[[CallContext], AudioPipeline | None] | None
+        ) = None,
     ) -> None:
         """Initialize call handler.
 
         Args:
             conversation_engine: Engine for AI conversation
-            audio_pipeline: Audio I/O pipeline
+            audio_pipeline: Audio I/O pipeline shared by calls without a factory
+            max_concurrent_calls: Calls admitted at once; more are rejected
+            audio_pipeline_factory: Creates an isolated pipeline per call
+                (may return None when audio is carried elsewhere, e.g. by
+                the telephony audio bridge)
         """
         self.conversation_engine = conversation_engine or ConversationEngine()
-        self.audio_pipeline = audio_pipeline or AudioPipeline(AudioConfig())
+        self.max_concurrent_calls = max_concurrent_calls
+        self._audio_pipeline_factory = audio_pipeline_factory
+        self.audio_pipeline = audio_pipeline
+        if self.audio_pipeline is None and audio_pipeline_factory is None:
+            self.audio_pipeline = AudioPipeline(AudioConfig())
 
-        self._current_call: CallContext | None = None
-        self._call_history: list[CallContext] = []
-        self._call_lock = asyncio.Lock()  # Protect call state changes
+        self._calls: dict[UUID, CallContext] = {}
+        self._call_locks: dict[UUID, asyncio.Lock] = {}
+        self._call_history: deque[CallContext] = deque(maxlen=1000)
+        self._call_lock = asyncio.Lock()  # Protect the call registry
 
         # Event callbacks
         self._on_state_change: Callable[[CallState, CallState, CallContext], None] | None = None
         self._on_call_start: Callable[[CallContext], None] | None = None
         self._on_call_end: Callable[[CallContext], None] | None = None
+        self._play_audio: Callable[[CallContext, Any], Awaitable[Any]] | None = None
 
         # State transition table
         self._transitions: dict[tuple[CallState, CallEvent], CallState] = {
@@ -162,96 +197,137 @@ class CallHandler:
 
         Returns:
             Call context for the new call
+
+        Raises:
+            CallCapacityError: If max_concurrent_calls calls are active
         """
         async with self._call_lock:
-            if self._current_call and self._current_call.state not in (CallState.IDLE, CallState.ENDED):
-                log.warning("Already in call, rejecting", caller_id=caller_id)
-                raise RuntimeError("Already handling a call")
+            active = self.active_call_count
+            if active >= self.max_concurrent_calls:
+                log.warning(
+                    "Call capacity reached, rejecting",
+                    caller_id=caller_id,
+                    active_calls=active,
+                    max_concurrent_calls=self.max_concurrent_calls,
+                )
+                raise CallCapacityError(
+                    "Maximum concurrent calls reached",
+                    details={
+                        "active_calls": active,
+                        "max_calls": self.max_concurrent_calls,
+                    },
+                )
 
-            # Create call context
-            self._current_call = CallContext(
+            # Create and register call context
+            call = CallContext(
                 caller_id=caller_id,
                 callee_id=callee_id,
                 metadata=metadata or {},
             )
+            self._calls[call.call_id] = call
+            self._call_locks[call.call_id] = asyncio.Lock()
 
-            # Transition to RINGING (caller already holds lock)
-            await self._transition(CallEvent.INCOMING_CALL, _lock_held=True)
+        await self._transition(call, CallEvent.INCOMING_CALL)
 
-            log.info(
-                "Incoming call",
-                call_id=str(self._current_call.call_id),
-                caller_id=caller_id,
-            )
+        log.info(
+            "Incoming call",
+            call_id=str(call.call_id),
+            caller_id=caller_id,
+            active_calls=self.active_call_count,
+        )
 
-            return self._current_call
+        return call
 
-    async def answer_call(self) -> None:
-        """Answer the current ringing call."""
-        # Perform state checks and mutations under lock
-        async with self._call_lock:
-            if not self._current_call or self._current_call.state != CallState.RINGING:
+    async def answer_call(self, call_id: UUID | None = None) -> None:
+        """Answer a ringing call.
+
+        Args:
+            call_id: Call to answer (default: most recent call)
+        """
+        call = self._resolve_call(call_id)
+
+        # Perform state checks and mutations under the call's lock
+        async with self._call_locks[call.call_id]:
+            if call.state != CallState.RINGING:
                 raise RuntimeError("No ringing call to answer")
 
-            self._current_call.started_at = datetime.now()
+            call.started_at = datetime.now()
 
             # Start conversation
-            self._current_call.conversation = self.conversation_engine.start_conversation()
+            call.conversation = self.conversation_engine.start_conversation()
+            call.audio_pipeline = self._create_audio_pipeline(call)
 
             # Transition to GREETING (caller already holds lock)
-            await self._transition(CallEvent.CALL_ANSWERED, _lock_held=True)
+            await self._transition(call, CallEvent.CALL_ANSWERED, _lock_held=True)
 
             if self._on_call_start:
-                self._on_call_start(self._current_call)
+                self._on_call_start(call)
 
         # Long-running I/O operations outside lock
         # Start audio pipeline
-        self.audio_pipeline.start()
+        if call.audio_pipeline is not None:
+            call.audio_pipeline.start()
 
         # Generate and play greeting
-        await self._play_greeting()
+        await self._play_greeting(call)
+
+    def _create_audio_pipeline(self, call: CallContext) -> AudioPipeline | None:
+        """Attach an audio pipeline to a call (isolated if a factory is set)."""
+        if self._audio_pipeline_factory is not None:
+            pipeline = self._audio_pipeline_factory(call)
+        else:
+            pipeline = self.audio_pipeline
+
+        if pipeline is not None:
+            # Barge-in: caller speech stops our playback
+            pipeline.on_speech_start(lambda: self._on_caller_speech(call))
+        return pipeline
 
-    async def _play_greeting(self) -> None:
+    async def _play_greeting(self, call: CallContext) -> None:
         """Generate and play greeting message."""
-        if not self._current_call or not self._current_call.conversation:
+        if not call.conversation:
             return
 
         greeting_text, greeting_audio = await self.conversation_engine.generate_greeting(
-            self._current_call.conversation.id
+            call.conversation.id
         )
 
-        log.info("Playing greeting", text=greeting_text[:50])
+        log.info("Playing greeting", call_id=str(call.call_id), text=greeting_text[:50])
 
-        # Play audio
-        self.audio_pipeline.play(greeting_audio)
+        await self._play_and_wait(call, greeting_audio)
 
-        # Wait for playback (approximate)
-        await asyncio.sleep(len(greeting_audio) / 22050)  # Rough estimate
+        await self._transition(call, CallEvent.GREETING_COMPLETE)
 
-        await self._transition(CallEvent.GREETING_COMPLETE)
-
-    async def process_utterance(self, audio: bytes | None = None) -> str:
+    async def process_utterance(
+        self,
+        audio: bytes | None = None,
+        call_id: UUID | None = None,
+    ) -> str:
         """Process user utterance and generate response.
 
         Args:
             audio: Audio bytes (if None, captures from pipeline)
+            call_id: Call the utterance belongs to (default: most recent call)
 
         Returns:
             Response text
         """
-        if not self._current_call or not self._current_call.conversation:
+        call = self._resolve_call(call_id)
+        if not call.conversation:
             raise RuntimeError("No active call")
 
         import numpy as np
 
         # Get audio
         if audio is None:
+            if call.audio_pipeline is None:
+                raise RuntimeError("Call has no audio pipeline to capture from")
             # Capture from pipeline
-            audio_array = await self.audio_pipeline.capture_utterance(timeout=30.0)
+            audio_array = await call.audio_pipeline.capture_utterance(timeout=30.0)
             if audio_array is None:
                 # Timeout - prompt user
-                await self._transition(CallEvent.TIMEOUT)
-                return await self._speak_prompt()
+                await self._transition(call, CallEvent.TIMEOUT)
+                return await self._speak_prompt(call)
         else:
             # Parse provided audio
             import io
@@ -263,43 +339,77 @@ class CallHandler:
                     audio_array = np.frombuffer(frames, dtype=np.int16)
                     audio_array = audio_array.astype(np.float32) / 32768.0
 
-        await self._transition(CallEvent.UTTERANCE_COMPLETE)
+        return await self.handle_utterance(call.call_id, audio_array)
+
+    async def handle_utterance(self, call_id: UUID, audio: Any) -> str:
+        """Run one conversational turn for a call.
+
+        Args:
+            call_id: Call the utterance belongs to
+            audio: Utterance as float32 samples
+
+        Returns:
+            Response text
+        """
+        call = self._resolve_call(call_id)
+        if not call.conversation:
+            raise RuntimeError("No active call")
+
+        await self._transition(call, CallEvent.UTTERANCE_COMPLETE)
 
         # Process through conversation engine
         response_text, response_audio = await self.conversation_engine.process_audio(
-            audio_array,
-            self._current_call.conversation.id,
+            audio,
+            call.conversation.id,
         )
 
-        await self._transition(CallEvent.RESPONSE_READY)
+        await self._transition(call, CallEvent.RESPONSE_READY)
 
         # Check for transfer trigger
         if self._should_transfer(response_text):
-            await self._transition(CallEvent.TRANSFER_REQUESTED)
+            await self._transition(call, CallEvent.TRANSFER_REQUESTED)
             return response_text
 
-        # Play response
-        self.audio_pipeline.play(response_audio)
-
-        # Wait for playback
-        await asyncio.sleep(len(response_audio) / 22050)
+        await self._play_and_wait(call, response_audio)
 
-        await self._transition(CallEvent.PLAYBACK_COMPLETE)
+        await self._transition(call, CallEvent.PLAYBACK_COMPLETE)
 
         return response_text
 
-    async def _speak_prompt(self) -> str:
+    async def _speak_prompt(self, call: CallContext) -> str:
         """Speak a prompt when user is silent."""
-        prompt = "Entschuldigung, ich habe Sie nicht verstanden. Können Sie das bitte wiederholen?"
+        prompt = REPEAT_PROMPT
 
-        if self._current_call and self._current_call.conversation:
+        if call.conversation:
             response_audio = await self.conversation_engine.tts.synthesize_async(prompt)
-            self.audio_pipeline.play(response_audio)
-            await asyncio.sleep(len(response_audio) / 22050)
+            await self._play_and_wait(call, response_audio)
 
-        await self._transition(CallEvent.PLAYBACK_COMPLETE)
+        await self._transition(call, CallEvent.PLAYBACK_COMPLETE)
         return prompt
 
+    async def _play_and_wait(self, call: CallContext, audio: Any) -> None:
+        """Play audio to a call and wait until it has been heard or interrupted."""
+        with span("playback"):
+            if self._play_audio is not None:
+                await self._play_audio(call, audio)
+                return
+
+            pipeline = call.audio_pipeline
+            if pipeline is None:
+                return
+            duration = pipeline.play(audio)
+            # Margin covers output latency; barge-in ends the wait early
+            await pipeline.wait_for_playback(timeout=duration + 2.0)
+
+    def _on_caller_speech(self, call: CallContext) -> None:
+        """Stop playback when the caller talks over a prompt or response."""
+        if (
+            call.state in (CallState.GREETING, CallState.SPEAKING)
+            and call.audio_pipeline
+        ):
+            log.info("Barge-in, stopping playback", call_id=str(call.call_id))
+            call.audio_pipeline.stop_playback()
+
     def _should_transfer(self, response: str) -> bool:
         """Check if response indicates need for human transfer."""
         transfer_keywords = [
@@ -312,81 +422,113 @@ class CallHandler:
         response_lower = response.lower()
         return any(kw in response_lower for kw in transfer_keywords)
 
-    async def hangup(self) -> CallContext | None:
-        """End the current call."""
-        if not self._current_call:
-            return None
+    async def hangup(self, call_id: UUID | None = None) -> CallContext | None:
+        """End a call.
 
-        call = self._current_call
+        Args:
+            call_id: Call to end (default: most recent call)
 
-        # Stop audio
-        self.audio_pipeline.stop()
+        Returns:
+            The ended call, or None if there was no such call
+        """
+        call = self._calls.get(call_id) if call_id is not None else self.current_call
+        if call is None:
+            return None
+
+        # Stop audio (a shared pipeline keeps running for other calls)
+        if call.audio_pipeline is not None and (
+            self._audio_pipeline_factory is not None or self.active_call_count <= 1
+        ):
+            call.audio_pipeline.stop()
 
         # End conversation
         if call.conversation:
             self.conversation_engine.end_conversation(call.conversation.id)
 
         call.ended_at = datetime.now()
-        await self._transition(CallEvent.HANGUP)
+        await self._transition(call, CallEvent.HANGUP)
 
         if self._on_call_end:
             self._on_call_end(call)
 
         # Archive call
+        async with self._call_lock:
+            self._calls.pop(call.call_id, None)
+            self._call_locks.pop(call.call_id, None)
         self._call_history.append(call)
-        self._current_call = None
 
         log.info(
             "Call ended",
             call_id=str(call.call_id),
             duration=call.duration_seconds,
+            active_calls=self.active_call_count,
         )
 
         return call
 
-    async def _transition(self, event: CallEvent, _lock_held: bool = False) -> None:
-        """Perform state transition based on event.
+    async def _transition(
+        self,
+        call: CallContext,
+        event: CallEvent,
+        _lock_held: bool = False,
+    ) -> None:
+        """Perform state transition of one call based on event.
 
         Args:
+            call: The call whose state machine advances
             event: The event triggering the transition
-            _lock_held: Internal flag indicating if caller already holds the lock
-                       to avoid deadlock. Do not use externally.
+            _lock_held: Internal flag indicating if caller already holds the
+                       call's lock to avoid deadlock. Do not use externally.
         """
-        async def _do_transition() -> None:
-            if not self._current_call:
-                return
-
-            current_state = self._current_call.state
+        def _do_transition() -> None:
+            current_state = call.state
             key = (current_state, event)
 
             if key not in self._transitions:
                 log.warning(
                     "Invalid transition",
+                    call_id=str(call.call_id),
                     current_state=current_state.name,
-                    event=event.name,
+                    call_event=event.name,
                 )
                 return
 
             new_state = self._transitions[key]
-            self._current_call.state = new_state
+            call.state = new_state
 
             log.debug(
                 "State transition",
+                call_id=str(call.call_id),
                 from_state=current_state.name,
-                event=event.name,
+                call_event=event.name,
                 to_state=new_state.name,
             )
 
             if self._on_state_change:
-                self._on_state_change(current_state, new_state, self._current_call)
+                self._on_state_change(current_state, new_state, call)
 
-        if _lock_held:
-            # Caller already holds lock, execute directly
-            await _do_transition()
+        lock = self._call_locks.get(call.call_id)
+        if _lock_held or lock is None:
+            # Caller already holds lock (or the call was archived)
+            _do_transition()
         else:
-            # Acquire lock for thread-safe state transitions
-            async with self._call_lock:
-                await _do_transition()
+            # Acquire the call's lock for consistent state transitions
+            async with lock:
+                _do_transition()
+
+    def _resolve_call(self, call_id: UUID | None) -> CallContext:
+        """Look up a call, defaulting to the most recent active call.
+
+        Raises:
+            CallNotFoundError: If there is no such call
+        """
+        call = self._calls.get(call_id) if call_id is not None else self.current_call
+        if call is None:
+            raise CallNotFoundError(
+                "No active call",
+                details={"call_id": str(call_id) if call_id else None},
+            )
+        return call
 
     def on_state_change(
         self,
@@ -403,15 +545,44 @@ class CallHandler:
         """Set callback for call end."""
         self._on_call_end = callback
 
+    def on_play_audio(
+        self, callback: Callable[[CallContext, Any], Awaitable[Any]]
+    ) -> None:
+        """Set coroutine that plays audio to a call and returns once heard.
+
+        Replaces local audio pipeline playback, e.g. to route greetings and
+        responses through the telephony audio bridge.
+        """
+        self._play_audio = callback
+
+    def get_call(self, call_id: UUID) -> CallContext | None:
+        """Get an active call by ID."""
+        return self._calls.get(call_id)
+
+    @property
+    def active_calls(self) -> list[CallContext]:
+        """Get all calls in progress."""
+        return [call for call in self._calls.values() if call.is_active]
+
+    @property
+    def active_call_count(self) -> int:
+        """Get number of calls in progress."""
+        return sum(1 for call in self._calls.values() if call.is_active)
+
+    @property
+    def can_accept_call(self) -> bool:
+        """Check if another call would be admitted."""
+        return self.active_call_count < self.max_concurrent_calls
+
     @property
     def current_call(self) -> CallContext | None:
-        """Get current call context."""
-        return self._current_call
+        """Get the most recent active call (single-line convenience)."""
+        for call in reversed(self._calls.values()):
+            if call.is_active:
+                return call
+        return None
 
     @property
     def is_in_call(self) -> bool:
-        """Check if currently handling a call."""
-        return (
-            self._current_call is not None
-            and self._current_call.state not in (CallState.IDLE, CallState.ENDED)
-        )
+        """Check if currently handling any call."""
+        return self.active_call_count > 0
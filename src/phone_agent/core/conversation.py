@@ -9,8 +9,6 @@ Manages the full conversation flow for the phone agent, including:
 
 from __future__ import annotations
 
-import asyncio
-import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -24,44 +22,56 @@ from phone_agent.ai import (
     SpeechToText,
     DialectAwareSTT,
     DialectResult,
+    InferenceScheduler,
     LanguageModel,
     TextToSpeech,
+    create_tts_cache,
+    get_inference_scheduler,
+    iterate_in_thread,
 )
 from phone_agent.config import get_settings
+from phone_agent.core.metrics import get_metrics
+from phone_agent.core.tracing import get_tracer, span
+from phone_agent.core.response_pipeline import PipelineConfig, ResponsePipeline
+# Re-exported: sentence splitting lived here before the response pipeline
+from phone_agent.core.response_pipeline import (  # noqa: F401
+    SENTENCE_END_PATTERN,
+    extract_complete_sentence,
+)
 from phone_agent.industry.prompt_loader import (
     IndustryAdapter,
     get_triage_result_class,
+    get_tts_phrases,
 )
 
 log = get_logger(__name__)
 
 
-# Sentence boundary pattern for German text
-# Matches: period, exclamation, question mark followed by space or end
-SENTENCE_END_PATTERN = re.compile(r'([.!?])(?:\s+|$)')
-
-
-def extract_complete_sentence(buffer: str) -> tuple[str | None, str]:
-    """Extract the first complete sentence from a buffer.
-
-    Args:
-        buffer: Text buffer that may contain partial sentences
-
-    Returns:
-        Tuple of (complete_sentence or None, remaining_buffer)
-    """
-    match = SENTENCE_END_PATTERN.search(buffer)
-    if match:
-        # Found a sentence boundary
-        end_pos = match.end()
-        sentence = buffer[:end_pos].strip()
-        remaining = buffer[end_pos:].lstrip()
-
-        # Filter out very short "sentences" (likely noise)
-        if len(sentence) >= 5:
-            return sentence, remaining
+# Spoken when the caller was silent or not understood
+REPEAT_PROMPT = (
+    "Entschuldigung, ich habe Sie nicht verstanden. Können Sie das bitte wiederholen?"
+)
 
-    return None, buffer
+# Industry-specific greeting templates ({time_of_day}: Morgen, Mittag, ...)
+GREETING_TEMPLATES = {
+    "gesundheit": (
+        "Guten {time_of_day}, Praxis, hier spricht der Telefonassistent. "
+        "Wie kann ich Ihnen helfen?"
+    ),
+    "handwerk": (
+        "Guten {time_of_day}, Handwerksbetrieb, hier spricht der Telefonassistent. "
+        "Wie kann ich Ihnen helfen?"
+    ),
+    "gastro": (
+        "Guten {time_of_day}, Restaurant, hier spricht der Telefonassistent. "
+        "Wie kann ich Ihnen helfen?"
+    ),
+    "freie_berufe": (
+        "Guten {time_of_day}, hier spricht der Telefonassistent. "
+        "Wie kann ich Ihnen helfen?"
+    ),
+}
+TIMES_OF_DAY = ("Morgen", "Mittag", "Nachmittag", "Abend")
 
 
 class TurnRole(str, Enum):
@@ -168,6 +178,8 @@ class ConversationEngine:
         dialect_aware: bool = True,
         industry: str | None = None,
         language: str = "de",
+        scheduler: InferenceScheduler | None = None,
+        pipeline_config: PipelineConfig | None = None,
     ) -> None:
         """Initialize conversation engine.
 
@@ -180,8 +192,13 @@ class ConversationEngine:
             industry: Industry name for multi-tenant support (gesundheit, handwerk, etc.)
                       If None, uses config setting or defaults to gesundheit
             language: Language code for prompts (de, tr, ru)
+            scheduler: Inference scheduler shared by the STT engines it creates
+                      (default: global scheduler)
+            pipeline_config: Queue sizes of the streaming response pipeline
         """
         settings = get_settings()
+        self.scheduler = scheduler or get_inference_scheduler()
+        self.pipeline_config = pipeline_config or PipelineConfig()
 
         # Determine industry from parameter, config, or default
         if industry is None:
@@ -209,6 +226,7 @@ class ConversationEngine:
                 compute_type=settings.ai.stt.compute_type,
                 dialect_detection=True,
                 detection_mode="text",  # Post-transcription detection (faster)
+                scheduler=self.scheduler,
             )
         else:
             self.stt = SpeechToText(
@@ -217,6 +235,7 @@ class ConversationEngine:
                 device=settings.ai.stt.device,
                 compute_type=settings.ai.stt.compute_type,
                 language=settings.ai.stt.language,
+                scheduler=self.scheduler,
             )
 
         self.llm = llm or LanguageModel(
@@ -225,11 +244,16 @@ class ConversationEngine:
             n_ctx=settings.ai.llm.n_ctx,
             n_threads=settings.ai.llm.n_threads,
             n_gpu_layers=settings.ai.llm.n_gpu_layers,
+            prompt_cache_bytes=settings.ai.llm.prompt_cache_mb * 1024 * 1024,
         )
-        self.tts = tts or TextToSpeech(
-            model=settings.ai.tts.model,
-            model_path=settings.ai.tts.model_path,
-        )
+        if tts is not None:
+            self.tts = tts
+        else:
+            self.tts = TextToSpeech(
+                model=settings.ai.tts.model,
+                model_path=settings.ai.tts.model_path,
+                cache=create_tts_cache(settings.ai.tts),
+            )
 
         # Use custom system prompt or get from industry adapter
         self.system_prompt = system_prompt or self._industry_adapter.system_prompt
@@ -251,8 +275,53 @@ class ConversationEngine:
         self.stt.load()
         self.llm.load()
         self.tts.load()
+
+        # Evaluate the system prompt once so first turns reuse its state
+        if hasattr(self.llm, "prime_prompt"):
+            self.llm.prime_prompt(self.system_prompt)
+        self.warm_tts_cache()
         log.info("All models loaded")
 
+    def greeting_text(self, time_of_day: str) -> str:
+        """Greeting for this engine's industry.
+
+        Args:
+            time_of_day: "Morgen", "Mittag", "Nachmittag" or "Abend"
+
+        Returns:
+            Greeting text
+        """
+        template = GREETING_TEMPLATES.get(
+            self.industry, GREETING_TEMPLATES["freie_berufe"]
+        )
+        return template.format(time_of_day=time_of_day)
+
+    def warm_tts_cache(self, extra_phrases: list[str] | None = None) -> int:
+        """Synthesize greetings and fixed prompts into the TTS phrase cache.
+
+        The cache key includes the output format, so phrases are warmed
+        twice: as WAV for whole-utterance synthesis and as raw PCM for the
+        streaming response pipeline (``synthesize_stream``).
+
+        Args:
+            extra_phrases: Additional texts to pre-synthesize
+
+        Returns:
+            Number of entries newly cached (0 if the TTS has no cache)
+        """
+        cache = getattr(self.tts, "cache", None)
+        if cache is None:
+            return 0
+
+        phrases = [self.greeting_text(t) for t in TIMES_OF_DAY]
+        phrases.append(REPEAT_PROMPT)
+        phrases.extend(get_tts_phrases(self.industry, self.language))
+        phrases.extend(extra_phrases or [])
+        return sum(
+            cache.prewarm(self.tts, phrases, output_format=output_format)
+            for output_format in ("wav", "raw")
+        )
+
     def unload_models(self) -> None:
         """Unload all AI models to free memory."""
         self.stt.unload()
@@ -402,50 +471,59 @@ Der Anrufer spricht {dialect_name}.
         if not state:
             raise ValueError(f"Unknown conversation: {conversation_id}")
 
-        # STT: Audio → Text
-        log.debug("Starting STT", audio_length=len(audio) / sample_rate)
-        user_text = await self.stt.transcribe_async(audio, sample_rate)
+        with get_tracer().turn(call_id=str(conversation_id)):
+            # STT: Audio → Text
+            log.debug("Starting STT", audio_length=len(audio) / sample_rate)
+            with span("stt", audio_s=round(len(audio) / sample_rate, 2)):
+                user_text = await self.stt.transcribe_async(audio, sample_rate)
 
-        # Update dialect detection from STT (if using DialectAwareSTT)
-        self._update_dialect_from_stt(state)
+            # Update dialect detection from STT (if using DialectAwareSTT)
+            self._update_dialect_from_stt(state)
 
-        state.add_turn(
-            TurnRole.USER,
-            user_text,
-            audio_duration=len(audio) / sample_rate,
-            metadata={"dialect": state.detected_dialect},
-        )
-        log.info("User said", text=user_text[:100])
-
-        # Triage/classification check (industry-specific)
-        triage_result = self._industry_adapter.perform_triage(user_text)
-        if triage_result and self._is_urgent_triage(triage_result):
-            state.triage_result = triage_result
-            log.warning(
-                "Triage alert",
-                industry=self.industry,
-                result=str(triage_result),
+            state.add_turn(
+                TurnRole.USER,
+                user_text,
+                audio_duration=len(audio) / sample_rate,
+                metadata={"dialect": state.detected_dialect},
+            )
+            log.info("User said", text=user_text[:100])
+
+            # Triage/classification check (industry-specific)
+            with span("triage"):
+                triage_result = self._industry_adapter.perform_triage(user_text)
+            if triage_result and self._is_urgent_triage(triage_result):
+                state.triage_result = triage_result
+                log.warning(
+                    "Triage alert",
+                    industry=self.industry,
+                    result=str(triage_result),
+                )
+
+            # LLM: Generate response with conversation history
+            log.debug(
+                "Starting LLM generation",
+                history_turns=len(state.turns),
+                dialect=state.detected_dialect,
             )
 
-        # LLM: Generate response with conversation history
-        log.debug(
-            "Starting LLM generation",
-            history_turns=len(state.turns),
-            dialect=state.detected_dialect,
-        )
-
-        # Build messages with dialect-aware system prompt
-        effective_prompt = self._build_system_prompt_with_dialect(state)
-        messages = [{"role": "system", "content": effective_prompt}]
-        messages.extend(state.get_history_for_llm(max_turns=10))
-
-        response_text = await self.llm.generate_with_history_async(messages)
-        state.add_turn(TurnRole.ASSISTANT, response_text, triage_result=triage_result)
-        log.info("Assistant response", text=response_text[:100])
+            # Build messages with dialect-aware system prompt
+            effective_prompt = self._build_system_prompt_with_dialect(state)
+            messages = [{"role": "system", "content": effective_prompt}]
+            messages.extend(state.get_history_for_llm(max_turns=10))
+
+            with span("llm") as llm_span:
+                response_text = await self.llm.generate_with_history_async(messages)
+                if llm_span is not None:
+                    llm_span.attributes["chars"] = len(response_text)
+            state.add_turn(
+                TurnRole.ASSISTANT, response_text, triage_result=triage_result
+            )
+            log.info("Assistant response", text=response_text[:100])
 
-        # TTS: Text → Audio
-        log.debug("Starting TTS")
-        response_audio = await self.tts.synthesize_async(response_text)
+            # TTS: Text → Audio
+            log.debug("Starting TTS")
+            with span("tts"):
+                response_audio = await self.tts.synthesize_async(response_text)
 
         return response_text, response_audio
 
@@ -499,18 +577,7 @@ Der Anrufer spricht {dialect_name}.
 
         time_of_day = await get_time_of_day()
 
-        # Industry-specific greeting templates
-        greeting_templates = {
-            "gesundheit": f"Guten {time_of_day}, Praxis, hier spricht der Telefonassistent. Wie kann ich Ihnen helfen?",
-            "handwerk": f"Guten {time_of_day}, Handwerksbetrieb, hier spricht der Telefonassistent. Wie kann ich Ihnen helfen?",
-            "gastro": f"Guten {time_of_day}, Restaurant, hier spricht der Telefonassistent. Wie kann ich Ihnen helfen?",
-            "freie_berufe": f"Guten {time_of_day}, hier spricht der Telefonassistent. Wie kann ich Ihnen helfen?",
-        }
-
-        greeting = greeting_templates.get(
-            self.industry,
-            greeting_templates["freie_berufe"]  # Default fallback
-        )
+        greeting = self.greeting_text(time_of_day)
 
         state = self._conversations.get(conversation_id)
         if state:
@@ -547,9 +614,11 @@ Der Anrufer spricht {dialect_name}.
         messages = [{"role": "system", "content": effective_prompt}]
         messages.extend(state.get_history_for_llm(max_turns=10))
 
-        # Stream from LLM with history
+        # Stream from LLM with history (generated on a worker thread)
         full_response = ""
-        for token in self.llm.generate_stream_with_history(messages):
+        async for token in iterate_in_thread(
+            self.llm.generate_stream_with_history, messages
+        ):
             full_response += token
             yield token
 
@@ -559,8 +628,9 @@ Der Anrufer spricht {dialect_name}.
         self,
         audio: np.ndarray,
         conversation_id: UUID,
-        on_sentence_ready: Callable[[str, bytes], Awaitable[None]],
+        on_sentence_ready: Callable[[str, bytes], Awaitable[None]] | None = None,
         sample_rate: int = 16000,
+        on_audio_chunk: Callable[[bytes], Awaitable[None]] | None = None,
     ) -> tuple[str, str, bytes]:
         """Process audio with streaming TTS - speak as soon as first sentence is ready.
 
@@ -571,12 +641,15 @@ Der Anrufer spricht {dialect_name}.
         Args:
             audio: Audio waveform as numpy array
             conversation_id: Active conversation ID
-            on_sentence_ready: Async callback called with (sentence_text, audio_bytes)
+            on_sentence_ready: Async callback called with (sentence_text, wav_bytes)
                               for each complete sentence. Should play audio immediately.
             sample_rate: Audio sample rate (default 16kHz)
+            on_audio_chunk: Async callback called with raw int16 PCM chunks at
+                            tts.sample_rate as soon as they are synthesized, before
+                            the sentence is complete
 
         Returns:
-            Tuple of (user_text, full_response_text, full_response_audio)
+            Tuple of (user_text, full_response_text, full_response_audio as one WAV)
         """
         import time
 
@@ -584,86 +657,69 @@ Der Anrufer spricht {dialect_name}.
         if not state:
             raise ValueError(f"Unknown conversation: {conversation_id}")
 
-        start_time = time.time()
-
-        # === STT Phase ===
-        log.debug("Streaming: Starting STT", audio_length=len(audio) / sample_rate)
-        user_text = await self.stt.transcribe_async(audio, sample_rate)
-
-        # Update dialect detection
-        self._update_dialect_from_stt(state)
-
-        state.add_turn(
-            TurnRole.USER,
-            user_text,
-            audio_duration=len(audio) / sample_rate,
-            metadata={"dialect": state.detected_dialect},
-        )
-        stt_time = time.time() - start_time
-        log.info("Streaming: User said", text=user_text[:100], stt_time=f"{stt_time:.2f}s")
-
-        # === Triage (quick check for emergencies - industry-specific) ===
-        triage_result = await asyncio.get_event_loop().run_in_executor(
-            None,
-            lambda: self._industry_adapter.perform_triage(user_text),
-        )
-
-        # === LLM + TTS Streaming Phase ===
-        effective_prompt = self._build_system_prompt_with_dialect(state)
-        messages = [{"role": "system", "content": effective_prompt}]
-        messages.extend(state.get_history_for_llm(max_turns=10))
-
-        buffer = ""
-        full_response = ""
-        all_audio_chunks: list[bytes] = []
-        sentences_spoken = 0
-        first_sentence_time = None
-
-        log.debug("Streaming: Starting LLM generation")
+        turn_start = time.perf_counter()
 
-        for token in self.llm.generate_stream_with_history(messages):
-            buffer += token
-            full_response += token
+        with get_tracer().turn(call_id=str(conversation_id)):
+            # === STT Phase ===
+            log.debug("Streaming: Starting STT", audio_length=len(audio) / sample_rate)
+            with span("stt", audio_s=round(len(audio) / sample_rate, 2)):
+                user_text = await self.stt.transcribe_async(audio, sample_rate)
 
-            # Try to extract complete sentences
-            while True:
-                sentence, buffer = extract_complete_sentence(buffer)
-                if sentence is None:
-                    break
+            # Update dialect detection
+            self._update_dialect_from_stt(state)
 
-                # Synthesize and play this sentence immediately
-                if sentences_spoken == 0:
-                    first_sentence_time = time.time() - start_time
-                    log.info(
-                        "Streaming: First sentence ready",
-                        time=f"{first_sentence_time:.2f}s",
-                        sentence=sentence[:50],
-                    )
-
-                audio_chunk = await self.tts.synthesize_async(sentence)
-                all_audio_chunks.append(audio_chunk)
-
-                # Call the callback to play audio immediately
-                await on_sentence_ready(sentence, audio_chunk)
-                sentences_spoken += 1
-
-        # Handle any remaining text in buffer
-        if buffer.strip() and len(buffer.strip()) >= 3:
-            audio_chunk = await self.tts.synthesize_async(buffer.strip())
-            all_audio_chunks.append(audio_chunk)
-            await on_sentence_ready(buffer.strip(), audio_chunk)
-
-        # Combine all audio chunks for the full response
-        full_audio = b"".join(all_audio_chunks)
+            state.add_turn(
+                TurnRole.USER,
+                user_text,
+                audio_duration=len(audio) / sample_rate,
+                metadata={"dialect": state.detected_dialect},
+            )
+            stt_time = time.perf_counter() - turn_start
+            log.info(
+                "Streaming: User said",
+                text=user_text[:100],
+                stt_time=f"{stt_time:.2f}s",
+            )
 
-        state.add_turn(TurnRole.ASSISTANT, full_response, triage_result=triage_result)
+            # === Triage (quick check for emergencies - industry-specific) ===
+            # Rule-based and cheap: run inline rather than queueing behind
+            # model inferences on the scheduler's workers
+            with span("triage"):
+                triage_result = self._industry_adapter.perform_triage(user_text)
+
+            # === LLM -> TTS -> playout pipeline ===
+            effective_prompt = self._build_system_prompt_with_dialect(state)
+            messages = [{"role": "system", "content": effective_prompt}]
+            messages.extend(state.get_history_for_llm(max_turns=10))
+
+            log.debug("Streaming: Starting response pipeline")
+            pipeline_start = time.perf_counter() - turn_start
+            pipeline = ResponsePipeline(self.llm, self.tts, self.pipeline_config)
+            result = await pipeline.run(
+                messages,
+                on_sentence_ready=on_sentence_ready,
+                on_audio_chunk=on_audio_chunk,
+            )
+            full_response = result.text
+            full_audio = result.wav
+
+            timings = self._report_timings(
+                result,
+                stt_time,
+                pipeline_start,
+                audio_duration=len(audio) / sample_rate,
+            )
+            state.add_turn(
+                TurnRole.ASSISTANT,
+                full_response,
+                triage_result=triage_result,
+                metadata={"timings": timings},
+            )
 
-        total_time = time.time() - start_time
         log.info(
             "Streaming: Complete",
-            total_time=f"{total_time:.2f}s",
-            first_sentence_time=f"{first_sentence_time:.2f}s" if first_sentence_time else "N/A",
-            sentences=sentences_spoken,
+            total_time=f"{time.perf_counter() - turn_start:.2f}s",
+            **timings,
         )
 
         return user_text, full_response, full_audio
@@ -672,17 +728,19 @@ Der Anrufer spricht {dialect_name}.
         self,
         text: str,
         conversation_id: UUID,
-        on_sentence_ready: Callable[[str, bytes], Awaitable[None]],
+        on_sentence_ready: Callable[[str, bytes], Awaitable[None]] | None = None,
+        on_audio_chunk: Callable[[bytes], Awaitable[None]] | None = None,
     ) -> tuple[str, bytes]:
         """Process text input with streaming TTS output.
 
         Args:
             text: User text input
             conversation_id: Active conversation ID
-            on_sentence_ready: Async callback for each sentence
+            on_sentence_ready: Async callback for each sentence (text, wav_bytes)
+            on_audio_chunk: Async callback for raw PCM chunks as they are synthesized
 
         Returns:
-            Tuple of (full_response_text, full_response_audio)
+            Tuple of (full_response_text, full_response_audio as one WAV)
         """
         import time
 
@@ -690,7 +748,7 @@ Der Anrufer spricht {dialect_name}.
         if not state:
             raise ValueError(f"Unknown conversation: {conversation_id}")
 
-        start_time = time.time()
+        turn_start = time.perf_counter()
         state.add_turn(TurnRole.USER, text)
 
         # Build messages with history
@@ -698,42 +756,65 @@ Der Anrufer spricht {dialect_name}.
         messages = [{"role": "system", "content": effective_prompt}]
         messages.extend(state.get_history_for_llm(max_turns=10))
 
-        buffer = ""
-        full_response = ""
-        all_audio_chunks: list[bytes] = []
-        sentences_spoken = 0
-
-        for token in self.llm.generate_stream_with_history(messages):
-            buffer += token
-            full_response += token
-
-            while True:
-                sentence, buffer = extract_complete_sentence(buffer)
-                if sentence is None:
-                    break
-
-                audio_chunk = await self.tts.synthesize_async(sentence)
-                all_audio_chunks.append(audio_chunk)
-                await on_sentence_ready(sentence, audio_chunk)
-                sentences_spoken += 1
-
-        # Handle remaining buffer
-        if buffer.strip() and len(buffer.strip()) >= 3:
-            audio_chunk = await self.tts.synthesize_async(buffer.strip())
-            all_audio_chunks.append(audio_chunk)
-            await on_sentence_ready(buffer.strip(), audio_chunk)
+        with get_tracer().turn(call_id=str(conversation_id)):
+            pipeline_start = time.perf_counter() - turn_start
+            pipeline = ResponsePipeline(self.llm, self.tts, self.pipeline_config)
+            result = await pipeline.run(
+                messages,
+                on_sentence_ready=on_sentence_ready,
+                on_audio_chunk=on_audio_chunk,
+            )
+        full_response = result.text
+        full_audio = result.wav
 
-        full_audio = b"".join(all_audio_chunks)
-        state.add_turn(TurnRole.ASSISTANT, full_response)
+        timings = self._report_timings(result, 0.0, pipeline_start)
+        state.add_turn(TurnRole.ASSISTANT, full_response, metadata={"timings": timings})
 
         log.debug(
             "Text streaming complete",
-            time=f"{time.time() - start_time:.2f}s",
-            sentences=sentences_spoken,
+            time=f"{time.perf_counter() - turn_start:.2f}s",
+            **timings,
         )
 
         return full_response, full_audio
 
+    def _report_timings(
+        self,
+        result: Any,
+        stt_time: float,
+        pipeline_start: float,
+        audio_duration: float = 0.0,
+    ) -> dict[str, Any]:
+        """Record a pipelined turn's stage timings to the latency metrics.
+
+        Args:
+            result: PipelineResult of the response
+            stt_time: Transcription time
+            pipeline_start: Seconds from the start of the turn to the start
+                of the pipeline (STT, triage and prompt building)
+            audio_duration: Caller audio duration
+
+        Returns:
+            Stage timings in milliseconds, measured from the turn's start
+        """
+        timings = result.timings
+        first_audio = pipeline_start + (timings.first_audio or timings.total)
+        get_metrics().record_turn(
+            stt_time=stt_time,
+            llm_time=timings.llm,
+            tts_time=timings.tts,
+            first_byte_time=first_audio,
+            audio_duration=audio_duration,
+            response_length=len(result.text),
+            total_time=pipeline_start + timings.total,
+        )
+        return {
+            "stt_ms": round(stt_time * 1000, 1),
+            "pipeline_start_ms": round(pipeline_start * 1000, 1),
+            "time_to_first_audio_ms": round(first_audio * 1000, 1),
+            **timings.to_dict(),
+        }
+
     def get_conversation(self, conversation_id: UUID) -> ConversationState | None:
         """Get conversation state by ID."""
         return self._conversations.get(conversation_id)
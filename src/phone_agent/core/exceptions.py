@@ -138,6 +138,20 @@ class CallNotFoundError(CallError):
     error_code = "CALL_NOT_FOUND"
 
 
+class CallCapacityError(CallError):
+    """Maximum number of concurrent calls reached."""
+
+    status_code = 503
+    error_code = "CALL_CAPACITY_EXCEEDED"
+
+
+class ServiceNotReadyError(CallError):
+    """AI models are still warming up; calls cannot be served yet."""
+
+    status_code = 503
+    error_code = "SERVICE_NOT_READY"
+
+
 class CallTransferError(CallError):
     """Failed to transfer call."""
 
@@ -3,10 +3,14 @@
 Provides:
 - Per-component timing (STT, LLM, TTS, VAD)
 - End-to-end latency tracking
-- Percentile calculations (p50, p90, p99)
-- Historical data storage
+- Percentile calculations (p50, p90, p99) from log-bucketed histograms
+- Rolling windows (1m, 5m, 1h) next to lifetime totals
 - CLI and JSON reporting
 
+Recording a sample is O(1) and memory per component is bounded, so
+per-frame timings can be recorded on the hot path. Histograms from
+several workers can be merged.
+
 Usage:
     from phone_agent.core.metrics import get_metrics, LatencyMetrics
 
@@ -26,86 +30,325 @@ Usage:
 
 from __future__ import annotations
 
-import statistics
+import copy
+import math
 import threading
 import time
-from collections import defaultdict
+from collections import deque
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Iterator
+from typing import Any
 
 from itf_shared import get_logger
 
 log = get_logger(__name__)
 
 
+# Histogram layout: buckets grow by 2^(1/32), i.e. about 1.1% relative
+# error per percentile, from 1 µs up to ~1.7 hours (1040 buckets).
+HISTOGRAM_MIN_VALUE = 1e-6
+HISTOGRAM_BUCKETS_PER_OCTAVE = 32
+HISTOGRAM_BUCKETS = 1040
+
+_LOG_GROWTH = math.log(2) / HISTOGRAM_BUCKETS_PER_OCTAVE
+
+# Rolling windows reported next to lifetime totals: name -> seconds
+WINDOWS = {"1m": 60, "5m": 300, "1h": 3600}
+
+
+def bucket_index(value: float) -> int:
+    """Histogram bucket for a value in seconds."""
+    if value < HISTOGRAM_MIN_VALUE:
+        return 0
+    index = int(math.log(value / HISTOGRAM_MIN_VALUE) / _LOG_GROWTH) + 1
+    return min(index, HISTOGRAM_BUCKETS - 1)
+
+
+def bucket_value(index: int) -> float:
+    """Representative (geometric midpoint) value of a bucket."""
+    if index == 0:
+        return 0.0
+    return HISTOGRAM_MIN_VALUE * math.exp((index - 0.5) * _LOG_GROWTH)
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with exact count, sum, min and max.
+
+    Buckets are stored sparsely, so an idle or narrow distribution costs
+    a few entries. Histograms share one bucket layout and can be merged.
+    """
+
+    __slots__ = ("counts", "count", "total", "total_squares", "min", "max")
+
+    def __init__(self) -> None:
+        """Initialize empty histogram."""
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.total_squares = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value: float, index: int | None = None) -> None:
+        """Record one value in seconds.
+
+        Args:
+            value: Value in seconds
+            index: Precomputed bucket_index(value)
+        """
+        if index is None:
+            index = bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.total_squares += value * value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add another histogram's samples to this one."""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.total_squares += other.total_squares
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def copy(self) -> LatencyHistogram:
+        """Independent copy."""
+        clone = LatencyHistogram()
+        clone.merge(self)
+        return clone
+
+    def percentile(self, q: float) -> float:
+        """Value at quantile q (0-1), within one bucket of the exact value."""
+        if self.count == 0:
+            return 0.0
+        rank = min(int(self.count * q) + 1, self.count)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(max(bucket_value(index), self.min), self.max)
+        return self.max
+
+    def cumulative(self, bounds: list[float]) -> list[int]:
+        """Cumulative counts at each upper bound (e.g. Prometheus ``le`` buckets).
+
+        A bucket is counted under the first bound at or above its
+        representative value.
+
+        Args:
+            bounds: Ascending upper bounds in seconds
+
+        Returns:
+            Count of values <= each bound
+        """
+        counts = [0] * len(bounds)
+        for index, count in self.counts.items():
+            value = bucket_value(index)
+            for i, bound in enumerate(bounds):
+                if value <= bound:
+                    counts[i] += count
+                    break
+        running = 0
+        for i, count in enumerate(counts):
+            running += count
+            counts[i] = running
+        return counts
+
+    @property
+    def mean(self) -> float:
+        """Mean in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def stddev(self) -> float:
+        """Sample standard deviation in seconds."""
+        if self.count < 2:
+            return 0.0
+        spread = self.total_squares - self.total * self.total / self.count
+        variance = spread / (self.count - 1)
+        return math.sqrt(max(variance, 0.0))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize (e.g. to ship to another worker for merging)."""
+        return {
+            "counts": {str(index): count for index, count in self.counts.items()},
+            "count": self.count,
+            "total": self.total,
+            "total_squares": self.total_squares,
+            "min": self.min if self.count else None,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LatencyHistogram:
+        """Deserialize a histogram produced by to_dict."""
+        histogram = cls()
+        histogram.counts = {
+            int(index): count for index, count in data["counts"].items()
+        }
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        histogram.total_squares = data["total_squares"]
+        histogram.min = data["min"] if data["min"] is not None else math.inf
+        histogram.max = data["max"]
+        return histogram
+
+
+class RollingHistogram:
+    """Histogram over a sliding time window, kept as a ring of slots.
+
+    Each slot covers ``slot_seconds``; slots older than the ring are
+    reused, so memory stays constant. Querying a window merges the slots
+    it covers (resolution is one slot).
+    """
+
+    def __init__(self, slot_seconds: float, slots: int) -> None:
+        """Initialize rolling histogram.
+
+        Args:
+            slot_seconds: Time covered by one slot
+            slots: Number of slots (slot_seconds * slots is the longest window)
+        """
+        self.slot_seconds = slot_seconds
+        self._epochs = [-1] * slots
+        self._slots = [LatencyHistogram() for _ in range(slots)]
+
+    def record(self, value: float, now: float, index: int | None = None) -> None:
+        """Record a value at monotonic time now."""
+        epoch = int(now // self.slot_seconds)
+        slot = epoch % len(self._slots)
+        if self._epochs[slot] != epoch:
+            self._epochs[slot] = epoch
+            self._slots[slot] = LatencyHistogram()
+        self._slots[slot].record(value, index)
+
+    def window(self, seconds: float, now: float) -> LatencyHistogram:
+        """Merged histogram of the last ``seconds`` (rounded up to slots)."""
+        epoch = int(now // self.slot_seconds)
+        slots = min(math.ceil(seconds / self.slot_seconds), len(self._slots))
+        oldest = epoch - slots + 1
+        merged = LatencyHistogram()
+        for slot_epoch, slot in zip(self._epochs, self._slots):
+            if oldest <= slot_epoch <= epoch:
+                merged.merge(slot)
+        return merged
+
+    def copy(self) -> RollingHistogram:
+        """Independent copy."""
+        clone = copy.copy(self)
+        clone._epochs = list(self._epochs)
+        clone._slots = [slot.copy() for slot in self._slots]
+        return clone
+
+
 @dataclass
 class ComponentMetrics:
-    """Metrics for a single component."""
+    """Metrics for a single component.
+
+    Lifetime statistics come from one histogram; the 1m and 5m windows
+    from 10-second slots and the 1h window from 1-minute slots.
+    """
 
     name: str
-    samples: list[float] = field(default_factory=list)
     total_calls: int = 0
     total_time: float = 0.0
     last_recorded: datetime | None = None
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+    recent: RollingHistogram = field(default_factory=lambda: RollingHistogram(10, 30))
+    hourly: RollingHistogram = field(default_factory=lambda: RollingHistogram(60, 60))
+    clock: Callable[[], float] = field(default=time.monotonic, repr=False)
 
     def record(self, duration: float) -> None:
         """Record a timing sample."""
-        self.samples.append(duration)
+        now = self.clock()
+        index = bucket_index(duration)
+        self.histogram.record(duration, index)
+        self.recent.record(duration, now, index)
+        self.hourly.record(duration, now, index)
         self.total_calls += 1
         self.total_time += duration
         self.last_recorded = datetime.now()
 
-        # Keep only last 1000 samples for memory efficiency
-        if len(self.samples) > 1000:
-            self.samples = self.samples[-1000:]
+    def merge(self, other: ComponentMetrics) -> None:
+        """Add another worker's lifetime samples for the same component."""
+        self.histogram.merge(other.histogram)
+        self.total_calls += other.total_calls
+        self.total_time += other.total_time
+
+    def window(self, name: str) -> LatencyHistogram:
+        """Histogram of a rolling window ("1m", "5m" or "1h")."""
+        seconds = WINDOWS[name]
+        rolling = self.recent if seconds <= 300 else self.hourly
+        return rolling.window(seconds, self.clock())
+
+    def snapshot(self) -> ComponentMetrics:
+        """Copy that later records do not affect."""
+        return ComponentMetrics(
+            name=self.name,
+            total_calls=self.total_calls,
+            total_time=self.total_time,
+            last_recorded=self.last_recorded,
+            histogram=self.histogram.copy(),
+            recent=self.recent.copy(),
+            hourly=self.hourly.copy(),
+            clock=self.clock,
+        )
 
     @property
     def mean(self) -> float:
         """Mean latency in seconds."""
-        return statistics.mean(self.samples) if self.samples else 0.0
+        return self.histogram.mean
 
     @property
     def median(self) -> float:
         """Median latency (p50) in seconds."""
-        return statistics.median(self.samples) if self.samples else 0.0
+        return self.histogram.percentile(0.5)
 
     @property
     def p90(self) -> float:
         """90th percentile latency in seconds."""
-        if not self.samples:
-            return 0.0
-        sorted_samples = sorted(self.samples)
-        idx = int(len(sorted_samples) * 0.9)
-        return sorted_samples[min(idx, len(sorted_samples) - 1)]
+        return self.histogram.percentile(0.9)
 
     @property
     def p99(self) -> float:
         """99th percentile latency in seconds."""
-        if not self.samples:
-            return 0.0
-        sorted_samples = sorted(self.samples)
-        idx = int(len(sorted_samples) * 0.99)
-        return sorted_samples[min(idx, len(sorted_samples) - 1)]
+        return self.histogram.percentile(0.99)
 
     @property
     def min(self) -> float:
         """Minimum latency in seconds."""
-        return min(self.samples) if self.samples else 0.0
+        return self.histogram.min if self.histogram.count else 0.0
 
     @property
     def max(self) -> float:
         """Maximum latency in seconds."""
-        return max(self.samples) if self.samples else 0.0
+        return self.histogram.max
 
     @property
     def stddev(self) -> float:
         """Standard deviation in seconds."""
-        return statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0
+        return self.histogram.stddev
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
+        windows = {}
+        for name in WINDOWS:
+            histogram = self.window(name)
+            windows[name] = {
+                "calls": histogram.count,
+                "mean_ms": round(histogram.mean * 1000, 1),
+                "p50_ms": round(histogram.percentile(0.5) * 1000, 1),
+                "p90_ms": round(histogram.percentile(0.9) * 1000, 1),
+                "p99_ms": round(histogram.percentile(0.99) * 1000, 1),
+            }
         return {
             "name": self.name,
             "calls": self.total_calls,
@@ -117,6 +360,7 @@ class ComponentMetrics:
             "min_ms": round(self.min * 1000, 1),
             "max_ms": round(self.max * 1000, 1),
             "stddev_ms": round(self.stddev * 1000, 1),
+            "windows": windows,
         }
 
 
@@ -168,13 +412,16 @@ class LatencyMetrics:
     - tts: Text-to-speech synthesis
     - vad: Voice activity detection
     - e2e: End-to-end turn latency
+
+    The lock only guards recording and snapshotting; percentiles and
+    reports are computed from snapshots after it is released.
     """
 
     def __init__(self) -> None:
         """Initialize metrics collector."""
         self._lock = threading.Lock()
         self._components: dict[str, ComponentMetrics] = {}
-        self._turns: list[TurnMetrics] = []
+        self._turns: deque[TurnMetrics] = deque(maxlen=100)  # Last 100 turns
         self._turn_counter = 0
         self._start_time = datetime.now()
 
@@ -224,6 +471,7 @@ class LatencyMetrics:
         first_byte_time: float = 0.0,
         audio_duration: float = 0.0,
         response_length: int = 0,
+        total_time: float | None = None,
     ) -> TurnMetrics:
         """Record a complete conversation turn.
 
@@ -235,10 +483,14 @@ class LatencyMetrics:
             first_byte_time: Time to first TTS byte in seconds
             audio_duration: Input audio duration in seconds
             response_length: Response character count
+            total_time: Wall-clock turn time when stages overlapped
+                        (default: sum of STT, LLM and TTS)
 
         Returns:
             TurnMetrics object
         """
+        if total_time is None:
+            total_time = stt_time + llm_time + tts_time
         with self._lock:
             self._turn_counter += 1
             turn = TurnMetrics(
@@ -249,16 +501,12 @@ class LatencyMetrics:
                 tts_time=tts_time,
                 vad_time=vad_time,
                 first_byte_time=first_byte_time,
-                total_time=stt_time + llm_time + tts_time,
+                total_time=total_time,
                 audio_duration=audio_duration,
                 response_length=response_length,
             )
             self._turns.append(turn)
 
-            # Keep only last 100 turns
-            if len(self._turns) > 100:
-                self._turns = self._turns[-100:]
-
             # Record to component metrics
             if stt_time > 0:
                 self._components["stt"].record(stt_time)
@@ -280,6 +528,42 @@ class LatencyMetrics:
         with self._lock:
             return self._components.get(name)
 
+    def merge(self, other: LatencyMetrics) -> None:
+        """Add another collector's lifetime component histograms to this one.
+
+        Args:
+            other: Collector from another worker
+        """
+        with other._lock:
+            components = [metrics.snapshot() for metrics in other._components.values()]
+        with self._lock:
+            for metrics in components:
+                if metrics.name not in self._components:
+                    self._components[metrics.name] = ComponentMetrics(name=metrics.name)
+                self._components[metrics.name].merge(metrics)
+
+    def _snapshot(
+        self,
+    ) -> tuple[datetime, dict[str, ComponentMetrics], list[TurnMetrics]]:
+        """Copy state under the lock so reports are built without it."""
+        with self._lock:
+            components = {
+                name: metrics.snapshot()
+                for name, metrics in self._components.items()
+                if metrics.total_calls > 0
+            }
+            return self._start_time, components, list(self._turns)
+
+    def snapshot_components(self) -> dict[str, ComponentMetrics]:
+        """Independent copies of all components that have samples."""
+        _, components, _ = self._snapshot()
+        return components
+
+    def get_stats(self) -> dict[str, dict]:
+        """Per-component statistics (see ComponentMetrics.to_dict)."""
+        _, components, _ = self._snapshot()
+        return {name: metrics.to_dict() for name, metrics in components.items()}
+
     def get_report(self, format: str = "text") -> str | dict:
         """Generate a metrics report.
 
@@ -289,62 +573,78 @@ class LatencyMetrics:
         Returns:
             Formatted report
         """
-        with self._lock:
-            uptime = (datetime.now() - self._start_time).total_seconds()
-
-            report_data = {
-                "uptime_s": round(uptime, 1),
-                "total_turns": len(self._turns),
-                "components": {
-                    name: metrics.to_dict()
-                    for name, metrics in self._components.items()
-                    if metrics.total_calls > 0
-                },
-                "recent_turns": [t.to_dict() for t in self._turns[-5:]],
-            }
+        start_time, components, turns = self._snapshot()
+        uptime = (datetime.now() - start_time).total_seconds()
+
+        report_data = {
+            "uptime_s": round(uptime, 1),
+            "total_turns": len(turns),
+            "components": {
+                name: metrics.to_dict() for name, metrics in components.items()
+            },
+            "recent_turns": [t.to_dict() for t in turns[-5:]],
+        }
 
-            if format == "json":
-                return report_data
-
-            # Text format
-            lines = [
-                "=" * 60,
-                "  PHONE AGENT LATENCY METRICS",
-                "=" * 60,
-                f"  Uptime: {uptime:.1f}s | Turns: {len(self._turns)}",
-                "",
-                "  COMPONENT LATENCIES (ms)",
-                "-" * 60,
-                f"  {'Component':<12} {'Calls':>8} {'Mean':>8} {'P50':>8} {'P90':>8} {'P99':>8}",
-                "-" * 60,
-            ]
-
-            for name, metrics in sorted(self._components.items()):
-                if metrics.total_calls > 0:
-                    lines.append(
-                        f"  {name:<12} {metrics.total_calls:>8} "
-                        f"{metrics.mean * 1000:>7.1f} {metrics.median * 1000:>7.1f} "
-                        f"{metrics.p90 * 1000:>7.1f} {metrics.p99 * 1000:>7.1f}"
-                    )
-
-            lines.extend([
-                "",
-                "  RECENT TURNS",
-                "-" * 60,
-            ])
-
-            for turn in self._turns[-5:]:
+        if format == "json":
+            return report_data
+
+        # Text format
+        lines = [
+            "=" * 60,
+            "  PHONE AGENT LATENCY METRICS",
+            "=" * 60,
+            f"  Uptime: {uptime:.1f}s | Turns: {len(turns)}",
+            "",
+            "  COMPONENT LATENCIES (ms)",
+            "-" * 60,
+            f"  {'Component':<12} {'Calls':>8} {'Mean':>8} "
+            f"{'P50':>8} {'P90':>8} {'P99':>8}",
+            "-" * 60,
+        ]
+
+        for name, metrics in sorted(components.items()):
+            lines.append(
+                f"  {name:<12} {metrics.total_calls:>8} "
+                f"{metrics.mean * 1000:>7.1f} {metrics.median * 1000:>7.1f} "
+                f"{metrics.p90 * 1000:>7.1f} {metrics.p99 * 1000:>7.1f}"
+            )
+
+        lines.extend([
+            "",
+            "  LAST 5 MINUTES (ms)",
+            "-" * 60,
+            f"  {'Component':<12} {'Calls':>8} {'Mean':>8} "
+            f"{'P50':>8} {'P90':>8} {'P99':>8}",
+            "-" * 60,
+        ])
+
+        for name, metrics in sorted(components.items()):
+            window = metrics.window("5m")
+            if window.count:
+                p50, p90, p99 = (window.percentile(q) * 1000 for q in (0.5, 0.9, 0.99))
                 lines.append(
-                    f"  Turn {turn.turn_id}: "
-                    f"STT={turn.stt_time * 1000:.0f}ms "
-                    f"LLM={turn.llm_time * 1000:.0f}ms "
-                    f"TTS={turn.tts_time * 1000:.0f}ms "
-                    f"Total={turn.total_time * 1000:.0f}ms"
+                    f"  {name:<12} {window.count:>8} "
+                    f"{window.mean * 1000:>7.1f} {p50:>7.1f} {p90:>7.1f} {p99:>7.1f}"
                 )
 
-            lines.append("=" * 60)
+        lines.extend([
+            "",
+            "  RECENT TURNS",
+            "-" * 60,
+        ])
+
+        for turn in turns[-5:]:
+            lines.append(
+                f"  Turn {turn.turn_id}: "
+                f"STT={turn.stt_time * 1000:.0f}ms "
+                f"LLM={turn.llm_time * 1000:.0f}ms "
+                f"TTS={turn.tts_time * 1000:.0f}ms "
+                f"Total={turn.total_time * 1000:.0f}ms"
+            )
+
+        lines.append("=" * 60)
 
-            return "\n".join(lines)
+        return "\n".join(lines)
 
     def reset(self) -> None:
         """Reset all metrics."""
@@ -0,0 +1,549 @@
+"""Prometheus text exposition of phone agent metrics.
+
+Renders the process's metrics in the Prometheus text format (0.0.4)
+without a client library: latency histograms, audio bridge counters,
+FreeSWITCH ESL commands, campaign scheduler and outbound dialer stats,
+circuit breaker states, database pool occupancy, inference executor
+queues, and the LLM prompt and TTS phrase caches.
+
+Every series carries ``tenant`` and ``industry`` labels identifying the
+deployment. They are constant labels from ``deployment_labels()`` (the
+device and configured industry), not per-call or per-tenant breakdowns:
+a multi-tenant process reports under one tenant value. Per-call data is
+aggregated and the number of latency components is capped, so the series
+count stays bounded no matter how many calls the process handles.
+
+Usage:
+    from phone_agent.core.prometheus import collect, register_collector
+
+    register_collector("campaign_scheduler", lambda w: export_scheduler(w, scheduler))
+    body = collect()
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+from typing import Any
+
+from itf_shared import get_logger
+
+log = get_logger(__name__)
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Histogram bucket bounds for pipeline latencies, in seconds
+LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0]
+
+# At most this many latency components are exported (the rest are skipped)
+MAX_COMPONENTS = 64
+
+PREFIX = "phone_agent"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class MetricsWriter:
+    """Accumulates metric families in exposition order.
+
+    Families may be written from several places; HELP/TYPE are emitted
+    once, before the family's first sample.
+    """
+
+    def __init__(self, const_labels: dict[str, str] | None = None) -> None:
+        """Initialize writer.
+
+        Args:
+            const_labels: Labels added to every sample
+        """
+        self.const_labels = const_labels or {}
+        self._families: dict[str, tuple[str, str, list[str]]] = {}
+
+    def _family(self, name: str, kind: str, help_text: str) -> list[str]:
+        family = self._families.get(name)
+        if family is None:
+            family = self._families[name] = (kind, help_text, [])
+        return family[2]
+
+    def _sample(self, name: str, labels: dict[str, str] | None, value: float) -> str:
+        merged = {**self.const_labels, **(labels or {})}
+        if merged:
+            rendered = ",".join(
+                f'{key}="{_escape(str(val))}"' for key, val in merged.items()
+            )
+            return f"{name}{{{rendered}}} {_format_value(value)}"
+        return f"{name} {_format_value(value)}"
+
+    def gauge(
+        self,
+        name: str,
+        help_text: str,
+        value: float,
+        labels: dict[str, str] | None = None,
+    ) -> None:
+        """Write a gauge sample."""
+        name = f"{PREFIX}_{name}"
+        self._family(name, "gauge", help_text).append(self._sample(name, labels, value))
+
+    def counter(
+        self,
+        name: str,
+        help_text: str,
+        value: float,
+        labels: dict[str, str] | None = None,
+    ) -> None:
+        """Write a counter sample (name gets the ``_total`` suffix)."""
+        name = f"{PREFIX}_{name}_total"
+        self._family(name, "counter", help_text).append(
+            self._sample(name, labels, value)
+        )
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        buckets: list[float],
+        cumulative: list[int],
+        count: int,
+        total: float,
+        labels: dict[str, str] | None = None,
+    ) -> None:
+        """Write a histogram (cumulative bucket counts, sum and count)."""
+        name = f"{PREFIX}_{name}"
+        samples = self._family(name, "histogram", help_text)
+        for bound, bucket_count in zip(buckets, cumulative):
+            bucket_labels = {**(labels or {}), "le": _format_value(bound)}
+            samples.append(self._sample(f"{name}_bucket", bucket_labels, bucket_count))
+        samples.append(
+            self._sample(f"{name}_bucket", {**(labels or {}), "le": "+Inf"}, count)
+        )
+        samples.append(self._sample(f"{name}_sum", labels, total))
+        samples.append(self._sample(f"{name}_count", labels, count))
+
+    def render(self) -> str:
+        """Exposition text."""
+        lines = []
+        for name, (kind, help_text, samples) in self._families.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+# ============================================================================
+# Exporters
+# ============================================================================
+
+
+def export_latency(writer: MetricsWriter) -> None:
+    """Pipeline latency histograms and rolling-window percentiles."""
+    from phone_agent.core.metrics import WINDOWS, get_metrics
+
+    components = get_metrics().snapshot_components()
+    for name in sorted(components)[:MAX_COMPONENTS]:
+        metrics = components[name]
+        labels = {"component": name}
+        histogram = metrics.histogram
+        writer.histogram(
+            "latency_seconds",
+            "Latency of pipeline components",
+            LATENCY_BUCKETS,
+            histogram.cumulative(LATENCY_BUCKETS),
+            histogram.count,
+            histogram.total,
+            labels,
+        )
+        for window in WINDOWS:
+            recent = metrics.window(window)
+            for quantile in (0.5, 0.9, 0.99):
+                writer.gauge(
+                    "latency_recent_seconds",
+                    "Latency percentiles over rolling windows",
+                    recent.percentile(quantile),
+                    {**labels, "window": window, "quantile": str(quantile)},
+                )
+    if len(components) > MAX_COMPONENTS:
+        log.warning(
+            "Latency components over export limit",
+            components=len(components),
+            limit=MAX_COMPONENTS,
+        )
+
+
+BRIDGE_COUNTERS = {
+    "connections": "Audio bridge connections accepted",
+    "bytes_received": "Audio bytes received from the media server",
+    "bytes_sent": "Audio bytes sent to the media server",
+    "frames_received": "Audio frames received",
+    "frames_sent": "Audio frames sent",
+    "codec_decode_errors": "Codec decode errors",
+    "codec_encode_errors": "Codec encode errors",
+    "jitter_buffer_underruns": "Jitter buffer underruns",
+    "jitter_buffer_overruns": "Jitter buffer overruns",
+    "utterances_detected": "Utterances detected by the endpointer",
+    "silence_seconds_skipped": "Seconds of silence not sent to STT",
+    "frames_dropped": "Inbound frames dropped on full ingest queues",
+    "barge_ins": "Caller barge-ins during playout",
+    "responses_dropped": "Response audio dropped after a barge-in",
+}
+
+
+def export_bridge(writer: MetricsWriter, bridge: Any) -> None:
+    """Audio bridge counters; per-call ingest queues are aggregated."""
+    stats = bridge.statistics.to_dict()
+    for key, help_text in BRIDGE_COUNTERS.items():
+        value = stats["connections_total"] if key == "connections" else stats[key]
+        writer.counter(f"bridge_{key}", help_text, value)
+    calls = stats["calls"].values()
+    writer.gauge("bridge_connections_active", "Active audio bridge connections",
+                 stats["connections_active"])
+    writer.gauge(
+        "bridge_ingest_queue_depth",
+        "Frames waiting in ingest queues (all calls)",
+        sum(call["queue_depth"] for call in calls),
+    )
+    writer.gauge("bridge_ingest_queue_max_depth", "Deepest ingest queue of any call",
+                 max((call["queue_depth"] for call in calls), default=0))
+    writer.gauge(
+        "bridge_playout_buffered_seconds",
+        "Audio buffered for playout (all calls)",
+        sum(call["playout_buffered_ms"] for call in calls) / 1000,
+    )
+
+
+def export_freeswitch(writer: MetricsWriter, client: Any) -> None:
+    """FreeSWITCH ESL command counters and connection state.
+
+    Per-command latencies are exported as ``esl_<command>`` latency components.
+    """
+    stats = client.statistics.to_dict()
+    for key, help_text in [
+        ("commands_sent", "ESL commands sent"),
+        ("commands_completed", "ESL commands completed"),
+        ("commands_failed", "ESL commands answered with -ERR"),
+        ("commands_timed_out", "ESL commands that timed out"),
+        ("events_received", "ESL events received"),
+    ]:
+        writer.counter(f"esl_{key}", help_text, stats[key])
+    writer.gauge("esl_commands_in_flight", "ESL commands waiting for a result",
+                 client.commands_in_flight)
+    writer.gauge("esl_events_pending", "ESL events queued behind a running handler",
+                 client.pending_events)
+    writer.gauge("esl_connected", "Connected to FreeSWITCH (1) or not (0)",
+                 1 if client.is_connected else 0)
+
+
+def export_rtp_engine(writer: MetricsWriter, engine: Any) -> None:
+    """RTP media engine packet counters and active sessions."""
+    stats = engine.rtp_statistics.to_dict()
+    for key, help_text in [
+        ("sessions_opened", "RTP sessions opened"),
+        ("sessions_timed_out", "RTP sessions ended by the media timeout"),
+        ("sessions_expired", "RTP sessions whose expected source never sent media"),
+        ("packets_received", "RTP packets received"),
+        ("packets_sent", "RTP packets sent"),
+        ("packets_invalid", "Datagrams not parseable as RTP/RTCP"),
+        ("packets_unknown_source", "RTP packets matching no session"),
+        (
+            "packets_rejected",
+            "RTP/RTCP packets from an address a session does not follow",
+        ),
+        ("rtcp_received", "RTCP packets received"),
+        ("rtcp_sent", "RTCP packets sent"),
+        ("byes_received", "RTCP BYE packets received"),
+    ]:
+        writer.counter(f"rtp_{key}", help_text, stats[key])
+    writer.gauge(
+        "rtp_sessions_active", "Active RTP media sessions", engine.active_sessions
+    )
+
+
+def export_campaign_scheduler(writer: MetricsWriter, scheduler: Any) -> None:
+    """Recall campaign scheduler counters and state."""
+    metrics = scheduler.metrics
+    for key, help_text in [
+        ("contacts_processed", "Campaign contacts processed"),
+        ("calls_initiated", "Campaign calls initiated"),
+        ("calls_completed", "Campaign calls completed"),
+        ("calls_failed", "Campaign calls failed"),
+        ("errors", "Campaign scheduler errors"),
+    ]:
+        writer.counter(f"campaign_{key}", help_text, getattr(metrics, key))
+    writer.gauge(
+        "campaign_active_calls",
+        "Campaign calls in progress",
+        scheduler.active_call_count,
+    )
+    writer.gauge(
+        "campaign_scheduler_running",
+        "Campaign scheduler running (1) or not (0)",
+        1 if scheduler.is_running else 0,
+    )
+
+
+def export_dialer(writer: MetricsWriter, dialer: Any) -> None:
+    """Outbound dialer counters, queue and status."""
+    stats = dialer.stats
+    for key, help_text in [
+        ("calls_queued", "Outbound calls queued"),
+        ("calls_completed", "Outbound calls completed"),
+        ("calls_answered", "Outbound calls answered"),
+        ("calls_no_answer", "Outbound calls not answered"),
+        ("calls_failed", "Outbound calls failed"),
+        ("sms_sent", "SMS fallbacks sent"),
+    ]:
+        writer.counter(f"dialer_{key}", help_text, getattr(stats, key))
+    writer.gauge("dialer_queue_size", "Outbound calls waiting", dialer.queue_size)
+    for status in type(dialer.status):
+        writer.gauge("dialer_status", "Outbound dialer status (1 for the current one)",
+                     1 if dialer.status == status else 0, {"status": status.value})
+
+
+def export_llm_prompt_cache(
+    writer: MetricsWriter,
+    llm: Any,
+    labels: dict[str, str] | None = None,
+) -> None:
+    """LLM prompt prefix cache hits and prompt-eval tokens saved."""
+    stats = getattr(llm, "cache_statistics", None)
+    if not stats or not stats["enabled"]:
+        return
+    for key, help_text in [
+        ("lookups", "Prompt cache lookups"),
+        ("hits", "Prompt cache lookups restoring a conversation's own state"),
+        ("prompt_tokens", "Tokens in prompts looked up in the cache"),
+        ("reused_tokens", "Prompt tokens restored instead of evaluated"),
+        ("evictions", "Prompt states evicted from the cache"),
+    ]:
+        writer.counter(f"llm_prompt_cache_{key}", help_text, stats[key], labels)
+    writer.gauge("llm_prompt_cache_bytes", "Bytes of saved prompt states",
+                 stats["bytes"], labels)
+    writer.gauge("llm_prompt_cache_entries", "Saved prompt states",
+                 stats["entries"], labels)
+
+
+def export_tts_cache(
+    writer: MetricsWriter,
+    cache: Any,
+    labels: dict[str, str] | None = None,
+) -> None:
+    """TTS phrase cache hits, audio bytes saved and tier sizes."""
+    stats = cache.statistics
+    labels = labels or {}
+    writer.counter("tts_cache_lookups", "Phrase cache lookups",
+                   stats["lookups"], labels)
+    for tier in ("memory", "disk"):
+        writer.counter("tts_cache_hits", "Phrase cache hits per tier",
+                       stats[f"{tier}_hits"], {**labels, "tier": tier})
+    writer.counter("tts_cache_bytes_saved", "Audio bytes served without synthesis",
+                   stats["bytes_saved"], labels)
+    writer.counter("tts_cache_evictions", "Phrase audio evicted from memory",
+                   stats["evictions"], labels)
+    writer.gauge("tts_cache_hit_ratio", "Fraction of lookups served from cache",
+                 stats["hit_ratio"], labels)
+    writer.gauge("tts_cache_entries", "Phrases held in memory",
+                 stats["entries"], labels)
+    for tier in ("memory", "disk"):
+        writer.gauge("tts_cache_bytes", "Bytes of cached phrase audio per tier",
+                     stats[f"{tier}_bytes"], {**labels, "tier": tier})
+
+
+def export_circuit_breakers(writer: MetricsWriter) -> None:
+    """State and failure count of every circuit breaker."""
+    from phone_agent.core.retry import CircuitState, get_circuit_breaker_status
+
+    for name, status in sorted(get_circuit_breaker_status().items()):
+        for state in CircuitState:
+            writer.gauge(
+                "circuit_breaker_state",
+                "Circuit breaker state (1 for the current one)",
+                1 if status["state"] == state.value else 0,
+                {"breaker": name, "state": state.value},
+            )
+        writer.gauge(
+            "circuit_breaker_failures",
+            "Consecutive failures counted by the breaker",
+            status["failure_count"],
+            {"breaker": name},
+        )
+
+
+def export_db_pool(writer: MetricsWriter) -> None:
+    """Database connection pool occupancy and checkout counters."""
+    from phone_agent.db.session import get_pool_statistics
+
+    stats = get_pool_statistics()
+    if stats is None:
+        return
+    for key, help_text in [
+        ("connects", "Database connections opened"),
+        ("checkouts", "Database connection checkouts"),
+        ("checkins", "Database connection checkins"),
+        ("invalidations", "Database connections invalidated"),
+        ("timeouts", "Checkouts that timed out waiting for a connection"),
+    ]:
+        writer.counter(f"db_pool_{key}", help_text, stats[key])
+    writer.counter("db_pool_checkout_seconds", "Time connections were checked out",
+                   stats["checkout_seconds"])
+    for key, help_text in [
+        ("size", "Configured pool size"),
+        ("checked_out", "Connections currently checked out"),
+        ("overflow", "Overflow connections currently open"),
+        ("capacity", "Pool size plus allowed overflow"),
+    ]:
+        if key in stats:
+            writer.gauge(f"db_pool_{key}", help_text, stats[key])
+
+
+def export_executors(writer: MetricsWriter) -> None:
+    """Queue depth of the inference scheduler and VAD service, if running."""
+    from phone_agent.ai.scheduler import peek_inference_scheduler
+    from phone_agent.ai.vad_service import peek_vad_service
+
+    inference = peek_inference_scheduler()
+    if inference is not None:
+        stats = inference.statistics
+        labels = {"executor": "inference"}
+        writer.gauge("executor_queue_depth", "Work items waiting for a worker",
+                     stats["queue_depth"], labels)
+        writer.gauge(
+            "executor_busy_workers",
+            "Workers running an item",
+            stats["busy_workers"],
+            labels,
+        )
+        writer.gauge("executor_workers", "Worker threads", stats["workers"], labels)
+        for key in ("submitted", "completed", "failed", "cancelled"):
+            writer.counter(f"executor_{key}", f"Work items {key}", stats[key], labels)
+
+    vad = peek_vad_service()
+    if vad is not None:
+        stats = vad.statistics
+        labels = {"executor": "vad"}
+        writer.gauge("executor_queue_depth", "Work items waiting for a worker",
+                     vad.pending_requests, labels)
+        writer.gauge(
+            "vad_active_streams",
+            "Calls registered with the VAD service",
+            vad.active_streams,
+        )
+        writer.counter("vad_windows", "VAD windows evaluated", stats["windows"])
+        writer.counter(
+            "vad_forward_passes", "Batched VAD forward passes", stats["passes"]
+        )
+
+
+def _export_telephony(writer: MetricsWriter) -> None:
+    from phone_agent.dependencies import peek_telephony_service
+
+    service = peek_telephony_service()
+    if service is not None:
+        export_bridge(writer, service.audio_bridge)
+        if service.freeswitch_client is not None:
+            export_freeswitch(writer, service.freeswitch_client)
+        if service.rtp_engine is not None:
+            export_rtp_engine(writer, service.rtp_engine)
+
+
+def _export_models(writer: MetricsWriter) -> None:
+    from phone_agent.dependencies import peek_llm, peek_telephony_service, peek_tts
+
+    # The telephony engine and the API endpoints hold separate models
+    service = peek_telephony_service()
+    sources = [("api", peek_llm(), peek_tts())]
+    if service is not None:
+        engine = service.conversation_engine
+        sources.insert(0, ("telephony", engine.llm, engine.tts))
+    exported: set[int] = set()
+    for engine_name, llm, tts in sources:
+        labels = {"engine": engine_name}
+        if llm is not None and id(llm) not in exported:
+            exported.add(id(llm))
+            export_llm_prompt_cache(writer, llm, labels)
+        # Local (Piper) and ElevenLabs TTS both keep their cache on .cache
+        cache = getattr(tts, "cache", None)
+        if cache is not None and id(cache) not in exported:
+            exported.add(id(cache))
+            export_tts_cache(writer, cache, labels)
+
+
+def _export_dialer(writer: MetricsWriter) -> None:
+    from phone_agent.industry.gesundheit.outbound.dialer import peek_outbound_dialer
+
+    dialer = peek_outbound_dialer()
+    if dialer is not None:
+        export_dialer(writer, dialer)
+
+
+# Collectors run on every scrape; each only reports components that exist
+_collectors: dict[str, Callable[[MetricsWriter], None]] = {
+    "latency": export_latency,
+    "bridge": _export_telephony,
+    "models": _export_models,
+    "dialer": _export_dialer,
+    "circuit_breakers": export_circuit_breakers,
+    "db_pool": export_db_pool,
+    "executors": export_executors,
+}
+
+
+def register_collector(name: str, collector: Callable[[MetricsWriter], None]) -> None:
+    """Add or replace a collector (e.g. for an instance owned by the app).
+
+    Args:
+        name: Unique collector name
+        collector: Writes samples into the writer
+    """
+    _collectors[name] = collector
+
+
+def unregister_collector(name: str) -> None:
+    """Remove a collector."""
+    _collectors.pop(name, None)
+
+
+def deployment_labels() -> dict[str, str]:
+    """Constant tenant/industry labels of this deployment."""
+    from phone_agent.config import get_settings
+
+    settings = get_settings()
+    return {
+        "tenant": settings.device_id or settings.device_name,
+        "industry": settings.industry.name,
+    }
+
+
+def collect(const_labels: dict[str, str] | None = None) -> str:
+    """Run all collectors and render the exposition text.
+
+    A failing collector is logged and skipped; the others still report.
+
+    Args:
+        const_labels: Labels for every series (default: deployment_labels())
+
+    Returns:
+        Prometheus text format
+    """
+    writer = MetricsWriter(
+        const_labels if const_labels is not None else deployment_labels()
+    )
+    for name, collector in list(_collectors.items()):
+        try:
+            collector(writer)
+        except Exception as e:
+            log.warning("Metrics collector failed", collector=name, error=str(e))
+    writer.gauge("up", "Phone agent metrics endpoint reachable", 1)
+    return writer.render()
@@ -0,0 +1,303 @@
+"""Overlapped LLM / TTS / playout pipeline for one response.
+
+A streamed response used to run strictly in sequence: the LLM generator
+was advanced on the event loop, and every sentence was synthesized and
+played before the next token was requested. The pipeline splits a turn
+into concurrent stages connected by bounded queues:
+
+    LLM tokens (worker thread) -> sentence segmenter -> TTS (worker thread)
+    -> playout consumer
+
+so sentence N+1 is generated and synthesized while sentence N plays.
+The bounded queues keep the LLM and TTS from running arbitrarily far
+ahead of the caller, which matters when the caller barges in.
+
+Usage:
+    pipeline = ResponsePipeline(llm, tts)
+    result = await pipeline.run(messages, on_audio_chunk=send_pcm)
+    log.info("Turn", **result.timings.to_dict())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import Any
+
+from itf_shared import get_logger
+
+from phone_agent.ai import iterate_in_thread, pcm_to_wav
+from phone_agent.core import tracing
+
+log = get_logger(__name__)
+
+
+# Sentence boundary pattern for German text
+# Matches: period, exclamation, question mark followed by space or end
+SENTENCE_END_PATTERN = re.compile(r'([.!?])(?:\s+|$)')
+
+
+def extract_complete_sentence(buffer: str) -> tuple[str | None, str]:
+    """Extract the first complete sentence from a buffer.
+
+    Args:
+        buffer: Text buffer that may contain partial sentences
+
+    Returns:
+        Tuple of (complete_sentence or None, remaining_buffer)
+    """
+    match = SENTENCE_END_PATTERN.search(buffer)
+    if match:
+        # Found a sentence boundary
+        end_pos = match.end()
+        sentence = buffer[:end_pos].strip()
+        remaining = buffer[end_pos:].lstrip()
+
+        # Filter out very short "sentences" (likely noise)
+        if len(sentence) >= 5:
+            return sentence, remaining
+
+    return None, buffer
+
+
+@dataclass
+class PipelineConfig:
+    """Response pipeline configuration."""
+
+    sentence_queue_size: int = 2  # Sentences generated ahead of TTS
+    audio_queue_chunks: int = 64  # PCM chunks synthesized ahead of playout
+    min_tail_chars: int = 3  # Shorter trailing text is not spoken
+
+
+@dataclass
+class StageTimings:
+    """Per-stage timing of one response, in seconds from turn start."""
+
+    first_token: float | None = None
+    first_sentence: float | None = None
+    first_audio: float | None = None  # First PCM chunk handed to playout
+    llm: float = 0.0  # Until the last token was generated
+    tts: float = 0.0  # Time spent synthesizing (excludes queue waits)
+    playout: float = 0.0  # Time spent in playout callbacks
+    total: float = 0.0
+    sentences: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary (milliseconds)."""
+
+        def ms(value: float | None) -> float | None:
+            return None if value is None else round(value * 1000, 1)
+
+        return {
+            "first_token_ms": ms(self.first_token),
+            "first_sentence_ms": ms(self.first_sentence),
+            "first_audio_ms": ms(self.first_audio),
+            "llm_ms": ms(self.llm),
+            "tts_ms": ms(self.tts),
+            "playout_ms": ms(self.playout),
+            "total_ms": ms(self.total),
+            "sentences": self.sentences,
+        }
+
+
+@dataclass
+class PipelineResult:
+    """Outcome of one pipelined response."""
+
+    text: str
+    pcm_chunks: list[bytes] = field(default_factory=list)
+    sample_rate: int = 22050
+    timings: StageTimings = field(default_factory=StageTimings)
+
+    @property
+    def wav(self) -> bytes:
+        """Whole response as a single WAV."""
+        return pcm_to_wav(self.pcm_chunks, self.sample_rate)
+
+
+class ResponsePipeline:
+    """Run LLM generation, synthesis and playout concurrently.
+
+    The LLM generator and TTS stream each run on a worker thread. The
+    playout stage runs the caller's callbacks on the event loop; while it
+    awaits them, the other stages keep working on later sentences.
+    """
+
+    def __init__(
+        self,
+        llm: Any,
+        tts: Any,
+        config: PipelineConfig | None = None,
+    ) -> None:
+        """Initialize response pipeline.
+
+        Args:
+            llm: Model with generate_stream_with_history(messages)
+            tts: Engine with synthesize_stream_async(text) and sample_rate
+            config: Pipeline configuration
+        """
+        self.llm = llm
+        self.tts = tts
+        self.config = config or PipelineConfig()
+
+    async def run(
+        self,
+        messages: list[dict[str, str]],
+        on_sentence_ready: Callable[[str, bytes], Awaitable[None]] | None = None,
+        on_audio_chunk: Callable[[bytes], Awaitable[None]] | None = None,
+    ) -> PipelineResult:
+        """Generate, synthesize and play one response.
+
+        Args:
+            messages: Chat messages for the LLM
+            on_sentence_ready: Called with (sentence, wav_bytes) once a
+                               sentence is fully synthesized
+            on_audio_chunk: Called with each raw PCM chunk as it is synthesized
+
+        Returns:
+            Response text, PCM and stage timings
+
+        Raises:
+            Exception: The first error raised by any stage (the others are cancelled)
+        """
+        start = time.perf_counter()
+        result = PipelineResult(text="", sample_rate=self.tts.sample_rate)
+        sentences: asyncio.Queue[str | None] = asyncio.Queue(
+            self.config.sentence_queue_size
+        )
+        audio: asyncio.Queue[tuple[str, bytes | None] | None] = asyncio.Queue(
+            self.config.audio_queue_chunks
+        )
+        tokens: list[str] = []
+
+        stages = [
+            asyncio.create_task(
+                self._generate(messages, sentences, tokens, result.timings, start)
+            ),
+            asyncio.create_task(self._synthesize(sentences, audio, result.timings)),
+            asyncio.create_task(
+                self._play(audio, result, on_sentence_ready, on_audio_chunk, start)
+            ),
+        ]
+        try:
+            done, _ = await asyncio.wait(stages, return_when=asyncio.FIRST_EXCEPTION)
+            for stage in done:
+                if stage.exception() is not None:
+                    raise stage.exception()
+        finally:
+            for stage in stages:
+                if not stage.done():
+                    stage.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+
+        result.text = "".join(tokens)
+        result.timings.total = time.perf_counter() - start
+        return result
+
+    async def _generate(
+        self,
+        messages: list[dict[str, str]],
+        sentences: asyncio.Queue[str | None],
+        tokens: list[str],
+        timings: StageTimings,
+        start: float,
+    ) -> None:
+        """Stage 1: stream tokens from a worker thread and segment sentences."""
+        buffer = ""
+        began = tracing.now()
+        first_token_at = None
+        stream = iterate_in_thread(self.llm.generate_stream_with_history, messages)
+        async with aclosing(stream):
+            async for token in stream:
+                if timings.first_token is None:
+                    timings.first_token = time.perf_counter() - start
+                    first_token_at = tracing.now()
+                    tracing.record_span("llm.prompt_eval", began, first_token_at)
+                tokens.append(token)
+                buffer += token
+
+                while True:
+                    sentence, buffer = extract_complete_sentence(buffer)
+                    if sentence is None:
+                        break
+                    if timings.first_sentence is None:
+                        timings.first_sentence = time.perf_counter() - start
+                        log.debug("Pipeline: first sentence", sentence=sentence[:50])
+                    await sentences.put(sentence)
+
+        if first_token_at is not None:
+            tracing.record_span("llm.generate", first_token_at, tokens=len(tokens))
+        tail = buffer.strip()
+        if len(tail) >= self.config.min_tail_chars:
+            await sentences.put(tail)
+        timings.llm = time.perf_counter() - start
+        await sentences.put(None)
+
+    async def _synthesize(
+        self,
+        sentences: asyncio.Queue[str | None],
+        audio: asyncio.Queue[tuple[str, bytes | None] | None],
+        timings: StageTimings,
+    ) -> None:
+        """Stage 2: synthesize sentences into PCM chunks."""
+        first_sentence = True
+        while (sentence := await sentences.get()) is not None:
+            began = tracing.now()
+            first_chunk_at = None
+            stream = self.tts.synthesize_stream_async(sentence)
+            async with aclosing(stream):
+                mark = time.perf_counter()
+                async for chunk in stream:
+                    timings.tts += time.perf_counter() - mark
+                    if first_chunk_at is None:
+                        first_chunk_at = tracing.now()
+                        if first_sentence:
+                            tracing.record_span(
+                                "tts.first_chunk", began, first_chunk_at
+                            )
+                            first_sentence = False
+                    await audio.put((sentence, chunk))
+                    mark = time.perf_counter()
+                timings.tts += time.perf_counter() - mark
+            first_chunk_ms = (
+                round((first_chunk_at - began) * 1000, 1) if first_chunk_at else None
+            )
+            tracing.record_span(
+                "tts", began, chars=len(sentence), first_chunk_ms=first_chunk_ms
+            )
+            await audio.put((sentence, None))  # End of sentence
+        await audio.put(None)
+
+    async def _play(
+        self,
+        audio: asyncio.Queue[tuple[str, bytes | None] | None],
+        result: PipelineResult,
+        on_sentence_ready: Callable[[str, bytes], Awaitable[None]] | None,
+        on_audio_chunk: Callable[[bytes], Awaitable[None]] | None,
+        start: float,
+    ) -> None:
+        """Stage 3: hand audio to the caller as it arrives."""
+        timings = result.timings
+        sentence_start = 0
+        while (item := await audio.get()) is not None:
+            sentence, chunk = item
+            began = time.perf_counter()
+            if chunk is None:
+                timings.sentences += 1
+                if on_sentence_ready is not None:
+                    wav = pcm_to_wav(
+                        result.pcm_chunks[sentence_start:], result.sample_rate
+                    )
+                    await on_sentence_ready(sentence, wav)
+                sentence_start = len(result.pcm_chunks)
+            else:
+                if timings.first_audio is None:
+                    timings.first_audio = began - start
+                result.pcm_chunks.append(chunk)
+                if on_audio_chunk is not None:
+                    await on_audio_chunk(chunk)
+            timings.playout += time.perf_counter() - began
@@ -0,0 +1,420 @@
+"""Per-turn tracing across the voice pipeline.
+
+Each conversational turn gets a trace with a trace ID, carried through
+async code in a context variable. Components record spans on whatever
+trace is current, so a turn's breakdown builds up without threading a
+tracer through every call:
+
+    VAD endpoint -> STT (queue wait / compute) -> triage
+    -> LLM (prompt eval / generation) -> TTS (first chunk / total)
+    -> encode -> network send -> playout
+
+Spans are cheap and always recorded while tracing is enabled. When a
+trace finishes it is kept in memory and, if sampled or slower than
+``slow_turn_ms``, exported as one JSON line for offline analysis.
+
+Work handed to thread pools does not inherit context variables; code
+that crosses threads captures ``current_trace()`` / ``current_span_id()``
+first and calls ``Trace.add_span`` from the worker.
+
+Usage:
+    tracer = get_tracer()
+    with tracer.turn(call_id=str(call_id)):
+        with span("stt"):
+            text = await stt.transcribe_async(audio)
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from itf_shared import get_logger
+
+log = get_logger(__name__)
+
+
+_current_trace: ContextVar[Trace | None] = ContextVar("phone_agent_trace", default=None)
+_current_span: ContextVar[str | None] = ContextVar("phone_agent_span", default=None)
+
+
+def now() -> float:
+    """Clock used for span times (monotonic seconds)."""
+    return time.monotonic()
+
+
+@dataclass
+class TracingConfig:
+    """Tracing configuration."""
+
+    enabled: bool = True
+    sample_rate: float = 0.01  # Share of turns exported regardless of speed
+    slow_turn_ms: float = 2000.0  # Slower turns are always exported
+    export_path: str | None = None  # JSON lines file (None: keep in memory only)
+    max_spans: int = 512  # Per trace; further spans are dropped
+    keep_recent: int = 100  # Finished traces kept in memory
+
+
+@dataclass
+class Span:
+    """A timed operation within a trace (times are monotonic seconds)."""
+
+    name: str
+    span_id: str
+    parent_id: str | None
+    start: float
+    end: float
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        """Span duration in seconds."""
+        return self.end - self.start
+
+
+class Trace:
+    """Spans of one turn (or other unit of work)."""
+
+    def __init__(
+        self,
+        name: str,
+        call_id: str | None = None,
+        start: float | None = None,
+        max_spans: int = 512,
+        **attributes: Any,
+    ) -> None:
+        """Initialize trace.
+
+        Args:
+            name: Trace name (e.g. "turn")
+            call_id: Call the trace belongs to
+            start: Monotonic start time (default: now)
+            max_spans: Spans beyond this are dropped
+            **attributes: Trace attributes
+        """
+        self.trace_id = uuid.uuid4().hex
+        self.name = name
+        self.call_id = call_id
+        self.start = start if start is not None else now()
+        # Wall-clock time matching the (possibly backdated) start
+        self.started_at = datetime.now(UTC).timestamp() - (now() - self.start)
+        self.end: float | None = None
+        self.attributes = attributes
+        self.spans: list[Span] = []
+        self.dropped_spans = 0
+        self.max_spans = max_spans
+        self._ids = iter(range(1, 1 << 62))
+
+    def add_span(
+        self,
+        name: str,
+        start: float,
+        end: float,
+        parent_id: str | None = None,
+        **attributes: Any,
+    ) -> Span | None:
+        """Record a span measured elsewhere (safe from worker threads).
+
+        Args:
+            name: Span name
+            start: Monotonic start time
+            end: Monotonic end time
+            parent_id: Enclosing span
+            **attributes: Span attributes
+
+        Returns:
+            The span, or None if the trace is full
+        """
+        if len(self.spans) >= self.max_spans:
+            self.dropped_spans += 1
+            return None
+        span = Span(
+            name=name,
+            span_id=f"{next(self._ids):x}",
+            parent_id=parent_id,
+            start=start,
+            end=end,
+            attributes=attributes,
+        )
+        self.spans.append(span)
+        return span
+
+    @property
+    def duration(self) -> float:
+        """Trace duration in seconds (so far, if not finished)."""
+        return (self.end if self.end is not None else now()) - self.start
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary (milliseconds relative to trace start)."""
+
+        def ms(value: float) -> float:
+            return round(value * 1000, 2)
+
+        return {
+            "trace_id": self.trace_id,
+            "name": self.name,
+            "call_id": self.call_id,
+            "started_at": datetime.fromtimestamp(self.started_at, UTC).isoformat(),
+            "duration_ms": ms(self.duration),
+            "attributes": self.attributes,
+            "dropped_spans": self.dropped_spans,
+            "spans": [
+                {
+                    "name": span.name,
+                    "span_id": span.span_id,
+                    "parent_id": span.parent_id,
+                    "start_ms": ms(span.start - self.start),
+                    "duration_ms": ms(span.duration),
+                    **({"attributes": span.attributes} if span.attributes else {}),
+                }
+                for span in sorted(self.spans, key=lambda s: s.start)
+            ],
+        }
+
+
+def current_trace() -> Trace | None:
+    """Trace of the running turn, if any."""
+    return _current_trace.get()
+
+
+def current_span_id() -> str | None:
+    """Innermost open span of the running turn, if any."""
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span | None]:
+    """Time a block as a span of the current trace (no-op without one).
+
+    Spans opened inside the block become its children. Attributes may
+    be added to the yielded span before the block ends.
+
+    Args:
+        name: Span name
+        **attributes: Span attributes
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    parent_id = _current_span.get()
+    record = trace.add_span(name, now(), 0.0, parent_id=parent_id, **attributes)
+    token = _current_span.set(record.span_id) if record is not None else None
+    try:
+        yield record
+    finally:
+        if record is not None:
+            record.end = now()
+            _current_span.reset(token)
+
+
+def record_span(
+    name: str, start: float, end: float | None = None, **attributes: Any
+) -> None:
+    """Record an already-measured span on the current trace (no-op without one).
+
+    Args:
+        name: Span name
+        start: Monotonic start time
+        end: Monotonic end time (default: now)
+        **attributes: Span attributes
+    """
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add_span(
+            name,
+            start,
+            end if end is not None else now(),
+            parent_id=_current_span.get(),
+            **attributes,
+        )
+
+
+class JsonLinesExporter:
+    """Append finished traces to a JSON lines file."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize exporter.
+
+        Args:
+            path: Output file (parent directories are created)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        """Write one trace as a line."""
+        line = json.dumps(trace.to_dict(), ensure_ascii=False, default=str)
+        with self._lock, self.path.open("a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+class Tracer:
+    """Starts traces, keeps recent ones and exports the sampled or slow."""
+
+    def __init__(
+        self,
+        config: TracingConfig | None = None,
+        exporter: JsonLinesExporter | None = None,
+    ) -> None:
+        """Initialize tracer.
+
+        Args:
+            config: Tracing configuration
+            exporter: Trace sink (default: JSON lines at config.export_path, if set)
+        """
+        self.config = config or TracingConfig()
+        if exporter is None and self.config.export_path:
+            exporter = JsonLinesExporter(self.config.export_path)
+        self.exporter = exporter
+        self._recent: deque[Trace] = deque(maxlen=self.config.keep_recent)
+        self._exported = 0
+
+    def start(
+        self,
+        name: str = "turn",
+        call_id: str | None = None,
+        start: float | None = None,
+        **attributes: Any,
+    ) -> Trace | None:
+        """Create a trace without activating it.
+
+        Args:
+            name: Trace name
+            call_id: Call the trace belongs to
+            start: Monotonic start time (e.g. when the caller stopped speaking)
+            **attributes: Trace attributes
+
+        Returns:
+            New trace, or None if tracing is disabled
+        """
+        if not self.config.enabled:
+            return None
+        return Trace(
+            name,
+            call_id=call_id,
+            start=start,
+            max_spans=self.config.max_spans,
+            **attributes,
+        )
+
+    @contextmanager
+    def activate(self, trace: Trace | None) -> Iterator[Trace | None]:
+        """Make a trace current for the block, finishing it afterwards."""
+        if trace is None:
+            yield None
+            return
+        token = _current_trace.set(trace)
+        span_token = _current_span.set(None)
+        try:
+            yield trace
+        finally:
+            _current_span.reset(span_token)
+            _current_trace.reset(token)
+            self.finish(trace)
+
+    @contextmanager
+    def turn(
+        self,
+        call_id: str | None = None,
+        name: str = "turn",
+        **attributes: Any,
+    ) -> Iterator[Trace | None]:
+        """Trace a turn, or join the turn already being traced.
+
+        Args:
+            call_id: Call the turn belongs to
+            name: Trace name
+            **attributes: Trace attributes (ignored when joining)
+        """
+        existing = _current_trace.get()
+        if existing is not None:
+            yield existing
+            return
+        with self.activate(self.start(name, call_id=call_id, **attributes)) as trace:
+            yield trace
+
+    def finish(self, trace: Trace) -> None:
+        """End a trace and export it if sampled or slow."""
+        if trace.end is not None:
+            return
+        trace.end = now()
+        self._recent.append(trace)
+
+        duration_ms = trace.duration * 1000
+        slow = duration_ms >= self.config.slow_turn_ms
+        if slow:
+            log.info(
+                "Slow turn",
+                trace_id=trace.trace_id,
+                call_id=trace.call_id,
+                duration_ms=round(duration_ms),
+                spans={
+                    s.name: round(s.duration * 1000)
+                    for s in trace.spans
+                    if s.parent_id is None
+                },
+            )
+        if self.exporter is not None and (
+            slow or random.random() < self.config.sample_rate
+        ):
+            try:
+                self.exporter.export(trace)
+                self._exported += 1
+            except Exception as e:
+                log.warning(
+                    "Trace export failed", trace_id=trace.trace_id, error=str(e)
+                )
+
+    @property
+    def recent(self) -> list[Trace]:
+        """Recently finished traces, oldest first."""
+        return list(self._recent)
+
+    @property
+    def exported(self) -> int:
+        """Traces exported so far."""
+        return self._exported
+
+
+# Global tracer instance
+_tracer: Tracer | None = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """Get the global tracer (configured from settings.tracing)."""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                from phone_agent.config import get_settings
+
+                settings = get_settings().tracing
+                _tracer = Tracer(TracingConfig(
+                    enabled=settings.enabled,
+                    sample_rate=settings.sample_rate,
+                    slow_turn_ms=settings.slow_turn_ms,
+                    export_path=settings.export_path,
+                ))
+    return _tracer
+
+
+def set_tracer(tracer: Tracer | None) -> None:
+    """Replace the global tracer (None: rebuild from settings on next use)."""
+    global _tracer
+    with _tracer_lock:
+        _tracer = tracer
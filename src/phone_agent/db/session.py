@@ -5,13 +5,19 @@ Provides:
 - AsyncSession factory with dependency injection
 - Database initialization and table creation
 - Transaction context manager
+- Connection pool statistics
 """
 from __future__ import annotations
 
+import time
+from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import AsyncGenerator
+from typing import Any
 
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -22,12 +28,94 @@ from sqlalchemy.ext.asyncio import (
 from phone_agent.config import get_settings
 from phone_agent.db.base import Base
 
-
 # Global engine and session factory (initialized lazily)
 _engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
 
 
+@dataclass
+class PoolStatistics:
+    """Connection pool counters, maintained by pool event listeners."""
+
+    connects: int = 0
+    checkouts: int = 0
+    checkins: int = 0
+    invalidations: int = 0
+    timeouts: int = 0  # Checkouts that gave up after pool_timeout
+    checkout_seconds: float = 0.0  # Total time connections were held
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "invalidations": self.invalidations,
+            "timeouts": self.timeouts,
+            "checkout_seconds": round(self.checkout_seconds, 3),
+        }
+
+
+_pool_stats = PoolStatistics()
+
+
+def instrument_pool(engine: AsyncEngine) -> None:
+    """Count checkouts and connection hold time on an engine's pool.
+
+    Args:
+        engine: Engine whose pool to observe
+    """
+    pool = engine.sync_engine.pool
+
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_connection: Any, record: Any) -> None:
+        _pool_stats.connects += 1
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection: Any, record: Any, proxy: Any) -> None:
+        _pool_stats.checkouts += 1
+        record.info["checked_out_at"] = time.perf_counter()
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_connection: Any, record: Any) -> None:
+        _pool_stats.checkins += 1
+        started = record.info.pop("checked_out_at", None)
+        if started is not None:
+            _pool_stats.checkout_seconds += time.perf_counter() - started
+
+    @event.listens_for(pool, "invalidate")
+    def _on_invalidate(dbapi_connection: Any, record: Any, exception: Any) -> None:
+        _pool_stats.invalidations += 1
+
+
+def get_pool_statistics() -> dict[str, Any] | None:
+    """Pool counters and current occupancy of the application engine.
+
+    Returns:
+        Statistics, or None if no engine has been created yet
+    """
+    if _engine is None:
+        return None
+    pool = _engine.sync_engine.pool
+    data = _pool_stats.to_dict()
+    data["pool_class"] = type(pool).__name__
+    # Occupancy is only available on queue-based pools
+    for key, method in [
+        ("size", "size"),
+        ("checked_out", "checkedout"),
+        ("checked_in", "checkedin"),
+        ("overflow", "overflow"),
+    ]:
+        if hasattr(pool, method):
+            data[key] = getattr(pool, method)()
+    if "overflow" in data:
+        data["overflow"] = max(data["overflow"], 0)  # Negative while below pool size
+    max_overflow = getattr(pool, "_max_overflow", None)
+    if max_overflow is not None and "size" in data:
+        data["capacity"] = data["size"] + max(max_overflow, 0)
+    return data
+
+
 def get_engine() -> AsyncEngine:
     """Get or create the async database engine.
 
@@ -81,6 +169,8 @@ def get_engine() -> AsyncEngine:
                 pool_pre_ping=True,
             )
 
+        instrument_pool(_engine)
+
     return _engine
 
 
@@ -122,7 +212,9 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         try:
             yield session
             await session.commit()
-        except Exception:
+        except Exception as e:
+            if isinstance(e, PoolTimeoutError):
+                _pool_stats.timeouts += 1
             await session.rollback()
             raise
 
@@ -143,7 +235,9 @@ async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
         try:
             yield session
             await session.commit()
-        except Exception:
+        except Exception as e:
+            if isinstance(e, PoolTimeoutError):
+                _pool_stats.timeouts += 1
             await session.rollback()
             raise
 
@@ -156,20 +250,20 @@ async def init_db() -> None:
     """
     # Import all models to register them with Base.metadata
     from phone_agent.db.models import (  # noqa: F401
-        CallModel,
         AppointmentModel,
-        ContactModel,
-        CompanyModel,
-        ContactCompanyLinkModel,
         AuditLogModel,
-        ConsentModel,
         CallMetricsModel,
-        CampaignMetricsModel,
-        RecallCampaignModel,
+        CallModel,
         CampaignContactModel,
+        CampaignMetricsModel,
+        CompanyModel,
+        ConsentModel,
+        ContactCompanyLinkModel,
+        ContactModel,
         DashboardSnapshotModel,
-        SMSMessageModel,
         EmailMessageModel,
+        RecallCampaignModel,
+        SMSMessageModel,
     )
 
     engine = get_engine()
@@ -107,6 +107,15 @@ def get_telephony_service():
     return _telephony_service_instance
 
 
+def peek_telephony_service():
+    """Get the telephony service singleton without creating it.
+
+    Returns:
+        TelephonyService instance, or None if none was created yet
+    """
+    return _telephony_service_instance
+
+
 def get_sip_client():
     """Get SIP client singleton.
 
@@ -235,6 +244,15 @@ def get_llm():
     return _llm_instance
 
 
+def peek_llm():
+    """Get the Language Model instance without creating it.
+
+    Returns:
+        LanguageModel instance, or None if none was created yet
+    """
+    return _llm_instance
+
+
 def get_tts():
     """Get Text-to-Speech instance.
 
@@ -247,6 +265,7 @@ def get_tts():
         with _tts_lock:
             if _tts_instance is None:
                 from phone_agent.ai.tts import TextToSpeech
+                from phone_agent.ai.tts_cache import create_tts_cache
 
                 settings = get_settings()
                 _tts_instance = TextToSpeech(
@@ -256,6 +275,7 @@ def get_tts():
                     sample_rate=settings.ai.tts.sample_rate,
                     voices=settings.ai.tts.voices,
                     max_cached_voices=settings.ai.tts.max_cached_voices,
+                    cache=create_tts_cache(settings.ai.tts),
                 )
 
                 # Preload voices if configured
@@ -265,6 +285,15 @@ def get_tts():
     return _tts_instance
 
 
+def peek_tts():
+    """Get the Text-to-Speech instance without creating it.
+
+    Returns:
+        TextToSpeech instance, or None if none was created yet
+    """
+    return _tts_instance
+
+
 # Language Detection
 _language_detector_instance = None
 
@@ -242,6 +242,14 @@ Vielen Dank für Ihren Anruf!"
 Antworte nur mit der Verabschiedung."""
 
 
+# Fixed phrases spoken verbatim (synthesized ahead of time into the TTS cache)
+TTS_PHRASES = [
+    "Vielen Dank für Ihren Anruf!",
+    "Bei Fragen erreichen Sie uns jederzeit. Auf Wiederhören!",
+    "Sie erhalten eine Bestätigung per E-Mail mit allen Details.",
+]
+
+
 # SMS/Email Templates
 SMS_APPOINTMENT_CONFIRMATION = """Kanzlei {practice_name}
 
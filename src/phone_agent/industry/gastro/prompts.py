@@ -221,6 +221,14 @@ sind wir gerne für Sie da. Einen schönen Tag noch!"
 Antworte nur mit der Verabschiedung."""
 
 
+# Fixed phrases spoken verbatim (synthesized ahead of time into the TTS cache)
+TTS_PHRASES = [
+    "Vielen Dank für Ihren Anruf und bis bald!",
+    "Sie erhalten gleich eine SMS-Bestätigung.",
+    "Vielen Dank für Ihren Anruf! Einen schönen Tag noch!",
+]
+
+
 # SMS Templates
 SMS_RESERVATION_CONFIRMATION = """Restaurant {restaurant_name}
 
@@ -12,6 +12,7 @@ from phone_agent.industry.gesundheit.outbound.dialer import (
     CallPriority,
     QueuedCall,
     get_outbound_dialer,
+    peek_outbound_dialer,
 )
 from phone_agent.industry.gesundheit.outbound.conversation_outbound import (
     OutboundConversationManager,
@@ -53,6 +54,7 @@ __all__ = [
     "CallPriority",
     "QueuedCall",
     "get_outbound_dialer",
+    "peek_outbound_dialer",
     # Conversation
     "OutboundConversationManager",
     "OutboundState",
@@ -1069,3 +1069,12 @@ def get_outbound_dialer(
         )
 
     return _outbound_dialer
+
+
+def peek_outbound_dialer() -> OutboundDialer | None:
+    """Get the global OutboundDialer without creating it.
+
+    Returns:
+        OutboundDialer instance, or None if none was created yet
+    """
+    return _outbound_dialer
@@ -146,6 +146,17 @@ Auf Wiederhören und einen schönen Tag!"
 Antworte nur mit der Verabschiedung."""
 
 
+# Fixed phrases spoken verbatim (synthesized ahead of time into the TTS cache)
+TTS_PHRASES = [
+    "Vielen Dank für Ihren Anruf. Auf Wiederhören!",
+    (
+        "Vielen Dank für Ihren Anruf. Bei weiteren Fragen sind wir gerne für Sie da. "
+        "Auf Wiederhören und einen schönen Tag!"
+    ),
+    "Sie erhalten eine Bestätigung per SMS.",
+]
+
+
 # Prompt for handling recall/follow-up campaigns
 RECALL_PROMPT = """Du rufst einen Patienten für eine Recall-Kampagne an.
 
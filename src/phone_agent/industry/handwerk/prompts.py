@@ -140,6 +140,14 @@ Bitte bleiben Sie erreichbar unter dieser Nummer.
 Auf Wiederhören!"
 """
 
+
+# Fixed phrases spoken verbatim (synthesized ahead of time into the TTS cache)
+TTS_PHRASES = [
+    "Vielen Dank für Ihren Anruf. Auf Wiederhören!",
+    "Sie erhalten eine SMS-Bestätigung.",
+    "Ich habe den Notdienst informiert. Ein Techniker ist schnellstmöglich bei Ihnen.",
+]
+
 # Emergency redirect prompt
 EMERGENCY_PROMPT = """Bei Sicherheitsgefährdung sofort reagieren.
 
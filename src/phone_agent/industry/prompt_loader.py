@@ -179,6 +179,20 @@ def get_farewell_prompt(industry: str, language: str = "de") -> str:
     return getattr(module, "FAREWELL_PROMPT", "")
 
 
+def get_tts_phrases(industry: str, language: str = "de") -> list[str]:
+    """Get fixed phrases worth pre-synthesizing for an industry.
+
+    Args:
+        industry: Industry name
+        language: Language code
+
+    Returns:
+        Phrases spoken verbatim (empty if the module defines none)
+    """
+    module = get_prompts_module(industry, language)
+    return list(getattr(module, "TTS_PHRASES", []))
+
+
 class MultilingualPrompts:
     """Convenience class for accessing prompts in multiple languages.
 
@@ -41,10 +41,16 @@ from phone_agent.api import (
     chat_websocket,
     jobs,
     elektro,
+    metrics,
 )
 from phone_agent.api import tenant_api, email_api
 from phone_agent.db import init_db, close_db
 from phone_agent.services.campaign_scheduler import CampaignScheduler, SchedulerConfig
+from phone_agent.core.prometheus import (
+    export_campaign_scheduler,
+    register_collector,
+    unregister_collector,
+)
 from phone_agent.api.rate_limits import limiter
 from phone_agent.industry.gesundheit.compliance import (
     start_audit_persistence,
@@ -241,55 +247,39 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         )
         scheduler = CampaignScheduler(config=scheduler_config)
         await scheduler.start()
+        register_collector(
+            "campaign_scheduler",
+            lambda writer: export_campaign_scheduler(writer, scheduler),
+        )
         log.info("Campaign scheduler started")
 
-    # Initialize AI models (configurable preloading)
+    # Warm AI models in the background (configurable preloading): the
+    # shared API instances and, with telephony enabled, the call engine's
+    # models in the same pool. Calls arriving before the warmup finishes
+    # wait for it, then are refused.
+    warm_pool = None
     preload_models = getattr(settings, "preload_ai_models", False)
     if preload_models:
-        log.info("Preloading AI models...")
         try:
-            from phone_agent.dependencies import get_stt, get_llm, get_tts
-            from phone_agent.ai.status import get_model_registry, ModelStatus
-
-            registry = get_model_registry()
-
-            # Preload STT
-            try:
-                registry.update_status("stt", ModelStatus.LOADING)
-                stt = get_stt()
-                stt.load()
-                registry.register_stt(stt)
-                log.info("STT model preloaded")
-            except Exception as e:
-                registry.update_status("stt", ModelStatus.ERROR, str(e))
-                log.error("Failed to preload STT model", error=str(e))
-
-            # Preload LLM
-            try:
-                registry.update_status("llm", ModelStatus.LOADING)
-                llm = get_llm()
-                llm.load()
-                registry.register_llm(llm)
-                log.info("LLM model preloaded")
-            except Exception as e:
-                registry.update_status("llm", ModelStatus.ERROR, str(e))
-                log.error("Failed to preload LLM model", error=str(e))
-
-            # Preload TTS
-            try:
-                registry.update_status("tts", ModelStatus.LOADING)
-                tts = get_tts()
-                tts.load()
-                registry.register_tts(tts)
-                log.info("TTS model preloaded")
-            except Exception as e:
-                registry.update_status("tts", ModelStatus.ERROR, str(e))
-                log.error("Failed to preload TTS model", error=str(e))
-
-            log.info("AI model preloading complete", status=registry.get_overall_status())
-
+            from phone_agent.ai.warmup import ModelWarmPool
+            from phone_agent.dependencies import get_llm, get_stt, get_tts
+
+            warm_pool = ModelWarmPool()
+            warm_pool.add_models(
+                get_stt(),
+                get_llm(),
+                get_tts(),
+                language=settings.ai.stt.language or "de",
+                voices=settings.ai.tts.preload_voices,
+            )
+            if settings.telephony.enabled:
+                from phone_agent.dependencies import get_telephony_service
+
+                get_telephony_service().start_warmup(warm_pool)
+            else:
+                warm_pool.start()
         except Exception as e:
-            log.error("AI model preloading failed", error=str(e))
+            log.error("AI model warmup failed to start", error=str(e))
     else:
         log.info("AI models will be loaded on first request (lazy loading)")
 
@@ -297,7 +287,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Shutdown
     log.info("Shutting down Phone Agent")
+    if warm_pool:
+        await warm_pool.stop()
+
     if scheduler:
+        unregister_collector("campaign_scheduler")
         await scheduler.stop()
         log.info("Campaign scheduler stopped")
 
@@ -371,6 +365,7 @@ def create_app() -> FastAPI:
 
     # Include routers
     app.include_router(health.router, tags=["Health"])
+    app.include_router(metrics.router, tags=["Monitoring"])
     app.include_router(calls.router, prefix="/api/v1", tags=["Calls"])
     app.include_router(appointments.router, prefix="/api/v1", tags=["Appointments"])
     app.include_router(webhooks.router, prefix="/api/v1", tags=["Webhooks"])
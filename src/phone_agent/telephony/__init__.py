@@ -9,9 +9,11 @@ Supports:
 
 Components:
 - codecs: G.711 (A-law, μ-law), G.722 encoding/decoding
-- rtp_config: RTP packet handling and jitter buffering
+- rtp_config: RTP/RTCP packet handling and jitter buffering
+- rtp_engine: UDP RTP media for many calls on one port
 - websocket_audio: WebSocket audio streaming (browser, Twilio)
 - audio_bridge: Bidirectional audio bridge with codec support
+- playout: Real-time paced outbound audio with barge-in
 """
 
 from phone_agent.telephony.sip_client import SIPClient, SIPConfig
@@ -27,7 +29,9 @@ from phone_agent.telephony.audio_bridge import (
     AudioBridgeConfig,
     TelephonyAudioBridge,
     BridgeStatistics,
+    IngestDropPolicy,
 )
+from phone_agent.telephony.playout import PlayoutResult, PlayoutScheduler
 from phone_agent.telephony.codecs import (
     CodecType,
     CodecPipeline,
@@ -35,6 +39,7 @@ from phone_agent.telephony.codecs import (
     ALawCodec,
     G722Codec,
     AudioResampler,
+    StreamingResampler,
     get_codec,
 )
 from phone_agent.telephony.rtp_config import (
@@ -44,10 +49,13 @@ from phone_agent.telephony.rtp_config import (
     JitterBuffer,
     JitterBufferConfig,
     RTPSession,
+    RTCPPacket,
 )
+from phone_agent.telephony.rtp_engine import ExpectedSource, RTPMediaEngine
 from phone_agent.telephony.websocket_audio import (
     WebSocketAudioHandler,
     TwilioMediaStreamHandler,
+    TwilioStreamConfig,
     AudioFrame,
 )
 
@@ -66,6 +74,9 @@ __all__ = [
     "AudioBridgeConfig",
     "TelephonyAudioBridge",
     "BridgeStatistics",
+    "IngestDropPolicy",
+    "PlayoutScheduler",
+    "PlayoutResult",
     # Codecs
     "CodecType",
     "CodecPipeline",
@@ -73,6 +84,7 @@ __all__ = [
     "ALawCodec",
     "G722Codec",
     "AudioResampler",
+    "StreamingResampler",
     "get_codec",
     # RTP
     "RTPPacket",
@@ -81,8 +93,12 @@ __all__ = [
     "JitterBuffer",
     "JitterBufferConfig",
     "RTPSession",
+    "RTCPPacket",
+    "RTPMediaEngine",
+    "ExpectedSource",
     # WebSocket
     "WebSocketAudioHandler",
     "TwilioMediaStreamHandler",
+    "TwilioStreamConfig",
     "AudioFrame",
 ]
@@ -18,18 +18,36 @@ from __future__ import annotations
 
 import asyncio
 import struct
+from collections import deque
+from collections.abc import Callable
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Any, Callable
+from enum import Enum, StrEnum
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 import numpy as np
 from itf_shared import get_logger
 
-from .codecs import CodecType, CodecPipeline, get_codec
+from phone_agent.core import tracing
+
+from .codecs import CODEC_INFO, CodecPipeline, CodecType
+from .esl import EslFrame
+from .playout import PlayoutResult, PlayoutScheduler
+
+if TYPE_CHECKING:
+    from phone_agent.ai.vad import SpeechEndpointer
 
 log = get_logger(__name__)
 
+# Queued after the last frame when the far end ends the stream
+_END_OF_STREAM = b""
+
+# Connection and response generation of the turn running in this context
+_current_turn: ContextVar[tuple[UUID, int] | None] = ContextVar(
+    "phone_agent_bridge_turn", default=None
+)
+
 
 class AudioProtocol(str, Enum):
     """Supported audio protocols."""
@@ -39,6 +57,14 @@ class AudioProtocol(str, Enum):
     RTP = "rtp"  # Direct RTP
 
 
+class IngestDropPolicy(StrEnum):
+    """What the reader does when a call's ingest queue is full."""
+
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest queued frame (keep latest audio)
+    DROP_NEWEST = "drop_newest"  # Discard the frame just read
+    BLOCK = "block"  # Stop reading; TCP flow control pushes back on the sender
+
+
 @dataclass
 class AudioBridgeConfig:
     """Audio bridge configuration."""
@@ -48,6 +74,11 @@ class AudioBridgeConfig:
     port: int = 9090
     protocol: AudioProtocol = AudioProtocol.TCP_SOCKET
 
+    # Connections name their channel before sending audio: the bridge
+    # sends "connect" and reads the channel data reply (mod_socket outbound)
+    connect_handshake: bool = False
+    connect_timeout_s: float = 5.0
+
     # Audio format (internal/AI processing)
     sample_rate: int = 16000  # AI models expect 16kHz
     channels: int = 1
@@ -61,12 +92,66 @@ class AudioBridgeConfig:
     chunk_size: int = 320  # 20ms at 16kHz
     buffer_chunks: int = 5  # 100ms buffer
 
+    # Ingest queue between the socket reader and the AI pipeline consumer
+    ingest_queue_frames: int = 500  # ~10s of 20ms reads per call
+    ingest_drop_policy: IngestDropPolicy = IngestDropPolicy.DROP_OLDEST
+
+    # Outbound playout
+    playout_frame_ms: int = 20  # Paced frame duration
+    playout_lead_ms: int = 40  # Audio sent ahead of real time
+    barge_in_enabled: bool = True  # Stop playout when the caller starts speaking
+
     # Jitter buffer
     jitter_buffer_enabled: bool = True
     jitter_buffer_min_ms: int = 40
     jitter_buffer_max_ms: int = 200
     jitter_buffer_target_ms: int = 100
 
+    # Direct RTP (RTPMediaEngine)
+    rtcp_interval_s: float = 5.0  # Sender/receiver report interval per session
+    rtp_media_timeout_s: float = 30.0  # Session ends without packets for this long
+    rtp_latch_timeout_s: float = 10.0  # Session ends if its expected source never sends
+    rtp_relatch_packets: int = 5  # Consecutive packets from a new address to follow it
+
+    # Endpointing: only complete utterances are handed to the AI pipeline
+    endpointing_enabled: bool = True
+    vad_backend: str = "simple"  # "simple" (energy), "silero" or "silero_batched"
+    vad_threshold: float | None = None  # None = backend default
+    endpoint_min_speech_ms: int = 96
+    endpoint_hangover_ms: int = 600
+    endpoint_preroll_ms: int = 192
+    endpoint_max_utterance_ms: int = 15000
+
+
+def create_endpointer(config: AudioBridgeConfig) -> SpeechEndpointer:
+    """Create an utterance endpointer from the bridge's VAD settings.
+
+    Shared by bridge connections and the provider WebSocket streams
+    (Twilio), so every call is endpointed the same way.
+
+    Args:
+        config: Bridge configuration (VAD backend, threshold, endpointing)
+
+    Returns:
+        Endpointer for one call's 16 kHz audio
+    """
+    from phone_agent.ai.vad import EndpointerConfig, SpeechEndpointer, get_vad
+
+    threshold = config.vad_threshold
+    if threshold is None:
+        threshold = 0.02 if config.vad_backend == "simple" else 0.5
+
+    return SpeechEndpointer(
+        get_vad(config.vad_backend, threshold=threshold),
+        EndpointerConfig(
+            sample_rate=config.sample_rate,
+            min_speech_ms=config.endpoint_min_speech_ms,
+            hangover_ms=config.endpoint_hangover_ms,
+            preroll_ms=config.endpoint_preroll_ms,
+            max_utterance_ms=config.endpoint_max_utterance_ms,
+        ),
+    )
+
 
 class AudioBridge:
     """Bidirectional audio bridge for telephony integration.
@@ -76,7 +161,8 @@ class AudioBridge:
 
     The bridge:
     1. Receives audio from telephony (caller's voice)
-    2. Buffers and forwards to AI pipeline (STT)
+    2. Detects complete utterances (VAD endpointing) and forwards
+       them to the AI pipeline (STT)
     3. Receives synthesized audio from AI pipeline (TTS)
     4. Streams back to telephony (caller hears response)
 
@@ -104,12 +190,6 @@ class AudioBridge:
         self._server: asyncio.Server | None = None
         self._connections: dict[UUID, AudioConnection] = {}
 
-        # Codec pipeline for telephony <-> AI conversion
-        self._codec_pipeline = CodecPipeline(
-            telephony_codec=self.config.telephony_codec,
-            ai_sample_rate=self.config.sample_rate,
-        )
-
         # Callbacks
         self._on_audio_received: Callable[[UUID, np.ndarray], Any] | None = None
         self._on_connection: Callable[[UUID], Any] | None = None
@@ -155,22 +235,93 @@ class AudioBridge:
         """Handle new socket connection."""
         from uuid import uuid4
 
-        call_id = uuid4()
-        conn = AudioConnection(
+        conn = self._create_connection(uuid4(), reader, writer)
+        if self.config.connect_handshake:
+            conn.channel_id = await self._read_connect_data(conn)
+            if conn.channel_id is None:
+                await conn.close()
+                return
+        await self._run_connection(conn)
+
+    async def _read_connect_data(self, conn: AudioConnection) -> str | None:
+        """Ask the far end which channel the connection carries.
+
+        Sends ``connect`` and reads the header block of the reply, as
+        FreeSWITCH's outbound socket does with its channel data.
+
+        Returns:
+            Channel ID (``Channel-Unique-ID``, else ``Unique-ID``), or
+            None if the far end sent none in time
+        """
+        assert conn.reader is not None
+        try:
+            conn.writer.write(b"connect\n\n")
+            await conn.writer.drain()
+            block = await asyncio.wait_for(
+                conn.reader.readuntil(b"\n\n"), timeout=self.config.connect_timeout_s
+            )
+        except (
+            TimeoutError,
+            asyncio.IncompleteReadError,
+            asyncio.LimitOverrunError,
+            OSError,
+        ) as e:
+            log.warning(
+                "Audio connection sent no channel data",
+                call_id=str(conn.call_id),
+                error=str(e) or type(e).__name__,
+            )
+            return None
+
+        headers = EslFrame.from_bytes(block).headers
+        channel_id = headers.get("Channel-Unique-ID") or headers.get("Unique-ID")
+        if not channel_id:
+            log.warning("Audio connection named no channel", call_id=str(conn.call_id))
+        return channel_id or None
+
+    def _create_connection(
+        self,
+        call_id: UUID,
+        reader: asyncio.StreamReader | None,
+        writer: asyncio.StreamWriter,
+    ) -> AudioConnection:
+        """Create the per-call state of a new connection."""
+        return AudioConnection(
             call_id=call_id,
             reader=reader,
             writer=writer,
             config=self.config,
+            codec_pipeline=self._create_codec_pipeline(),
+            endpointer=self._create_endpointer(),
+            frame_queue=asyncio.Queue(maxsize=self.config.ingest_queue_frames),
+            playout=PlayoutScheduler(
+                writer,
+                frame_bytes=self._playout_frame_bytes(),
+                frame_ms=self.config.playout_frame_ms,
+                lead_ms=self.config.playout_lead_ms,
+                on_frame_sent=self._count_sent_frame,
+            ),
         )
+
+    async def _run_connection(self, conn: AudioConnection) -> None:
+        """Register a connection and process it until it ends."""
+        call_id = conn.call_id
         self._connections[call_id] = conn
 
-        peer = writer.get_extra_info("peername")
-        log.info("New audio connection", call_id=str(call_id), peer=peer)
+        peer = conn.writer.get_extra_info("peername")
+        log.info("New audio connection", call_id=str(call_id), peer=peer,
+                 channel=conn.channel_id)
 
         if self._on_connection:
             result = self._on_connection(call_id)
             if asyncio.iscoroutine(result):
-                await result
+                result = await result
+            if result is False:
+                # Rejected (e.g. no call for this channel): nothing to hang up
+                log.info("Audio connection rejected", call_id=str(call_id))
+                await conn.close()
+                del self._connections[call_id]
+                return
 
         try:
             await self._process_connection(conn)
@@ -187,75 +338,378 @@ class AudioBridge:
 
             log.info("Audio connection closed", call_id=str(call_id))
 
+    def _create_codec_pipeline(self) -> CodecPipeline:
+        """Create the codec pipeline for one connection.
+
+        Pipelines carry resampler state, so they are never shared
+        between calls.
+        """
+        return CodecPipeline(
+            telephony_codec=self.config.telephony_codec,
+            ai_sample_rate=self.config.sample_rate,
+        )
+
+    def _create_endpointer(self) -> SpeechEndpointer | None:
+        """Create the utterance endpointer for one connection.
+
+        Returns:
+            Endpointer, or None if endpointing is disabled
+        """
+        if not self.config.endpointing_enabled:
+            return None
+        return create_endpointer(self.config)
+
+    async def _deliver_audio(self, conn: AudioConnection, audio: np.ndarray) -> None:
+        """Hand decoded audio on, endpointing it first if enabled.
+
+        Without an endpointer the callback runs inline. With one, the
+        completed utterances are queued for the connection's turn task,
+        so endpointing keeps running (and can detect barge-in) while the
+        AI pipeline handles a turn.
+
+        Args:
+            conn: Source connection
+            audio: Float32 audio at the AI sample rate
+        """
+        if conn.endpointer is None:
+            await self._invoke_callback(conn, audio)
+            return
+
+        discarded = conn.endpointer.samples_discarded
+        forced = conn.endpointer.forced_endpoints
+        utterances = await conn.endpointer.feed_async(audio)
+
+        self._stats.utterances_detected += len(utterances)
+        self._stats.utterances_max_length += conn.endpointer.forced_endpoints - forced
+        self._stats.silence_seconds_skipped += (
+            conn.endpointer.samples_discarded - discarded
+        ) / self.config.sample_rate
+
+        if (
+            self.config.barge_in_enabled
+            and conn.playout is not None
+            and (conn.playout.playing or conn.responding)
+            and (conn.endpointer.in_speech or utterances)
+        ):
+            # Stop what is playing and mark the running turn stale, so its
+            # later sentences are dropped instead of talking over the caller
+            result = conn.playout.cancel()
+            conn.response_generation += 1
+            conn.responding = False
+            self._stats.barge_ins += 1
+            log.info(
+                "Barge-in, playout stopped",
+                call_id=str(conn.call_id),
+                played_ms=round(result.played_ms) if result else None,
+            )
+
+        detected = tracing.now()
+        forced_now = conn.endpointer.forced_endpoints - forced
+        hangover = conn.endpointer.config.hangover_ms / 1000
+        for i, utterance in enumerate(utterances):
+            # The turn starts when the caller stopped speaking: the
+            # endpoint is declared a hangover period later
+            forced_cut = i < forced_now
+            speech_end = detected if forced_cut else detected - hangover
+            self._queue_turn(conn, utterance, speech_end, detected, forced=forced_cut)
+
+    def _queue_turn(
+        self,
+        conn: AudioConnection,
+        utterance: np.ndarray,
+        speech_end: float,
+        detected: float,
+        forced: bool,
+    ) -> None:
+        """Queue an utterance for the turn task and start its trace."""
+        trace = tracing.get_tracer().start(
+            call_id=str(conn.call_id),
+            start=speech_end,
+            audio_s=round(len(utterance) / self.config.sample_rate, 2),
+        )
+        if trace is not None:
+            trace.add_span("vad_endpoint", speech_end, detected, forced=forced)
+        conn.turn_traces.append((trace, detected))
+        conn.utterances.put_nowait(utterance)
+
+    def _end_stream(self, conn: AudioConnection) -> None:
+        """Queue the utterance cut off by the end of the stream, then stop turns."""
+        if conn.endpointer is None:
+            return
+        utterance = conn.endpointer.flush()
+        if utterance is not None:
+            self._stats.utterances_detected += 1
+            detected = tracing.now()
+            self._queue_turn(conn, utterance, detected, detected, forced=True)
+        conn.utterances.put_nowait(None)
+
+    async def _run_turns(self, conn: AudioConnection) -> None:
+        """Turn task: run the audio callback once per utterance, in order."""
+        tracer = tracing.get_tracer()
+        while True:
+            utterance = await conn.utterances.get()
+            if utterance is None:
+                return
+            trace, detected = (
+                conn.turn_traces.popleft() if conn.turn_traces else (None, None)
+            )
+            turn = _current_turn.set((conn.call_id, conn.response_generation))
+            try:
+                with tracer.activate(trace):
+                    if detected is not None:
+                        tracing.record_span("turn_queue", detected)
+                    await self._invoke_callback(conn, utterance)
+            finally:
+                _current_turn.reset(turn)
+                conn.responding = False
+
+    async def _invoke_callback(self, conn: AudioConnection, audio: np.ndarray) -> None:
+        """Run the audio callback, logging instead of propagating errors."""
+        if not self._on_audio_received:
+            return
+
+        try:
+            result = self._on_audio_received(conn.call_id, audio)
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception as e:
+            log.error("Audio callback failed", call_id=str(conn.call_id), error=str(e))
+
     async def _process_connection(self, conn: "AudioConnection") -> None:
-        """Process audio from connection."""
-        audio_buffer: list[bytes] = []
-        bytes_per_chunk = self.config.chunk_size * self.config.sample_width
+        """Process audio from connection.
+
+        Runs a reader task, which only drains the socket into the
+        connection's bounded frame queue, and a consumer task, which
+        decodes and endpoints the frames. With endpointing, a turn task
+        runs the audio callback per utterance. A slow AI pipeline
+        therefore never stalls the socket; when the queue is full the
+        configured drop policy applies.
+
+        When the far end ends the stream, the queued frames are still
+        decoded and the utterance in progress is answered before the
+        connection closes. Errors, shutdown and ``close`` cancel at once.
+        """
+        reader = asyncio.create_task(self._read_frames(conn))
+        consumer = asyncio.create_task(self._consume_frames(conn))
+        tasks = {reader, consumer}
+        if conn.endpointer is not None:
+            tasks.add(asyncio.create_task(self._run_turns(conn)))
+
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()
+            if reader in done and not conn.closed:
+                await conn.frame_queue.put(_END_OF_STREAM)
+                for task in tasks - {reader}:
+                    await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _read_size(self) -> int:
+        """Bytes requested from the socket per read."""
+        return self.config.chunk_size * self.config.sample_width
+
+    async def _read_frames(self, conn: AudioConnection) -> None:
+        """Reader task: move socket data into the frame queue until EOF."""
+        assert conn.reader is not None
+        read_size = self._read_size()
 
         while not conn.closed:
             try:
-                # Read audio data
-                data = await asyncio.wait_for(
-                    conn.reader.read(bytes_per_chunk),
-                    timeout=5.0,
+                data = await asyncio.wait_for(conn.reader.read(read_size), timeout=5.0)
+            except TimeoutError:
+                continue
+
+            if not data:
+                break
+
+            self._stats.bytes_received += len(data)
+            self._stats.frames_received += 1
+            conn.stats.frames_received += 1
+            await self._enqueue_frame(conn, data)
+
+    async def _enqueue_frame(self, conn: AudioConnection, data: bytes) -> None:
+        """Queue one frame, applying the drop policy when the queue is full."""
+        if self.config.ingest_drop_policy == IngestDropPolicy.BLOCK:
+            await conn.frame_queue.put(data)
+            conn.stats.queue_high_watermark = max(
+                conn.stats.queue_high_watermark, conn.frame_queue.qsize()
+            )
+        else:
+            self._offer_frame(conn, data, self.config.ingest_drop_policy)
+
+    def _offer_frame(
+        self,
+        conn: AudioConnection,
+        data: bytes,
+        policy: IngestDropPolicy,
+    ) -> None:
+        """Queue one frame without waiting, dropping one if the queue is full."""
+        queue = conn.frame_queue
+        if queue.full():
+            if policy == IngestDropPolicy.DROP_OLDEST:
+                queue.get_nowait()
+                queue.put_nowait(data)
+            if conn.stats.frames_dropped == 0:
+                log.warning(
+                    "Ingest queue full, dropping audio",
+                    call_id=str(conn.call_id),
+                    policy=policy.value,
                 )
+            conn.stats.frames_dropped += 1
+            self._stats.frames_dropped += 1
+        else:
+            queue.put_nowait(data)
 
-                if not data:
-                    break
+        conn.stats.queue_high_watermark = max(
+            conn.stats.queue_high_watermark, queue.qsize()
+        )
 
-                audio_buffer.append(data)
+    async def _consume_frames(self, conn: AudioConnection) -> None:
+        """Consumer task: decode queued frames and run the audio callback."""
+        queue = conn.frame_queue
+        pending: list[bytes] = []
+
+        while True:
+            pending.append(await queue.get())
+            # Catch up on a backlog in one decode instead of frame by frame
+            while not queue.empty():
+                pending.append(queue.get_nowait())
+
+            ended = pending[-1] == _END_OF_STREAM
+            if ended:
+                pending.pop()
+            elif conn.endpointer is None and len(pending) < self.config.buffer_chunks:
+                continue
 
-                # Process when we have enough data
-                if len(audio_buffer) >= self.config.buffer_chunks:
-                    # Combine chunks
-                    combined = b"".join(audio_buffer)
-                    audio_buffer = []
+            combined = b"".join(pending)
+            pending = []
 
-                    # Convert to numpy array
-                    audio = np.frombuffer(combined, dtype=np.int16)
-                    audio = audio.astype(np.float32) / 32768.0
+            audio = self._decode_audio(conn, combined) if combined else None
+            if audio is not None:
+                await self._deliver_audio(conn, audio)
+            if ended:
+                self._end_stream(conn)
+                return
 
-                    # Notify callback
-                    if self._on_audio_received:
-                        result = self._on_audio_received(conn.call_id, audio)
-                        if asyncio.iscoroutine(result):
-                            await result
+    def _decode_audio(self, conn: AudioConnection, data: bytes) -> np.ndarray | None:
+        """Convert received bytes to float32 audio at the AI sample rate.
 
-            except asyncio.TimeoutError:
-                continue
-            except asyncio.CancelledError:
-                break
+        Args:
+            conn: Source connection
+            data: Raw bytes from the socket (16-bit linear PCM)
+
+        Returns:
+            Float32 audio, or None if the data could not be decoded
+        """
+        return np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
 
     async def send_audio(self, call_id: UUID, audio: np.ndarray | bytes) -> bool:
-        """Send audio to a connection.
+        """Queue audio for paced playout on a connection.
+
+        Returns once the audio is queued; use ``wait_for_playout`` to
+        wait until the caller has heard it. Audio sent by a turn the
+        caller has since barged in on is dropped.
 
         Args:
             call_id: Target connection
             audio: Audio data (numpy float32 or bytes)
 
         Returns:
-            True if sent successfully
+            True if queued successfully
         """
         conn = self._connections.get(call_id)
-        if not conn or conn.closed:
+        if not conn or conn.closed or conn.playout is None:
             return False
 
-        try:
-            if isinstance(audio, np.ndarray):
-                # Convert float32 to int16 bytes
-                audio_int16 = (audio * 32767).astype(np.int16)
-                audio_bytes = audio_int16.tobytes()
-            else:
-                audio_bytes = audio
-
-            conn.writer.write(audio_bytes)
-            await conn.writer.drain()
-            return True
+        turn = _current_turn.get()
+        own_turn = turn is not None and turn[0] == call_id
+        if own_turn and turn[1] != conn.response_generation:
+            self._stats.responses_dropped += 1
+            return False
 
+        try:
+            with tracing.span("encode"):
+                audio_bytes = self._encode_audio(conn, audio)
         except Exception as e:
+            self._stats.codec_encode_errors += 1
             log.error("Send audio failed", call_id=str(call_id), error=str(e))
             return False
 
+        if not conn.playout.playing:
+            conn.playout_enqueued_at = tracing.now()
+        conn.playout.enqueue(audio_bytes)
+        conn.responding = conn.responding or own_turn
+        return True
+
+    async def wait_for_playout(self, call_id: UUID) -> PlayoutResult | None:
+        """Wait until queued audio has been played or interrupted.
+
+        Args:
+            call_id: Target connection
+
+        Returns:
+            Playout result, or None if the connection is unknown or idle
+        """
+        conn = self._connections.get(call_id)
+        if not conn or conn.playout is None:
+            return None
+        result = await conn.playout.wait()
+
+        first_frame = conn.playout.started_at
+        if conn.playout_enqueued_at is not None and first_frame is not None:
+            # Time until the first frame was on the wire, then until heard
+            tracing.record_span("network_send", conn.playout_enqueued_at, first_frame)
+            tracing.record_span(
+                "playout",
+                first_frame,
+                played_ms=round(result.played_ms) if result else None,
+                interrupted=result.interrupted if result else None,
+            )
+        conn.playout_enqueued_at = None
+        return result
+
+    def stop_playout(self, call_id: UUID) -> PlayoutResult | None:
+        """Stop playout immediately, discarding queued audio.
+
+        Args:
+            call_id: Target connection
+
+        Returns:
+            Result of the interrupted playout, or None if nothing was playing
+        """
+        conn = self._connections.get(call_id)
+        if not conn or conn.playout is None:
+            return None
+        return conn.playout.cancel()
+
+    def playout_position_ms(self, call_id: UUID) -> float:
+        """Get how much of the current response the caller has heard."""
+        conn = self._connections.get(call_id)
+        if not conn or conn.playout is None:
+            return 0.0
+        return conn.playout.position_ms
+
+    def _encode_audio(self, conn: AudioConnection, audio: np.ndarray | bytes) -> bytes:
+        """Convert outbound audio to the connection's wire format."""
+        if isinstance(audio, np.ndarray):
+            # Convert float32 to int16 bytes
+            return (audio * 32767).astype(np.int16).tobytes()
+        return audio
+
+    def _playout_frame_bytes(self) -> int:
+        """Wire bytes per playout frame (16-bit PCM at the AI sample rate)."""
+        samples = self.config.sample_rate * self.config.playout_frame_ms // 1000
+        return samples * self.config.sample_width
+
+    def _count_sent_frame(self, size: int) -> None:
+        """Account one paced outbound frame."""
+        self._stats.bytes_sent += size
+        self._stats.frames_sent += 1
+
     def on_audio_received(
         self,
         callback: Callable[[UUID, np.ndarray], Any],
@@ -264,7 +718,11 @@ class AudioBridge:
         self._on_audio_received = callback
 
     def on_connection(self, callback: Callable[[UUID], Any]) -> None:
-        """Set callback for new connections."""
+        """Set callback for new connections.
+
+        A callback returning False rejects the connection, which is then
+        closed without processing (and without a disconnection callback).
+        """
         self._on_connection = callback
 
     def on_disconnection(self, callback: Callable[[UUID], Any]) -> None:
@@ -280,21 +738,67 @@ class AudioBridge:
         """Get number of active connections."""
         return len(self._connections)
 
+    @property
+    def statistics(self) -> BridgeStatistics:
+        """Get bridge statistics, including per-call ingest queues."""
+        self._stats.connections_active = len(self._connections)
+        self._stats.calls = {
+            str(call_id): conn.ingest_statistics()
+            for call_id, conn in self._connections.items()
+        }
+        return self._stats
+
+
+@dataclass
+class ConnectionStatistics:
+    """Ingest counters for a single connection."""
+
+    frames_received: int = 0
+    frames_dropped: int = 0
+    queue_high_watermark: int = 0
+
 
 @dataclass
 class AudioConnection:
     """Represents an audio connection."""
 
     call_id: UUID
-    reader: asyncio.StreamReader
+    reader: asyncio.StreamReader | None  # None for packet transports (RTP)
     writer: asyncio.StreamWriter
     config: AudioBridgeConfig
+    codec_pipeline: CodecPipeline
+    endpointer: SpeechEndpointer | None = None
+    frame_queue: asyncio.Queue[bytes] = field(default_factory=asyncio.Queue)
+    utterances: asyncio.Queue[np.ndarray | None] = field(default_factory=asyncio.Queue)
+    turn_traces: deque[tuple[Any, float | None]] = field(default_factory=deque)
+    playout: PlayoutScheduler | None = None
+    playout_enqueued_at: float | None = None  # Playback start (tracing clock)
+    response_generation: int = 0  # Bumped on barge-in; older turns' audio is dropped
+    responding: bool = False  # The running turn has started speaking
+    stats: ConnectionStatistics = field(default_factory=ConnectionStatistics)
+    channel_id: str | None = None  # Channel named in the connect data, if read
     closed: bool = False
 
+    def ingest_statistics(self) -> dict:
+        """Current ingest queue state for this call."""
+        buffered_ms = round(self.playout.buffered_ms) if self.playout else 0
+        return {
+            "queue_depth": self.frame_queue.qsize(),
+            "queue_capacity": self.frame_queue.maxsize,
+            "queue_high_watermark": self.stats.queue_high_watermark,
+            "frames_received": self.stats.frames_received,
+            "frames_dropped": self.stats.frames_dropped,
+            "playout_buffered_ms": buffered_ms,
+        }
+
     async def close(self) -> None:
         """Close the connection."""
         if not self.closed:
             self.closed = True
+            if self.endpointer is not None:
+                self.endpointer.vad.close()
+            if self.playout is not None:
+                await self.playout.close()
             self.writer.close()
             try:
                 await self.writer.wait_closed()
@@ -378,6 +882,13 @@ class BridgeStatistics:
     codec_encode_errors: int = 0
     jitter_buffer_underruns: int = 0
     jitter_buffer_overruns: int = 0
+    utterances_detected: int = 0
+    utterances_max_length: int = 0
+    silence_seconds_skipped: float = 0.0
+    frames_dropped: int = 0
+    barge_ins: int = 0
+    responses_dropped: int = 0  # Audio sends from turns interrupted by barge-in
+    calls: dict[str, dict] = field(default_factory=dict)  # Per-call ingest queues
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -392,6 +903,13 @@ class BridgeStatistics:
             "codec_encode_errors": self.codec_encode_errors,
             "jitter_buffer_underruns": self.jitter_buffer_underruns,
             "jitter_buffer_overruns": self.jitter_buffer_overruns,
+            "utterances_detected": self.utterances_detected,
+            "utterances_max_length": self.utterances_max_length,
+            "silence_seconds_skipped": round(self.silence_seconds_skipped, 3),
+            "frames_dropped": self.frames_dropped,
+            "barge_ins": self.barge_ins,
+            "responses_dropped": self.responses_dropped,
+            "calls": self.calls,
         }
 
 
@@ -400,6 +918,8 @@ class TelephonyAudioBridge(AudioBridge):
 
     Extends AudioBridge with:
     - Automatic codec transcoding (G.711 <-> PCM)
+    - Per-call VAD endpointing (inherited), so only complete
+      utterances reach the callback
     - Jitter buffer for network variations
     - RTP packet handling
     - Quality metrics
@@ -413,7 +933,7 @@ class TelephonyAudioBridge(AudioBridge):
 
         @bridge.on_audio_received
         async def handle_audio(call_id, audio):
-            # audio is already decoded and resampled to 16kHz float32
+            # audio is one decoded utterance, resampled to 16kHz float32
             text = await stt.transcribe(audio)
             response_audio = await tts.synthesize(response)
             # send_audio will encode to G.711 automatically
@@ -436,102 +956,53 @@ class TelephonyAudioBridge(AudioBridge):
 
         Overrides parent to add codec decoding and jitter buffering.
         """
-        from .rtp_config import JitterBuffer, JitterBufferConfig
-
         # Create jitter buffer for this connection if enabled
-        jitter_buffer = None
-        if self.config.jitter_buffer_enabled:
-            jitter_buffer = JitterBuffer(
-                JitterBufferConfig(
-                    min_delay_ms=self.config.jitter_buffer_min_ms,
-                    max_delay_ms=self.config.jitter_buffer_max_ms,
-                    target_delay_ms=self.config.jitter_buffer_target_ms,
-                )
-            )
-            self._jitter_buffers[conn.call_id] = jitter_buffer
-
-        audio_buffer: list[bytes] = []
-        # Telephony frames are smaller (160 samples at 8kHz = 20ms)
-        bytes_per_chunk = 160 * self.config.sample_width
-
-        while not conn.closed:
-            try:
-                # Read audio data
-                data = await asyncio.wait_for(
-                    conn.reader.read(bytes_per_chunk),
-                    timeout=5.0,
-                )
-
-                if not data:
-                    break
+        if (
+            self.config.jitter_buffer_enabled
+            and conn.call_id not in self._jitter_buffers
+        ):
+            self._jitter_buffers[conn.call_id] = self._create_jitter_buffer()
 
-                self._stats.bytes_received += len(data)
-                audio_buffer.append(data)
-
-                # Process when we have enough data
-                if len(audio_buffer) >= self.config.buffer_chunks:
-                    # Combine chunks
-                    combined = b"".join(audio_buffer)
-                    audio_buffer = []
-
-                    try:
-                        # Decode from telephony codec to float32 at 16kHz
-                        audio = self._codec_pipeline.decode_for_ai(combined)
-                        self._stats.frames_received += 1
-
-                        # Notify callback
-                        if self._on_audio_received:
-                            result = self._on_audio_received(conn.call_id, audio)
-                            if asyncio.iscoroutine(result):
-                                await result
-
-                    except Exception as e:
-                        self._stats.codec_decode_errors += 1
-                        log.warning(f"Codec decode error: {e}")
-
-            except asyncio.TimeoutError:
-                continue
-            except asyncio.CancelledError:
-                break
-
-        # Cleanup jitter buffer
-        self._jitter_buffers.pop(conn.call_id, None)
+        try:
+            await super()._process_connection(conn)
+        finally:
+            # Cleanup jitter buffer
+            self._jitter_buffers.pop(conn.call_id, None)
 
-    async def send_audio(self, call_id: UUID, audio: np.ndarray | bytes) -> bool:
-        """Send audio to a connection with codec encoding.
+    def _create_jitter_buffer(self) -> Any:
+        """Create the jitter buffer for one connection."""
+        from .rtp_config import JitterBuffer, JitterBufferConfig
 
-        Args:
-            call_id: Target connection
-            audio: Audio data (numpy float32 at 16kHz or raw bytes)
+        return JitterBuffer(
+            JitterBufferConfig(
+                min_delay_ms=self.config.jitter_buffer_min_ms,
+                max_delay_ms=self.config.jitter_buffer_max_ms,
+                target_delay_ms=self.config.jitter_buffer_target_ms,
+                packet_time_ms=self.config.playout_frame_ms,
+                codec=self.config.telephony_codec,
+            )
+        )
 
-        Returns:
-            True if sent successfully
-        """
-        conn = self._connections.get(call_id)
-        if not conn or conn.closed:
-            return False
+    def _read_size(self) -> int:
+        """Telephony frames are smaller (160 samples at 8kHz = 20ms)."""
+        return 160 * self.config.sample_width
 
+    def _decode_audio(self, conn: AudioConnection, data: bytes) -> np.ndarray | None:
+        """Decode from telephony codec to float32 at 16kHz."""
         try:
-            if isinstance(audio, np.ndarray):
-                # Encode from float32 16kHz to telephony codec
-                audio_bytes = self._codec_pipeline.encode_for_telephony(audio)
-            else:
-                audio_bytes = audio
-
-            conn.writer.write(audio_bytes)
-            await conn.writer.drain()
-
-            self._stats.bytes_sent += len(audio_bytes)
-            self._stats.frames_sent += 1
-            return True
-
+            return conn.codec_pipeline.decode_for_ai(data)
         except Exception as e:
-            self._stats.codec_encode_errors += 1
-            log.error("Send audio failed", call_id=str(call_id), error=str(e))
-            return False
-
-    @property
-    def statistics(self) -> BridgeStatistics:
-        """Get bridge statistics."""
-        self._stats.connections_active = len(self._connections)
-        return self._stats
+            self._stats.codec_decode_errors += 1
+            log.warning(f"Codec decode error: {e}")
+            return None
+
+    def _encode_audio(self, conn: AudioConnection, audio: np.ndarray | bytes) -> bytes:
+        """Encode from float32 16kHz to the telephony codec (bytes pass through)."""
+        if isinstance(audio, np.ndarray):
+            return conn.codec_pipeline.encode_for_telephony(audio)
+        return audio
+
+    def _playout_frame_bytes(self) -> int:
+        """Encoded bytes per playout frame for the telephony codec."""
+        bitrate = CODEC_INFO[self.config.telephony_codec].bitrate_kbps
+        return bitrate * self.config.playout_frame_ms // 8
@@ -12,8 +12,11 @@ from __future__ import annotations
 
 import struct
 from abc import ABC, abstractmethod
+from bisect import bisect_right
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from math import gcd
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -115,6 +118,96 @@ class AudioCodec(ABC):
         ...
 
 
+def _all_pcm_values() -> NDArray[np.int32]:
+    """Every int16 sample value, ordered by ``value.view(np.uint16)``."""
+    return np.arange(65536, dtype=np.uint16).view(np.int16).astype(np.int32)
+
+
+@lru_cache(maxsize=1)
+def _mulaw_tables() -> tuple[NDArray[np.uint8], NDArray[np.int16]]:
+    """Build the μ-law encode (65,536 entries) and decode (256) tables.
+
+    Encoding follows the ITU-T G.191 reference (``ulaw_compress``): 14-bit
+    magnitude with one's complement for negative samples.
+
+    Returns:
+        Tuple of (encode table indexed by uint16 PCM, decode table)
+    """
+    x = _all_pcm_values()
+    magnitude = np.where(x < 0, (~x) >> 2, x >> 2) + 33
+    magnitude = np.minimum(magnitude, 0x1FFF)
+
+    # Segment number = 1 + bit length of (magnitude >> 6)
+    top = magnitude >> 6
+    segment = np.ones_like(top)
+    for bit in range(8):
+        segment += top >= (1 << bit)
+
+    code = ((8 - segment) << 4) | (0x0F - ((magnitude >> segment) & 0x0F))
+    code = np.where(x >= 0, code | 0x80, code)
+    encode_table = code.astype(np.uint8)
+
+    # Decode table (8-bit μ-law to 16-bit linear)
+    inv = ~np.arange(256, dtype=np.int32)
+    exponent = (inv >> 4) & 0x07
+    mantissa = inv & 0x0F
+    value = (((mantissa << 3) + 0x84) << exponent) - 0x84
+    decode_table = np.where(inv & 0x80, -value, value).astype(np.int16)
+
+    encode_table.setflags(write=False)
+    decode_table.setflags(write=False)
+    return encode_table, decode_table
+
+
+@lru_cache(maxsize=1)
+def _alaw_tables() -> tuple[NDArray[np.uint8], NDArray[np.int16]]:
+    """Build the A-law encode (65,536 entries) and decode (256) tables.
+
+    Encoding follows the ITU-T G.191 reference (``alaw_compress``): 12-bit
+    magnitude with one's complement for negative samples, even bits
+    inverted.
+
+    Returns:
+        Tuple of (encode table indexed by uint16 PCM, decode table)
+    """
+    x = _all_pcm_values()
+    magnitude = np.where(x < 0, (~x) >> 4, x >> 4)
+
+    # Segments 1-7: normalize mantissa to 5 bits, counting the shifts
+    compressed = magnitude > 15
+    exponent = compressed.astype(np.int32)
+    for _ in range(7):
+        shift = compressed & (magnitude > 31)
+        magnitude = np.where(shift, magnitude >> 1, magnitude)
+        exponent += shift
+    code = np.where(compressed, magnitude - 16 + (exponent << 4), magnitude)
+    code = np.where(x >= 0, code | 0x80, code) ^ 0x55
+    encode_table = code.astype(np.uint8)
+
+    # Decode table (8-bit A-law to 16-bit linear)
+    value = np.arange(256, dtype=np.int32) ^ 0x55
+    segment = (value >> 4) & 0x07
+    mantissa = value & 0x0F
+    linear = np.where(
+        segment == 0,
+        (mantissa << 4) + 8,
+        ((mantissa << 4) + 0x108) << np.maximum(segment - 1, 0),
+    )
+    decode_table = np.where(value & 0x80, linear, -linear).astype(np.int16)
+
+    encode_table.setflags(write=False)
+    decode_table.setflags(write=False)
+    return encode_table, decode_table
+
+
+def _table_indices(pcm: NDArray[np.generic]) -> NDArray[np.uint16]:
+    """View int16 PCM as uint16 lookup-table indices (no copy for int16)."""
+    samples = np.asarray(pcm)
+    if samples.dtype != np.int16:
+        samples = samples.astype(np.int16)
+    return samples.view(np.uint16)
+
+
 class MuLawCodec(AudioCodec):
     """G.711 μ-law (PCMU) codec.
 
@@ -123,10 +216,13 @@ class MuLawCodec(AudioCodec):
 
     μ-law formula: F(x) = sgn(x) * ln(1 + μ|x|) / ln(1 + μ)
     where μ = 255 (standard value)
+
+    Encoding and decoding are single table lookups; the tables are built
+    once per process and shared by all instances.
     """
 
-    # μ-law encoding table (from ITU-T G.711)
-    _MULAW_ENCODE_TABLE: bytes | None = None
+    # μ-law lookup tables (per ITU-T G.711 / G.191)
+    _MULAW_ENCODE_TABLE: NDArray[np.uint8] | None = None
     _MULAW_DECODE_TABLE: NDArray[np.int16] | None = None
 
     def __init__(self) -> None:
@@ -140,27 +236,7 @@ class MuLawCodec(AudioCodec):
         if cls._MULAW_ENCODE_TABLE is not None:
             return
 
-        # Build decode table (8-bit μ-law to 16-bit linear)
-        decode_table = np.zeros(256, dtype=np.int16)
-        for i in range(256):
-            # Invert the input
-            inv = ~i
-            # Extract sign, exponent, and mantissa
-            sign = inv & 0x80
-            exponent = (inv >> 4) & 0x07
-            mantissa = inv & 0x0F
-            # Calculate linear value
-            value = ((mantissa << 3) + 0x84) << exponent
-            value -= 0x84
-            if sign:
-                value = -value
-            decode_table[i] = value
-
-        cls._MULAW_DECODE_TABLE = decode_table
-
-        # Build encode table (16-bit linear to 8-bit μ-law)
-        # We use a direct calculation instead of full table for memory efficiency
-        cls._MULAW_ENCODE_TABLE = b""  # Placeholder - encoding uses formula
+        cls._MULAW_ENCODE_TABLE, cls._MULAW_DECODE_TABLE = _mulaw_tables()
 
     def encode(self, pcm: NDArray[np.int16]) -> bytes:
         """Encode 16-bit PCM to μ-law.
@@ -171,44 +247,24 @@ class MuLawCodec(AudioCodec):
         Returns:
             μ-law encoded bytes
         """
-        # Bias constant for μ-law
-        BIAS = 0x84
-        CLIP = 32635
-
-        # Vectorized encoding
-        sign = (pcm >> 8) & 0x80
-        pcm_abs = np.abs(pcm.astype(np.int32))
-        pcm_abs = np.clip(pcm_abs, 0, CLIP)
-        pcm_abs = pcm_abs + BIAS
-
-        # Find segment
-        exponent = np.zeros(len(pcm), dtype=np.uint8)
-        for i in range(7, 0, -1):
-            mask = pcm_abs >= (1 << (i + 7))
-            exponent[mask] = np.maximum(exponent[mask], i)
-
-        # Calculate mantissa
-        mantissa = (pcm_abs >> (exponent + 3)) & 0x0F
-
-        # Combine and invert
-        result = ~(sign | (exponent << 4) | mantissa) & 0xFF
+        return np.take(self._MULAW_ENCODE_TABLE, _table_indices(pcm)).tobytes()
 
-        return result.astype(np.uint8).tobytes()
-
-    def decode(self, data: bytes) -> NDArray[np.int16]:
+    def decode(
+        self,
+        data: bytes,
+        out: NDArray[np.int16] | None = None,
+    ) -> NDArray[np.int16]:
         """Decode μ-law to 16-bit PCM.
 
         Args:
             data: μ-law encoded bytes
+            out: Optional preallocated output buffer (len(data) samples)
 
         Returns:
             16-bit linear PCM samples
         """
-        if self._MULAW_DECODE_TABLE is None:
-            self._ensure_tables()
-
         indices = np.frombuffer(data, dtype=np.uint8)
-        return self._MULAW_DECODE_TABLE[indices]  # type: ignore[index]
+        return np.take(self._MULAW_DECODE_TABLE, indices, out=out)
 
 
 class ALawCodec(AudioCodec):
@@ -221,8 +277,13 @@ class ALawCodec(AudioCodec):
     F(x) = sgn(x) * { A|x|/(1+ln(A))     if |x| < 1/A
                     { (1+ln(A|x|))/(1+ln(A)) if 1/A ≤ |x| ≤ 1
     where A = 87.6
+
+    Encoding and decoding are single table lookups; the tables are built
+    once per process and shared by all instances.
     """
 
+    # A-law lookup tables (per ITU-T G.711 / G.191)
+    _ALAW_ENCODE_TABLE: NDArray[np.uint8] | None = None
     _ALAW_DECODE_TABLE: NDArray[np.int16] | None = None
 
     def __init__(self) -> None:
@@ -233,30 +294,10 @@ class ALawCodec(AudioCodec):
     @classmethod
     def _ensure_tables(cls) -> None:
         """Initialize lookup tables for fast encoding/decoding."""
-        if cls._ALAW_DECODE_TABLE is not None:
+        if cls._ALAW_ENCODE_TABLE is not None:
             return
 
-        # Build decode table (8-bit A-law to 16-bit linear)
-        decode_table = np.zeros(256, dtype=np.int16)
-        for i in range(256):
-            # Toggle even bits
-            value = i ^ 0x55
-            # Extract sign and magnitude
-            sign = value & 0x80
-            segment = (value >> 4) & 0x07
-            mantissa = value & 0x0F
-
-            if segment == 0:
-                linear = (mantissa << 4) + 8
-            else:
-                linear = ((mantissa << 4) + 0x108) << (segment - 1)
-
-            if sign:
-                linear = -linear
-
-            decode_table[i] = linear
-
-        cls._ALAW_DECODE_TABLE = decode_table
+        cls._ALAW_ENCODE_TABLE, cls._ALAW_DECODE_TABLE = _alaw_tables()
 
     def encode(self, pcm: NDArray[np.int16]) -> bytes:
         """Encode 16-bit PCM to A-law.
@@ -267,60 +308,285 @@ class ALawCodec(AudioCodec):
         Returns:
             A-law encoded bytes
         """
-        # Segment encoding table
-        SEG_END = [0x1F, 0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF]
-
-        # Get sign
-        sign = np.zeros(len(pcm), dtype=np.uint8)
-        pcm_work = pcm.astype(np.int32)
-        mask = pcm_work >= 0
-        sign[mask] = 0xD5
-        sign[~mask] = 0x55
-        pcm_work = np.abs(pcm_work)
-
-        # Compress and find segment
-        result = np.zeros(len(pcm), dtype=np.uint8)
-
-        for seg, end_val in enumerate(SEG_END):
-            if seg == len(SEG_END) - 1:
-                # Last segment - all remaining values
-                mask = pcm_work > SEG_END[seg - 1] if seg > 0 else np.ones(len(pcm), dtype=bool)
-            else:
-                lower = SEG_END[seg - 1] if seg > 0 else 0
-                mask = (pcm_work > lower) & (pcm_work <= end_val)
-
-            if seg < 2:
-                result[mask] = (pcm_work[mask] >> 4) & 0x0F
-            else:
-                result[mask] = (pcm_work[mask] >> (seg + 3)) & 0x0F
-
-            result[mask] |= seg << 4
-
-        result ^= sign
+        return np.take(self._ALAW_ENCODE_TABLE, _table_indices(pcm)).tobytes()
 
-        return result.tobytes()
-
-    def decode(self, data: bytes) -> NDArray[np.int16]:
+    def decode(
+        self,
+        data: bytes,
+        out: NDArray[np.int16] | None = None,
+    ) -> NDArray[np.int16]:
         """Decode A-law to 16-bit PCM.
 
         Args:
             data: A-law encoded bytes
+            out: Optional preallocated output buffer (len(data) samples)
 
         Returns:
             16-bit linear PCM samples
         """
-        if self._ALAW_DECODE_TABLE is None:
-            self._ensure_tables()
-
         indices = np.frombuffer(data, dtype=np.uint8)
-        return self._ALAW_DECODE_TABLE[indices]  # type: ignore[index]
+        return np.take(self._ALAW_DECODE_TABLE, indices, out=out)
+
+
+# ITU-T G.722 SB-ADPCM tables (64 kbit/s mode, 6 low-band + 2 high-band bits)
+_G722_QMF_COEFFS = np.array(
+    [3, -11, 12, 32, -210, 951, 3876, -805, 362, -156, 53, -11], dtype=np.int64
+)
+_G722_Q6 = (
+    0, 35, 72, 110, 150, 190, 233, 276, 323, 370, 422, 473, 530, 587, 650, 714,
+    786, 858, 940, 1023, 1121, 1219, 1339, 1458, 1612, 1765, 1980, 2195, 2557, 2919,
+)
+_G722_ILN = (
+    0, 63, 62, 31, 30, 29, 28, 27, 26, 25, 24, 23, 22, 21, 20, 19,
+    18, 17, 16, 15, 14, 13, 12, 11, 10, 9, 8, 7, 6, 5, 4,
+)
+_G722_ILP = (
+    0, 61, 60, 59, 58, 57, 56, 55, 54, 53, 52, 51, 50, 49, 48, 47,
+    46, 45, 44, 43, 42, 41, 40, 39, 38, 37, 36, 35, 34, 33, 32,
+)
+_G722_WL = (-60, -30, 58, 172, 334, 538, 1198, 3042)
+_G722_RL42 = (0, 7, 6, 5, 4, 3, 2, 1, 7, 6, 5, 4, 3, 2, 1, 0)
+_G722_ILB = (
+    2048, 2093, 2139, 2186, 2233, 2282, 2332, 2383, 2435, 2489, 2543, 2599,
+    2656, 2714, 2774, 2834, 2896, 2960, 3025, 3091, 3158, 3228, 3298, 3371,
+    3444, 3520, 3597, 3676, 3756, 3838, 3922, 4008,
+)
+_G722_QM4 = (
+    0, -20456, -12896, -8968, -6288, -4240, -2584, -1200,
+    20456, 12896, 8968, 6288, 4240, 2584, 1200, 0,
+)
+_G722_QM6 = (
+    -136, -136, -136, -136, -24808, -21904, -19008, -16704,
+    -14984, -13512, -12280, -11192, -10232, -9360, -8576, -7856,
+    -7192, -6576, -6000, -5456, -4944, -4464, -4008, -3576,
+    -3168, -2776, -2400, -2032, -1688, -1360, -1040, -728,
+    24808, 21904, 19008, 16704, 14984, 13512, 12280, 11192,
+    10232, 9360, 8576, 7856, 7192, 6576, 6000, 5456,
+    4944, 4464, 4008, 3576, 3168, 2776, 2400, 2032,
+    1688, 1360, 1040, 728, 432, 136, -432, -136,
+)
+_G722_QM2 = (-7408, -1616, 7408, 1616)
+_G722_WH = (0, -214, 798)
+_G722_RH2 = (2, 1, 2, 1)
+
+
+def _g722_scale_table(max_nb: int, shift: int) -> tuple[int, ...]:
+    """Step size for every log scale factor (blocks 3L/3H, SCALEL/SCALEH)."""
+    table = []
+    for nb in range(max_nb + 1):
+        mantissa = _G722_ILB[(nb >> 6) & 31]
+        exponent = shift - (nb >> 11)
+        scaled = mantissa << -exponent if exponent < 0 else mantissa >> exponent
+        table.append(scaled << 2)
+    return tuple(table)
+
+
+# The quantizer thresholds only depend on the step size, which takes a few
+# hundred distinct values, so the 30-way QUANTL search becomes one bisect.
+_G722_LOW_DET = _g722_scale_table(18432, 8)
+_G722_HIGH_DET = _g722_scale_table(22528, 10)
+_G722_LOW_THRESHOLDS = {
+    det: [(q * det) >> 12 for q in _G722_Q6[1:]] for det in set(_G722_LOW_DET)
+}
+
+
+class _G722Band:
+    """Adaptive predictor state of one G.722 sub-band (block 4)."""
+
+    __slots__ = ("s", "sz", "r1", "r2", "p1", "p2", "a1", "a2", "b", "d", "nb", "det")
+
+    def __init__(self, det: int) -> None:
+        self.s = 0  # Signal estimate
+        self.sz = 0  # Zero-section (6-tap) estimate
+        self.r1 = self.r2 = 0  # Reconstructed signal history
+        self.p1 = self.p2 = 0  # Partial reconstruction history
+        self.a1 = self.a2 = 0  # Pole-section coefficients
+        self.b = [0] * 6  # Zero-section coefficients
+        self.d = [0] * 6  # Quantized difference history
+        self.nb = 0  # Log scale factor
+        self.det = det  # Quantizer step size
+
+    def adapt(self, d: int) -> None:
+        """Update predictor with a quantized difference (G.722 block 4)."""
+        r0 = self.s + d
+        r0 = -32768 if r0 < -32768 else 32767 if r0 > 32767 else r0
+        p0 = self.sz + d
+        p0 = -32768 if p0 < -32768 else 32767 if p0 > 32767 else p0
+        a1 = self.a1
+        a2 = self.a2
+        sg0 = p0 >> 15
+        sg1 = self.p1 >> 15
+
+        # UPPOL2
+        wd1 = a1 << 2
+        wd1 = -32768 if wd1 < -32768 else 32767 if wd1 > 32767 else wd1
+        wd2 = -wd1 if sg0 == sg1 else wd1
+        if wd2 > 32767:
+            wd2 = 32767
+        ap2 = (
+            (wd2 >> 7) + (128 if sg0 == self.p2 >> 15 else -128) + ((a2 * 32512) >> 15)
+        )
+        ap2 = -12288 if ap2 < -12288 else 12288 if ap2 > 12288 else ap2
+
+        # UPPOL1
+        ap1 = (192 if sg0 == sg1 else -192) + ((a1 * 32640) >> 15)
+        ap1 = -32768 if ap1 < -32768 else 32767 if ap1 > 32767 else ap1
+        limit = 15360 - ap2
+        ap1 = -limit if ap1 < -limit else limit if ap1 > limit else ap1
+
+        # UPZERO: sign-sign update of the six zero-section coefficients
+        step = 0 if d == 0 else 128
+        neg = -step
+        sgd = d >> 15
+        d1, d2, d3, d4, d5, d6 = self.d
+        b1, b2, b3, b4, b5, b6 = self.b
+        b1 = (step if d1 >> 15 == sgd else neg) + ((b1 * 32640) >> 15)
+        b2 = (step if d2 >> 15 == sgd else neg) + ((b2 * 32640) >> 15)
+        b3 = (step if d3 >> 15 == sgd else neg) + ((b3 * 32640) >> 15)
+        b4 = (step if d4 >> 15 == sgd else neg) + ((b4 * 32640) >> 15)
+        b5 = (step if d5 >> 15 == sgd else neg) + ((b5 * 32640) >> 15)
+        b6 = (step if d6 >> 15 == sgd else neg) + ((b6 * 32640) >> 15)
+        b = [b1, b2, b3, b4, b5, b6]
+        if min(b) < -32768 or max(b) > 32767:
+            b = [-32768 if v < -32768 else 32767 if v > 32767 else v for v in b]
+            b1, b2, b3, b4, b5, b6 = b
+        self.b = b
+
+        # DELAYA
+        self.d = [d, d1, d2, d3, d4, d5]
+        self.r2 = r1 = self.r1
+        self.r1 = r0
+        self.p2 = self.p1
+        self.p1 = p0
+        self.a1 = ap1
+        self.a2 = ap2
+
+        # FILTEP
+        wd1 = r0 + r0
+        wd1 = -32768 if wd1 < -32768 else 32767 if wd1 > 32767 else wd1
+        wd2 = r1 + r1
+        wd2 = -32768 if wd2 < -32768 else 32767 if wd2 > 32767 else wd2
+        sp = ((ap1 * wd1) >> 15) + ((ap2 * wd2) >> 15)
+        sp = -32768 if sp < -32768 else 32767 if sp > 32767 else sp
+
+        # FILTEZ: quantized differences stay below 2**14, so 2*d never saturates
+        sz = (
+            ((b1 * 2 * d) >> 15) + ((b2 * 2 * d1) >> 15) + ((b3 * 2 * d2) >> 15)
+            + ((b4 * 2 * d3) >> 15) + ((b5 * 2 * d4) >> 15) + ((b6 * 2 * d5) >> 15)
+        )
+        sz = -32768 if sz < -32768 else 32767 if sz > 32767 else sz
+        self.sz = sz
+
+        # PREDIC
+        s = sp + sz
+        self.s = -32768 if s < -32768 else 32767 if s > 32767 else s
+
+
+def _g722_encode_bands(
+    xlow: list[int], xhigh: list[int], low: _G722Band, high: _G722Band
+) -> bytes:
+    """Run the SB-ADPCM encoder over sub-band samples (blocks 1-4)."""
+    codes = bytearray(len(xlow))
+    for k, (xl, xh) in enumerate(zip(xlow, xhigh)):
+        # Block 1L: SUBTRA, QUANTL
+        el = xl - low.s
+        el = -32768 if el < -32768 else 32767 if el > 32767 else el
+        if el >= 0:
+            ilow = _G722_ILP[bisect_right(_G722_LOW_THRESHOLDS[low.det], el) + 1]
+        else:
+            ilow = _G722_ILN[bisect_right(_G722_LOW_THRESHOLDS[low.det], -(el + 1)) + 1]
+
+        # Blocks 2L, 3L: INVQAL, LOGSCL, SCALEL
+        ril = ilow >> 2
+        dlow = (low.det * _G722_QM4[ril]) >> 15
+        nb = ((low.nb * 127) >> 7) + _G722_WL[_G722_RL42[ril]]
+        nb = 0 if nb < 0 else 18432 if nb > 18432 else nb
+        low.nb = nb
+        low.det = _G722_LOW_DET[nb]
+        low.adapt(dlow)
+
+        # Block 1H: SUBTRA, QUANTH
+        eh = xh - high.s
+        eh = -32768 if eh < -32768 else 32767 if eh > 32767 else eh
+        threshold = (564 * high.det) >> 12
+        if eh >= 0:
+            ihigh = 2 if eh >= threshold else 3
+        else:
+            ihigh = 0 if -(eh + 1) >= threshold else 1
+
+        # Blocks 2H, 3H: INVQAH, LOGSCH, SCALEH
+        dhigh = (high.det * _G722_QM2[ihigh]) >> 15
+        nb = ((high.nb * 127) >> 7) + _G722_WH[_G722_RH2[ihigh]]
+        nb = 0 if nb < 0 else 22528 if nb > 22528 else nb
+        high.nb = nb
+        high.det = _G722_HIGH_DET[nb]
+        high.adapt(dhigh)
+
+        codes[k] = (ihigh << 6) | ilow
+    return bytes(codes)
+
+
+def _g722_decode_bands(
+    codes: bytes, low: _G722Band, high: _G722Band
+) -> tuple[list[int], list[int]]:
+    """Reconstruct sub-band samples from SB-ADPCM codes (blocks 2-6)."""
+    rlow = [0] * len(codes)
+    rhigh = [0] * len(codes)
+    for k, code in enumerate(codes):
+        # Blocks 5L, 6L: INVQBL, RECONS, LIMIT
+        ilow = code & 0x3F
+        value = low.s + ((low.det * _G722_QM6[ilow]) >> 15)
+        rlow[k] = -16384 if value < -16384 else 16383 if value > 16383 else value
+
+        # Blocks 2L, 3L: INVQAL, LOGSCL, SCALEL
+        ril = ilow >> 2
+        dlow = (low.det * _G722_QM4[ril]) >> 15
+        nb = ((low.nb * 127) >> 7) + _G722_WL[_G722_RL42[ril]]
+        nb = 0 if nb < 0 else 18432 if nb > 18432 else nb
+        low.nb = nb
+        low.det = _G722_LOW_DET[nb]
+        low.adapt(dlow)
+
+        # Blocks 2H, 5H, 6H: INVQAH, RECONS, LIMIT
+        ihigh = code >> 6
+        dhigh = (high.det * _G722_QM2[ihigh]) >> 15
+        value = high.s + dhigh
+        rhigh[k] = -16384 if value < -16384 else 16383 if value > 16383 else value
+
+        # Block 3H: LOGSCH, SCALEH
+        nb = ((high.nb * 127) >> 7) + _G722_WH[_G722_RH2[ihigh]]
+        nb = 0 if nb < 0 else 22528 if nb > 22528 else nb
+        high.nb = nb
+        high.det = _G722_HIGH_DET[nb]
+        high.adapt(dhigh)
+    return rlow, rhigh
+
+
+def _qmf_windows(
+    history: NDArray[np.int64], samples: NDArray[np.int64]
+) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]:
+    """Even and odd 12-tap QMF windows for each sample pair.
+
+    Returns:
+        (even windows, odd windows, new 22-sample history)
+    """
+    buffer = np.concatenate((history, samples))
+    evens = np.lib.stride_tricks.sliding_window_view(buffer[0::2], 12)
+    odds = np.lib.stride_tricks.sliding_window_view(buffer[1::2], 12)
+    return evens, odds, buffer[-22:].copy()
 
 
 class G722Codec(AudioCodec):
     """G.722 wideband codec.
 
     Provides 7kHz bandwidth audio at 64kbps (vs 3.4kHz for G.711).
-    Uses Sub-Band Adaptive Differential PCM (SB-ADPCM).
+    Uses Sub-Band Adaptive Differential PCM (SB-ADPCM): a 24-tap QMF
+    filter bank splits the signal into two 8kHz sub-bands which are
+    ADPCM coded with 6 (low band) and 2 (high band) bits.
+
+    The QMF banks run vectorized over whole frames; the ADPCM predictors
+    are inherently sample-recursive. Encoder and decoder state persists
+    across frames, so use one instance per call direction.
 
     Native sample rate: 16kHz
     """
@@ -331,12 +597,27 @@ class G722Codec(AudioCodec):
         # G.722 state variables for encoder/decoder
         self._encoder_state: dict = {}
         self._decoder_state: dict = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset encoder and decoder to the G.722 initial state."""
+        self._encoder_state = {
+            "qmf": np.zeros(22, dtype=np.int64),
+            "low": _G722Band(det=32),
+            "high": _G722Band(det=8),
+            "pending": np.zeros(0, dtype=np.int64),
+        }
+        self._decoder_state = {
+            "qmf": np.zeros(22, dtype=np.int64),
+            "low": _G722Band(det=32),
+            "high": _G722Band(det=8),
+        }
 
     def encode(self, pcm: NDArray[np.int16]) -> bytes:
         """Encode 16-bit PCM to G.722.
 
-        This is a simplified implementation. For production, consider
-        using a dedicated G.722 library.
+        Each pair of input samples becomes one byte. An odd trailing
+        sample is held back and encoded with the next frame.
 
         Args:
             pcm: 16-bit linear PCM samples at 16kHz
@@ -344,40 +625,23 @@ class G722Codec(AudioCodec):
         Returns:
             G.722 encoded bytes
         """
-        # G.722 encodes 2 samples into 1 byte
-        # Split into lower and upper subbands using QMF filterbank
-
-        try:
-            # Try to use av (PyAV) for proper G.722 encoding
-            import av
-
-            # Create a memory buffer
-            output = []
-
-            # Create encoder
-            codec = av.Codec("g722", "w")
-            encoder = codec.create()
-            encoder.sample_rate = 16000
-            encoder.channels = 1
-            encoder.format = av.AudioFormat("s16")
-
-            # Encode frame
-            frame = av.AudioFrame.from_ndarray(
-                pcm.reshape(1, -1),
-                format="s16",
-                layout="mono",
-            )
-            frame.sample_rate = 16000
-
-            for packet in encoder.encode(frame):
-                output.append(bytes(packet))
-
-            return b"".join(output)
-
-        except ImportError:
-            # Fallback: Return raw PCM (lossy, but functional)
-            log.warning("G.722 encoding requires PyAV, falling back to PCM")
-            return pcm.tobytes()
+        state = self._encoder_state
+        samples = np.concatenate((state["pending"], np.asarray(pcm, dtype=np.int64)))
+        usable = len(samples) - len(samples) % 2
+        state["pending"] = samples[usable:]
+        if usable == 0:
+            return b""
+
+        # Transmit QMF: keep every other output of the 24-tap analysis filter
+        evens, odds, state["qmf"] = _qmf_windows(state["qmf"], samples[:usable])
+        sum_odd = evens @ _G722_QMF_COEFFS
+        sum_even = odds @ _G722_QMF_COEFFS[::-1]
+        xlow = (sum_even + sum_odd) >> 14
+        xhigh = (sum_even - sum_odd) >> 14
+
+        return _g722_encode_bands(
+            xlow.tolist(), xhigh.tolist(), state["low"], state["high"]
+        )
 
     def decode(self, data: bytes) -> NDArray[np.int16]:
         """Decode G.722 to 16-bit PCM.
@@ -386,29 +650,25 @@ class G722Codec(AudioCodec):
             data: G.722 encoded bytes
 
         Returns:
-            16-bit linear PCM samples at 16kHz
+            16-bit linear PCM samples at 16kHz (two per input byte)
         """
-        try:
-            import av
-            import io
-
-            # Create decoder
-            container = av.open(io.BytesIO(data), format="g722", mode="r")
+        state = self._decoder_state
+        if not data:
+            return np.zeros(0, dtype=np.int16)
+        rlow, rhigh = _g722_decode_bands(bytes(data), state["low"], state["high"])
+        rlow_arr = np.array(rlow, dtype=np.int64)
+        rhigh_arr = np.array(rhigh, dtype=np.int64)
 
-            output = []
-            for frame in container.decode(audio=0):
-                arr = frame.to_ndarray()
-                if arr.ndim > 1:
-                    arr = arr[0]
-                output.append(arr)
+        # Receive QMF: interleave sum/difference and run the synthesis filter
+        combined = np.empty(2 * len(rlow_arr), dtype=np.int64)
+        combined[0::2] = rlow_arr + rhigh_arr
+        combined[1::2] = rlow_arr - rhigh_arr
+        evens, odds, state["qmf"] = _qmf_windows(state["qmf"], combined)
 
-            container.close()
-            return np.concatenate(output).astype(np.int16)
-
-        except ImportError:
-            # Fallback: Assume raw PCM
-            log.warning("G.722 decoding requires PyAV, falling back to PCM")
-            return np.frombuffer(data, dtype=np.int16)
+        out = np.empty(len(combined), dtype=np.int64)
+        out[0::2] = (odds @ _G722_QMF_COEFFS[::-1]) >> 11
+        out[1::2] = (evens @ _G722_QMF_COEFFS) >> 11
+        return np.clip(out, -32768, 32767).astype(np.int16)
 
 
 class LinearPCMCodec(AudioCodec):
@@ -472,11 +732,228 @@ def get_codec(codec_type: CodecType | str) -> AudioCodec:
     return codecs[codec_type]()
 
 
+# Resampling ratios used on the hot path (8k↔16k telephony/AI, Piper 22.05k
+# and ElevenLabs 24k TTS output down to narrowband). Their filter banks are
+# built at import time and shared by every call in the process.
+COMMON_RESAMPLE_RATES: tuple[tuple[int, int], ...] = (
+    (8000, 16000),
+    (16000, 8000),
+    (22050, 8000),
+    (24000, 8000),
+)
+
+
+@lru_cache(maxsize=32)
+def _polyphase_filter(up: int, down: int) -> NDArray[np.float32]:
+    """Design the polyphase anti-aliasing filter for an up/down ratio.
+
+    Mirrors ``scipy.signal.resample_poly`` (Kaiser-windowed sinc, beta 5.0,
+    ten zero crossings per side) but is built with NumPy only and returned
+    as an ``(up, taps_per_phase)`` matrix so each output sample is a single
+    dot product.
+
+    Args:
+        up: Upsampling factor
+        down: Downsampling factor
+
+    Returns:
+        Polyphase filter bank, one row per phase
+    """
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    n = np.arange(-half_len, half_len + 1, dtype=np.float64)
+    taps = np.sinc(n / max_rate) * np.kaiser(len(n), 5.0)
+    taps *= up / taps.sum()  # Unity DC gain after zero-stuffing
+
+    taps_per_phase = -(-len(taps) // up)
+    padded = np.zeros(taps_per_phase * up, dtype=np.float64)
+    padded[: len(taps)] = taps
+
+    # bank[p, j] = h[p + (K - 1 - j) * up]: time-reversed so that row p
+    # applies directly to the input window x[i - K + 1 .. i]
+    bank = padded.reshape(taps_per_phase, up).T[:, ::-1]
+    return np.ascontiguousarray(bank, dtype=np.float32)
+
+
+@lru_cache(maxsize=256)
+def _gather_plan(
+    up: int,
+    down: int,
+    phase: int,
+    n: int,
+) -> tuple[NDArray[np.intp], NDArray[np.float32]]:
+    """Input window indices and filter rows for one chunk.
+
+    Chunks of a fixed size cycle through a handful of start phases, so
+    the plan is cached and shared by every stream with the same ratio.
+
+    Args:
+        up: Upsampling factor
+        down: Downsampling factor
+        phase: Start position on the upsampled axis
+        n: Number of input samples in the chunk
+
+    Returns:
+        Tuple of (window index per output, filter row per output)
+    """
+    positions = np.arange(phase, n * up, down)
+    bases, phases = np.divmod(positions, up)
+    return bases, _polyphase_filter(up, down)[phases]
+
+
+def _ratio(input_rate: int, output_rate: int) -> tuple[int, int]:
+    """Reduce a rate conversion to its (up, down) factors."""
+    g = gcd(input_rate, output_rate)
+    return output_rate // g, input_rate // g
+
+
+# Precompute the filter banks for the fixed telephony/TTS ratios
+for _input_rate, _output_rate in COMMON_RESAMPLE_RATES:
+    _polyphase_filter(*_ratio(_input_rate, _output_rate))
+
+
+class StreamingResampler:
+    """Stateful polyphase resampler for continuous audio streams.
+
+    Keeps the filter history and output phase between calls, so a stream
+    split into arbitrary chunks produces the same samples as resampling it
+    in one piece - without the FFT cost and chunk-edge artifacts of
+    ``scipy.signal.resample``. Use one instance per call and direction.
+
+    The output lags the input by the filter's group delay (about 1.25 ms
+    for the common ratios); per-chunk output length may differ by one
+    sample from the nominal ratio, but the running total is exact.
+    """
+
+    # Ratios with at most this many phases are computed phase by phase
+    # with strided mat-vecs; larger ones (e.g. 22.05k -> 8k) use a gather.
+    _MAX_GROUPED_PHASES = 8
+
+    def __init__(
+        self,
+        input_rate: int,
+        output_rate: int,
+        skip_delay: bool = False,
+    ) -> None:
+        """Initialize resampler.
+
+        Args:
+            input_rate: Input sample rate
+            output_rate: Output sample rate
+            skip_delay: Drop the filter's group delay from the start of the
+                output (for one-shot resampling of complete signals)
+        """
+        self.input_rate = input_rate
+        self.output_rate = output_rate
+
+        self.up, self.down = _ratio(input_rate, output_rate)
+
+        self._bank = _polyphase_filter(self.up, self.down)
+        self._bank_t = np.ascontiguousarray(self._bank.T)
+        self._taps_per_phase = self._bank.shape[1]
+        self._half_len = 10 * max(self.up, self.down)
+        self._skip_delay = skip_delay
+        self._history = np.zeros(self._taps_per_phase - 1, dtype=np.float32)
+        # Position of the next output sample on the upsampled time axis,
+        # relative to the first sample of the next input chunk.
+        self._phase = self._half_len if skip_delay else 0
+
+    @property
+    def passthrough(self) -> bool:
+        """Whether input and output rates are identical."""
+        return self.up == self.down
+
+    @property
+    def delay_samples(self) -> float:
+        """Group delay of the filter in output samples."""
+        return self._half_len / self.down
+
+    @property
+    def flush_samples(self) -> int:
+        """Input samples needed to push the group delay out of the filter."""
+        return -(-self._half_len // self.up) + 1
+
+    def process(self, audio: NDArray[np.generic]) -> NDArray[np.float32]:
+        """Resample the next chunk of the stream.
+
+        Args:
+            audio: Input samples (any numeric dtype, same scale is kept)
+
+        Returns:
+            Resampled samples as float32
+        """
+        samples = np.asarray(audio, dtype=np.float32)
+        if self.passthrough:
+            return samples
+
+        n = len(samples)
+        up, down = self.up, self.down
+        end = n * up
+        if self._phase >= end:
+            self._phase -= end
+            self._append_history(samples)
+            return np.zeros(0, dtype=np.float32)
+
+        count = -(-(end - self._phase) // down)
+        buffer = np.concatenate((self._history, samples))
+        # windows[i] = buffer[i : i + K], i.e. x[i - K + 1 .. i] for input i
+        # (a strided view; built directly as sliding_window_view is slow)
+        windows = np.ndarray(
+            (len(buffer) - self._taps_per_phase + 1, self._taps_per_phase),
+            dtype=np.float32,
+            buffer=buffer,
+            strides=(buffer.itemsize, buffer.itemsize),
+        )
+
+        if down == 1:
+            # Pure upsampling: every input window feeds all `up` phases, and
+            # the (window, phase) products are already in output order.
+            first, offset = divmod(self._phase, up)
+            last = first + (offset + count - 1) // up
+            products = windows[first:last + 1] @ self._bank_t
+            output = products.ravel()[offset:offset + count]
+        elif up <= self._MAX_GROUPED_PHASES:
+            # Outputs m, m + up, m + 2*up, ... share one filter phase and
+            # advance by `down` input samples: one strided mat-vec per phase.
+            output = np.empty(count, dtype=np.float32)
+            for r in range(min(up, count)):
+                position = self._phase + r * down
+                base, phase = divmod(position, up)
+                n_out = len(range(r, count, up))
+                output[r::up] = (
+                    windows[base:base + down * (n_out - 1) + 1:down]
+                    @ self._bank[phase]
+                )
+        else:
+            bases, rows = _gather_plan(up, down, self._phase, n)
+            output = np.einsum("ij,ij->i", windows[bases], rows)
+
+        self._phase += count * down - end
+        self._history = buffer[len(buffer) - len(self._history):].copy()
+        return output.astype(np.float32, copy=False)
+
+    def _append_history(self, samples: NDArray[np.float32]) -> None:
+        """Shift samples into the filter history without producing output."""
+        keep = len(self._history)
+        if keep:
+            self._history = np.concatenate((self._history, samples))[-keep:]
+
+    def reset(self) -> None:
+        """Clear filter state (e.g. when a call ends or the stream restarts)."""
+        self._history[:] = 0.0
+        self._phase = self._half_len if self._skip_delay else 0
+
+
 class AudioResampler:
     """Resample audio between sample rates.
 
     Handles conversion between telephony rates (8kHz) and
     AI processing rate (16kHz).
+
+    By default every ``resample`` call is treated as a complete signal
+    (group delay compensated, exact output length). With ``streaming=True``
+    consecutive calls are treated as chunks of one continuous stream and
+    filter state is carried across them.
     """
 
     def __init__(
@@ -484,6 +961,7 @@ class AudioResampler:
         input_rate: int = 8000,
         output_rate: int = 16000,
         channels: int = 1,
+        streaming: bool = False,
     ) -> None:
         """Initialize resampler.
 
@@ -491,11 +969,13 @@ class AudioResampler:
             input_rate: Input sample rate
             output_rate: Output sample rate
             channels: Number of audio channels
+            streaming: Keep filter state between calls (one instance per stream)
         """
         self.input_rate = input_rate
         self.output_rate = output_rate
         self.channels = channels
-        self._resampler = None
+        self.streaming = streaming
+        self._resampler = StreamingResampler(input_rate, output_rate)
 
     def resample(self, audio: NDArray[np.int16]) -> NDArray[np.int16]:
         """Resample audio to target rate.
@@ -509,24 +989,28 @@ class AudioResampler:
         if self.input_rate == self.output_rate:
             return audio
 
-        try:
-            # Try using scipy for high-quality resampling
-            from scipy import signal
+        if self.streaming:
+            resampled = self._resampler.process(audio)
+        else:
+            resampled = self._resample_block(audio)
 
-            # Calculate target length
-            target_length = int(len(audio) * self.output_rate / self.input_rate)
+        return np.clip(np.rint(resampled), -32768, 32767).astype(np.int16)
 
-            # Resample
-            resampled = signal.resample(audio.astype(np.float64), target_length)
-            return np.clip(resampled, -32768, 32767).astype(np.int16)
+    def _resample_block(self, audio: NDArray[np.int16]) -> NDArray[np.float32]:
+        """Resample a complete signal with a fresh, delay-compensated filter."""
+        resampler = StreamingResampler(
+            self.input_rate, self.output_rate, skip_delay=True
+        )
+        target_length = int(len(audio) * self.output_rate / self.input_rate)
+        padded = np.concatenate((
+            np.asarray(audio, dtype=np.float32),
+            np.zeros(resampler.flush_samples, dtype=np.float32),
+        ))
+        return resampler.process(padded)[:target_length]
 
-        except ImportError:
-            # Fallback to simple linear interpolation
-            ratio = self.output_rate / self.input_rate
-            target_length = int(len(audio) * ratio)
-            indices = np.linspace(0, len(audio) - 1, target_length)
-            resampled = np.interp(indices, np.arange(len(audio)), audio.astype(np.float64))
-            return np.clip(resampled, -32768, 32767).astype(np.int16)
+    def reset(self) -> None:
+        """Clear streaming filter state."""
+        self._resampler.reset()
 
 
 class CodecPipeline:
@@ -539,6 +1023,8 @@ class CodecPipeline:
     4. Convert back to int16
     5. Resample to telephony rate
     6. Encode to telephony codec
+
+    Resampling is stateful, so each call (stream) needs its own pipeline.
     """
 
     def __init__(
@@ -555,10 +1041,10 @@ class CodecPipeline:
         self.codec = get_codec(telephony_codec)
         self.ai_sample_rate = ai_sample_rate
 
-        # Resamplers
+        # Streaming resamplers (filter state carried across chunks)
         codec_rate = self.codec.info.sample_rate
-        self._upsample = AudioResampler(codec_rate, ai_sample_rate)
-        self._downsample = AudioResampler(ai_sample_rate, codec_rate)
+        self._upsample = StreamingResampler(codec_rate, ai_sample_rate)
+        self._downsample = StreamingResampler(ai_sample_rate, codec_rate)
 
     def decode_for_ai(self, data: bytes) -> NDArray[np.float32]:
         """Decode telephony audio for AI processing.
@@ -569,14 +1055,22 @@ class CodecPipeline:
         Returns:
             Float32 audio at AI sample rate
         """
-        # Decode to PCM
-        pcm = self.codec.decode(data)
+        return self.pcm_for_ai(self.codec.decode(data))
+
+    def pcm_for_ai(self, pcm: NDArray[np.int16]) -> NDArray[np.float32]:
+        """Convert decoded telephony PCM for AI processing.
 
-        # Resample to AI rate
-        resampled = self._upsample.resample(pcm)
+        Args:
+            pcm: 16-bit PCM at the codec's sample rate
+
+        Returns:
+            Float32 audio at AI sample rate
+        """
+        # Resample to AI rate (float32, int16 scale)
+        resampled = self._upsample.process(pcm)
 
-        # Convert to float32 normalized
-        return resampled.astype(np.float32) / 32768.0
+        # Normalize to [-1, 1]
+        return resampled * np.float32(1.0 / 32768.0)
 
     def encode_for_telephony(self, audio: NDArray[np.float32]) -> bytes:
         """Encode AI audio for telephony.
@@ -587,14 +1081,19 @@ class CodecPipeline:
         Returns:
             Encoded telephony audio
         """
-        # Convert to int16
-        pcm = (audio * 32767).astype(np.int16)
-
         # Resample to codec rate
-        resampled = self._downsample.resample(pcm)
+        resampled = self._downsample.process(audio)
+
+        # Convert to int16
+        pcm = np.clip(resampled * 32767, -32768, 32767).astype(np.int16)
 
         # Encode
-        return self.codec.encode(resampled)
+        return self.codec.encode(pcm)
+
+    def reset(self) -> None:
+        """Reset resampler state for a new stream."""
+        self._upsample.reset()
+        self._downsample.reset()
 
 
 # Convenience functions
@@ -0,0 +1,339 @@
+"""Event Socket (ESL) wire protocol: frame parsing and ordered dispatch.
+
+FreeSWITCH sends messages as a block of ``Name: value`` header lines,
+a blank line and, if the headers carry ``Content-Length``, that many
+bytes of body. Events (``text/event-plain``) nest a second header block
+with URL-encoded values in the body.
+
+The parser works on the received bytes directly: a frame records
+offsets into the chunk it arrived in, and header values are looked up,
+decoded and URL-decoded only when read. Busy switches send hundreds of
+headers per event while handlers read a handful, so most bytes are
+never decoded.
+
+Usage:
+    parser = EslParser()
+    for frame in parser.feed(await reader.read(65536)):
+        print(frame.content_type, frame.headers.get("Reply-Text"))
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterator, Mapping
+from typing import Any, Generic, TypeVar
+from urllib.parse import unquote
+
+from itf_shared import get_logger
+
+log = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Bytes requested per socket read
+READ_SIZE = 65536
+
+_CONTENT_LENGTH = b"Content-Length: "
+
+
+class EslHeaders(Mapping[str, str]):
+    """Header block read in place from the received bytes.
+
+    ``get``/``[]`` search the raw block for the one header asked for and
+    cache its decoded value; iterating decodes the whole block once.
+    """
+
+    __slots__ = ("_data", "_start", "_end", "_url_encoded", "_cache", "_all")
+
+    def __init__(
+        self,
+        data: bytes,
+        start: int = 0,
+        end: int | None = None,
+        url_encoded: bool = False,
+    ) -> None:
+        """Initialize headers.
+
+        Args:
+            data: Buffer holding the block
+            start: Offset of the first header line
+            end: Offset just past the last header line (default: end of data)
+            url_encoded: Values are URL-encoded (event headers)
+        """
+        self._data = data
+        self._start = start
+        self._end = len(data) if end is None else end
+        self._url_encoded = url_encoded
+        self._cache: dict[str, str | None] = {}
+        self._all: dict[str, str] | None = None
+
+    def _decode(self, raw: bytes) -> str:
+        value = raw.decode("utf-8", "replace").strip()
+        if self._url_encoded and "%" in value:
+            return unquote(value)
+        return value
+
+    def _lookup(self, key: str) -> str | None:
+        if key in self._cache:
+            return self._cache[key]
+        needle = key.encode() + b": "
+        data, start, end = self._data, self._start, self._end
+        if data.startswith(needle, start, end):
+            pos = start + len(needle)
+        else:
+            pos = data.find(b"\n" + needle, start, end)
+            if pos >= 0:
+                pos += len(needle) + 1
+        value = None
+        if pos >= 0:
+            stop = data.find(b"\n", pos, end)
+            value = self._decode(data[pos:stop if stop >= 0 else end])
+        self._cache[key] = value
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Value of a header, or default if absent."""
+        value = self._lookup(key)
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> str:
+        value = self._lookup(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._lookup(key) is not None
+
+    def _decode_all(self) -> dict[str, str]:
+        if self._all is None:
+            headers: dict[str, str] = {}
+            block = self._data[self._start:self._end]
+            for line in block.split(b"\n"):
+                key, sep, value = line.partition(b": ")
+                if sep:
+                    headers.setdefault(key.decode().strip(), self._decode(value))
+            self._all = headers
+        return self._all
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._decode_all())
+
+    def __len__(self) -> int:
+        return len(self._decode_all())
+
+    def __repr__(self) -> str:
+        return f"EslHeaders({self._decode_all()!r})"
+
+
+class EslFrame:
+    """One Event Socket message: headers and optional body (as offsets)."""
+
+    __slots__ = ("data", "headers", "body_start", "body_end", "_body")
+
+    def __init__(
+        self,
+        data: bytes,
+        header_start: int,
+        header_end: int,
+        body_start: int,
+        body_end: int,
+    ) -> None:
+        """Initialize frame.
+
+        Args:
+            data: Buffer the message was received in
+            header_start: Offset of the first header line
+            header_end: Offset just past the last header line
+            body_start: Offset of the body
+            body_end: Offset just past the body
+        """
+        self.data = data
+        self.headers = EslHeaders(data, header_start, header_end)
+        self.body_start = body_start
+        self.body_end = body_end
+        self._body: str | None = None
+
+    @classmethod
+    def from_bytes(cls, message: bytes) -> EslFrame:
+        """Frame from one complete message (e.g. in tests)."""
+        head, sep, _ = message.partition(b"\n\n")
+        body_start = len(head) + len(sep)
+        return cls(message, 0, len(head), body_start, len(message))
+
+    @property
+    def content_type(self) -> str:
+        """Message type (command/reply, api/response, text/event-plain, ...)."""
+        return self.headers.get("Content-Type", "")
+
+    @property
+    def reply_text(self) -> str:
+        """Reply-Text of a command/reply (e.g. "+OK Job-UUID: ...")."""
+        return self.headers.get("Reply-Text", "")
+
+    @property
+    def body(self) -> str:
+        """Body decoded as text (on first access)."""
+        if self._body is None:
+            raw = self.data[self.body_start:self.body_end]
+            self._body = raw.decode("utf-8", "replace")
+        return self._body
+
+    def event_parts(self) -> tuple[EslHeaders, str]:
+        """Split a text/event-plain body into event headers and event body.
+
+        Returns:
+            URL-decoding headers over the body bytes, and the event's own
+            body (e.g. a bgapi result), if any
+        """
+        data, start, end = self.data, self.body_start, self.body_end
+        split = data.find(b"\n\n", start, end)
+        if split < 0:
+            return EslHeaders(data, start, end, url_encoded=True), ""
+        body = data[split + 2:end].decode("utf-8", "replace") if split + 2 < end else ""
+        return EslHeaders(data, start, split, url_encoded=True), body
+
+
+class EslParser:
+    """Incremental parser turning received chunks into frames.
+
+    Complete messages are parsed straight out of the chunk they arrived
+    in. Only an incomplete tail is kept, and chunks of a message still
+    missing bytes are collected without rejoining them on every read.
+    """
+
+    def __init__(self) -> None:
+        """Initialize parser."""
+        self._chunks: list[bytes] = []
+        self._buffered = 0
+        self._needed = 0  # Bytes required before a parse can make progress
+
+    def feed(self, chunk: bytes) -> list[EslFrame]:
+        """Add received bytes and return the messages they complete.
+
+        Args:
+            chunk: Bytes read from the socket
+
+        Returns:
+            Complete frames, in order
+        """
+        if not chunk:
+            return []
+        self._chunks.append(chunk)
+        self._buffered += len(chunk)
+        if self._buffered < self._needed:
+            return []
+
+        data = self._chunks[0] if len(self._chunks) == 1 else b"".join(self._chunks)
+        frames, pos = self._parse(data)
+
+        tail = data[pos:] if pos < len(data) else b""
+        self._chunks = [tail] if tail else []
+        self._buffered = len(tail)
+        return frames
+
+    def _parse(self, data: bytes) -> tuple[list[EslFrame], int]:
+        frames: list[EslFrame] = []
+        pos = 0
+        size = len(data)
+        self._needed = 0
+        while pos < size:
+            # Blank lines between messages
+            while pos < size and data[pos] == 0x0A:
+                pos += 1
+            header_end = data.find(b"\n\n", pos)
+            if header_end < 0:
+                break
+
+            length = 0
+            if data.startswith(_CONTENT_LENGTH, pos):
+                cl = pos + len(_CONTENT_LENGTH)
+            else:
+                cl = data.find(b"\n" + _CONTENT_LENGTH, pos, header_end)
+                if cl >= 0:
+                    cl += len(_CONTENT_LENGTH) + 1
+            if cl >= 0:
+                stop = data.find(b"\n", cl, header_end + 1)
+                length = int(data[cl:stop])
+
+            body_start = header_end + 2
+            body_end = body_start + length
+            if body_end > size:
+                self._needed = body_end - pos
+                break
+            frames.append(EslFrame(data, pos, header_end, body_start, body_end))
+            pos = body_end
+        return frames, pos
+
+    @property
+    def buffered(self) -> int:
+        """Bytes of an incomplete message held back."""
+        return self._buffered
+
+
+class OrderedDispatcher(Generic[T]):
+    """Runs a handler per key in arrival order; keys run concurrently.
+
+    Each key with pending items gets a task draining its queue; the
+    task ends when the queue is empty. Events of one call are handled in
+    order, while a slow handler only delays its own call.
+    """
+
+    def __init__(self, handle: Callable[[T], Awaitable[None]]) -> None:
+        """Initialize dispatcher.
+
+        Args:
+            handle: Coroutine run for each item (should not raise)
+        """
+        self._handle = handle
+        self._queues: dict[str, deque[T]] = {}
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self.dispatched = 0
+        self.max_depth = 0
+
+    def submit(self, key: str, item: T) -> None:
+        """Queue an item behind earlier items of the same key."""
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = deque()
+            self._tasks[key] = asyncio.create_task(self._drain(key, queue))
+        queue.append(item)
+        if len(queue) > self.max_depth:
+            self.max_depth = len(queue)
+
+    async def _drain(self, key: str, queue: deque[T]) -> None:
+        try:
+            while queue:
+                item = queue.popleft()
+                try:
+                    await self._handle(item)
+                except Exception as e:
+                    log.error("Dispatch handler error", key=key, error=str(e))
+                self.dispatched += 1
+        finally:
+            # No await since the last check: nothing was queued meanwhile
+            del self._queues[key]
+            del self._tasks[key]
+
+    async def join(self) -> None:
+        """Wait until every queued item has been handled."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks.values()), return_exceptions=True)
+
+    async def close(self) -> None:
+        """Cancel pending work."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @property
+    def pending(self) -> int:
+        """Items waiting behind the one being handled, over all keys."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    @property
+    def active_keys(self) -> int:
+        """Keys with work in progress."""
+        return len(self._tasks)
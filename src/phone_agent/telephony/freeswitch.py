@@ -19,13 +19,19 @@ from __future__ import annotations
 
 import asyncio
 import re
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable
+from typing import Any
 from uuid import UUID, uuid4
 
 from itf_shared import get_logger
 
+from phone_agent.core.metrics import get_metrics
+from phone_agent.telephony.esl import READ_SIZE, EslFrame, EslParser, OrderedDispatcher
+
 log = get_logger(__name__)
 
 
@@ -89,21 +95,77 @@ class FreeSwitchConfig:
     reconnect_delay: float = 5.0
     max_reconnect_attempts: int = 10
 
+    # Commands
+    command_timeout: float = 10.0  # Seconds to wait for a command result
+
 
 @dataclass
 class FreeSwitchEvent:
-    """FreeSWITCH event data."""
-
-    event_name: str
-    event_uuid: str = ""
-    channel_uuid: str = ""
-    caller_id_number: str = ""
-    caller_id_name: str = ""
-    destination_number: str = ""
-    channel_state: str = ""
-    headers: dict[str, str] = field(default_factory=dict)
+    """FreeSWITCH event data.
+
+    Fields read from the event headers, which decode a value only when
+    it is first accessed.
+    """
+
+    headers: Mapping[str, str]
     body: str = ""
 
+    @property
+    def event_name(self) -> str:
+        """Event-Name (e.g. CHANNEL_CREATE)."""
+        return self.headers.get("Event-Name", "")
+
+    @property
+    def event_uuid(self) -> str:
+        """Event-UUID."""
+        return self.headers.get("Event-UUID", "")
+
+    @property
+    def channel_uuid(self) -> str:
+        """Unique-ID of the channel (empty for non-channel events)."""
+        return self.headers.get("Unique-ID", "")
+
+    @property
+    def caller_id_number(self) -> str:
+        """Caller number."""
+        return self.headers.get("Caller-Caller-ID-Number", "")
+
+    @property
+    def caller_id_name(self) -> str:
+        """Caller name."""
+        return self.headers.get("Caller-Caller-ID-Name", "")
+
+    @property
+    def destination_number(self) -> str:
+        """Dialed number."""
+        return self.headers.get("Caller-Destination-Number", "")
+
+    @property
+    def channel_state(self) -> str:
+        """Channel-State (e.g. CS_ROUTING)."""
+        return self.headers.get("Channel-State", "")
+
+
+@dataclass
+class EslStatistics:
+    """ESL command and event counters (latencies go to the esl_<command> metrics)."""
+
+    commands_sent: int = 0
+    commands_completed: int = 0
+    commands_failed: int = 0  # Result was -ERR
+    commands_timed_out: int = 0
+    events_received: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert to dictionary."""
+        return {
+            "commands_sent": self.commands_sent,
+            "commands_completed": self.commands_completed,
+            "commands_failed": self.commands_failed,
+            "commands_timed_out": self.commands_timed_out,
+            "events_received": self.events_received,
+        }
+
 
 class FreeSwitchClient:
     """FreeSWITCH ESL client for PBX integration.
@@ -113,6 +175,13 @@ class FreeSwitchClient:
     - Call control commands
     - Audio streaming coordination
 
+    A single read task parses every message and routes replies to the
+    waiting command and events to the handlers. Call control runs as
+    ``bgapi`` jobs correlated by Job-UUID, so commands for concurrent
+    calls are in flight together instead of queueing behind each other.
+    Handlers run per channel in event order; different channels are
+    handled concurrently, so a slow handler only holds up its own call.
+
     Usage:
         client = FreeSwitchClient(FreeSwitchConfig(host="localhost"))
         await client.connect()
@@ -134,13 +203,26 @@ class FreeSwitchClient:
         """
         self.config = config
         self._connected = False
+        self._closing = False
         self._reader: asyncio.StreamReader | None = None
         self._writer: asyncio.StreamWriter | None = None
         self._reconnect_task: asyncio.Task[None] | None = None
+        self._read_task: asyncio.Task[None] | None = None
+        self._parser = EslParser()
+        self._frames: deque[EslFrame] = deque()
 
-        # Event handlers
+        # Event handlers, run in order per channel (Unique-ID)
         self._event_handlers: dict[str, list[Callable[[FreeSwitchEvent], Any]]] = {}
         self._global_handlers: list[Callable[[FreeSwitchEvent], Any]] = []
+        self._dispatcher: OrderedDispatcher[FreeSwitchEvent] = OrderedDispatcher(
+            self._dispatch_event
+        )
+
+        # In-flight commands: api/command replies arrive in send order,
+        # bgapi results as BACKGROUND_JOB events carrying our Job-UUID
+        self._replies: deque[asyncio.Future[EslFrame]] = deque()
+        self._jobs: dict[str, asyncio.Future[str]] = {}
+        self.statistics = EslStatistics()
 
         # Call tracking
         self._calls: dict[str, UUID] = {}  # channel_uuid -> our call_id
@@ -158,32 +240,35 @@ class FreeSwitchClient:
                 port=self.config.port,
             )
 
+            self._closing = False
+            self._parser = EslParser()
+            self._frames.clear()
             self._reader, self._writer = await asyncio.open_connection(
                 self.config.host,
                 self.config.port,
             )
 
             # Read welcome message
-            welcome = await self._read_response()
-            if "Content-Type: auth/request" not in welcome:
+            welcome = await self._read_frame()
+            if welcome.content_type != "auth/request":
                 raise ConnectionError("Unexpected welcome message")
 
             # Authenticate
             await self._send_command(f"auth {self.config.password}")
-            auth_response = await self._read_response()
+            auth_reply = await self._read_frame()
 
-            if "Reply-Text: +OK" not in auth_response:
+            if not auth_reply.reply_text.startswith("+OK"):
                 raise ConnectionError("Authentication failed")
 
-            # Subscribe to events
+            # Subscribe to events (includes BACKGROUND_JOB for bgapi results)
             await self._send_command("event plain all")
-            await self._read_response()
+            await self._read_frame()
 
             self._connected = True
             log.info("Connected to FreeSWITCH")
 
-            # Start event loop
-            asyncio.create_task(self._event_loop())
+            # From here on the read task owns the socket
+            self._read_task = asyncio.create_task(self._read_loop())
 
             return True
 
@@ -195,11 +280,21 @@ class FreeSwitchClient:
 
     async def disconnect(self) -> None:
         """Disconnect from FreeSWITCH."""
+        self._closing = True
         self._connected = False
 
         if self._reconnect_task:
             self._reconnect_task.cancel()
 
+        if self._read_task and not self._read_task.done():
+            self._read_task.cancel()
+            try:
+                await self._read_task
+            except asyncio.CancelledError:
+                pass
+        await self._dispatcher.close()
+        self._fail_pending(ConnectionError("Disconnected from FreeSWITCH"))
+
         if self._writer:
             self._writer.close()
             await self._writer.wait_closed()
@@ -214,53 +309,161 @@ class FreeSwitchClient:
         self._writer.write(f"{command}\n\n".encode())
         await self._writer.drain()
 
-    async def _read_response(self) -> str:
-        """Read response from FreeSWITCH."""
-        if not self._reader:
+    async def _read_frame(self) -> EslFrame:
+        """Next message from FreeSWITCH (reads the socket only when needed)."""
+        while not self._frames:
+            if not self._reader:
+                raise ConnectionError("Not connected")
+            chunk = await self._reader.read(READ_SIZE)
+            if not chunk:
+                raise ConnectionError("Connection closed by FreeSWITCH")
+            self._frames.extend(self._parser.feed(chunk))
+        return self._frames.popleft()
+
+    async def _read_loop(self) -> None:
+        """Route every message: replies to waiting commands, events to handlers."""
+        try:
+            while self._connected:
+                self._route_frame(await self._read_frame())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if self._closing:
+                return
+            log.error("FreeSWITCH connection lost", error=str(e))
+            self._connected = False
+            self._fail_pending(ConnectionError(f"FreeSWITCH connection lost: {e}"))
+            if self.config.reconnect:
+                self._schedule_reconnect()
+
+    def _route_frame(self, frame: EslFrame) -> None:
+        """Hand one message to the command or event it belongs to."""
+        content_type = frame.content_type
+        if content_type in ("api/response", "command/reply"):
+            if not self._replies:
+                log.warning("Unexpected ESL reply", content_type=content_type)
+                return
+            future = self._replies.popleft()
+            if not future.done():  # Timed out waiters are skipped
+                future.set_result(frame)
+        elif content_type == "text/event-plain":
+            headers, body = frame.event_parts()
+            event = FreeSwitchEvent(headers=headers, body=body.strip())
+            event_name = event.event_name
+            if not event_name:
+                return
+            self.statistics.events_received += 1
+            if event_name == "BACKGROUND_JOB":
+                job = self._jobs.pop(headers.get("Job-UUID", ""), None)
+                if job is not None and not job.done():
+                    job.set_result(event.body)
+            self._dispatcher.submit(event.channel_uuid, event)
+        elif content_type == "text/disconnect-notice":
+            log.warning("FreeSWITCH is closing the event socket")
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail every in-flight command (connection gone)."""
+        for future in [*self._replies, *self._jobs.values()]:
+            if not future.done():
+                future.set_exception(error)
+        self._replies.clear()
+        self._jobs.clear()
+
+    async def _request(self, command: str, timeout: float) -> EslFrame:
+        """Send a command and wait for its reply.
+
+        Replies arrive in send order, so the waiter is queued in the same
+        step as the write.
+        """
+        if not self._connected or not self._writer:
             raise ConnectionError("Not connected")
+        future: asyncio.Future[EslFrame] = asyncio.get_running_loop().create_future()
+        self._replies.append(future)
+        await self._send_command(command)
+        return await asyncio.wait_for(future, timeout)
 
-        response_lines = []
-        content_length = 0
+    async def api(self, command: str, timeout: float | None = None) -> str:
+        """Run an API command and wait for its output.
 
-        # Read headers
-        while True:
-            line = await self._reader.readline()
-            line_str = line.decode().strip()
+        FreeSWITCH runs ``api`` commands one after another on this
+        socket, so a slow command delays the ones behind it; prefer
+        ``bgapi`` for call control.
 
-            if not line_str:
-                break
+        Args:
+            command: API command (e.g. "status")
+            timeout: Seconds to wait (default: config.command_timeout)
 
-            response_lines.append(line_str)
+        Returns:
+            Command output
+        """
+        name = command.split(" ", 1)[0]
+        start = time.monotonic()
+        self.statistics.commands_sent += 1
+        try:
+            frame = await self._request(
+                f"api {command}", timeout or self.config.command_timeout
+            )
+        except TimeoutError:
+            self.statistics.commands_timed_out += 1
+            log.warning("ESL command timed out", command=name)
+            raise
+        self._record(name, time.monotonic() - start, frame.body)
+        return frame.body
 
-            if line_str.startswith("Content-Length:"):
-                content_length = int(line_str.split(":")[1].strip())
+    async def bgapi(self, command: str, timeout: float | None = None) -> str:
+        """Run an API command in the background and wait for its result.
 
-        # Read body if present
-        if content_length > 0:
-            body = await self._reader.read(content_length)
-            response_lines.append(body.decode())
+        The command runs in its own FreeSWITCH thread; its result comes
+        back as a BACKGROUND_JOB event matched by Job-UUID, so any number
+        of bgapi commands can be in flight at once.
 
-        return "\n".join(response_lines)
+        Args:
+            command: API command (e.g. "uuid_answer <uuid>")
+            timeout: Seconds to wait for the result (default: config.command_timeout)
 
-    async def _event_loop(self) -> None:
-        """Main event processing loop."""
-        while self._connected and self._reader:
-            try:
-                response = await self._read_response()
-                if response:
-                    event = self._parse_event(response)
-                    if event:
-                        await self._dispatch_event(event)
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                log.error("Event loop error", error=str(e))
-                if self.config.reconnect:
-                    self._schedule_reconnect()
-                break
+        Returns:
+            Command output (e.g. "+OK", "-ERR No such channel!")
+        """
+        name = command.split(" ", 1)[0]
+        timeout = timeout or self.config.command_timeout
+        start = time.monotonic()
+        job_uuid = str(uuid4())
+        job: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._jobs[job_uuid] = job
+        self.statistics.commands_sent += 1
+        try:
+            reply = await self._request(
+                f"bgapi {command}\nJob-UUID: {job_uuid}", timeout
+            )
+            if not reply.reply_text.startswith("+OK"):
+                result = reply.reply_text  # Rejected before running
+            else:
+                remaining = timeout - (time.monotonic() - start)
+                result = await asyncio.wait_for(job, remaining)
+        except TimeoutError:
+            self.statistics.commands_timed_out += 1
+            log.warning("ESL command timed out", command=name, job_uuid=job_uuid)
+            raise
+        finally:
+            self._jobs.pop(job_uuid, None)
+        self._record(name, time.monotonic() - start, result)
+        return result
+
+    def _record(self, name: str, seconds: float, result: str) -> None:
+        """Count a finished command and record its latency."""
+        if result.startswith("-ERR"):
+            self.statistics.commands_failed += 1
+        else:
+            self.statistics.commands_completed += 1
+        get_metrics().record(f"esl_{name}", seconds)
+
+    @property
+    def commands_in_flight(self) -> int:
+        """Commands waiting for a reply or background result."""
+        return len(self._jobs) + sum(1 for f in self._replies if not f.done())
 
     def _parse_event(self, data: str) -> FreeSwitchEvent | None:
-        """Parse FreeSWITCH event data.
+        """Parse a complete FreeSWITCH event message.
 
         FreeSWITCH event format:
         Content-Type: text/event-plain
@@ -271,49 +474,17 @@ class FreeSwitchClient:
 
         optional body
         """
-        if "Content-Type: text/event-plain" not in data:
-            return None
-
-        headers: dict[str, str] = {}
-        body = ""
-
-        lines = data.split("\n")
-        empty_line_count = 0
-        in_body = False
-
-        for line in lines:
-            # Skip the Content-Type line
-            if line.startswith("Content-Type:"):
-                continue
-
-            # Count empty lines - body starts after second empty line
-            if not line.strip():
-                empty_line_count += 1
-                if empty_line_count >= 2:
-                    in_body = True
-                continue
-
-            if in_body:
-                body += line + "\n"
-            elif ":" in line:
-                key, value = line.split(":", 1)
-                headers[key.strip()] = value.strip()
-
-        event_name = headers.get("Event-Name", "")
-        if not event_name:
+        frame = EslFrame.from_bytes(data.encode())
+        if frame.content_type != "text/event-plain":
             return None
+        headers, body = frame.event_parts()
+        event = FreeSwitchEvent(headers=headers, body=body.strip())
+        return event if event.event_name else None
 
-        return FreeSwitchEvent(
-            event_name=event_name,
-            event_uuid=headers.get("Event-UUID", ""),
-            channel_uuid=headers.get("Unique-ID", ""),
-            caller_id_number=headers.get("Caller-Caller-ID-Number", ""),
-            caller_id_name=headers.get("Caller-Caller-ID-Name", ""),
-            destination_number=headers.get("Caller-Destination-Number", ""),
-            channel_state=headers.get("Channel-State", ""),
-            headers=headers,
-            body=body.strip(),
-        )
+    @property
+    def pending_events(self) -> int:
+        """Events queued behind a running handler (all channels)."""
+        return self._dispatcher.pending
 
     async def _dispatch_event(self, event: FreeSwitchEvent) -> None:
         """Dispatch event to handlers."""
@@ -327,7 +498,7 @@ class FreeSwitchClient:
             except Exception as e:
                 log.error(
                     "Event handler error",
-                    event=event.event_name,
+                    event_name=event.event_name,
                     error=str(e),
                 )
 
@@ -361,8 +532,7 @@ class FreeSwitchClient:
             True if successful
         """
         try:
-            await self._send_command(f"api uuid_answer {channel_uuid}")
-            response = await self._read_response()
+            response = await self.bgapi(f"uuid_answer {channel_uuid}")
             success = "+OK" in response
             log.info("Answer channel", uuid=channel_uuid, success=success)
             return success
@@ -381,8 +551,7 @@ class FreeSwitchClient:
             True if successful
         """
         try:
-            await self._send_command(f"api uuid_kill {channel_uuid} {cause}")
-            response = await self._read_response()
+            response = await self.bgapi(f"uuid_kill {channel_uuid} {cause}")
             success = "+OK" in response
             log.info("Hangup channel", uuid=channel_uuid, success=success)
             return success
@@ -409,10 +578,9 @@ class FreeSwitchClient:
             True if successful
         """
         try:
-            await self._send_command(
-                f"api uuid_transfer {channel_uuid} {destination} {dialplan} {context}"
+            response = await self.bgapi(
+                f"uuid_transfer {channel_uuid} {destination} {dialplan} {context}"
             )
-            response = await self._read_response()
             success = "+OK" in response
             log.info(
                 "Transfer channel",
@@ -440,10 +608,9 @@ class FreeSwitchClient:
             True if successful
         """
         try:
-            await self._send_command(
-                f"api uuid_bridge {channel_uuid} {destination}"
+            response = await self.bgapi(
+                f"uuid_bridge {channel_uuid} {destination}"
             )
-            response = await self._read_response()
             success = "+OK" in response
             log.info("Bridge channel", uuid=channel_uuid, success=success)
             return success
@@ -468,9 +635,8 @@ class FreeSwitchClient:
             True if successful
         """
         try:
-            cmd = f"api uuid_broadcast {channel_uuid} {app}::{args}"
-            await self._send_command(cmd)
-            response = await self._read_response()
+            cmd = f"uuid_broadcast {channel_uuid} {app}::{args}"
+            response = await self.bgapi(cmd)
             success = "+OK" in response
             log.info(
                 "Execute app",
@@ -623,10 +789,12 @@ class FreeSwitchClient:
 
             # Build originate command
             dial_string = f"sofia/gateway/{gateway}/{destination}"
-            cmd = f"api originate {vars_str}{dial_string} &park()"
+            cmd = f"originate {vars_str}{dial_string} &park()"
 
-            await self._send_command(cmd)
-            response = await self._read_response()
+            # The result arrives once the call is answered or fails
+            response = await self.bgapi(
+                cmd, timeout=timeout + self.config.command_timeout
+            )
 
             # Extract channel UUID from response
             if "+OK" in response:
@@ -726,10 +894,7 @@ class FreeSwitchClient:
         try:
             # Set timeout and fallback
             if fallback_voicemail:
-                await self._send_command(
-                    f"api uuid_setvar {channel_uuid} continue_on_fail true"
-                )
-                await self._read_response()
+                await self.bgapi(f"uuid_setvar {channel_uuid} continue_on_fail true")
 
             success = await self.transfer(channel_uuid, destination)
 
@@ -765,9 +930,8 @@ class FreeSwitchClient:
             True if successful
         """
         try:
-            cmd = f"api uuid_send_dtmf {channel_uuid} {digits}@{duration_ms}"
-            await self._send_command(cmd)
-            response = await self._read_response()
+            cmd = f"uuid_send_dtmf {channel_uuid} {digits}@{duration_ms}"
+            response = await self.bgapi(cmd)
             success = "+OK" in response
             log.debug("Send DTMF", uuid=channel_uuid, digits=digits, success=success)
             return success
@@ -816,9 +980,8 @@ class FreeSwitchClient:
             True if successful
         """
         try:
-            cmd = f"api uuid_setvar {channel_uuid} {name} {value}"
-            await self._send_command(cmd)
-            response = await self._read_response()
+            cmd = f"uuid_setvar {channel_uuid} {name} {value}"
+            response = await self.bgapi(cmd)
             return "+OK" in response
         except Exception as e:
             log.error("Set variable failed", error=str(e))
@@ -839,9 +1002,8 @@ class FreeSwitchClient:
             Variable value or None
         """
         try:
-            cmd = f"api uuid_getvar {channel_uuid} {name}"
-            await self._send_command(cmd)
-            response = await self._read_response()
+            cmd = f"uuid_getvar {channel_uuid} {name}"
+            response = await self.bgapi(cmd)
             if "+OK" not in response and "-ERR" not in response:
                 return response.strip()
             return None
@@ -862,8 +1024,7 @@ class FreeSwitchClient:
             True if successful
         """
         try:
-            await self._send_command(f"api uuid_hold {channel_uuid}")
-            response = await self._read_response()
+            response = await self.bgapi(f"uuid_hold {channel_uuid}")
             success = "+OK" in response
 
             if success and music_path:
@@ -885,8 +1046,7 @@ class FreeSwitchClient:
             True if successful
         """
         try:
-            await self._send_command(f"api uuid_hold off {channel_uuid}")
-            response = await self._read_response()
+            response = await self.bgapi(f"uuid_hold off {channel_uuid}")
             success = "+OK" in response
             log.info("Unhold channel", uuid=channel_uuid, success=success)
             return success
@@ -905,8 +1065,9 @@ class FreeSwitchClient:
             True if successful
         """
         try:
-            await self._send_command(f"api uuid_audio {channel_uuid} start {direction} mute")
-            response = await self._read_response()
+            response = await self.bgapi(
+                f"uuid_audio {channel_uuid} start {direction} mute"
+            )
             return "+OK" in response
         except Exception as e:
             log.error("Mute failed", error=str(e))
@@ -923,8 +1084,9 @@ class FreeSwitchClient:
             True if successful
         """
         try:
-            await self._send_command(f"api uuid_audio {channel_uuid} stop {direction} mute")
-            response = await self._read_response()
+            response = await self.bgapi(
+                f"uuid_audio {channel_uuid} stop {direction} mute"
+            )
             return "+OK" in response
         except Exception as e:
             log.error("Unmute failed", error=str(e))
@@ -942,8 +1104,7 @@ class FreeSwitchClient:
             Channel info dict or None
         """
         try:
-            await self._send_command(f"api uuid_dump {channel_uuid}")
-            response = await self._read_response()
+            response = await self.bgapi(f"uuid_dump {channel_uuid}")
 
             if "-ERR" in response:
                 return None
@@ -968,8 +1129,7 @@ class FreeSwitchClient:
             List of call info dicts
         """
         try:
-            await self._send_command("api show calls")
-            response = await self._read_response()
+            response = await self.bgapi("show calls")
 
             calls = []
             lines = response.split("\n")
@@ -1016,9 +1176,8 @@ class FreeSwitchClient:
             True if successful
         """
         try:
-            cmd = f"api uuid_send_message {channel_uuid} {message}"
-            await self._send_command(cmd)
-            response = await self._read_response()
+            cmd = f"uuid_send_message {channel_uuid} {message}"
+            response = await self.bgapi(cmd)
             return "+OK" in response
         except Exception as e:
             log.error("Send message failed", error=str(e))
@@ -1041,9 +1200,8 @@ class FreeSwitchClient:
             True if successful
         """
         try:
-            cmd = f"api uuid_broadcast {channel_uuid} {audio_path} {leg}"
-            await self._send_command(cmd)
-            response = await self._read_response()
+            cmd = f"uuid_broadcast {channel_uuid} {audio_path} {leg}"
+            response = await self.bgapi(cmd)
             return "+OK" in response
         except Exception as e:
             log.error("Broadcast failed", error=str(e))
@@ -1059,8 +1217,7 @@ class FreeSwitchClient:
             True if successful
         """
         try:
-            await self._send_command(f"api uuid_break {channel_uuid}")
-            response = await self._read_response()
+            response = await self.bgapi(f"uuid_break {channel_uuid}")
             return "+OK" in response
         except Exception as e:
             log.error("Break audio failed", error=str(e))
@@ -0,0 +1,223 @@
+"""Real-time paced playout of outbound call audio.
+
+Writes encoded audio to the telephony leg one frame at a time at
+wall-clock pace, instead of pushing a whole TTS response into the
+socket at once. This keeps the far end's buffers small, gives an
+accurate playback position, and lets a response be cut off the moment
+the caller starts speaking (barge-in).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from itf_shared import get_logger
+
+log = get_logger(__name__)
+
+
+@dataclass
+class PlayoutResult:
+    """Outcome of one playback (all audio queued since the player was idle)."""
+
+    queued_ms: float  # Audio submitted for playback
+    played_ms: float  # Audio the caller actually heard
+    interrupted: bool = False  # Cancelled (barge-in) or connection lost
+
+
+class PlayoutScheduler:
+    """Paced frame writer for one connection.
+
+    Audio is queued with ``enqueue`` and written in fixed-duration frames
+    against a monotonic deadline, so timing errors do not accumulate. A
+    small lead is sent ahead of real time to prime the far end's jitter
+    buffer.
+
+    Usage:
+        playout = PlayoutScheduler(writer, frame_bytes=160)
+        playout.enqueue(encoded_audio)
+        result = await playout.wait()  # or playout.cancel() on barge-in
+    """
+
+    def __init__(
+        self,
+        writer: asyncio.StreamWriter,
+        frame_bytes: int,
+        frame_ms: int = 20,
+        lead_ms: int = 40,
+        on_frame_sent: Callable[[int], None] | None = None,
+    ) -> None:
+        """Initialize playout scheduler.
+
+        Args:
+            writer: Stream to write frames to
+            frame_bytes: Encoded bytes per frame
+            frame_ms: Frame duration in milliseconds
+            lead_ms: Audio sent ahead of real time
+            on_frame_sent: Called with the byte count of each written frame
+        """
+        self.writer = writer
+        self.frame_bytes = frame_bytes
+        self.frame_ms = frame_ms
+        self.lead_ms = lead_ms
+        self._on_frame_sent = on_frame_sent
+
+        self._buffer = bytearray()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._done: asyncio.Future[PlayoutResult] | None = None
+        self._queued_bytes = 0
+        self._played_bytes = 0
+        self._started_at: float | None = None
+        self._last_result: PlayoutResult | None = None
+        self._closed = False
+
+    def enqueue(self, data: bytes) -> None:
+        """Queue encoded audio behind anything already playing.
+
+        Args:
+            data: Encoded audio in the connection's wire format
+        """
+        if self._closed or not data:
+            return
+
+        if self._done is None:
+            # Start a new playback
+            self._done = asyncio.get_running_loop().create_future()
+            self._queued_bytes = 0
+            self._played_bytes = 0
+            self._started_at = None
+
+        self._buffer += data
+        self._queued_bytes += len(data)
+        self._wakeup.set()
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def wait(self) -> PlayoutResult | None:
+        """Wait until the current playback finishes or is cancelled.
+
+        Returns:
+            Result of the playback, or None if nothing was ever played
+        """
+        if self._done is None:
+            return self._last_result
+        return await asyncio.shield(self._done)
+
+    def cancel(self) -> PlayoutResult | None:
+        """Stop playback immediately, discarding queued audio.
+
+        Returns:
+            Result of the interrupted playback, or None if idle
+        """
+        if self._done is None:
+            return None
+        self._buffer.clear()
+        return self._finish(interrupted=True)
+
+    async def close(self) -> None:
+        """Stop playback and the writer task."""
+        self._closed = True
+        self.cancel()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def playing(self) -> bool:
+        """Whether audio is queued or being played."""
+        return self._done is not None
+
+    @property
+    def position_ms(self) -> float:
+        """Playback position within the current playback.
+
+        Frames sent ahead of real time (the lead) are not counted until
+        their playback time has come.
+        """
+        if self._started_at is None:
+            return 0.0
+        elapsed_ms = (time.monotonic() - self._started_at) * 1000
+        return min(self._bytes_to_ms(self._played_bytes), elapsed_ms)
+
+    @property
+    def started_at(self) -> float | None:
+        """Monotonic time the current (or last) playback's first frame was written."""
+        return self._started_at
+
+    @property
+    def buffered_ms(self) -> float:
+        """Audio queued but not yet written."""
+        return self._bytes_to_ms(len(self._buffer))
+
+    def _bytes_to_ms(self, count: int) -> float:
+        return count * self.frame_ms / self.frame_bytes
+
+    def _finish(self, interrupted: bool) -> PlayoutResult:
+        """Resolve the current playback."""
+        result = PlayoutResult(
+            queued_ms=self._bytes_to_ms(self._queued_bytes),
+            played_ms=self.position_ms,
+            interrupted=interrupted,
+        )
+        if self._done is not None and not self._done.done():
+            self._done.set_result(result)
+        self._done = None
+        self._last_result = result
+        return result
+
+    async def _run(self) -> None:
+        """Writer task: send one frame per frame period."""
+        frame_s = self.frame_ms / 1000
+        lead_s = self.lead_ms / 1000
+
+        while not self._closed:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            deadline = time.monotonic() - lead_s
+            while self._buffer:
+                frame = bytes(self._buffer[:self.frame_bytes])
+                del self._buffer[:self.frame_bytes]
+
+                try:
+                    self.writer.write(frame)
+                    await self.writer.drain()
+                except Exception as e:
+                    log.warning("Playout write failed", error=str(e))
+                    self._buffer.clear()
+                    self._finish(interrupted=True)
+                    self._closed = True
+                    return
+
+                if self._started_at is None:
+                    self._started_at = time.monotonic()
+                self._played_bytes += len(frame)
+                if self._on_frame_sent:
+                    self._on_frame_sent(len(frame))
+
+                deadline += frame_s * len(frame) / self.frame_bytes
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                elif delay < -frame_s * 5:
+                    # Event loop stalled: resync instead of bursting to catch up
+                    deadline = time.monotonic()
+
+            if self._done is None:
+                continue  # Cancelled
+
+            # Let the lead play out so completion matches what the caller heard
+            tail = deadline + lead_s - time.monotonic()
+            if tail > 0:
+                await asyncio.sleep(tail)
+            if self._done is not None and not self._buffer:
+                self._finish(interrupted=False)
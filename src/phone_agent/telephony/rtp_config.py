@@ -1,7 +1,7 @@
 """RTP (Real-time Transport Protocol) packet handling.
 
-Implements RTP packet parsing, creation, and jitter buffering for
-real-time audio streaming in telephony applications.
+Implements RTP packet parsing, creation, jitter buffering and packet
+loss concealment for real-time audio streaming in telephony applications.
 
 RTP Header Structure (RFC 3550):
     0                   1                   2                   3
@@ -20,7 +20,6 @@ from __future__ import annotations
 import asyncio
 import struct
 import time
-from collections import deque
 from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import TYPE_CHECKING, Callable
@@ -28,6 +27,8 @@ from typing import TYPE_CHECKING, Callable
 import numpy as np
 from itf_shared import get_logger
 
+from phone_agent.telephony.codecs import CODEC_INFO, AudioCodec, CodecType, get_codec
+
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
@@ -66,7 +67,7 @@ class RTPPacket:
 
     header: RTPHeader
     payload: bytes
-    received_time: float = field(default_factory=time.time)
+    received_time: float = field(default_factory=time.monotonic)  # Monotonic clock
 
     @classmethod
     def parse(cls, data: bytes) -> "RTPPacket":
@@ -163,15 +164,151 @@ class RTPPacket:
         return header_bytes + self.payload
 
 
+# Codec carried by each static payload type (RFC 3551)
+PAYLOAD_CODECS: dict[int, CodecType] = {
+    RTPPayloadType.PCMU: CodecType.PCMU,
+    RTPPayloadType.PCMA: CodecType.PCMA,
+    RTPPayloadType.G722: CodecType.G722,
+    RTPPayloadType.L16_MONO: CodecType.L16,
+}
+
+
 @dataclass
 class JitterBufferConfig:
-    """Jitter buffer configuration."""
+    """Jitter buffer configuration.
+
+    ``capacity`` must be a power of two no larger than 65536: slots are
+    indexed by ``sequence % capacity``, which only stays consistent
+    across the 16-bit sequence wrap when capacity divides 65536.
+    """
 
     min_delay_ms: int = 40  # Minimum buffer delay
     max_delay_ms: int = 200  # Maximum buffer delay
     target_delay_ms: int = 100  # Target delay
     adaptive: bool = True  # Adaptive jitter compensation
     packet_time_ms: int = 20  # Expected packet interval
+    capacity: int = 64  # Packet slots (sequence numbers held at once; power of two)
+    codec: CodecType | str | None = None  # Payload codec (None: from payload type)
+    jitter_multiplier: float = 4.0  # Delay as a multiple of the jitter estimate
+    max_conceal_ms: int = 60  # Concealment fades to silence by this point
+
+    def __post_init__(self) -> None:
+        """Reject capacities that break slot indexing at the sequence wrap."""
+        if not 0 < self.capacity <= 65536 or self.capacity & (self.capacity - 1):
+            raise ValueError(
+                "Jitter buffer capacity must be a power of two up to 65536, "
+                f"got {self.capacity}"
+            )
+
+
+class PacketLossConcealer:
+    """Fills lost frames in the style of G.711 Appendix I.
+
+    A lost frame is replaced by repeating the last pitch period of the
+    audio before the loss. The repetition is attenuated by 20% per
+    10 ms after the first 10 ms and reaches silence after
+    ``max_conceal_ms``. The first good frame after a loss is crossfaded
+    with the continued repetition over a quarter pitch period.
+    """
+
+    HISTORY_MS = 40  # Audio kept for pitch estimation
+    MIN_PITCH_HZ = 66
+    MAX_PITCH_HZ = 400
+
+    def __init__(self, sample_rate: int = 8000, max_conceal_ms: int = 60) -> None:
+        """Initialize concealer.
+
+        Args:
+            sample_rate: Decoded sample rate
+            max_conceal_ms: Loss duration after which output is silent
+        """
+        self.sample_rate = sample_rate
+        self.max_conceal_ms = max_conceal_ms
+        self._history = np.zeros(
+            sample_rate * self.HISTORY_MS // 1000, dtype=np.float32
+        )
+        self._period: np.ndarray | None = None  # Pitch period being repeated
+        self._phase = 0  # Position within the period
+        self._lost_samples = 0  # Concealed samples in the current loss
+
+    def good(self, samples: NDArray[np.int16]) -> NDArray[np.int16]:
+        """Record a received frame, smoothing the transition after a loss.
+
+        Args:
+            samples: Decoded frame
+
+        Returns:
+            Frame to play out
+        """
+        if self._period is not None and len(samples):
+            overlap = min(len(samples), max(len(self._period) // 4, 1))
+            tail = self._repeat(overlap).astype(np.float32)
+            ramp = np.linspace(0.0, 1.0, overlap, endpoint=False, dtype=np.float32)
+            head = samples[:overlap].astype(np.float32) * ramp + tail * (1.0 - ramp)
+            samples = samples.copy()
+            samples[:overlap] = np.clip(head, -32768, 32767).astype(np.int16)
+        self._period = None
+        self._lost_samples = 0
+        self._remember(samples)
+        return samples
+
+    def conceal(self, count: int) -> NDArray[np.int16]:
+        """Audio for a lost frame.
+
+        Args:
+            count: Samples in the lost frame
+
+        Returns:
+            Concealment samples
+        """
+        if self._period is None:
+            self._period = self._last_period()
+            self._phase = 0
+        return np.clip(self._repeat(count), -32768, 32767).astype(np.int16)
+
+    def _repeat(self, count: int) -> NDArray[np.float32]:
+        period = self._period
+        assert period is not None
+        index = (self._phase + np.arange(count)) % len(period)
+        self._phase = int((self._phase + count) % len(period))
+
+        # 1.0 for the first 10 ms, then -20% per 10 ms down to silence
+        elapsed_ms = (self._lost_samples + np.arange(count)) * 1000.0 / self.sample_rate
+        fade = 1.0 - 0.2 * (elapsed_ms - 10.0) / 10.0
+        fade *= elapsed_ms < self.max_conceal_ms
+        self._lost_samples += count
+        return period[index] * np.clip(fade, 0.0, 1.0).astype(np.float32)
+
+    def _last_period(self) -> NDArray[np.float32]:
+        """Last pitch period of the history (autocorrelation pitch estimate)."""
+        history = self._history
+        min_lag = self.sample_rate // self.MAX_PITCH_HZ
+        max_lag = min(self.sample_rate // self.MIN_PITCH_HZ, len(history) // 2)
+        window = history[-max_lag:]
+        best_lag, best_score = max_lag, 0.0
+        for lag in range(min_lag, max_lag + 1):
+            past = history[-max_lag - lag:-lag]
+            energy = float(np.dot(past, past))
+            if energy > 0:
+                score = float(np.dot(window, past)) / np.sqrt(energy)
+                if score > best_score:
+                    best_lag, best_score = lag, score
+        return history[-best_lag:].copy()
+
+    def _remember(self, samples: NDArray[np.int16]) -> None:
+        keep = len(self._history)
+        if len(samples) >= keep:
+            self._history = samples[-keep:].astype(np.float32)
+        else:
+            self._history = np.concatenate(
+                (self._history[len(samples):], samples.astype(np.float32))
+            )
+
+    def reset(self) -> None:
+        """Forget history and any loss in progress."""
+        self._history[:] = 0.0
+        self._period = None
+        self._lost_samples = 0
 
 
 class JitterBuffer:
@@ -180,11 +317,15 @@ class JitterBuffer:
     Handles:
     - Packet reordering (out-of-order delivery)
     - Variable network delay (jitter)
-    - Packet loss detection
+    - Packet loss detection and concealment
     - Playout timing
 
-    The buffer collects incoming packets and releases them at regular
-    intervals, smoothing out network jitter.
+    Packets are stored in a slot array indexed by ``sequence % capacity``.
+    The capacity is a power of two, so the index stays valid when the
+    16-bit sequence number wraps. Inserting, detecting duplicates and
+    playing out are constant time. The playout delay follows the RFC 3550
+    interarrival jitter estimate and is applied when playout starts or
+    restarts after the buffer ran dry. Times come from the monotonic clock.
     """
 
     def __init__(self, config: JitterBufferConfig | None = None) -> None:
@@ -194,23 +335,37 @@ class JitterBuffer:
             config: Buffer configuration
         """
         self.config = config or JitterBufferConfig()
+        self._capacity = self.config.capacity
 
-        # Packet storage (sorted by sequence number)
-        self._packets: deque[RTPPacket] = deque(maxlen=100)
+        # Packet storage: slot = sequence % capacity
+        self._slots: list[RTPPacket | None] = [None] * self._capacity
+        self._count = 0
 
         # Sequence tracking
-        self._last_seq: int | None = None
-        self._expected_seq: int | None = None
+        self._next_seq: int | None = None  # Next sequence to play out
 
         # Timing
         self._playout_time: float | None = None
-        self._buffer_delay_ms = self.config.target_delay_ms
+        self._buffer_delay_ms = float(self.config.target_delay_ms)
+
+        # RFC 3550 interarrival jitter (timestamp units)
+        self._jitter = 0.0
+        self._last_transit: float | None = None
+        self._clock_rate = 8000
+
+        # Decoding and concealment (set up from the first packet)
+        self._codec: AudioCodec | None = None
+        self._plc: PacketLossConcealer | None = None
+        self._frame_samples = 0
 
         # Statistics
         self._packets_received = 0
-        self._packets_dropped = 0
+        self._packets_dropped = 0  # Overflow
+        self._packets_duplicate = 0
         self._packets_late = 0
         self._packets_lost = 0
+        self._packets_concealed = 0
+        self._underruns = 0  # Times playout ran dry
         self._max_jitter_ms = 0.0
 
     def put(self, packet: RTPPacket) -> None:
@@ -220,104 +375,170 @@ class JitterBuffer:
             packet: RTP packet to buffer
         """
         self._packets_received += 1
-
-        # Initialize on first packet
-        if self._expected_seq is None:
-            self._expected_seq = packet.header.sequence
-            self._playout_time = packet.received_time + (self.config.target_delay_ms / 1000)
-
-        # Check for duplicates
-        for existing in self._packets:
-            if existing.header.sequence == packet.header.sequence:
-                return  # Duplicate packet
-
-        # Calculate jitter
-        if self._last_seq is not None:
-            expected_time = self._playout_time
-            actual_delay = (packet.received_time - expected_time) * 1000 if expected_time else 0
-            self._max_jitter_ms = max(self._max_jitter_ms, abs(actual_delay))
-
-        self._last_seq = packet.header.sequence
-
-        # Insert in sequence order
-        inserted = False
-        for i, existing in enumerate(self._packets):
-            if self._sequence_less_than(packet.header.sequence, existing.header.sequence):
-                self._packets.insert(i, packet)
-                inserted = True
-                break
-
-        if not inserted:
-            self._packets.append(packet)
-
-        # Adaptive delay adjustment
-        if self.config.adaptive:
-            self._adjust_delay()
+        seq = packet.header.sequence
+
+        # Initialize on first packet; resynchronize on a sequence jump
+        # while empty (new source); restart playout after running dry
+        if self._next_seq is None:
+            self._clock_rate = self._rtp_clock_rate(packet)
+            self._next_seq = seq
+        elif (
+            not self._count
+            and abs(self._sequence_diff(seq, self._next_seq)) >= self._capacity
+        ):
+            self._next_seq = seq
+        if self._playout_time is None:
+            self._playout_time = packet.received_time + self._buffer_delay_ms / 1000
+
+        self._update_jitter(packet)
+
+        offset = self._sequence_diff(seq, self._next_seq)
+        if offset < 0:
+            self._packets_late += 1  # Its playout slot has passed
+            return
+        if offset >= self._capacity:
+            self._advance(offset - self._capacity + 1)
+
+        slot = seq % self._capacity
+        if self._slots[slot] is not None:
+            self._packets_duplicate += 1
+            return
+        self._slots[slot] = packet
+        self._count += 1
 
     def get(self) -> RTPPacket | None:
         """Get next packet for playout.
 
+        Missing packets before it are skipped and counted as lost.
+
         Returns:
             Next packet or None if buffer is empty/not ready
         """
-        if not self._packets:
-            return None
-
-        current_time = time.time()
-
-        # Check if we have enough buffer
-        if self._playout_time and current_time < self._playout_time:
-            return None
-
-        # Get next packet in sequence
-        packet = self._packets.popleft()
-
-        # Check for gaps (lost packets)
-        if self._expected_seq is not None:
-            gap = self._sequence_diff(packet.header.sequence, self._expected_seq)
-            if gap > 0:
-                self._packets_lost += gap
-
-        # Update expected sequence
-        self._expected_seq = (packet.header.sequence + 1) & 0xFFFF
-
-        # Update playout time
-        if self._playout_time:
-            self._playout_time += self.config.packet_time_ms / 1000
-
-        return packet
+        while self._count:
+            ready, packet = self._pop()
+            if not ready:
+                return None
+            if packet is not None:
+                return packet
+            self._packets_lost += 1
+        return None
 
     def get_audio(
         self,
         sample_rate: int = 8000,
         samples_per_packet: int = 160,
     ) -> NDArray[np.int16] | None:
-        """Get audio samples for playout.
+        """Get the next frame of audio for playout.
 
-        Handles packet loss concealment by returning silence for missing packets.
+        Payloads are decoded with the codec of their payload type. A lost
+        packet yields one frame of concealment audio in its place.
 
         Args:
-            sample_rate: Audio sample rate
-            samples_per_packet: Samples per RTP packet
+            sample_rate: Audio sample rate (until the first packet is decoded)
+            samples_per_packet: Samples per RTP packet (until the first
+                packet is decoded)
 
         Returns:
             Audio samples or None if not ready
         """
-        packet = self.get()
-        if packet is None:
+        if not self._count:
+            return None
+        ready, packet = self._pop()
+        if not ready:
             return None
 
-        # Check for lost packets and generate silence
-        if self._packets_lost > 0:
-            # Concealment: return silence for lost packets
-            lost = min(self._packets_lost, 5)  # Max 5 packets concealment
-            self._packets_lost -= lost
-            silence = np.zeros(samples_per_packet * lost, dtype=np.int16)
-            log.debug(f"Concealing {lost} lost packets with silence")
-            return silence
+        if packet is None:
+            self._packets_lost += 1
+            self._packets_concealed += 1
+            if self._plc is None:
+                self._plc = PacketLossConcealer(sample_rate, self.config.max_conceal_ms)
+            return self._plc.conceal(self._frame_samples or samples_per_packet)
+
+        samples = self._decode(packet)
+        self._frame_samples = len(samples)
+        assert self._plc is not None
+        return self._plc.good(samples)
+
+    def _pop(self) -> tuple[bool, RTPPacket | None]:
+        """Take the next slot if its playout time has come.
 
-        # Return payload as audio samples
-        return np.frombuffer(packet.payload, dtype=np.int16)
+        Returns:
+            Whether a slot was due, and its packet (None if missing)
+        """
+        if self._next_seq is None:
+            return False, None
+        if self._playout_time is not None and time.monotonic() < self._playout_time:
+            return False, None
+
+        slot = self._next_seq % self._capacity
+        packet = self._slots[slot]
+        self._slots[slot] = None
+        self._next_seq = (self._next_seq + 1) & 0xFFFF
+
+        if packet is not None:
+            self._count -= 1
+        if self._count == 0:
+            # Ran dry: the next packet restarts playout at the current delay
+            self._underruns += 1
+            self._playout_time = None
+        elif self._playout_time is not None:
+            self._playout_time += self.config.packet_time_ms / 1000
+        return True, packet
+
+    def _advance(self, count: int) -> None:
+        """Move playout forward, discarding slots to make room."""
+        assert self._next_seq is not None
+        for _ in range(min(count, self._capacity)):
+            slot = self._next_seq % self._capacity
+            if self._slots[slot] is not None:
+                self._slots[slot] = None
+                self._count -= 1
+                self._packets_dropped += 1
+            else:
+                self._packets_lost += 1
+            self._next_seq = (self._next_seq + 1) & 0xFFFF
+        if count > self._capacity:
+            self._packets_lost += count - self._capacity
+            self._next_seq = (self._next_seq + count - self._capacity) & 0xFFFF
+
+    def _codec_type(self, packet: RTPPacket) -> CodecType | str:
+        return self.config.codec or PAYLOAD_CODECS.get(
+            packet.header.payload_type, CodecType.L16
+        )
+
+    def _rtp_clock_rate(self, packet: RTPPacket) -> int:
+        """RTP timestamp rate (8 kHz for G.722 too, per RFC 3551)."""
+        codec = self._codec_type(packet)
+        if not isinstance(codec, CodecType):
+            codec = CodecType(codec.upper())
+        return CODEC_INFO[codec].sample_rate if codec == CodecType.L16 else 8000
+
+    def _decode(self, packet: RTPPacket) -> NDArray[np.int16]:
+        """Decode a payload with the codec of the stream."""
+        if self._codec is None:
+            self._codec = get_codec(self._codec_type(packet))
+            self._plc = PacketLossConcealer(
+                self._codec.info.sample_rate, self.config.max_conceal_ms
+            )
+        return self._codec.decode(packet.payload)
+
+    def _update_jitter(self, packet: RTPPacket) -> None:
+        """Update the RFC 3550 interarrival jitter estimate and the delay.
+
+        J += (|D| - J) / 16, where D is the change in transit time
+        (arrival minus RTP timestamp) between consecutive packets.
+        """
+        transit = packet.received_time * self._clock_rate - packet.header.timestamp
+        if self._last_transit is not None:
+            d = abs(transit - self._last_transit)
+            if d < self._clock_rate:  # Ignore timestamp jumps (new source, long gap)
+                self._jitter += (d - self._jitter) / 16
+        self._last_transit = transit
+
+        jitter_ms = self.jitter_ms
+        self._max_jitter_ms = max(self._max_jitter_ms, jitter_ms)
+        if self.config.adaptive:
+            self._adjust_delay(jitter_ms)
 
     def _sequence_less_than(self, a: int, b: int) -> bool:
         """Compare sequence numbers with wrap-around handling.
@@ -347,21 +568,21 @@ class JitterBuffer:
             diff -= 0x10000
         return diff
 
-    def _adjust_delay(self) -> None:
-        """Adjust buffer delay based on jitter measurements."""
-        # Increase delay if jitter is high
-        if self._max_jitter_ms > self._buffer_delay_ms * 0.8:
-            self._buffer_delay_ms = min(
-                self.config.max_delay_ms,
-                self._buffer_delay_ms + 10,
-            )
+    def _adjust_delay(self, jitter_ms: float) -> None:
+        """Set the buffer delay from the jitter estimate, within limits."""
+        config = self.config
+        target = max(float(config.min_delay_ms), jitter_ms * config.jitter_multiplier)
+        self._buffer_delay_ms = min(float(config.max_delay_ms), target)
 
-        # Decrease delay if jitter is low
-        elif self._max_jitter_ms < self._buffer_delay_ms * 0.3:
-            self._buffer_delay_ms = max(
-                self.config.min_delay_ms,
-                self._buffer_delay_ms - 5,
-            )
+    @property
+    def jitter(self) -> int:
+        """Interarrival jitter in timestamp units (as in RTCP reports)."""
+        return int(self._jitter)
+
+    @property
+    def jitter_ms(self) -> float:
+        """Interarrival jitter in milliseconds."""
+        return self._jitter * 1000 / self._clock_rate
 
     @property
     def stats(self) -> dict:
@@ -373,19 +594,26 @@ class JitterBuffer:
         return {
             "packets_received": self._packets_received,
             "packets_dropped": self._packets_dropped,
+            "packets_duplicate": self._packets_duplicate,
             "packets_late": self._packets_late,
             "packets_lost": self._packets_lost,
-            "buffer_size": len(self._packets),
+            "packets_concealed": self._packets_concealed,
+            "underruns": self._underruns,
+            "buffer_size": self._count,
             "buffer_delay_ms": self._buffer_delay_ms,
+            "jitter_ms": self.jitter_ms,
             "max_jitter_ms": self._max_jitter_ms,
         }
 
     def clear(self) -> None:
         """Clear the buffer."""
-        self._packets.clear()
-        self._last_seq = None
-        self._expected_seq = None
+        self._slots = [None] * self._capacity
+        self._count = 0
+        self._next_seq = None
         self._playout_time = None
+        self._last_transit = None
+        if self._plc is not None:
+            self._plc.reset()
 
 
 class RTPSession:
@@ -521,6 +749,197 @@ class RTCPReport:
         )
 
 
+    def to_bytes(self) -> bytes:
+        """Serialize the report block (24 bytes)."""
+        return struct.pack(
+            ">IIIIII",
+            self.ssrc,
+            ((self.fraction_lost & 0xFF) << 24) | (self.cumulative_lost & 0x00FFFFFF),
+            self.highest_seq & 0xFFFFFFFF,
+            self.jitter & 0xFFFFFFFF,
+            self.last_sr_timestamp & 0xFFFFFFFF,
+            self.delay_since_sr & 0xFFFFFFFF,
+        )
+
+
+class RTCPType(IntEnum):
+    """RTCP packet types (RFC 3550)."""
+
+    SR = 200  # Sender report
+    RR = 201  # Receiver report
+    SDES = 202  # Source description
+    BYE = 203  # Goodbye
+
+
+# Seconds from the NTP epoch (1900) to the Unix epoch (1970)
+NTP_EPOCH_OFFSET = 2208988800
+
+
+def ntp_timestamp(unix_time: float) -> int:
+    """64-bit NTP timestamp for a wall-clock time."""
+    return int((unix_time + NTP_EPOCH_OFFSET) * (1 << 32)) & 0xFFFFFFFFFFFFFFFF
+
+
+@dataclass
+class RTCPPacket:
+    """One packet of a compound RTCP datagram (SR, RR or BYE)."""
+
+    packet_type: int
+    ssrc: int  # Sender of the packet
+    ntp_timestamp: int = 0  # SR only
+    rtp_timestamp: int = 0  # SR only
+    packets_sent: int = 0  # SR only
+    octets_sent: int = 0  # SR only
+    reports: list[RTCPReport] = field(default_factory=list)
+
+    @classmethod
+    def parse_compound(cls, data: bytes) -> list[RTCPPacket]:
+        """Parse a compound RTCP datagram.
+
+        Packet types other than SR, RR and BYE are skipped.
+
+        Args:
+            data: Datagram bytes
+
+        Returns:
+            Parsed packets, in order
+
+        Raises:
+            ValueError: If the datagram is malformed
+        """
+        packets: list[RTCPPacket] = []
+        pos = 0
+        while pos + 8 <= len(data):
+            first, packet_type, length = struct.unpack(">BBH", data[pos:pos + 4])
+            if first >> 6 != 2:
+                raise ValueError(f"Unsupported RTCP version: {first >> 6}")
+            end = pos + (length + 1) * 4
+            if end > len(data):
+                raise ValueError("RTCP packet truncated")
+            count = first & 0x1F
+            (ssrc,) = struct.unpack(">I", data[pos + 4:pos + 8])
+            body = pos + 8
+
+            if packet_type == RTCPType.SR:
+                if body + 20 > end:
+                    raise ValueError("RTCP sender report too short")
+                ntp, rtp_ts, sent, octets = struct.unpack(">QIII", data[body:body + 20])
+                packet = cls(packet_type, ssrc, ntp, rtp_ts, sent, octets)
+                body += 20
+            elif packet_type in (RTCPType.RR, RTCPType.BYE):
+                packet = cls(packet_type, ssrc)
+            else:
+                pos = end
+                continue
+
+            if packet_type != RTCPType.BYE:
+                for i in range(count):
+                    block = body + i * 24
+                    if block + 24 > end:
+                        raise ValueError("RTCP report block truncated")
+                    packet.reports.append(RTCPReport.parse(data[block:block + 24]))
+            packets.append(packet)
+            pos = end
+        return packets
+
+    def to_bytes(self) -> bytes:
+        """Serialize the packet (SR, RR or BYE)."""
+        if self.packet_type == RTCPType.BYE:
+            body = struct.pack(">I", self.ssrc)
+            count = 1
+        else:
+            body = struct.pack(">I", self.ssrc)
+            if self.packet_type == RTCPType.SR:
+                body += struct.pack(
+                    ">QIII",
+                    self.ntp_timestamp,
+                    self.rtp_timestamp & 0xFFFFFFFF,
+                    self.packets_sent & 0xFFFFFFFF,
+                    self.octets_sent & 0xFFFFFFFF,
+                )
+            body += b"".join(report.to_bytes() for report in self.reports)
+            count = len(self.reports)
+        header = struct.pack(">BBH", 0x80 | count, self.packet_type, len(body) // 4)
+        return header + body
+
+
+def build_sdes_cname(ssrc: int, cname: str) -> bytes:
+    """RTCP SDES packet with the CNAME item every compound packet carries."""
+    text = cname.encode()[:255]
+    chunk = struct.pack(">IBB", ssrc, 1, len(text)) + text + b"\x00"
+    chunk += b"\x00" * (-len(chunk) % 4)
+    return struct.pack(">BBH", 0x81, RTCPType.SDES, len(chunk) // 4) + chunk
+
+
+class ReceptionStatistics:
+    """Per-source reception counters for RTCP report blocks (RFC 3550 A.3)."""
+
+    def __init__(self, ssrc: int, first_seq: int) -> None:
+        """Initialize statistics.
+
+        Args:
+            ssrc: Source being received
+            first_seq: Sequence number of its first packet
+        """
+        self.ssrc = ssrc
+        self.base_seq = first_seq
+        self.max_seq = first_seq
+        self.cycles = 0
+        self.received = 0
+        self._expected_prior = 0
+        self._received_prior = 0
+
+    def update(self, seq: int) -> None:
+        """Count a received packet."""
+        self.received += 1
+        delta = (seq - self.max_seq) & 0xFFFF
+        if 0 < delta < 0x8000:
+            if seq < self.max_seq:
+                self.cycles += 1 << 16
+            self.max_seq = seq
+
+    @property
+    def extended_max_seq(self) -> int:
+        """Highest sequence number received, extended with wrap cycles."""
+        return self.cycles + self.max_seq
+
+    @property
+    def lost(self) -> int:
+        """Packets expected but not received (may be negative with duplicates)."""
+        return self.extended_max_seq - self.base_seq + 1 - self.received
+
+    def report(
+        self, jitter: int, last_sr: int = 0, delay_since_sr: int = 0
+    ) -> RTCPReport:
+        """Report block for this source, starting a new reporting interval.
+
+        Args:
+            jitter: Interarrival jitter (timestamp units)
+            last_sr: Middle 32 bits of the NTP timestamp of the last SR
+            delay_since_sr: Time since that SR (1/65536 seconds)
+
+        Returns:
+            Report block
+        """
+        expected = self.extended_max_seq - self.base_seq + 1
+        expected_interval = expected - self._expected_prior
+        lost_interval = expected_interval - (self.received - self._received_prior)
+        self._expected_prior = expected
+        self._received_prior = self.received
+        fraction = 0
+        if expected_interval > 0 and lost_interval > 0:
+            fraction = (lost_interval << 8) // expected_interval
+        return RTCPReport(
+            ssrc=self.ssrc,
+            fraction_lost=min(fraction, 255),
+            cumulative_lost=max(0, min(self.lost, 0x7FFFFF)),
+            highest_seq=self.extended_max_seq,
+            jitter=jitter,
+            last_sr_timestamp=last_sr,
+            delay_since_sr=delay_since_sr,
+        )
+
+
 class RTPReceiver:
     """Async RTP packet receiver.
 
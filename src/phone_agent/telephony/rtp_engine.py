@@ -0,0 +1,641 @@
+"""UDP RTP media engine: call audio straight from the trunk.
+
+The audio bridge receives call audio from FreeSWITCH over one TCP
+audio socket per call. The media engine terminates RTP itself instead:
+a single UDP port carries the media of every call, RTCP runs on the
+port above it, and packets are demultiplexed to sessions by SSRC and
+source address. Each session gets the bridge's per-call pipeline
+(jitter buffer, codec, endpointing, paced playout), so a trunk can
+send media directly without the extra hop through the media server.
+
+Usage:
+    engine = RTPMediaEngine(AudioBridgeConfig(port=10000))
+    await engine.listen()
+    session_id = engine.open_session(remote=("203.0.113.5", 40000))
+    pending_id = engine.open_session(expected=ExpectedSource("203.0.113.5"))
+    engine.on_audio_received(handle_utterance)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID, uuid4
+
+import numpy as np
+from itf_shared import get_logger
+
+from .audio_bridge import (
+    AudioBridgeConfig,
+    AudioConnection,
+    AudioProtocol,
+    IngestDropPolicy,
+    TelephonyAudioBridge,
+)
+from .codecs import CodecType
+from .rtp_config import (
+    JitterBuffer,
+    ReceptionStatistics,
+    RTCPPacket,
+    RTCPReport,
+    RTCPType,
+    RTPPacket,
+    RTPPayloadType,
+    RTPSession,
+    build_sdes_cname,
+    ntp_timestamp,
+)
+
+log = get_logger(__name__)
+
+
+# Static payload type sent for each telephony codec (RFC 3551)
+CODEC_PAYLOAD_TYPES: dict[CodecType, int] = {
+    CodecType.PCMU: RTPPayloadType.PCMU,
+    CodecType.PCMA: RTPPayloadType.PCMA,
+    CodecType.G722: RTPPayloadType.G722,
+}
+
+
+@dataclass
+class RTPEngineStatistics:
+    """Packet counters of the media engine (all sessions)."""
+
+    sessions_opened: int = 0
+    sessions_timed_out: int = 0
+    sessions_expired: int = 0  # No media from the expected source in time
+    packets_received: int = 0
+    packets_sent: int = 0
+    packets_invalid: int = 0  # Not parseable as RTP/RTCP
+    packets_unknown_source: int = 0  # No session for the SSRC or address
+    packets_rejected: int = 0  # Session's SSRC from an address it does not follow (yet)
+    rtcp_received: int = 0
+    rtcp_sent: int = 0
+    byes_received: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert to dictionary."""
+        return {
+            "sessions_opened": self.sessions_opened,
+            "sessions_timed_out": self.sessions_timed_out,
+            "sessions_expired": self.sessions_expired,
+            "packets_received": self.packets_received,
+            "packets_sent": self.packets_sent,
+            "packets_invalid": self.packets_invalid,
+            "packets_unknown_source": self.packets_unknown_source,
+            "packets_rejected": self.packets_rejected,
+            "rtcp_received": self.rtcp_received,
+            "rtcp_sent": self.rtcp_sent,
+            "byes_received": self.byes_received,
+        }
+
+
+@dataclass(frozen=True)
+class ExpectedSource:
+    """Where a session's media may come from, as signalled (SDP).
+
+    A session only latches onto, or moves to, a source address that
+    matches: the far end's host and, optionally, its port range.
+    """
+
+    host: str
+    port_min: int = 1
+    port_max: int = 65535
+
+    def matches(self, addr: tuple[str, int]) -> bool:
+        """Whether packets from ``addr`` may belong to the session."""
+        return addr[0] == self.host and self.port_min <= addr[1] <= self.port_max
+
+
+class RTPStream:
+    """RTP state of one session: addresses, SSRCs and RTCP counters."""
+
+    def __init__(
+        self,
+        session_id: UUID,
+        jitter_buffer: JitterBuffer,
+        payload_type: int,
+        expected: ExpectedSource,
+        remote: tuple[str, int] | None = None,
+    ) -> None:
+        """Initialize stream.
+
+        Args:
+            session_id: Session (and audio connection) ID
+            jitter_buffer: Buffer for received packets
+            payload_type: Payload type of sent packets
+            expected: Addresses the far end's media may come from
+            remote: Far end's RTP address (None: latch onto the first
+                packet from an expected address)
+        """
+        self.session_id = session_id
+        self.jitter_buffer = jitter_buffer
+        self.sender = RTPSession(payload_type=payload_type, sample_rate=8000)
+        self.expected = expected
+        self.remote = remote
+        self.opened_at = time.monotonic()
+        self.latched = asyncio.Event()  # Set once we know where to send media
+        if remote is not None:
+            self.latched.set()
+        self.relatch_candidate: tuple[str, int] | None = None
+        self.relatch_packets = 0
+        self.rtcp_remote: tuple[str, int] | None = None
+        self.remote_ssrc: int | None = None
+        self.reception: ReceptionStatistics | None = None
+        self.remote_report: RTCPReport | None = None  # Far end's view of our stream
+
+        self.packets_sent = 0
+        self.octets_sent = 0
+        self.last_rtp_timestamp = 0
+        self.last_sent = 0.0
+        self.last_received = time.monotonic()
+        self.last_sr = 0  # Middle 32 bits of the last SR's NTP timestamp
+        self.last_sr_at: float | None = None
+        self._reported_sent = 0
+        self.ended = asyncio.Event()
+
+    @property
+    def ssrc(self) -> int:
+        """SSRC of the packets we send."""
+        return self.sender.ssrc
+
+    @property
+    def rtcp_address(self) -> tuple[str, int] | None:
+        """Where to send RTCP: where it came from, else the RTP port + 1."""
+        if self.rtcp_remote is not None:
+            return self.rtcp_remote
+        if self.remote is not None:
+            return self.remote[0], self.remote[1] + 1
+        return None
+
+    def rtcp_report(self) -> bytes:
+        """Compound RTCP report: SR if we sent media since the last one, else RR."""
+        blocks = []
+        if self.reception is not None:
+            delay = 0
+            if self.last_sr_at is not None:
+                delay = int((time.monotonic() - self.last_sr_at) * 65536)
+            blocks.append(
+                self.reception.report(self.jitter_buffer.jitter, self.last_sr, delay)
+            )
+
+        if self.packets_sent > self._reported_sent:
+            report = RTCPPacket(
+                RTCPType.SR,
+                self.ssrc,
+                ntp_timestamp=ntp_timestamp(time.time()),
+                rtp_timestamp=self.last_rtp_timestamp,
+                packets_sent=self.packets_sent,
+                octets_sent=self.octets_sent,
+                reports=blocks,
+            )
+        else:
+            report = RTCPPacket(RTCPType.RR, self.ssrc, reports=blocks)
+        self._reported_sent = self.packets_sent
+        cname = build_sdes_cname(self.ssrc, f"phone-agent@{self.session_id}")
+        return report.to_bytes() + cname
+
+
+class _RTPWriter:
+    """Stream writer stand-in that sends playout frames as RTP packets."""
+
+    def __init__(self, engine: RTPMediaEngine, stream: RTPStream) -> None:
+        self._engine = engine
+        self._stream = stream
+
+    def write(self, data: bytes) -> None:
+        self._engine._send_rtp(self._stream, data)
+
+    async def drain(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self._stream.ended.set()
+
+    async def wait_closed(self) -> None:
+        pass
+
+    def get_extra_info(self, name: str, default: Any = None) -> Any:
+        return self._stream.remote if name == "peername" else default
+
+
+class _MediaProtocol(asyncio.DatagramProtocol):
+    """Hands RTP or RTCP datagrams to the engine."""
+
+    def __init__(self, engine: RTPMediaEngine, rtcp: bool) -> None:
+        self._engine = engine
+        self._rtcp = rtcp
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        if self._rtcp:
+            self._engine._on_rtcp(data, addr)
+        else:
+            self._engine._on_rtp(data, addr)
+
+    def error_received(self, exc: Exception) -> None:
+        log.warning("RTP socket error", error=str(exc))
+
+
+class RTPMediaEngine(TelephonyAudioBridge):
+    """RTP media for many concurrent calls on one UDP port.
+
+    Sessions are opened per call with ``open_session``. Incoming packets
+    are matched by SSRC, then by source address; a session opened
+    without a remote address latches onto the first unknown source that
+    matches its expected source (symmetric RTP) and sends its media back
+    there, or ends after ``rtp_latch_timeout_s``. A known SSRC only moves
+    its session to a new address after ``rtp_relatch_packets``
+    consecutive packets from there. Each session plays its jitter
+    buffer out on a 20 ms clock into the bridge's ingest queue, sends
+    paced playout frames as RTP and exchanges RTCP sender/receiver
+    reports. RTCP is only accepted from the session's expected source
+    or its latched host. A session ends on ``close_session``, an RTCP
+    BYE or when no packets arrive for ``rtp_media_timeout_s``.
+    """
+
+    def __init__(self, config: AudioBridgeConfig | None = None) -> None:
+        """Initialize media engine.
+
+        Args:
+            config: Bridge configuration (port is the RTP port; RTCP uses port + 1)
+        """
+        super().__init__(
+            config or AudioBridgeConfig(port=10000, protocol=AudioProtocol.RTP)
+        )
+        self.rtp_statistics = RTPEngineStatistics()
+        self._payload_type = CODEC_PAYLOAD_TYPES.get(
+            self.config.telephony_codec, RTPPayloadType.PCMA
+        )
+
+        self._streams: dict[UUID, RTPStream] = {}
+        self._by_ssrc: dict[int, RTPStream] = {}
+        self._by_addr: dict[tuple[str, int], RTPStream] = {}
+        self._unlatched: deque[RTPStream] = deque()
+        self._session_tasks: dict[UUID, asyncio.Task[None]] = {}
+
+        self._transport: asyncio.DatagramTransport | None = None
+        self._rtcp_transport: asyncio.DatagramTransport | None = None
+        self._rtcp_task: asyncio.Task[None] | None = None
+        self._stopped = asyncio.Event()
+
+    async def listen(self) -> None:
+        """Bind the RTP and RTCP sockets."""
+        loop = asyncio.get_running_loop()
+        self._stopped.clear()
+        self._transport, _ = await loop.create_datagram_endpoint(
+            lambda: _MediaProtocol(self, rtcp=False),
+            local_addr=(self.config.host, self.config.port),
+        )
+        self._rtcp_transport, _ = await loop.create_datagram_endpoint(
+            lambda: _MediaProtocol(self, rtcp=True),
+            local_addr=(self.config.host, self.port + 1),
+        )
+        self._rtcp_task = asyncio.create_task(self._rtcp_loop())
+        log.info("RTP media engine started", host=self.config.host, port=self.port)
+
+    async def start(self) -> None:
+        """Bind the sockets and run until stopped."""
+        await self.listen()
+        await self._stopped.wait()
+
+    async def stop(self) -> None:
+        """Close all sessions and the sockets."""
+        for session_id in list(self._session_tasks):
+            await self.close_session(session_id)
+        if self._rtcp_task is not None:
+            self._rtcp_task.cancel()
+            await asyncio.gather(self._rtcp_task, return_exceptions=True)
+            self._rtcp_task = None
+        for transport in (self._transport, self._rtcp_transport):
+            if transport is not None:
+                transport.close()
+        self._transport = self._rtcp_transport = None
+        self._stopped.set()
+        log.info("RTP media engine stopped")
+
+    @property
+    def port(self) -> int:
+        """Bound RTP port."""
+        if self._transport is not None:
+            return self._transport.get_extra_info("sockname")[1]
+        return self.config.port
+
+    # Sessions
+
+    def open_session(
+        self,
+        remote: tuple[str, int] | None = None,
+        expected: ExpectedSource | None = None,
+    ) -> UUID:
+        """Start media for one call.
+
+        Args:
+            remote: Far end's RTP address from signalling (None: latch
+                onto the first packet from an expected source)
+            expected: Addresses the far end's media may come from
+                (default: any port on the remote host)
+
+        Returns:
+            Session ID, used like an audio bridge connection ID
+
+        Raises:
+            ValueError: If neither a remote address nor an expected
+                source is given
+        """
+        if expected is None:
+            if remote is None:
+                raise ValueError(
+                    "RTP session needs a remote address or expected source"
+                )
+            expected = ExpectedSource(remote[0])
+
+        session_id = uuid4()
+        jitter_buffer = self._create_jitter_buffer()
+        self._jitter_buffers[session_id] = jitter_buffer
+        stream = RTPStream(
+            session_id, jitter_buffer, self._payload_type, expected, remote
+        )
+        self._streams[session_id] = stream
+        if remote is not None:
+            self._by_addr[remote] = stream
+        else:
+            self._unlatched.append(stream)
+
+        conn = self._create_connection(session_id, None, _RTPWriter(self, stream))  # type: ignore[arg-type]
+        self._session_tasks[session_id] = asyncio.create_task(
+            self._run_session(conn, stream)
+        )
+        self.rtp_statistics.sessions_opened += 1
+        return session_id
+
+    async def close_session(self, session_id: UUID) -> None:
+        """End a session and wait until it is torn down.
+
+        Unlike a BYE or a media timeout, which let the caller's last
+        utterance be answered, closing cancels the session's turns.
+        """
+        stream = self._streams.get(session_id)
+        if stream is not None:
+            stream.ended.set()
+        task = self._session_tasks.get(session_id)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def wait_latched(self, session_id: UUID) -> bool:
+        """Wait until a session knows where to send its media.
+
+        Returns:
+            True once latched, False if the session ended first
+        """
+        stream = self._streams.get(session_id)
+        if stream is None:
+            return False
+        if not stream.latched.is_set():
+            waits = [
+                asyncio.ensure_future(stream.latched.wait()),
+                asyncio.ensure_future(stream.ended.wait()),
+            ]
+            try:
+                await asyncio.wait(waits, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for wait in waits:
+                    wait.cancel()
+        return stream.latched.is_set()
+
+    def session_info(self, session_id: UUID) -> dict[str, Any] | None:
+        """Local media address and stream state of a session."""
+        stream = self._streams.get(session_id)
+        if stream is None:
+            return None
+        return {
+            "port": self.port,
+            "rtcp_port": self.port + 1,
+            "ssrc": stream.ssrc,
+            "payload_type": self._payload_type,
+            "remote": list(stream.remote) if stream.remote else None,
+            "remote_ssrc": stream.remote_ssrc,
+            "jitter_buffer": stream.jitter_buffer.stats,
+        }
+
+    async def _run_session(self, conn: AudioConnection, stream: RTPStream) -> None:
+        try:
+            await self._run_connection(conn)
+        finally:
+            self._send_rtcp(stream, stream.rtcp_report()
+                            + RTCPPacket(RTCPType.BYE, stream.ssrc).to_bytes())
+            buffer_stats = stream.jitter_buffer.stats
+            self._stats.jitter_buffer_underruns += buffer_stats["underruns"]
+            self._stats.jitter_buffer_overruns += buffer_stats["packets_dropped"]
+            self._forget(stream)
+
+    def _forget(self, stream: RTPStream) -> None:
+        stream.ended.set()
+        self._streams.pop(stream.session_id, None)
+        self._session_tasks.pop(stream.session_id, None)
+        self._jitter_buffers.pop(stream.session_id, None)
+        if (
+            stream.remote_ssrc is not None
+            and self._by_ssrc.get(stream.remote_ssrc) is stream
+        ):
+            del self._by_ssrc[stream.remote_ssrc]
+        if stream.remote is not None and self._by_addr.get(stream.remote) is stream:
+            del self._by_addr[stream.remote]
+        if stream in self._unlatched:
+            self._unlatched.remove(stream)
+
+    # Inbound
+
+    def _on_rtp(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Route one RTP datagram to its session's jitter buffer."""
+        try:
+            packet = RTPPacket.parse(data)
+        except ValueError:
+            self.rtp_statistics.packets_invalid += 1
+            return
+
+        ssrc = packet.header.ssrc
+        stream = self._by_ssrc.get(ssrc) or self._by_addr.get(addr) or self._latch(addr)
+        if stream is None:
+            self.rtp_statistics.packets_unknown_source += 1
+            return
+        if stream.remote != addr and not self._relatch(stream, addr):
+            self.rtp_statistics.packets_rejected += 1
+            return
+        stream.relatch_candidate = None
+
+        if stream.remote_ssrc != ssrc:
+            if stream.remote_ssrc is not None:
+                self._by_ssrc.pop(stream.remote_ssrc, None)
+            stream.remote_ssrc = ssrc
+            stream.reception = ReceptionStatistics(ssrc, packet.header.sequence)
+            self._by_ssrc[ssrc] = stream
+
+        assert stream.reception is not None
+        stream.reception.update(packet.header.sequence)
+        stream.last_received = packet.received_time
+        stream.jitter_buffer.put(packet)
+        self.rtp_statistics.packets_received += 1
+        self._stats.bytes_received += len(packet.payload)
+
+    def _latch(self, addr: tuple[str, int]) -> RTPStream | None:
+        """Latch the oldest pending session expecting media from ``addr``."""
+        for stream in self._unlatched:
+            if stream.expected.matches(addr):
+                self._unlatched.remove(stream)
+                stream.remote = addr
+                self._by_addr[addr] = stream
+                stream.latched.set()
+                log.info(
+                    "RTP source latched", session_id=str(stream.session_id), remote=addr
+                )
+                return stream
+        return None
+
+    def _relatch(self, stream: RTPStream, addr: tuple[str, int]) -> bool:
+        """Move a session to a new source address (symmetric RTP behind NAT).
+
+        Only an expected address that sent the session's SSRC for
+        ``rtp_relatch_packets`` packets in a row takes over; a stray or
+        spoofed packet does not redirect the call's media.
+        """
+        owner = self._by_addr.get(addr)
+        if not stream.expected.matches(addr) or owner not in (None, stream):
+            return False
+        if stream.relatch_candidate != addr:
+            stream.relatch_candidate = addr
+            stream.relatch_packets = 0
+        stream.relatch_packets += 1
+        if stream.relatch_packets < self.config.rtp_relatch_packets:
+            return False
+
+        if stream.remote is not None and self._by_addr.get(stream.remote) is stream:
+            del self._by_addr[stream.remote]
+        stream.remote = addr
+        self._by_addr[addr] = stream
+        log.info(
+            "RTP source re-latched", session_id=str(stream.session_id), remote=addr
+        )
+        return True
+
+    def _on_rtcp(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Apply sender reports, report blocks and BYEs to their sessions.
+
+        Packets naming a session's SSRC from anywhere but its expected
+        source or latched host are rejected, so a third party cannot
+        redirect its RTCP or end it with a forged BYE.
+        """
+        try:
+            packets = RTCPPacket.parse_compound(data)
+        except ValueError:
+            self.rtp_statistics.packets_invalid += 1
+            return
+
+        self.rtp_statistics.rtcp_received += 1
+        for packet in packets:
+            stream = self._by_ssrc.get(packet.ssrc)
+            if stream is None:
+                continue
+            if not stream.expected.matches(addr) and (
+                stream.remote is None or stream.remote[0] != addr[0]
+            ):
+                self.rtp_statistics.packets_rejected += 1
+                continue
+            stream.rtcp_remote = addr
+            if packet.packet_type == RTCPType.SR:
+                stream.last_sr = (packet.ntp_timestamp >> 16) & 0xFFFFFFFF
+                stream.last_sr_at = time.monotonic()
+            for report in packet.reports:
+                if report.ssrc == stream.ssrc:
+                    stream.remote_report = report
+            if packet.packet_type == RTCPType.BYE:
+                self.rtp_statistics.byes_received += 1
+                log.info("RTCP BYE", session_id=str(stream.session_id))
+                stream.ended.set()
+
+    async def _read_frames(self, conn: AudioConnection) -> None:
+        """Session clock: play the jitter buffer out into the ingest queue.
+
+        Runs every frame period until the session ends, its media times
+        out or its expected source never sends. UDP cannot push back, so
+        a BLOCK drop policy drops the oldest frame instead.
+        """
+        config = self.config
+        stream = self._streams[conn.call_id]
+        buffer = stream.jitter_buffer
+        policy = config.ingest_drop_policy
+        if policy == IngestDropPolicy.BLOCK:
+            policy = IngestDropPolicy.DROP_OLDEST
+        frame_s = config.playout_frame_ms / 1000
+        rate = config.telephony_sample_rate
+        samples = rate * config.playout_frame_ms // 1000
+
+        deadline = time.monotonic()
+        while not conn.closed and not stream.ended.is_set():
+            deadline += frame_s
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            elif delay < -frame_s * 5:
+                deadline = time.monotonic()  # Event loop stalled: resync
+
+            now = time.monotonic()
+            if (not stream.latched.is_set()
+                    and now - stream.opened_at > config.rtp_latch_timeout_s):
+                self.rtp_statistics.sessions_expired += 1
+                log.warning("RTP session expired before media arrived",
+                            session_id=str(conn.call_id))
+                return
+            if now - stream.last_received > config.rtp_media_timeout_s:
+                self.rtp_statistics.sessions_timed_out += 1
+                log.warning("RTP media timeout", session_id=str(conn.call_id))
+                return
+
+            while (pcm := buffer.get_audio(rate, samples)) is not None:
+                self._stats.frames_received += 1
+                conn.stats.frames_received += 1
+                self._offer_frame(conn, pcm.tobytes(), policy)
+
+    def _decode_audio(self, conn: AudioConnection, data: bytes) -> np.ndarray | None:
+        """Jitter buffer output is decoded PCM: resample it for the AI."""
+        return conn.codec_pipeline.pcm_for_ai(np.frombuffer(data, dtype=np.int16))
+
+    # Outbound
+
+    def _send_rtp(self, stream: RTPStream, payload: bytes) -> None:
+        """Send one playout frame as an RTP packet."""
+        if self._transport is None or stream.remote is None:
+            return  # Nowhere to send until the far end's address is known
+        now = time.monotonic()
+        # Marker bit on the first packet of a talk spurt
+        marker = now - stream.last_sent > 2 * self.config.playout_frame_ms / 1000
+        packet = stream.sender.create_packet(payload, marker=marker)
+        self._transport.sendto(packet.to_bytes(), stream.remote)
+
+        stream.last_sent = now
+        stream.last_rtp_timestamp = packet.header.timestamp
+        stream.packets_sent += 1
+        stream.octets_sent += len(payload)
+        self.rtp_statistics.packets_sent += 1
+
+    def _send_rtcp(self, stream: RTPStream, data: bytes) -> None:
+        address = stream.rtcp_address
+        if self._rtcp_transport is None or address is None:
+            return
+        self._rtcp_transport.sendto(data, address)
+        self.rtp_statistics.rtcp_sent += 1
+
+    async def _rtcp_loop(self) -> None:
+        """Send a sender or receiver report per session every interval."""
+        while True:
+            await asyncio.sleep(self.config.rtcp_interval_s)
+            for stream in list(self._streams.values()):
+                self._send_rtcp(stream, stream.rtcp_report())
+
+    @property
+    def active_sessions(self) -> int:
+        """Sessions with media in progress."""
+        return len(self._streams)
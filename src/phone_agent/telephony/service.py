@@ -10,21 +10,39 @@ Main service that orchestrates:
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from typing import Any
 from uuid import UUID
 
 import numpy as np
 from itf_shared import get_logger
 
+from phone_agent.ai.status import get_model_registry
+from phone_agent.ai.warmup import ModelWarmPool
 from phone_agent.config import get_settings
-from phone_agent.core import ConversationEngine, CallHandler, CallState
-from phone_agent.telephony.sip_client import SIPClient, SIPConfig, SIPCall
-from phone_agent.telephony.freeswitch import FreeSwitchClient, FreeSwitchConfig, FreeSwitchEvent
+from phone_agent.core import (
+    CallCapacityError,
+    CallContext,
+    CallHandler,
+    ConversationEngine,
+    ServiceNotReadyError,
+)
 from phone_agent.telephony.audio_bridge import AudioBridge, AudioBridgeConfig
+from phone_agent.telephony.freeswitch import (
+    FreeSwitchClient,
+    FreeSwitchConfig,
+    FreeSwitchEvent,
+)
+from phone_agent.telephony.rtp_engine import ExpectedSource, RTPMediaEngine
+from phone_agent.telephony.sip_client import SIPCall, SIPClient, SIPConfig
 
 log = get_logger(__name__)
 
+# Webhook trunks streaming call audio over their own WebSocket endpoints
+# (api/webhooks.py) rather than the audio bridge or the RTP engine
+_WEBSOCKET_TRUNKS = frozenset({"twilio", "sipgate", "web"})
+
 
 @dataclass
 class TelephonyServiceConfig:
@@ -47,8 +65,24 @@ class TelephonyServiceConfig:
     audio_bridge_host: str = "0.0.0.0"
     audio_bridge_port: int = 9090
 
+    # Call media: "audio_socket" (audio bridge) or "rtp" (RTP media engine),
+    # overridable per trunk (webhook provider, or "sip" for the SIP backend).
+    # Twilio, sipgate and browser (web) calls always stream over their own
+    # WebSockets.
+    media_transport: str = "audio_socket"
+    trunk_media: dict[str, str] = field(default_factory=dict)
+    rtp_host: str = "0.0.0.0"
+    rtp_port: int = 10000  # RTCP uses the port above
+    rtp_advertise_host: str = ""  # Address given to trunks (default: rtp_host)
+
+    # Calls admitted at once (None: telephony.max_concurrent_calls setting)
+    max_concurrent_calls: int | None = None
+
     # AI
-    preload_models: bool = True
+    preload_models: bool = True  # Warm models in the background on start()
+    # Seconds a call waits for warming models before it is refused
+    # (None: model_warmup_wait_s setting)
+    model_warmup_wait_s: float | None = None
 
 
 class TelephonyService:
@@ -75,16 +109,39 @@ class TelephonyService:
         """
         self.config = config or TelephonyServiceConfig()
 
-        # Components
+        settings = get_settings()
+        max_calls = self.config.max_concurrent_calls
+        if max_calls is None:
+            max_calls = settings.telephony.max_concurrent_calls
+        self._warmup_wait_s = self.config.model_warmup_wait_s
+        if self._warmup_wait_s is None:
+            self._warmup_wait_s = settings.model_warmup_wait_s
+
+        # Components: call audio flows through the bridge, so calls get no
+        # local audio pipeline and responses are played via the bridge
         self.conversation_engine = ConversationEngine()
-        self.call_handler = CallHandler(conversation_engine=self.conversation_engine)
+        self.call_handler = CallHandler(
+            conversation_engine=self.conversation_engine,
+            max_concurrent_calls=max_calls,
+            audio_pipeline_factory=lambda call: None,
+        )
+        self.call_handler.on_play_audio(self._play_to_call)
         self.audio_bridge = AudioBridge(
             AudioBridgeConfig(
                 host=self.config.audio_bridge_host,
                 port=self.config.audio_bridge_port,
+                connect_handshake=True,
             )
         )
 
+        self.rtp_engine: RTPMediaEngine | None = None
+        if "rtp" in (self.config.media_transport, *self.config.trunk_media.values()):
+            self.rtp_engine = RTPMediaEngine(
+                AudioBridgeConfig(host=self.config.rtp_host, port=self.config.rtp_port)
+            )
+
+        self.warm_pool: ModelWarmPool | None = None
+
         # Backend-specific clients
         self.freeswitch_client: FreeSwitchClient | None = None
         self.sip_client: SIPClient | None = None
@@ -97,6 +154,19 @@ class TelephonyService:
         # Call mapping: external_id -> internal_call_id
         self._call_map: dict[str, UUID] = {}
 
+        # Audio routing: bridge connection_id <-> internal_call_id. Calls
+        # wait for the bridge connection naming their channel (external ID).
+        self._connection_calls: dict[UUID, UUID] = {}
+        self._call_connections: dict[UUID, UUID] = {}
+        self._awaiting_audio: dict[str, UUID] = {}
+        self._pending_audio: dict[UUID, list[Any]] = {}
+        # Calls streaming over a provider WebSocket (Twilio): call -> player
+        self._media_streams: dict[UUID, Callable[[Any], Awaitable[None]]] = {}
+        # Calls whose media runs over the RTP engine: call -> session, and
+        # the tasks binding each session once the far end's media arrives
+        self._rtp_sessions: dict[UUID, UUID] = {}
+        self._rtp_binds: dict[UUID, asyncio.Task[None]] = {}
+
     async def start(self) -> None:
         """Start the telephony service."""
         if self._running:
@@ -107,16 +177,20 @@ class TelephonyService:
 
         log.info("Starting telephony service", backend=self.config.backend)
 
-        # Preload AI models
+        # Warm AI models in the background; calls wait for them
         if self.config.preload_models:
-            log.info("Preloading AI models...")
-            self.conversation_engine.preload_models()
+            self.start_warmup()
 
         # Setup audio bridge callbacks
         self.audio_bridge.on_audio_received(self._on_audio_received)
         self.audio_bridge.on_connection(self._on_audio_connection)
         self.audio_bridge.on_disconnection(self._on_audio_disconnection)
 
+        if self.rtp_engine:
+            self.rtp_engine.on_audio_received(self._on_audio_received)
+            self.rtp_engine.on_disconnection(self._on_audio_disconnection)
+            await self.rtp_engine.listen()
+
         # Start backend
         if self.config.backend == "freeswitch":
             await self._start_freeswitch()
@@ -148,6 +222,8 @@ class TelephonyService:
 
         # Stop audio bridge
         await self.audio_bridge.stop()
+        if self.rtp_engine:
+            await self.rtp_engine.stop()
 
         # Cancel tasks
         for task in self._tasks:
@@ -158,6 +234,8 @@ class TelephonyService:
                 pass
 
         # Unload models
+        if self.warm_pool:
+            await self.warm_pool.stop()
         self.conversation_engine.unload_models()
 
         log.info("Telephony service stopped")
@@ -166,6 +244,51 @@ class TelephonyService:
         """Wait until service is stopped."""
         await self._stop_event.wait()
 
+    def start_warmup(self, pool: ModelWarmPool | None = None) -> asyncio.Task[Any]:
+        """Load and warm the conversation models in the background.
+
+        Until the warmup finishes, incoming calls wait for it (see
+        ``_check_ready``). Calling this again returns the running warmup.
+
+        Args:
+            pool: Pool to add the engine's models to, e.g. one already
+                holding the shared API models (default: a new pool)
+
+        Returns:
+            Warmup task (its result lists startup time per model)
+        """
+        if self.warm_pool is None:
+            settings = get_settings()
+            log.info("Warming AI models in the background")
+            self.warm_pool = pool or ModelWarmPool()
+            self.warm_pool.add_engine(
+                self.conversation_engine,
+                voices=settings.ai.tts.preload_voices,
+                dialects=settings.ai.stt.dialect.preload_dialects,
+            )
+        return self.warm_pool.start()
+
+    async def _check_ready(self) -> None:
+        """Hold a new call until the models are warm.
+
+        Calls arriving during the startup warmup wait up to
+        ``model_warmup_wait_s`` for it. Without startup warmup, or after
+        a failed one, calls are admitted and models load on first use.
+
+        Raises:
+            ServiceNotReadyError: Models still warming after the wait
+        """
+        registry = get_model_registry()
+        if registry.readiness != "warming":
+            return
+        log.info("Call waiting for model warmup", timeout_s=self._warmup_wait_s)
+        if await registry.wait_until_ready(self._warmup_wait_s) == "warming":
+            log.warning("Refusing call: AI models still warming")
+            raise ServiceNotReadyError(
+                "AI models are still warming up",
+                details={"models": registry.get_detailed_status()["models"]},
+            )
+
     async def _start_freeswitch(self) -> None:
         """Start FreeSWITCH backend."""
         if not self.config.freeswitch_password:
@@ -221,13 +344,20 @@ class TelephonyService:
         )
 
         # Create internal call
-        call_context = await self.call_handler.handle_incoming_call(
-            caller_id=caller_id,
-            callee_id=event.destination_number,
-            metadata={"channel_uuid": channel_uuid},
-        )
+        try:
+            await self._check_ready()
+            call_context = await self.call_handler.handle_incoming_call(
+                caller_id=caller_id,
+                callee_id=event.destination_number,
+                metadata={"channel_uuid": channel_uuid},
+            )
+        except (CallCapacityError, ServiceNotReadyError):
+            if self.freeswitch_client:
+                await self.freeswitch_client.hangup(channel_uuid, cause="USER_BUSY")
+            return
 
         self._call_map[channel_uuid] = call_context.call_id
+        self._awaiting_audio[channel_uuid] = call_context.call_id
 
         # Answer and connect to audio bridge
         if self.freeswitch_client:
@@ -239,7 +369,7 @@ class TelephonyService:
             )
 
         # Answer in call handler
-        await self.call_handler.answer_call()
+        await self.call_handler.answer_call(call_context.call_id)
 
     async def _handle_freeswitch_hangup(self, event: FreeSwitchEvent) -> None:
         """Handle hangup from FreeSWITCH."""
@@ -248,7 +378,7 @@ class TelephonyService:
 
         if call_id:
             log.info("FreeSWITCH hangup", channel=channel_uuid)
-            await self.call_handler.hangup()
+            await self._end_call(call_id)
 
     # SIP Handlers
 
@@ -261,59 +391,235 @@ class TelephonyService:
         )
 
         # Create internal call
-        call_context = await self.call_handler.handle_incoming_call(
-            caller_id=sip_call.caller_id,
-            callee_id=sip_call.callee_id,
-            metadata={"sip_call_id": sip_call.sip_call_id},
-        )
+        try:
+            await self._check_ready()
+            call_context = await self.call_handler.handle_incoming_call(
+                caller_id=sip_call.caller_id,
+                callee_id=sip_call.callee_id,
+                metadata={"sip_call_id": sip_call.sip_call_id},
+            )
+        except (CallCapacityError, ServiceNotReadyError):
+            if self.sip_client:
+                await self.sip_client.hangup(sip_call.call_id)
+            return
 
         self._call_map[sip_call.sip_call_id] = call_context.call_id
+        session_id = self._open_rtp_media(
+            call_context.call_id,
+            "sip",
+            sip_call.rtp_remote_host,
+            sip_call.rtp_remote_port,
+        )
+        if session_id is not None:
+            sip_call.rtp_local_port = self.rtp_engine.port  # type: ignore[union-attr]
+        else:
+            self._awaiting_audio[sip_call.sip_call_id] = call_context.call_id
 
         # Answer
         if self.sip_client:
             await self.sip_client.answer(sip_call.call_id)
 
-        await self.call_handler.answer_call()
+        await self.call_handler.answer_call(call_context.call_id)
+        if session_id is not None:
+            self._bind_rtp_media(call_context.call_id, session_id)
+
+    # Media Routing
+
+    def _media_transport(self, trunk: str) -> str:
+        """Media transport of a trunk: "audio_socket", "rtp" or "websocket"."""
+        if trunk in _WEBSOCKET_TRUNKS:
+            return "websocket"
+        return self.config.trunk_media.get(trunk, self.config.media_transport)
+
+    def _open_rtp_media(
+        self,
+        call_id: UUID,
+        trunk: str,
+        remote_host: str | None = None,
+        remote_port: int | None = None,
+    ) -> UUID | None:
+        """Open an RTP session for a call if its trunk sends RTP directly.
+
+        Caller audio is routed to the call at once; our audio is held
+        until ``_bind_rtp_media`` has seen the far end's media.
+
+        Args:
+            call_id: Internal call ID
+            trunk: Trunk the call arrived on
+            remote_host: Far end's media host from signalling
+            remote_port: Far end's RTP port (None: latch onto the first
+                packet from the host)
+
+        Returns:
+            Session ID, or None if the call uses the audio socket
+        """
+        if self.rtp_engine is None or self._media_transport(trunk) != "rtp":
+            return None
+        if not remote_host:
+            # Latching onto any source would let anyone take the call's media
+            log.warning("RTP trunk sent no media host, using the audio socket",
+                        call_id=str(call_id), trunk=trunk)
+            return None
+
+        remote = (remote_host, remote_port) if remote_port else None
+        session_id = self.rtp_engine.open_session(remote, ExpectedSource(remote_host))
+        self._rtp_sessions[call_id] = session_id
+        self._connection_calls[session_id] = call_id
+        log.info("RTP media opened", call_id=str(call_id), session_id=str(session_id))
+        return session_id
+
+    def _bind_rtp_media(self, call_id: UUID, session_id: UUID) -> None:
+        """Send a call's audio to its RTP session once media has latched."""
+
+        async def bind() -> None:
+            if not await self.rtp_engine.wait_latched(session_id):  # type: ignore[union-attr]
+                return
+            self._rtp_binds.pop(call_id, None)
+            self._call_connections[call_id] = session_id
+            log.info(
+                "RTP media latched", call_id=str(call_id), session_id=str(session_id)
+            )
+            for audio in self._pending_audio.pop(call_id, []):
+                await self.rtp_engine.send_audio(session_id, audio)  # type: ignore[union-attr]
+
+        self._rtp_binds[call_id] = asyncio.create_task(bind())
+
+    def _media(self, call_id: UUID) -> AudioBridge:
+        """Bridge carrying a call's audio."""
+        if call_id in self._rtp_sessions and self.rtp_engine is not None:
+            return self.rtp_engine
+        return self.audio_bridge
 
     # Audio Bridge Handlers
 
-    async def _on_audio_received(self, call_id: UUID, audio: np.ndarray) -> None:
-        """Handle audio received from telephony."""
-        if not self.call_handler.is_in_call:
-            return
+    async def _on_audio_received(self, connection_id: UUID, audio: np.ndarray) -> None:
+        """Handle a caller utterance received from telephony."""
+        call_id = self._connection_calls.get(connection_id)
+        call = self.call_handler.get_call(call_id) if call_id else None
 
         # Validate call state before accessing conversation
-        current_call = self.call_handler.current_call
-        if current_call is None or current_call.conversation is None:
-            log.warning("Audio received but no active conversation", call_id=str(call_id))
+        if call is None or call.conversation is None:
+            log.warning(
+                "Audio received but no active conversation",
+                connection_id=str(connection_id),
+            )
             return
 
         try:
-            # Process through AI pipeline
-            response_text, response_audio = await self.conversation_engine.process_audio(
-                audio,
-                current_call.conversation.id,
+            # Run the turn through the call's own state machine and
+            # conversation; the response is played via _play_to_call
+            response_text = await self.call_handler.handle_utterance(
+                call.call_id, audio
             )
+            log.info("AI response", call_id=str(call.call_id), text=response_text[:50])
 
-            log.info("AI response", text=response_text[:50])
+        except Exception:
+            log.exception("Audio processing error", call_id=str(call.call_id))
 
-            # Send response audio back
-            await self.audio_bridge.send_audio(call_id, response_audio)
+    async def _play_to_call(self, call: CallContext, audio: Any) -> None:
+        """Play audio to a call over its bridge connection.
 
-        except Exception:
-            log.exception("Audio processing error", call_id=str(call_id))
+        Audio for a call whose connection has not arrived yet (the
+        greeting, typically) is held until the connection is bound.
+        """
+        play = self._media_streams.get(call.call_id)
+        if play is not None:
+            await play(audio)
+            return
+
+        connection_id = self._call_connections.get(call.call_id)
+        if connection_id is None:
+            self._pending_audio.setdefault(call.call_id, []).append(audio)
+            return
+
+        # Hold the turn until the caller has heard it (barge-in ends
+        # playout early)
+        media = self._media(call.call_id)
+        if await media.send_audio(connection_id, audio):
+            await media.wait_for_playout(connection_id)
+
+    async def attach_media_stream(
+        self,
+        call_id: UUID,
+        play: Callable[[Any], Awaitable[None]],
+    ) -> None:
+        """Play a call's audio over its provider WebSocket stream.
+
+        Twilio calls carry media over their own WebSocket rather than the
+        audio bridge. Audio held for the call (the greeting) is played
+        first.
+
+        Args:
+            call_id: Internal call ID
+            play: Plays one response, returning once it has been heard
+                (or cleared by barge-in)
+        """
+        self._media_streams[call_id] = play
+        for audio in self._pending_audio.pop(call_id, []):
+            await play(audio)
+
+    async def _on_audio_connection(self, connection_id: UUID) -> bool:
+        """Bind a new audio connection to the call whose channel it names.
+
+        Returns:
+            False if no answered call awaits the connection's channel (the
+            bridge then closes it)
+        """
+        conn = self.audio_bridge.get_connection(connection_id)
+        channel_id = conn.channel_id if conn is not None else None
+        call_id = self._awaiting_audio.pop(channel_id, None) if channel_id else None
+
+        if call_id is None or self.call_handler.get_call(call_id) is None:
+            log.warning(
+                "Audio connection matches no call",
+                connection_id=str(connection_id),
+                channel=channel_id,
+            )
+            return False
+
+        self._connection_calls[connection_id] = call_id
+        self._call_connections[call_id] = connection_id
+        log.info(
+            "Audio connection established",
+            connection_id=str(connection_id),
+            call_id=str(call_id),
+        )
 
-    async def _on_audio_connection(self, call_id: UUID) -> None:
-        """Handle new audio connection."""
-        log.info("Audio connection established", call_id=str(call_id))
+        for audio in self._pending_audio.pop(call_id, []):
+            await self.audio_bridge.send_audio(connection_id, audio)
+        return True
 
-    async def _on_audio_disconnection(self, call_id: UUID) -> None:
+    async def _on_audio_disconnection(self, connection_id: UUID) -> None:
         """Handle audio disconnection."""
-        log.info("Audio connection closed", call_id=str(call_id))
+        call_id = self._connection_calls.get(connection_id)
+        log.info(
+            "Audio connection closed",
+            connection_id=str(connection_id),
+            call_id=str(call_id) if call_id else None,
+        )
 
         # Hangup if still in call
-        if self.call_handler.is_in_call:
-            await self.call_handler.hangup()
+        if call_id is not None:
+            await self._end_call(call_id)
+
+    async def _end_call(self, call_id: UUID) -> None:
+        """Hang up one call and drop its audio routing."""
+        connection_id = self._call_connections.pop(call_id, None)
+        if connection_id is not None:
+            self._connection_calls.pop(connection_id, None)
+        bind = self._rtp_binds.pop(call_id, None)
+        if bind is not None:
+            bind.cancel()
+        session_id = self._rtp_sessions.pop(call_id, None)
+        if session_id is not None:
+            self._connection_calls.pop(session_id, None)
+            await self.rtp_engine.close_session(session_id)  # type: ignore[union-attr]
+        self._pending_audio.pop(call_id, None)
+        self._media_streams.pop(call_id, None)
+        awaiting = self._awaiting_audio
+        for channel_id in [c for c, waiting in awaiting.items() if waiting == call_id]:
+            del awaiting[channel_id]
+        await self.call_handler.hangup(call_id)
 
     # Webhook Support (for external SIP systems)
 
@@ -323,16 +629,27 @@ class TelephonyService:
         caller_id: str,
         callee_id: str,
         metadata: dict[str, Any] | None = None,
+        provider: str | None = None,
     ) -> dict[str, Any]:
         """Handle incoming call webhook.
 
-        Called by external SIP system via REST API.
+        Called by external SIP system via REST API. Audio socket trunks
+        get the audio bridge address; their connection must answer the
+        bridge's ``connect`` with ``Channel-Unique-ID: <call_id>``. Trunks
+        configured for RTP get the engine's media address instead and
+        must pass their media host as ``rtp_remote_host`` metadata (plus
+        ``rtp_remote_port`` if known); only media from that host is
+        accepted. The response returns before the greeting plays, which
+        waits for the trunk's first RTP packet. Twilio, sipgate and web calls
+        stream over their own WebSocket endpoints.
 
         Args:
             call_id: External call ID
             caller_id: Caller number
             callee_id: Called number
             metadata: Additional data
+            provider: Trunk the call arrived on (default: metadata
+                "provider", else "generic")
 
         Returns:
             Response dict with instructions
@@ -344,16 +661,50 @@ class TelephonyService:
         )
 
         # Create internal call
-        call_context = await self.call_handler.handle_incoming_call(
-            caller_id=caller_id,
-            callee_id=callee_id,
-            metadata={"external_call_id": call_id, **(metadata or {})},
-        )
+        try:
+            await self._check_ready()
+            call_context = await self.call_handler.handle_incoming_call(
+                caller_id=caller_id,
+                callee_id=callee_id,
+                metadata={"external_call_id": call_id, **(metadata or {})},
+            )
+        except (CallCapacityError, ServiceNotReadyError) as e:
+            return {"action": "reject", "reason": e.message}
 
         self._call_map[call_id] = call_context.call_id
-
-        # Answer
-        await self.call_handler.answer_call()
+        metadata = metadata or {}
+        trunk = provider or metadata.get("provider", "generic")
+        remote_host = metadata.get("rtp_remote_host")
+        remote_port = metadata.get("rtp_remote_port")
+        session_id = self._open_rtp_media(
+            call_context.call_id,
+            trunk,
+            str(remote_host) if remote_host else None,
+            int(remote_port) if remote_port else None,
+        )
+        transport = self._media_transport(trunk)
+        if session_id is None and transport != "websocket":
+            self._awaiting_audio[call_id] = call_context.call_id
+
+        # Answer: the greeting is held until the call's media is bound
+        await self.call_handler.answer_call(call_context.call_id)
+
+        if session_id is not None:
+            self._bind_rtp_media(call_context.call_id, session_id)
+            info = self.rtp_engine.session_info(session_id)  # type: ignore[union-attr]
+            return {
+                "action": "answer",
+                "internal_call_id": str(call_context.call_id),
+                "rtp": {
+                    "host": self.config.rtp_advertise_host or self.config.rtp_host,
+                    "port": info["port"],
+                    "ssrc": info["ssrc"],
+                    "payload_type": info["payload_type"],
+                },
+            }
+
+        if transport == "websocket":
+            return {"action": "answer", "internal_call_id": str(call_context.call_id)}
 
         # Return audio bridge connection info
         return {
@@ -377,10 +728,45 @@ class TelephonyService:
         internal_id = self._call_map.pop(call_id, None)
 
         if internal_id:
-            await self.call_handler.hangup()
+            await self._end_call(internal_id)
 
         return {"action": "hangup", "success": internal_id is not None}
 
+    def get_external_call(self, call_id: str) -> CallContext | None:
+        """Active call registered under an external (provider) call ID.
+
+        Args:
+            call_id: External call ID, e.g. a Twilio call SID
+
+        Returns:
+            Call context, or None if no such call is active
+        """
+        internal_id = self._call_map.get(call_id)
+        return self.call_handler.get_call(internal_id) if internal_id else None
+
+    async def start_virtual_call(self, session_id: str) -> CallContext | None:
+        """Start a call for a browser audio session.
+
+        The session's WebSocket carries the call's media, like a provider
+        stream; the greeting is held until it attaches.
+
+        Args:
+            session_id: Web audio session ID, used as the external call ID
+
+        Returns:
+            Call context, or None if the call was rejected
+        """
+        await self.handle_webhook_incoming(session_id, "web", "web", provider="web")
+        return self.get_external_call(session_id)
+
+    async def end_virtual_call(self, session_id: str) -> None:
+        """End the call of a browser audio session, if it is still active.
+
+        Args:
+            session_id: Web audio session ID
+        """
+        await self.handle_webhook_hangup(session_id)
+
     @property
     def is_running(self) -> bool:
         """Check if service is running."""
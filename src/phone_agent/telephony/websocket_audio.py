@@ -18,8 +18,10 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import binascii
 import json
 import struct
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Callable
@@ -34,6 +36,12 @@ if TYPE_CHECKING:
 
 log = get_logger(__name__)
 
+try:
+    # Several times faster than json for the 50/s media messages per call
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class WebSocketMessageType(str, Enum):
     """Message types for WebSocket protocol."""
@@ -133,6 +141,31 @@ class AudioFrame:
         )
 
 
+def response_samples(audio: NDArray[np.float32] | bytes) -> NDArray[np.float32]:
+    """Response audio as 16 kHz float32 samples.
+
+    Args:
+        audio: float32 samples, or WAV bytes as returned by the TTS
+
+    Returns:
+        float32 audio at 16 kHz
+    """
+    if isinstance(audio, np.ndarray):
+        return audio
+
+    import io
+    import wave
+
+    from phone_agent.telephony.codecs import AudioResampler
+
+    with wave.open(io.BytesIO(audio), "rb") as wav:
+        rate = wav.getframerate()
+        pcm = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+    if rate != 16000:
+        pcm = AudioResampler(rate, 16000).resample(pcm)
+    return pcm.astype(np.float32) / 32768.0
+
+
 @dataclass
 class WebSocketSession:
     """Active WebSocket audio session."""
@@ -147,6 +180,11 @@ class WebSocketSession:
     frames_sent: int = 0
     last_activity: float = field(default_factory=lambda: __import__("time").time())
 
+    # Streaming transcription of the current utterance
+    transcript_stream: Any = None
+    transcript_tasks: set[asyncio.Task[None]] = field(default_factory=set)
+    last_partial: str = ""
+
     # Callbacks
     on_audio: Callable[[UUID, NDArray[np.float32]], Any] | None = None
     on_disconnect: Callable[[UUID], Any] | None = None
@@ -157,6 +195,8 @@ class WebSocketAudioHandler:
 
     Manages multiple concurrent WebSocket sessions for audio streaming.
     Integrates with the AI pipeline for real-time speech processing.
+    With a streaming-capable STT engine, partial transcripts are sent
+    while the user is still speaking and final ones on stop.
 
     Usage:
         handler = WebSocketAudioHandler()
@@ -171,6 +211,7 @@ class WebSocketAudioHandler:
         sample_rate: int = 16000,
         frame_duration_ms: int = 20,
         max_connections: int = 10,
+        stt: Any = None,
     ) -> None:
         """Initialize handler.
 
@@ -178,15 +219,18 @@ class WebSocketAudioHandler:
             sample_rate: Audio sample rate
             frame_duration_ms: Frame duration in milliseconds
             max_connections: Maximum concurrent connections
+            stt: STT engine with open_stream() for partial transcripts
         """
         self.sample_rate = sample_rate
         self.frame_duration_ms = frame_duration_ms
         self.max_connections = max_connections
+        self.stt = stt
 
         self._sessions: dict[UUID, WebSocketSession] = {}
         self._audio_callback: Callable[[UUID, NDArray[np.float32]], Any] | None = None
         self._connection_callback: Callable[[UUID], Any] | None = None
         self._disconnection_callback: Callable[[UUID], Any] | None = None
+        self._transcript_callback: Callable[[UUID, Any], Any] | None = None
 
     async def handle_connection(self, websocket: "WebSocket") -> None:
         """Handle new WebSocket connection.
@@ -289,6 +333,7 @@ class WebSocketAudioHandler:
 
             elif msg_type == WebSocketMessageType.STOP.value:
                 session.audio_started = False
+                await self._finish_transcript(session)
                 await self._send_message(
                     session.websocket,
                     {"type": WebSocketMessageType.AUDIO_END.value},
@@ -351,12 +396,80 @@ class WebSocketAudioHandler:
         # Convert to numpy
         audio = frame.to_numpy()
 
+        if self.stt is not None:
+            # Decode in the background so receiving is not held up; the
+            # chunk is buffered as soon as the task starts
+            task = asyncio.create_task(self._update_transcript(session, audio))
+            session.transcript_tasks.add(task)
+            task.add_done_callback(session.transcript_tasks.discard)
+
         # Notify callback
         if self._audio_callback:
             result = self._audio_callback(session.session_id, audio)
             if asyncio.iscoroutine(result):
                 await result
 
+    async def _update_transcript(
+        self,
+        session: WebSocketSession,
+        audio: NDArray[np.float32],
+    ) -> None:
+        """Feed the session's transcript stream and send changed partials.
+
+        Args:
+            session: Active session
+            audio: Float32 audio frame
+        """
+        if session.transcript_stream is None:
+            session.transcript_stream = self.stt.open_stream()
+            session.last_partial = ""
+
+        try:
+            hypothesis = await session.transcript_stream.feed_async(audio)
+        except Exception as e:
+            log.error(f"Streaming transcription failed: {e}")
+            return
+
+        if hypothesis is None or hypothesis.text == session.last_partial:
+            return
+        session.last_partial = hypothesis.text
+        await self.send_transcript(session.session_id, hypothesis.text, is_final=False)
+        await self._notify_transcript(session, hypothesis)
+
+    async def _finish_transcript(self, session: WebSocketSession) -> None:
+        """Finalize the session's transcript stream, if any.
+
+        Args:
+            session: Active session
+        """
+        if session.transcript_tasks:
+            await asyncio.gather(*session.transcript_tasks, return_exceptions=True)
+
+        stream = session.transcript_stream
+        if stream is None:
+            return
+        session.transcript_stream = None
+
+        try:
+            hypothesis = await stream.finish_async()
+        except Exception as e:
+            log.error(f"Streaming transcription failed: {e}")
+            return
+
+        if hypothesis.text:
+            await self.send_transcript(
+                session.session_id, hypothesis.text, is_final=True
+            )
+        await self._notify_transcript(session, hypothesis)
+
+    async def _notify_transcript(
+        self, session: WebSocketSession, hypothesis: Any
+    ) -> None:
+        if self._transcript_callback:
+            result = self._transcript_callback(session.session_id, hypothesis)
+            if asyncio.iscoroutine(result):
+                await result
+
     async def send_audio(
         self,
         session_id: UUID,
@@ -484,6 +597,9 @@ class WebSocketAudioHandler:
         """
         session_id = session.session_id
 
+        for task in session.transcript_tasks:
+            task.cancel()
+
         # Remove from active sessions
         self._sessions.pop(session_id, None)
 
@@ -506,6 +622,16 @@ class WebSocketAudioHandler:
         """
         self._audio_callback = callback
 
+    def on_transcript(self, callback: Callable[[UUID, Any], Any]) -> None:
+        """Set transcript callback for partial and final hypotheses.
+
+        Lets triage or LLM prefetch start before the end of the turn.
+
+        Args:
+            callback: Function called with (session_id, StreamingHypothesis)
+        """
+        self._transcript_callback = callback
+
     def on_connection(self, callback: Callable[[UUID], Any]) -> None:
         """Set connection callback.
 
@@ -544,6 +670,246 @@ class WebSocketAudioHandler:
         return list(self._sessions.keys())
 
 
+@dataclass
+class TwilioStreamConfig:
+    """Twilio Media Streams handling configuration."""
+
+    window_ms: int = 100  # Caller audio per callback (whole 20 ms frames)
+    frame_ms: int = 20  # Outbound media event duration
+    lead_ms: int = 60  # Outbound audio sent ahead of real time
+    mark_responses: bool = True  # Follow each response with a mark event
+
+
+class _TwilioMediaWriter:
+    """Stream writer stand-in that sends playout frames as media events.
+
+    Marks queued at a byte offset of the outbound audio are sent right
+    after the frame that reaches it, so Twilio echoes each one when the
+    caller has heard the audio before it.
+    """
+
+    def __init__(self, stream: TwilioStream) -> None:
+        self._stream = stream
+        # Media events differ only in the payload: build the JSON around it
+        self._media_prefix = (
+            '{"event":"media","streamSid":' + json.dumps(stream.stream_sid)
+            + ',"media":{"payload":"'
+        )
+        self._pending: list[str] = []
+        self.bytes_written = 0
+        self.marks: deque[tuple[int, str]] = deque()
+
+    def write(self, data: bytes) -> None:
+        payload = base64.b64encode(data).decode("ascii")
+        self._pending.append(self._media_prefix + payload + '"}}')
+        self.bytes_written += len(data)
+        self._stream.frames_sent += 1
+        while self.marks and self.marks[0][0] <= self.bytes_written:
+            _, name = self.marks.popleft()
+            self._pending.append(self._stream.control_message("mark", name))
+            self._stream.marks_sent += 1
+
+    async def drain(self) -> None:
+        pending, self._pending = self._pending, []
+        for text in pending:
+            await self._stream.websocket.send_text(text)
+
+    def close(self) -> None:
+        pass
+
+    async def wait_closed(self) -> None:
+        pass
+
+    def get_extra_info(self, name: str, default: Any = None) -> Any:
+        return default
+
+
+class TwilioStream:
+    """State of one Twilio media stream.
+
+    Holds the stream's resamplers across messages, collects caller audio
+    into fixed windows of whole frames and paces outbound audio as 20 ms
+    media events.
+    """
+
+    FRAME_BYTES = 160  # 20 ms of 8 kHz μ-law
+
+    def __init__(
+        self,
+        stream_sid: str,
+        websocket: WebSocket,
+        config: TwilioStreamConfig | None = None,
+        call_sid: str | None = None,
+        account_sid: str | None = None,
+    ) -> None:
+        """Initialize stream state.
+
+        Args:
+            stream_sid: Stream identifier
+            websocket: WebSocket the stream arrives on
+            config: Handling configuration
+            call_sid: Twilio call identifier
+            account_sid: Twilio account identifier
+        """
+        from .codecs import MuLawCodec, StreamingResampler
+        from .playout import PlayoutScheduler
+
+        self.stream_sid = stream_sid
+        self.websocket = websocket
+        self.config = config or TwilioStreamConfig()
+        self.call_sid = call_sid
+        self.account_sid = account_sid
+
+        self.codec = MuLawCodec()
+        self.upsampler = StreamingResampler(8000, 16000)
+        self.downsampler = StreamingResampler(16000, 8000)
+
+        # Receive window, filled in place and decoded once when complete
+        frames = max(1, self.config.window_ms // 20)
+        self._window = np.empty(frames * self.FRAME_BYTES, dtype=np.uint8)
+        self._pcm = np.empty(len(self._window), dtype=np.int16)
+        self._filled = 0
+
+        self.writer = _TwilioMediaWriter(self)
+        self.playout = PlayoutScheduler(
+            self.writer,  # type: ignore[arg-type]
+            frame_bytes=self.FRAME_BYTES * self.config.frame_ms // 20,
+            frame_ms=self.config.frame_ms,
+            lead_ms=self.config.lead_ms,
+        )
+        self._queued_bytes = 0
+        self._mark_count = 0
+        self._marks: dict[str, asyncio.Future[None]] = {}
+
+        self.media_received = 0
+        self.windows_delivered = 0
+        self.frames_sent = 0
+        self.marks_sent = 0
+        self.marks_played = 0
+
+    def control_message(self, event: str, mark: str | None = None) -> str:
+        """JSON text of a mark or clear event for this stream."""
+        message: dict[str, Any] = {"event": event, "streamSid": self.stream_sid}
+        if mark is not None:
+            message["mark"] = {"name": mark}
+        return json.dumps(message)
+
+    def add_media(self, mulaw: bytes) -> list[NDArray[np.float32]]:
+        """Collect received μ-law bytes.
+
+        Args:
+            mulaw: Decoded payload of one media message
+
+        Returns:
+            Windows completed by the payload (16 kHz float32)
+        """
+        self.media_received += 1
+        data = np.frombuffer(mulaw, dtype=np.uint8)
+        windows = []
+        while len(data):
+            take = min(len(data), len(self._window) - self._filled)
+            self._window[self._filled:self._filled + take] = data[:take]
+            self._filled += take
+            data = data[take:]
+            if self._filled == len(self._window):
+                windows.append(self._convert(len(self._window)))
+        return windows
+
+    def flush(self) -> NDArray[np.float32] | None:
+        """Audio of an incomplete window (at stream end), if any."""
+        if self._filled == 0:
+            return None
+        return self._convert(self._filled)
+
+    def _convert(self, count: int) -> NDArray[np.float32]:
+        """Decode and upsample the first count bytes of the window."""
+        pcm = self.codec.decode(self._window[:count], out=self._pcm[:count])  # type: ignore[arg-type]
+        self._filled = 0
+        self.windows_delivered += 1
+        audio = self.upsampler.process(pcm)
+        audio *= 1 / 32768.0
+        return audio
+
+    def enqueue(self, audio: NDArray[np.float32]) -> str | None:
+        """Queue response audio for paced playout.
+
+        Args:
+            audio: Audio data (16kHz float32)
+
+        Returns:
+            Name of the mark following the audio, if marks are enabled
+        """
+        pcm = self.downsampler.process(audio * 32767)
+        mulaw = self.codec.encode(np.clip(pcm, -32768, 32767).astype(np.int16))
+        if not mulaw:
+            return None
+        self.playout.enqueue(mulaw)
+        self._queued_bytes += len(mulaw)
+        if not self.config.mark_responses:
+            return None
+
+        self._mark_count += 1
+        name = f"response-{self._mark_count}"
+        self._marks[name] = asyncio.get_running_loop().create_future()
+        self.writer.marks.append((self._queued_bytes, name))
+        return name
+
+    def mark_played(self, name: str) -> None:
+        """Record Twilio's echo of a mark."""
+        future = self._marks.get(name)
+        if future is not None and not future.done():
+            future.set_result(None)
+            self.marks_played += 1
+
+    async def wait_for_mark(self, name: str, timeout: float | None = None) -> bool:
+        """Wait until the audio before a mark has played or been cleared.
+
+        Returns:
+            True once it has, False if it timed out or the mark is unknown
+        """
+        future = self._marks.get(name)
+        if future is None:
+            return False
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+        except TimeoutError:
+            return False
+        self._marks.pop(name, None)
+        return True
+
+    async def clear(self) -> None:
+        """Stop outbound audio (barge-in) and release waiting marks."""
+        self.playout.cancel()
+        self.writer.marks.clear()
+        self._queued_bytes = self.writer.bytes_written
+        # Twilio echoes the marks it already received; release all waiters
+        for future in self._marks.values():
+            if not future.done():
+                future.set_result(None)
+        await self.websocket.send_text(self.control_message("clear"))
+
+    async def close(self) -> None:
+        """Stop playout and release waiting marks."""
+        await self.playout.close()
+        for future in self._marks.values():
+            if not future.done():
+                future.cancel()
+        self._marks.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert counters to dictionary."""
+        return {
+            "stream_sid": self.stream_sid,
+            "call_sid": self.call_sid,
+            "media_received": self.media_received,
+            "windows_delivered": self.windows_delivered,
+            "frames_sent": self.frames_sent,
+            "marks_sent": self.marks_sent,
+            "marks_played": self.marks_played,
+            "playout_buffered_ms": self.playout.buffered_ms,
+        }
+
+
 class TwilioMediaStreamHandler:
     """Handler for Twilio Media Streams WebSocket.
 
@@ -554,22 +920,28 @@ class TwilioMediaStreamHandler:
     - Connected: Receive 'connected' event
     - Start: Receive 'start' event with stream info
     - Media: Receive 'media' events with audio chunks
+    - Mark: Receive 'mark' events when sent audio has been played
     - Stop: Receive 'stop' event when stream ends
 
     Audio format:
     - μ-law encoded (PCMU)
     - 8kHz sample rate
     - Base64 encoded in JSON
-    """
 
-    def __init__(self) -> None:
-        """Initialize Twilio handler."""
-        from .codecs import MuLawCodec, AudioResampler
+    Twilio sends a media message every 20 ms per call. Each stream keeps
+    its resamplers and groups frames into ``window_ms`` windows before
+    the audio callback; responses are sent as paced 20 ms media events
+    followed by a mark. Messages are parsed with orjson when installed.
+    """
 
-        self._codec = MuLawCodec()
-        self._resampler = AudioResampler(8000, 16000)
+    def __init__(self, config: TwilioStreamConfig | None = None) -> None:
+        """Initialize Twilio handler.
 
-        self._sessions: dict[str, dict] = {}
+        Args:
+            config: Handling configuration applied to every stream
+        """
+        self.config = config or TwilioStreamConfig()
+        self._streams: dict[str, TwilioStream] = {}
         self._audio_callback: Callable[[str, NDArray[np.float32]], Any] | None = None
 
     async def handle_connection(self, websocket: "WebSocket") -> None:
@@ -579,62 +951,87 @@ class TwilioMediaStreamHandler:
             websocket: FastAPI WebSocket
         """
         await websocket.accept()
-        stream_sid: str | None = None
+        try:
+            await self.serve(websocket)
+        except Exception as e:
+            log.error(f"Twilio WebSocket error: {e}")
+        finally:
+            await websocket.close()
+
+    async def serve(self, websocket: WebSocket) -> None:
+        """Process messages of an accepted connection until the stream stops.
+
+        Receive errors (including the disconnect) propagate to the caller.
+
+        Args:
+            websocket: Accepted FastAPI WebSocket
+        """
+        stream: TwilioStream | None = None
 
         try:
             while True:
-                message = await websocket.receive_json()
+                message = _json_loads(await websocket.receive_text())
                 event = message.get("event")
 
-                if event == "connected":
+                if event == "media":
+                    if stream is not None:
+                        await self._handle_media(stream, message)
+
+                elif event == "connected":
                     log.info("Twilio stream connected")
 
                 elif event == "start":
-                    stream_sid = message.get("streamSid")
-                    self._sessions[stream_sid] = {
-                        "call_sid": message.get("start", {}).get("callSid"),
-                        "account_sid": message.get("start", {}).get("accountSid"),
-                    }
-                    log.info(f"Twilio stream started: {stream_sid}")
-
-                elif event == "media":
-                    if stream_sid:
-                        await self._handle_media(stream_sid, message)
+                    start = message.get("start", {})
+                    stream = self._open_stream(
+                        message.get("streamSid", ""),
+                        websocket,
+                        call_sid=start.get("callSid"),
+                        account_sid=start.get("accountSid"),
+                    )
+                    log.info("Twilio stream started", stream_sid=stream.stream_sid)
+
+                elif event == "mark":
+                    if stream is not None:
+                        stream.mark_played(message.get("mark", {}).get("name", ""))
 
                 elif event == "stop":
-                    log.info(f"Twilio stream stopped: {stream_sid}")
+                    log.info(
+                        "Twilio stream stopped",
+                        stream_sid=stream.stream_sid if stream else None,
+                    )
                     break
 
-        except Exception as e:
-            log.error(f"Twilio WebSocket error: {e}")
         finally:
-            if stream_sid:
-                self._sessions.pop(stream_sid, None)
-            await websocket.close()
-
-    async def _handle_media(self, stream_sid: str, message: dict) -> None:
+            if stream is not None:
+                tail = stream.flush()
+                if tail is not None:
+                    await self._notify(stream.stream_sid, tail)
+                await stream.close()
+                self._streams.pop(stream.stream_sid, None)
+
+    def _open_stream(
+        self,
+        stream_sid: str,
+        websocket: WebSocket,
+        call_sid: str | None = None,
+        account_sid: str | None = None,
+    ) -> TwilioStream:
+        stream = TwilioStream(stream_sid, websocket, self.config, call_sid, account_sid)
+        self._streams[stream_sid] = stream
+        return stream
+
+    async def _handle_media(self, stream: TwilioStream, message: dict) -> None:
         """Handle Twilio media event.
 
         Args:
-            stream_sid: Stream identifier
+            stream: Stream the message belongs to
             message: Media message
         """
-        media = message.get("media", {})
-        payload = media.get("payload", "")
-
-        # Decode base64 μ-law audio
-        mulaw_data = base64.b64decode(payload)
-
-        # Decode to PCM
-        pcm = self._codec.decode(mulaw_data)
+        payload = message.get("media", {}).get("payload", "")
+        for audio in stream.add_media(binascii.a2b_base64(payload)):
+            await self._notify(stream.stream_sid, audio)
 
-        # Resample to 16kHz
-        pcm_16k = self._resampler.resample(pcm)
-
-        # Convert to float32
-        audio = pcm_16k.astype(np.float32) / 32768.0
-
-        # Notify callback
+    async def _notify(self, stream_sid: str, audio: NDArray[np.float32]) -> None:
         if self._audio_callback:
             result = self._audio_callback(stream_sid, audio)
             if asyncio.iscoroutine(result):
@@ -645,39 +1042,59 @@ class TwilioMediaStreamHandler:
         websocket: "WebSocket",
         stream_sid: str,
         audio: NDArray[np.float32],
-    ) -> None:
+    ) -> str | None:
         """Send audio back to Twilio.
 
+        The audio is queued behind earlier responses and sent in paced
+        20 ms media events; the call returns once it is queued.
+
         Args:
             websocket: WebSocket connection
             stream_sid: Stream identifier
             audio: Audio data (16kHz float32)
+
+        Returns:
+            Name of the mark Twilio echoes once the audio has played
+            (None if marks are disabled)
         """
-        from .codecs import AudioResampler
+        stream = self._streams.get(stream_sid)
+        if stream is None:
+            stream = self._open_stream(stream_sid, websocket)
+        return stream.enqueue(audio)
 
-        # Resample to 8kHz
-        resampler = AudioResampler(16000, 8000)
-        audio_8k = resampler.resample((audio * 32767).astype(np.int16))
+    async def wait_for_playback(
+        self,
+        stream_sid: str,
+        mark: str,
+        timeout: float | None = None,
+    ) -> bool:
+        """Wait until the caller has heard a response.
+
+        Args:
+            stream_sid: Stream identifier
+            mark: Mark returned by ``send_audio``
+            timeout: Seconds to wait at most
 
-        # Encode to μ-law
-        mulaw = self._codec.encode(audio_8k)
+        Returns:
+            True once the audio has played or been cleared
+        """
+        stream = self._streams.get(stream_sid)
+        return stream is not None and await stream.wait_for_mark(mark, timeout)
 
-        # Base64 encode
-        payload = base64.b64encode(mulaw).decode("utf-8")
+    async def clear(self, stream_sid: str) -> None:
+        """Stop audio being played to a stream (barge-in)."""
+        stream = self._streams.get(stream_sid)
+        if stream is not None:
+            await stream.clear()
 
-        # Send media message
-        await websocket.send_json(
-            {
-                "event": "media",
-                "streamSid": stream_sid,
-                "media": {"payload": payload},
-            }
-        )
+    def get_stream(self, stream_sid: str) -> TwilioStream | None:
+        """Get stream state by ID."""
+        return self._streams.get(stream_sid)
 
     def on_audio(self, callback: Callable[[str, NDArray[np.float32]], Any]) -> None:
         """Set audio callback.
 
         Args:
-            callback: Called with (stream_sid, audio_data)
+            callback: Called with (stream_sid, audio_data) per receive window
         """
         self._audio_callback = callback
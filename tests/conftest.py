@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import os
 import sys
+import time
 from pathlib import Path
 from typing import AsyncGenerator
 
@@ -71,6 +72,128 @@ def mock_settings(monkeypatch):
     return settings
 
 
+# ============================================================================
+# Fake AI Model Fixtures
+# ============================================================================
+
+
+class FakeSTT:
+    """Speech-to-text stand-in recording loads and transcriptions."""
+
+    model_name = "fake-whisper"
+    load_seconds = 0.0
+
+    def __init__(self):
+        self.calls = []
+        self.loads = 0
+
+    def load(self):
+        time.sleep(self.load_seconds)
+        self.loads += 1
+        self.calls.append("load")
+
+    def unload(self):
+        pass
+
+    def transcribe(self, audio, sample_rate=16000):
+        self.calls.append(("transcribe", len(audio)))
+        return ""
+
+    async def transcribe_async(self, audio, sample_rate=16000):
+        await asyncio.sleep(len(audio) / sample_rate * 0.01)
+        return "Ich hätte gern einen Termin."
+
+
+class FakeLLM:
+    """LLM stand-in streaming a fixed two-sentence answer."""
+
+    model_name = "fake-llm"
+    load_seconds = 0.0
+
+    def __init__(self):
+        self.calls = []
+
+    def load(self):
+        time.sleep(self.load_seconds)
+        self.calls.append("load")
+
+    def unload(self):
+        pass
+
+    def prime_prompt(self, system_prompt):
+        self.calls.append("prime")
+
+    def generate(self, prompt, system_prompt=None, max_tokens=None):
+        self.calls.append(("generate", max_tokens))
+        return "Hallo"
+
+    def generate_stream_with_history(self, messages):
+        for token in ["Guten ", "Tag. ", "Bis ", "bald."]:
+            time.sleep(0.001)
+            yield token
+
+
+class FakeTTS:
+    """Text-to-speech stand-in yielding two PCM chunks per sentence."""
+
+    model_name = "fake-voice"
+    sample_rate = 16000
+    cache = None
+    load_seconds = 0.0
+
+    def __init__(self):
+        self.calls = []
+
+    def load(self, language=None):
+        time.sleep(self.load_seconds)
+        self.calls.append("load")
+
+    def unload(self):
+        pass
+
+    def preload_voices(self, languages):
+        self.calls.append(("voices", languages))
+
+    def synthesize_to_array(self, text, language=None):
+        import numpy as np
+
+        self.calls.append(("synthesize", language))
+        return np.full(1600, 0.1, dtype=np.float32)
+
+    async def synthesize_stream_async(self, text, language=None):
+        for _ in range(2):
+            await asyncio.sleep(0.002)
+            yield b"\x00\x01" * 800
+
+
+@pytest.fixture
+def fake_stt():
+    """Create a fake speech-to-text model."""
+    return FakeSTT()
+
+
+@pytest.fixture
+def fake_llm():
+    """Create a fake streaming LLM."""
+    return FakeLLM()
+
+
+@pytest.fixture
+def fake_tts():
+    """Create a fake text-to-speech model."""
+    return FakeTTS()
+
+
+@pytest.fixture
+def fake_engine(fake_stt, fake_llm, fake_tts):
+    """Create a ConversationEngine running on the fake models."""
+    from phone_agent.core.conversation import ConversationEngine
+
+    return ConversationEngine(
+        stt=fake_stt, llm=fake_llm, tts=fake_tts, dialect_aware=False
+    )
+
+
 # ============================================================================
 # Async Database Fixtures
 # ============================================================================
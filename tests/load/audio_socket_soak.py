@@ -0,0 +1,583 @@
+"""Concurrent-call soak test for the FreeSWITCH audio socket path.
+
+Opens N TCP connections to a TelephonyAudioBridge and streams paced
+G.711 frames, the way FreeSWITCH's audio socket does, with injected
+network jitter, loss and reordering. Measures per call:
+
+- response latency (end of caller speech -> first response byte) and
+  the bridge's own share of it (latency minus stub delay and hangover)
+- response playout timing as FreeSWITCH would see it: inter-arrival
+  jitter, gaps and frames arriving too late for a fixed jitter buffer
+- frames lost in the network and dropped by the bridge's ingest queue
+
+By default the bridge runs in-process with a deterministic AI stub
+(fixed delay, fixed-length reply), so the results show bridge/codec
+capacity per node independently of model speed. ``--external``
+targets a bridge already listening at ``--host/--port`` instead
+(bridge-side counters are then unavailable).
+
+Run with:
+    python tests/load/audio_socket_soak.py --calls 50 --duration 60
+    python tests/load/audio_socket_soak.py --calls 100 --jitter-ms 30 --loss 0.02
+    python tests/load/audio_socket_soak.py --recordings calls/ --codec pcmu --json
+
+Requirements:
+    pip install numpy psutil   # psutil optional (memory)
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from uuid import UUID
+
+import numpy as np
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from phone_agent.core.audio import speech_like_noise  # noqa: E402
+from phone_agent.core.benchmark import read_wav, rss_mb  # noqa: E402
+from phone_agent.telephony.audio_bridge import (  # noqa: E402
+    AudioBridgeConfig,
+    AudioConnection,
+    TelephonyAudioBridge,
+)
+from phone_agent.telephony.codecs import (  # noqa: E402
+    CODEC_INFO,
+    AudioResampler,
+    CodecType,
+    get_codec,
+)
+
+FRAME_MS = 20
+SPEECH_RMS = 0.02  # Frames above this (float scale) count as caller speech
+NEW_RESPONSE_GAP_S = 0.3  # Silence on the downlink that separates responses
+
+
+@dataclass
+class Impairment:
+    """Network impairment applied to the caller's frames."""
+    jitter_ms: float = 0.0  # Std deviation of extra per-frame delay
+    loss: float = 0.0  # Probability a frame is lost
+    reorder: float = 0.0  # Probability a frame swaps places with the next
+
+
+@dataclass
+class CallAudio:
+    """Encoded caller audio, split into 20 ms frames."""
+    name: str
+    frames: list[bytes]
+    speech: list[bool]  # Per frame: caller is speaking
+
+
+@dataclass
+class CallResult:
+    """Measurements of one simulated call."""
+    call: int
+    audio: str
+    frames_sent: int = 0
+    frames_lost: int = 0
+    frames_reordered: int = 0
+    bytes_received: int = 0
+    response_latencies_ms: list[float] = field(default_factory=list)
+    late_frames: int = 0  # Downlink frames too late for the jitter buffer
+    downlink_frames: int = 0
+    max_gap_ms: float = 0.0
+    jitter_ms: float = 0.0  # RFC 3550 interarrival jitter of the downlink
+    error: str | None = None
+
+
+def make_synthetic_call(
+    index: int,
+    seconds: float,
+    pause_s: float,
+    codec: CodecType,
+) -> CallAudio:
+    """Alternate speech-like utterances with pauses long enough for a reply."""
+    rng = np.random.default_rng(index)
+    rate = CODEC_INFO[codec].sample_rate
+    parts = []
+    total = 0.0
+    turn = 0
+    while total < seconds:
+        speech = float(rng.uniform(1.0, 3.0))
+        parts.append(speech_like_noise(f"call-{index}-{turn}", speech, rate))
+        parts.append(np.zeros(int(pause_s * rate), dtype=np.float32))
+        total += speech + pause_s
+        turn += 1
+    return encode_call(f"synthetic-{index}", np.concatenate(parts), rate, codec)
+
+
+def load_recorded_calls(directory: Path, codec: CodecType) -> list[CallAudio]:
+    """Load caller-side WAV recordings, resampled to the codec rate."""
+    rate = CODEC_INFO[codec].sample_rate
+    calls = []
+    for path in sorted(directory.glob("*.wav")):
+        audio, source_rate = read_wav(path)
+        if source_rate != rate:
+            pcm = (audio * 32767).astype(np.int16)
+            resampled = AudioResampler(source_rate, rate).resample(pcm)
+            audio = resampled.astype(np.float32) / 32768
+        calls.append(encode_call(path.stem, audio, rate, codec))
+    if not calls:
+        raise SystemExit(f"No .wav recordings in {directory}")
+    return calls
+
+
+def encode_call(name: str, audio: np.ndarray, rate: int, codec: CodecType) -> CallAudio:
+    """Encode audio into 20 ms codec frames, marking speech frames."""
+    samples = rate * FRAME_MS // 1000
+    encoder = get_codec(codec)
+    frames, speech = [], []
+    for start in range(0, len(audio) - samples + 1, samples):
+        chunk = audio[start:start + samples]
+        frames.append(encoder.encode((chunk * 32767).astype(np.int16)))
+        speech.append(float(np.sqrt(np.mean(chunk * chunk))) > SPEECH_RMS)
+    return CallAudio(name, frames, speech)
+
+
+def schedule(
+    audio: CallAudio,
+    impairment: Impairment,
+    rng: np.random.Generator,
+    result: CallResult,
+    limit_s: float,
+) -> list[tuple[float, int]]:
+    """Departure offsets (seconds) of the frames that survive the network.
+
+    Only the frames of the first ``limit_s`` seconds are scheduled.
+    """
+    order = list(range(min(len(audio.frames), int(limit_s * 1000 / FRAME_MS))))
+    for i in range(len(order) - 1):
+        if rng.random() < impairment.reorder:
+            order[i], order[i + 1] = order[i + 1], order[i]
+            result.frames_reordered += 1
+
+    departures = []
+    for slot, frame in enumerate(order):
+        if rng.random() < impairment.loss:
+            result.frames_lost += 1
+            continue
+        delay = (
+            abs(rng.normal(0.0, impairment.jitter_ms)) / 1000
+            if impairment.jitter_ms
+            else 0.0
+        )
+        departures.append((slot * FRAME_MS / 1000 + delay, frame))
+    departures.sort()
+    return departures
+
+
+class Downlink:
+    """Receives the bridge's audio and models a fixed-delay jitter buffer."""
+
+    def __init__(self, frame_bytes: int, buffer_ms: float) -> None:
+        self.frame_bytes = frame_bytes
+        self.buffer_s = buffer_ms / 1000
+        self.responses: list[float] = []  # Arrival of each response's first byte
+        self._bytes = 0
+        self._frames = 0
+        self._burst_start: float | None = None
+        self._burst_frames = 0
+        self._last_arrival: float | None = None
+        self._transit: float | None = None
+
+    def receive(self, data: bytes, now: float, result: CallResult) -> None:
+        """Account for one socket read."""
+        if self._last_arrival is None or now - self._last_arrival > NEW_RESPONSE_GAP_S:
+            self.responses.append(now)
+            self._burst_start = now
+            self._burst_frames = 0
+            self._transit = None
+        elif self._last_arrival is not None:
+            result.max_gap_ms = max(
+                result.max_gap_ms, (now - self._last_arrival) * 1000
+            )
+        self._last_arrival = now
+
+        result.bytes_received += len(data)
+        self._bytes += len(data)
+        while self._bytes >= (self._frames + 1) * self.frame_bytes:
+            self._frames += 1
+            # Frame k of a burst plays at burst start + buffer + k frame times
+            played = self._burst_frames * FRAME_MS / 1000
+            deadline = self._burst_start + self.buffer_s + played
+            if now > deadline:
+                result.late_frames += 1
+            # RFC 3550: J += (|D| - J) / 16, D = change in relative transit time
+            transit = now - played
+            if self._transit is not None:
+                change_ms = abs(transit - self._transit) * 1000
+                result.jitter_ms += (change_ms - result.jitter_ms) / 16
+            self._transit = transit
+            self._burst_frames += 1
+            result.downlink_frames += 1
+
+
+async def run_call(
+    index: int,
+    audio: CallAudio,
+    args: argparse.Namespace,
+    impairment: Impairment,
+    frame_bytes: int,
+) -> CallResult:
+    """Stream one call's audio for the test duration and record the replies."""
+    result = CallResult(call=index, audio=audio.name)
+    rng = np.random.default_rng(1000 + index)
+    await asyncio.sleep(index * args.ramp / max(1, args.calls))
+
+    try:
+        reader, writer = await asyncio.open_connection(args.host, args.port)
+    except OSError as e:
+        result.error = str(e)
+        return result
+
+    downlink = Downlink(frame_bytes, args.jitter_buffer_ms)
+    speech_ends: list[float] = []
+
+    async def receive() -> None:
+        while data := await reader.read(4096):
+            downlink.receive(data, time.perf_counter(), result)
+
+    receiver = asyncio.create_task(receive())
+    deadline = time.perf_counter() + args.duration
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            for offset, frame in schedule(
+                audio, impairment, rng, result, deadline - start
+            ):
+                delay = start + offset - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                writer.write(audio.frames[frame])
+                result.frames_sent += 1
+                last = frame + 1 == len(audio.frames) or not audio.speech[frame + 1]
+                if audio.speech[frame] and last:
+                    speech_ends.append(time.perf_counter())
+                if result.frames_sent % 10 == 0:
+                    await writer.drain()
+        # Let the last reply arrive
+        await asyncio.sleep(min(args.response_ms / 1000 + 1.0, 5.0))
+    except (ConnectionError, OSError) as e:
+        result.error = str(e)
+    finally:
+        receiver.cancel()
+        await asyncio.gather(receiver, return_exceptions=True)
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+
+    # Each response answers the most recent end of speech before it
+    for arrival in downlink.responses:
+        before = [t for t in speech_ends if t < arrival]
+        if before:
+            result.response_latencies_ms.append((arrival - before[-1]) * 1000)
+    return result
+
+
+def start_stub_bridge(
+    args: argparse.Namespace,
+) -> tuple[TelephonyAudioBridge, list[AudioConnection]]:
+    """Configure an in-process bridge that answers every utterance with a tone."""
+    config = AudioBridgeConfig(
+        host=args.host,
+        port=args.port,
+        telephony_codec=CodecType(args.codec.upper()),
+    )
+    bridge = TelephonyAudioBridge(config)
+    connections: list[AudioConnection] = []
+    tone = np.sin(2 * np.pi * 440 * np.arange(16 * args.response_ms) / 16000)
+    reply = (tone * 0.3).astype(np.float32)
+
+    @bridge.on_connection
+    def track(call_id: UUID) -> None:
+        connections.append(bridge.get_connection(call_id))
+
+    @bridge.on_audio_received
+    async def stub(call_id: UUID, audio: np.ndarray) -> None:
+        await asyncio.sleep(args.stub_delay_ms / 1000)
+        await bridge.send_audio(call_id, reply)
+        await bridge.wait_for_playout(call_id)
+
+    return bridge, connections
+
+
+async def measure_loop_lag(samples: list[float], stop: asyncio.Event) -> None:
+    """Record how late 10 ms timers fire (event loop saturation)."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        samples.append((time.perf_counter() - start - 0.01) * 1000)
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    """p50/p95/p99/max of a list of values."""
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def at(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * q))], 1)
+
+    return {
+        "p50": at(0.5),
+        "p95": at(0.95),
+        "p99": at(0.99),
+        "max": round(ordered[-1], 1),
+    }
+
+
+async def run(args: argparse.Namespace) -> dict:
+    """Run the soak test and return the report."""
+    codec = CodecType(args.codec.upper())
+    impairment = Impairment(args.jitter_ms, args.loss, args.reorder)
+    frame_bytes = CODEC_INFO[codec].bitrate_kbps * FRAME_MS // 8
+
+    if args.recordings:
+        recorded = load_recorded_calls(Path(args.recordings), codec)
+        calls = [recorded[i % len(recorded)] for i in range(args.calls)]
+    else:
+        config = AudioBridgeConfig()
+        turn_ms = config.endpoint_hangover_ms + args.stub_delay_ms + args.response_ms
+        pause = turn_ms / 1000 + 1.0
+        calls = [make_synthetic_call(i, 30.0, pause, codec) for i in range(args.calls)]
+
+    bridge = connections = server = None
+    if not args.external:
+        bridge, connections = start_stub_bridge(args)
+        server = asyncio.create_task(bridge.start())
+        await asyncio.sleep(0.2)
+
+    lag: list[float] = []
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(measure_loop_lag(lag, stop))
+    rss_start, _ = rss_mb()
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+
+    runs = (
+        run_call(i, audio, args, impairment, frame_bytes)
+        for i, audio in enumerate(calls)
+    )
+    results = await asyncio.gather(*runs)
+
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    rss_end, rss_peak = rss_mb()
+    stop.set()
+    await lag_task
+
+    report: dict = {
+        "config": {
+            "calls": args.calls,
+            "duration_s": args.duration,
+            "codec": args.codec,
+            "impairment": impairment.__dict__,
+            "stub_delay_ms": args.stub_delay_ms,
+            "response_ms": args.response_ms,
+            "jitter_buffer_ms": args.jitter_buffer_ms,
+            "bridge": "external" if args.external else "in-process",
+        },
+        "calls": [r.__dict__ for r in results] if args.per_call else None,
+        "summary": summarize(results, args),
+        "process": {
+            "cpu_s": round(cpu, 2),
+            "cpu_utilization": round(cpu / wall, 3) if wall else 0.0,
+            "rss_mb_start": rss_start,
+            "rss_mb_end": rss_end,
+            "rss_mb_peak": rss_peak,
+            "loop_lag_ms": percentiles(lag),
+        },
+    }
+
+    if bridge is not None:
+        stats = bridge.statistics.to_dict()
+        stats.pop("calls", None)
+        report["bridge"] = {
+            **stats,
+            "ingest_queue_high_watermark": percentiles(
+                [float(c.stats.queue_high_watermark) for c in connections if c]
+            ),
+            "frames_dropped_per_call": percentiles(
+                [float(c.stats.frames_dropped) for c in connections if c]
+            ),
+        }
+        await bridge.stop()
+        server.cancel()
+        await asyncio.gather(server, return_exceptions=True)
+    return report
+
+
+def summarize(results: list[CallResult], args: argparse.Namespace) -> dict:
+    """Aggregate per-call results."""
+    latencies = [v for r in results for v in r.response_latencies_ms]
+    overhead_ms = args.stub_delay_ms + AudioBridgeConfig().endpoint_hangover_ms
+    sent = sum(r.frames_sent for r in results)
+    downlink = sum(r.downlink_frames for r in results)
+    return {
+        "calls_failed": sum(1 for r in results if r.error),
+        "frames_sent": sent,
+        "frames_lost": sum(r.frames_lost for r in results),
+        "frames_reordered": sum(r.frames_reordered for r in results),
+        "responses": len(latencies),
+        "response_latency_ms": percentiles(latencies),
+        # Latency the bridge adds on top of the stub and the endpoint hangover
+        "bridge_latency_ms": (
+            percentiles([v - overhead_ms for v in latencies])
+            if not args.external
+            else None
+        ),
+        "downlink_frames": downlink,
+        "late_frames": sum(r.late_frames for r in results),
+        "late_frame_rate": (
+            round(sum(r.late_frames for r in results) / downlink, 4)
+            if downlink
+            else 0.0
+        ),
+        "downlink_jitter_ms": percentiles(
+            [r.jitter_ms for r in results if r.downlink_frames]
+        ),
+        "downlink_max_gap_ms": percentiles(
+            [r.max_gap_ms for r in results if r.downlink_frames]
+        ),
+        "errors": [r.error for r in results if r.error][:10],
+    }
+
+
+def print_report(report: dict) -> None:
+    """Print formatted results."""
+    config, summary, process = report["config"], report["summary"], report["process"]
+    print("\n" + "=" * 70)
+    print("AUDIO SOCKET SOAK TEST")
+    print("=" * 70)
+    print(
+        f"{config['calls']} calls x {config['duration_s']:.0f}s, {config['codec']}, "
+        f"impairment {config['impairment']}, bridge {config['bridge']}"
+    )
+    print(f"\nCalls failed:        {summary['calls_failed']}")
+    print(
+        f"Frames sent:         {summary['frames_sent']} "
+        f"(lost {summary['frames_lost']}, reordered {summary['frames_reordered']})"
+    )
+    print(f"Responses:           {summary['responses']}")
+    print(f"Response latency ms: {summary['response_latency_ms']}")
+    if summary["bridge_latency_ms"] is not None:
+        print(f"Bridge latency ms:   {summary['bridge_latency_ms']}")
+    print(
+        f"Downlink:            {summary['downlink_frames']} frames, "
+        f"{summary['late_frames']} late ({summary['late_frame_rate']:.2%})"
+    )
+    print(f"Downlink jitter ms:  {summary['downlink_jitter_ms']}")
+    print(f"Downlink max gap ms: {summary['downlink_max_gap_ms']}")
+    if "bridge" in report:
+        bridge = report["bridge"]
+        print(
+            f"\nBridge: {bridge['frames_received']} frames in, "
+            f"{bridge['frames_sent']} out, {bridge['frames_dropped']} dropped, "
+            f"{bridge['utterances_detected']} utterances, "
+            f"{bridge['barge_ins']} barge-ins, "
+            f"{bridge['codec_decode_errors']} decode errors"
+        )
+        print(f"  Ingest queue high watermark: {bridge['ingest_queue_high_watermark']}")
+    print(
+        f"\nProcess: CPU {process['cpu_s']}s ({process['cpu_utilization']:.2f} cores), "
+        f"RSS {process['rss_mb_start']} -> {process['rss_mb_end']} MB "
+        f"(peak {process['rss_mb_peak']}), "
+        f"loop lag ms {process['loop_lag_ms']}"
+    )
+    print("=" * 70)
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Audio socket soak test")
+    parser.add_argument(
+        "-c", "--calls", type=int, default=20, help="Concurrent calls (default: 20)"
+    )
+    parser.add_argument(
+        "-d",
+        "--duration",
+        type=float,
+        default=60.0,
+        help="Seconds per call (default: 60)",
+    )
+    parser.add_argument(
+        "--ramp",
+        type=float,
+        default=5.0,
+        help="Seconds over which calls start (default: 5)",
+    )
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="Bridge host (default: 127.0.0.1)"
+    )
+    parser.add_argument(
+        "--port", type=int, default=9190, help="Bridge port (default: 9190)"
+    )
+    parser.add_argument(
+        "--external",
+        action="store_true",
+        help="Connect to a running bridge instead of a stub",
+    )
+    parser.add_argument(
+        "--codec",
+        choices=["pcma", "pcmu"],
+        default="pcma",
+        help="G.711 variant (default: pcma)",
+    )
+    parser.add_argument(
+        "--recordings",
+        default=None,
+        help="Directory of caller-side WAV recordings to replay",
+    )
+    parser.add_argument(
+        "--jitter-ms",
+        type=float,
+        default=0.0,
+        help="Network jitter std deviation (default: 0)",
+    )
+    parser.add_argument(
+        "--loss", type=float, default=0.0, help="Frame loss probability"
+    )
+    parser.add_argument(
+        "--reorder", type=float, default=0.0, help="Frame reorder probability"
+    )
+    parser.add_argument(
+        "--stub-delay-ms",
+        type=float,
+        default=300.0,
+        help="AI stub think time (default: 300)",
+    )
+    parser.add_argument(
+        "--response-ms",
+        type=int,
+        default=1500,
+        help="AI stub reply length (default: 1500)",
+    )
+    parser.add_argument(
+        "--jitter-buffer-ms", type=float, default=60.0,
+        help="Downlink jitter buffer depth used to count late frames (default: 60)"
+    )
+    parser.add_argument(
+        "--per-call", action="store_true", help="Include per-call results"
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print JSON instead of a table"
+    )
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(report, indent=2, default=str))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
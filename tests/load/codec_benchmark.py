@@ -0,0 +1,338 @@
+"""Codec and resampling microbenchmarks for the telephony audio path.
+
+Measures CPU time spent per second of call audio when many calls are
+processed side by side, comparing the current implementation against the
+previous one so regressions and wins are visible in numbers.
+
+Run with:
+    python tests/load/codec_benchmark.py --calls 50 --seconds 10
+    python tests/load/codec_benchmark.py --suite resample --json
+    python tests/load/codec_benchmark.py --suite g722 --calls 20
+
+Requirements:
+    pip install numpy scipy
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from phone_agent.telephony.codecs import (  # noqa: E402
+    ALawCodec,
+    G722Codec,
+    MuLawCodec,
+    StreamingResampler,
+)
+
+
+@dataclass
+class BenchmarkResult:
+    """CPU cost of one implementation for one workload."""
+    suite: str
+    name: str
+    calls: int
+    audio_seconds: float
+    cpu_seconds: float
+
+    @property
+    def cpu_ms_per_audio_second(self) -> float:
+        """CPU milliseconds needed per second of call audio."""
+        return self.cpu_seconds / self.audio_seconds * 1000
+
+    @property
+    def realtime_factor(self) -> float:
+        """CPU seconds per second of audio (below 1.0 keeps up on one core)."""
+        return self.cpu_seconds / self.audio_seconds
+
+    @property
+    def calls_per_core(self) -> float:
+        """Calls one core could sustain for this stage alone."""
+        if self.cpu_seconds <= 0:
+            return float("inf")
+        return self.audio_seconds / self.cpu_seconds
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["cpu_ms_per_audio_second"] = round(self.cpu_ms_per_audio_second, 3)
+        data["realtime_factor"] = round(self.realtime_factor, 5)
+        data["calls_per_core"] = round(self.calls_per_core, 1)
+        return data
+
+
+def make_call_audio(calls: int, seconds: float, rate: int) -> list[np.ndarray]:
+    """Generate speech-like int16 audio (harmonics plus noise) per call."""
+    rng = np.random.default_rng(42)
+    t = np.arange(int(seconds * rate)) / rate
+    audio = []
+    for _ in range(calls):
+        f0 = rng.uniform(90, 220)
+        signal = sum(np.sin(2 * np.pi * f0 * k * t) / k for k in range(1, 8))
+        signal += rng.standard_normal(len(t)) * 0.05
+        audio.append((signal / np.abs(signal).max() * 12000).astype(np.int16))
+    return audio
+
+
+def run_interleaved(
+    suite: str,
+    name: str,
+    audio: list[np.ndarray],
+    rate: int,
+    chunk_ms: int,
+    make_processor: Callable[[], Callable[[np.ndarray], object]],
+) -> BenchmarkResult:
+    """Feed every call chunk by chunk, round-robin, like concurrent calls.
+
+    Args:
+        suite: Benchmark suite name
+        name: Implementation name
+        audio: One int16 array per call
+        rate: Sample rate of the input audio
+        chunk_ms: Chunk duration handed to the processor
+        make_processor: Factory returning a per-call processing function
+    """
+    processors = [make_processor() for _ in audio]
+    chunk = rate * chunk_ms // 1000
+    total = len(audio[0])
+
+    start = time.process_time()
+    for offset in range(0, total, chunk):
+        for process, samples in zip(processors, audio):
+            process(samples[offset:offset + chunk])
+    cpu = time.process_time() - start
+
+    return BenchmarkResult(
+        suite=suite,
+        name=name,
+        calls=len(audio),
+        audio_seconds=len(audio) * total / rate,
+        cpu_seconds=cpu,
+    )
+
+
+def legacy_fft_resampler(input_rate: int, output_rate: int):
+    """Per-chunk FFT resampling as previously done by AudioResampler."""
+    from scipy import signal
+
+    def process(samples: np.ndarray) -> np.ndarray:
+        target = int(len(samples) * output_rate / input_rate)
+        out = signal.resample(samples.astype(np.float64), target)
+        return np.clip(out, -32768, 32767).astype(np.int16)
+
+    return process
+
+
+def streaming_resampler(input_rate: int, output_rate: int):
+    """Stateful polyphase resampling (one instance per call)."""
+    return StreamingResampler(input_rate, output_rate).process
+
+
+def bench_resample(calls: int, seconds: float) -> list[BenchmarkResult]:
+    """Compare resampling paths for inbound and outbound call audio."""
+    results = []
+    workloads = [
+        # (input rate, output rate, chunk ms): bridge ingest and TTS egress
+        (8000, 16000, 100),
+        (16000, 8000, 20),
+        (22050, 8000, 20),
+        (24000, 8000, 20),
+    ]
+    for input_rate, output_rate, chunk_ms in workloads:
+        audio = make_call_audio(calls, seconds, input_rate)
+        suite = f"resample {input_rate}->{output_rate} ({chunk_ms}ms chunks)"
+        for name, factory in [
+            ("scipy.signal.resample (legacy)", legacy_fft_resampler),
+            ("StreamingResampler", streaming_resampler),
+        ]:
+            results.append(run_interleaved(
+                suite, name, audio, input_rate, chunk_ms,
+                lambda f=factory: f(input_rate, output_rate),
+            ))
+    return results
+
+
+def legacy_mulaw_encode(pcm: np.ndarray) -> bytes:
+    """Previous μ-law encoder: seven masked segment searches per frame."""
+    sign = (pcm >> 8) & 0x80
+    pcm_abs = np.clip(np.abs(pcm.astype(np.int32)), 0, 32635) + 0x84
+    exponent = np.zeros(len(pcm), dtype=np.uint8)
+    for i in range(7, 0, -1):
+        mask = pcm_abs >= (1 << (i + 7))
+        exponent[mask] = np.maximum(exponent[mask], i)
+    mantissa = (pcm_abs >> (exponent + 3)) & 0x0F
+    result = ~(sign | (exponent << 4) | mantissa) & 0xFF
+    return result.astype(np.uint8).tobytes()
+
+
+def legacy_alaw_encode(pcm: np.ndarray) -> bytes:
+    """Previous A-law encoder: one masked pass per segment."""
+    seg_end = [0x1F, 0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF]
+    sign = np.zeros(len(pcm), dtype=np.uint8)
+    pcm_work = pcm.astype(np.int32)
+    mask = pcm_work >= 0
+    sign[mask] = 0xD5
+    sign[~mask] = 0x55
+    pcm_work = np.abs(pcm_work)
+    result = np.zeros(len(pcm), dtype=np.uint8)
+    for seg, end_val in enumerate(seg_end):
+        if seg == len(seg_end) - 1:
+            mask = pcm_work > seg_end[seg - 1]
+        else:
+            lower = seg_end[seg - 1] if seg > 0 else 0
+            mask = (pcm_work > lower) & (pcm_work <= end_val)
+        if seg < 2:
+            result[mask] = (pcm_work[mask] >> 4) & 0x0F
+        else:
+            result[mask] = (pcm_work[mask] >> (seg + 3)) & 0x0F
+        result[mask] |= seg << 4
+    result ^= sign
+    return result.tobytes()
+
+
+def bench_g711(calls: int, seconds: float) -> list[BenchmarkResult]:
+    """Compare G.711 encoders and decoders on 20 ms telephony frames."""
+    results = []
+    audio = make_call_audio(calls, seconds, 8000)
+
+    for law, codec, legacy in [
+        ("PCMU", MuLawCodec(), legacy_mulaw_encode),
+        ("PCMA", ALawCodec(), legacy_alaw_encode),
+    ]:
+        suite = f"{law} encode (20ms frames)"
+        results.append(run_interleaved(
+            suite, "masked segment search (legacy)", audio, 8000, 20,
+            lambda f=legacy: f,
+        ))
+        results.append(run_interleaved(
+            suite, "65K lookup table", audio, 8000, 20,
+            lambda c=codec: c.encode,
+        ))
+
+        encoded = [
+            np.frombuffer(codec.encode(samples), dtype=np.uint8) for samples in audio
+        ]
+        suite = f"{law} decode (20ms frames)"
+        results.append(run_interleaved(
+            suite, "lookup table", encoded, 8000, 20,
+            lambda c=codec: (lambda frame: c.decode(frame.tobytes())),
+        ))
+
+        def decode_into(c=codec):
+            out = np.empty(160, dtype=np.int16)
+            return lambda frame: c.decode(frame.tobytes(), out=out[:len(frame)])
+
+        results.append(run_interleaved(
+            suite, "lookup table, preallocated output", encoded, 8000, 20,
+            decode_into,
+        ))
+    return results
+
+
+def bench_g722(calls: int, seconds: float) -> list[BenchmarkResult]:
+    """Measure sustained SB-ADPCM cost on 20 ms wideband frames."""
+    results = []
+    audio = make_call_audio(calls, seconds, 16000)
+    suite = "G722 (20ms frames)"
+
+    results.append(run_interleaved(
+        suite, "encode", audio, 16000, 20,
+        lambda: G722Codec().encode,
+    ))
+
+    encoded = [np.frombuffer(G722Codec().encode(a), dtype=np.uint8) for a in audio]
+    # One code byte per sample pair: 8 kHz byte rate, 20 ms = 160 bytes
+    results.append(run_interleaved(
+        suite, "decode", encoded, 8000, 20,
+        lambda: (lambda frame, c=G722Codec(): c.decode(frame.tobytes())),
+    ))
+
+    def full_duplex():
+        inbound, outbound = G722Codec(), G722Codec()
+        return lambda frame: inbound.decode(outbound.encode(frame))
+
+    results.append(
+        run_interleaved(suite, "encode + decode", audio, 16000, 20, full_duplex)
+    )
+    return results
+
+
+SUITES: dict[str, Callable[[int, float], list[BenchmarkResult]]] = {
+    "resample": bench_resample,
+    "g711": bench_g711,
+    "g722": bench_g722,
+}
+
+
+def print_results(results: list[BenchmarkResult]) -> None:
+    """Print formatted benchmark results grouped by suite."""
+    print("\n" + "=" * 78)
+    print("CODEC BENCHMARK RESULTS")
+    print("=" * 78)
+
+    suite = None
+    for result in results:
+        if result.suite != suite:
+            suite = result.suite
+            print(f"\n{suite} - {result.calls} calls, "
+                  f"{result.audio_seconds / result.calls:.0f}s audio each")
+            print(
+                f"  {'Implementation':<36} {'CPU ms/audio s':>15} "
+                f"{'RTF':>8} {'Calls/core':>12}"
+            )
+        print(
+            f"  {result.name:<36} {result.cpu_ms_per_audio_second:>15.3f} "
+            f"{result.realtime_factor:>8.4f} {result.calls_per_core:>12.0f}"
+        )
+    print("=" * 78)
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Telephony codec benchmarks")
+    parser.add_argument(
+        "-c", "--calls",
+        type=int,
+        default=50,
+        help="Number of concurrent calls (default: 50)",
+    )
+    parser.add_argument(
+        "-s", "--seconds",
+        type=float,
+        default=10.0,
+        help="Seconds of audio per call (default: 10)",
+    )
+    parser.add_argument(
+        "--suite",
+        choices=["all", *SUITES],
+        default="all",
+        help="Benchmark suite to run (default: all)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print machine-readable JSON instead of a table",
+    )
+    args = parser.parse_args()
+
+    selected = SUITES if args.suite == "all" else {args.suite: SUITES[args.suite]}
+    results: list[BenchmarkResult] = []
+    for bench in selected.values():
+        results.extend(bench(args.calls, args.seconds))
+
+    if args.json:
+        print(json.dumps([r.to_dict() for r in results], indent=2))
+    else:
+        print_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,447 @@
+"""FreeSWITCH Event Socket (ESL) parsing and dispatch benchmark.
+
+Replays an ESL capture (the byte stream FreeSWITCH sends after
+authentication) and measures:
+
+- parse: events per second for the previous readline/dict parser and
+  for the incremental ``EslParser`` with lazily decoded headers, both
+  reading the same fields a call handler reads.
+- dispatch: replays the capture over TCP into ``FreeSwitchClient`` with
+  one slow channel handler, and reports when the other channels'
+  events were handled with serial dispatch (as before) and with
+  per-channel ordered dispatch.
+
+Without ``--capture`` a realistic capture is synthesized: concurrent
+calls with ~100 URL-encoded headers per event, interleaved with
+BACKGROUND_JOB results.
+
+Run with:
+    python tests/load/esl_benchmark.py --channels 200 --events 50
+    python tests/load/esl_benchmark.py --record capture.esl
+    python tests/load/esl_benchmark.py --capture capture.esl --json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from phone_agent.telephony.esl import READ_SIZE, EslParser  # noqa: E402
+from phone_agent.telephony.freeswitch import (  # noqa: E402
+    FreeSwitchClient,
+    FreeSwitchConfig,
+    FreeSwitchEvent,
+)
+
+# Fields a typical call handler reads from each event
+HANDLER_FIELDS = ("Event-Name", "Unique-ID", "Caller-Caller-ID-Number", "Channel-State")
+
+CALL_EVENTS = (
+    "CHANNEL_CREATE", "CHANNEL_PROGRESS", "CHANNEL_ANSWER", "CHANNEL_PARK",
+    "CHANNEL_EXECUTE", "CHANNEL_EXECUTE_COMPLETE", "DTMF", "CHANNEL_CALLSTATE",
+)
+
+
+@dataclass
+class ParseResult:
+    """Parsing throughput of one implementation."""
+    name: str
+    events: int
+    megabytes: float
+    seconds: float
+
+    @property
+    def events_per_second(self) -> float:
+        """Events parsed per second."""
+        return self.events / self.seconds if self.seconds > 0 else float("inf")
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["events_per_second"] = round(self.events_per_second)
+        return data
+
+
+@dataclass
+class DispatchResult:
+    """Handler completion times with one slow channel."""
+    name: str
+    events: int
+    slow_events: int
+    other_done_seconds: float  # Until every event of the other channels was handled
+    all_done_seconds: float
+
+    @property
+    def events_per_second(self) -> float:
+        """Events handled per second, end to end."""
+        return self.events / self.all_done_seconds if self.all_done_seconds > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["events_per_second"] = round(self.events_per_second)
+        return data
+
+
+# =============================================================================
+# Capture
+# =============================================================================
+
+
+def _message(headers: list[tuple[str, str]], body: str = "") -> bytes:
+    head = "".join(f"{key}: {value}\n" for key, value in headers)
+    raw = body.encode()
+    if raw:
+        head += f"Content-Length: {len(raw)}\n"
+    return (head + "\n").encode() + raw
+
+
+def _event(headers: list[tuple[str, str]], event_body: str = "") -> bytes:
+    body = "".join(f"{key}: {quote(value, safe='')}\n" for key, value in headers)
+    if event_body:
+        body += f"Content-Length: {len(event_body.encode())}\n\n{event_body}"
+    else:
+        body += "\n"
+    return _message([("Content-Type", "text/event-plain")], body)
+
+
+def synthesize_capture(channels: int, events: int, seed: int = 42) -> bytes:
+    """ESL byte stream of concurrent calls, interleaved like a busy switch.
+
+    Args:
+        channels: Concurrent calls
+        events: Events per call (plus one BACKGROUND_JOB result each)
+        seed: Random seed
+
+    Returns:
+        Raw capture bytes
+    """
+    rng = random.Random(seed)
+    calls = []
+    for n in range(channels):
+        channel = str(uuid.UUID(int=rng.getrandbits(128)))
+        number = f"+49{rng.randrange(10**9, 10**10)}"
+        base = [
+            ("Core-UUID", "9f1c2e6a-0000-4000-8000-000000000001"),
+            ("FreeSWITCH-Hostname", "fs-prod-01.example.de"),
+            ("FreeSWITCH-IPv4", "10.0.0.5"),
+            ("Unique-ID", channel),
+            ("Channel-Name", f"sofia/external/{number}@sip.example.de:5060"),
+            (
+                "Caller-Caller-ID-Name",
+                rng.choice(["Müller, Anna", "Öztürk Ayşe", "Иванов И."]),
+            ),
+            ("Caller-Caller-ID-Number", number),
+            ("Caller-Destination-Number", "+4930123456789"),
+            ("Caller-Network-Addr", f"203.0.113.{n % 250}"),
+        ]
+        # Channel variables make up most of a real event
+        base += [
+            (f"variable_sip_h_X-Custom-{i}", f"value {i}; tag={n}&x=%/y")
+            for i in range(85)
+        ]
+        calls.append((channel, base))
+
+    queues = []
+    for channel, base in calls:
+        messages = []
+        for i in range(events):
+            if i == events - 1:
+                name = "CHANNEL_HANGUP"
+            else:
+                name = CALL_EVENTS[min(i, len(CALL_EVENTS) - 1)]
+            headers = [
+                ("Event-Name", name),
+                ("Event-UUID", str(uuid.UUID(int=rng.getrandbits(128)))),
+                ("Event-Date-Timestamp", str(1700000000000000 + i * 20000)),
+                ("Channel-State", "CS_EXECUTE" if i else "CS_INIT"),
+                *base,
+            ]
+            messages.append(_event(headers))
+            if i == 2:
+                job = str(uuid.UUID(int=rng.getrandbits(128)))
+                messages.append(_event([
+                    ("Event-Name", "BACKGROUND_JOB"),
+                    ("Job-UUID", job),
+                    ("Job-Command", "uuid_answer"),
+                    ("Job-Command-Arg", channel),
+                ], "+OK\n"))
+        queues.append(messages)
+
+    out = []
+    while queues:
+        messages = rng.choice(queues)
+        out.append(messages.pop(0))
+        if not messages:
+            queues.remove(messages)
+    return b"".join(out)
+
+
+# =============================================================================
+# Parse benchmark
+# =============================================================================
+
+
+async def legacy_parse(reader: asyncio.StreamReader) -> int:
+    """Readline frame reader and eager dict event parser (previous client)."""
+    events = 0
+    while True:
+        headers: dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if not line:
+                return events
+            line_str = line.decode().strip()
+            if not line_str:
+                if headers:
+                    break
+                continue
+            key, _, value = line_str.partition(":")
+            headers[key.strip()] = value.strip()
+        content_length = int(headers.get("Content-Length", 0))
+        body = ""
+        if content_length > 0:
+            body = (await reader.readexactly(content_length)).decode()
+
+        if headers.get("Content-Type") != "text/event-plain":
+            continue
+        header_block, _, event_body = body.partition("\n\n")
+        event_headers: dict[str, str] = {}
+        for line in header_block.split("\n"):
+            key, sep, value = line.partition(":")
+            if sep:
+                event_headers[key.strip()] = unquote(value.strip())
+        for field in HANDLER_FIELDS:
+            event_headers.get(field, "")
+        events += 1
+
+
+async def incremental_parse(reader: asyncio.StreamReader) -> int:
+    """EslParser over socket-sized reads with lazy headers (current client)."""
+    parser = EslParser()
+    events = 0
+    while True:
+        chunk = await reader.read(READ_SIZE)
+        if not chunk:
+            return events
+        for frame in parser.feed(chunk):
+            if frame.content_type != "text/event-plain":
+                continue
+            headers, body = frame.event_parts()
+            event = FreeSwitchEvent(headers=headers, body=body.strip())
+            for field in HANDLER_FIELDS:
+                event.headers.get(field, "")
+            events += 1
+
+
+def bench_parse(capture: bytes, rounds: int) -> list[ParseResult]:
+    """Events per second for each parser over an in-memory stream."""
+    results = []
+    for name, parse in (("legacy readline + dict", legacy_parse),
+                        ("incremental + lazy headers", incremental_parse)):
+
+        async def run() -> int:
+            reader = asyncio.StreamReader(limit=2**20)
+            reader.feed_data(capture)
+            reader.feed_eof()
+            return await parse(reader)
+
+        best = float("inf")
+        events = 0
+        for _ in range(rounds):
+            start = time.perf_counter()
+            events = asyncio.run(run())
+            best = min(best, time.perf_counter() - start)
+        results.append(ParseResult(name, events, len(capture) / 1e6, best))
+    return results
+
+
+# =============================================================================
+# Dispatch benchmark
+# =============================================================================
+
+
+async def _serve_capture(capture: bytes, reader: asyncio.StreamReader,
+                         writer: asyncio.StreamWriter) -> None:
+    writer.write(b"Content-Type: auth/request\n\n")
+    for _ in range(2):  # auth, event plain all
+        await reader.readuntil(b"\n\n")
+        writer.write(b"Content-Type: command/reply\nReply-Text: +OK accepted\n\n")
+    writer.write(capture)
+    await writer.drain()
+    try:
+        await reader.read()
+    except ConnectionError:
+        pass
+
+
+async def replay(capture: bytes, slow_ms: float, serial: bool) -> DispatchResult:
+    """Replay the capture into FreeSwitchClient with one slow channel."""
+    server = await asyncio.start_server(
+        lambda r, w: _serve_capture(capture, r, w), "127.0.0.1", 0
+    )
+    port = server.sockets[0].getsockname()[1]
+
+    # Expected events per channel (BACKGROUND_JOB has no channel)
+    expected: dict[str, int] = {}
+    for frame in EslParser().feed(capture):
+        if frame.content_type == "text/event-plain":
+            channel = frame.event_parts()[0].get("Unique-ID", "")
+            expected[channel] = expected.get(channel, 0) + 1
+    slow = next(channel for channel in expected if channel)
+    others = sum(count for channel, count in expected.items() if channel != slow)
+
+    handled = {"slow": 0, "other": 0}
+    other_done = asyncio.Event()
+    all_done = asyncio.Event()
+
+    client = FreeSwitchClient(FreeSwitchConfig(port=port, reconnect=False))
+
+    @client.on_all_events
+    async def handle(event: FreeSwitchEvent) -> None:
+        if event.channel_uuid == slow:
+            await asyncio.sleep(slow_ms / 1000)
+            handled["slow"] += 1
+        else:
+            handled["other"] += 1
+            if handled["other"] == others:
+                other_done.set()
+        if handled["slow"] + handled["other"] == others + expected[slow]:
+            all_done.set()
+
+    if serial:
+        # Previous behaviour: one queue for all channels
+        submit = client._dispatcher.submit
+        client._dispatcher.submit = lambda key, event: submit("", event)
+
+    start = time.perf_counter()
+    await client.connect()
+    await other_done.wait()
+    other_seconds = time.perf_counter() - start
+    await all_done.wait()
+    all_seconds = time.perf_counter() - start
+
+    await client.disconnect()
+    server.close()
+    await server.wait_closed()
+    return DispatchResult(
+        name="serial dispatch" if serial else "per-channel dispatch",
+        events=others + expected[slow],
+        slow_events=expected[slow],
+        other_done_seconds=other_seconds,
+        all_done_seconds=all_seconds,
+    )
+
+
+def bench_dispatch(capture: bytes, slow_ms: float) -> list[DispatchResult]:
+    """Compare serial and per-channel dispatch over TCP."""
+    return [asyncio.run(replay(capture, slow_ms, serial)) for serial in (True, False)]
+
+
+def print_results(parse: list[ParseResult], dispatch: list[DispatchResult],
+                  slow_ms: float) -> None:
+    """Print formatted benchmark results."""
+    print("\n" + "=" * 78)
+    print("ESL BENCHMARK RESULTS")
+    print("=" * 78)
+    if parse:
+        print(f"\nparse - {parse[0].events} events, {parse[0].megabytes:.1f} MB")
+        print(f"  {'Implementation':<36} {'Seconds':>10} {'Events/s':>14}")
+        for p in parse:
+            print(f"  {p.name:<36} {p.seconds:>10.3f} {p.events_per_second:>14,.0f}")
+    if dispatch:
+        print(f"\ndispatch - {dispatch[0].events} events, one channel "
+              f"({dispatch[0].slow_events} events) handled in {slow_ms:g} ms each")
+        print(f"  {'Implementation':<36} {'Others done s':>14} {'All done s':>12}")
+        for d in dispatch:
+            print(f"  {d.name:<36} {d.other_done_seconds:>14.3f} "
+                  f"{d.all_done_seconds:>12.3f}")
+    print("=" * 78)
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="FreeSWITCH ESL parse/dispatch benchmark"
+    )
+    parser.add_argument(
+        "--channels",
+        type=int,
+        default=200,
+        help="Concurrent calls in the synthesized capture (default: 200)",
+    )
+    parser.add_argument(
+        "--events",
+        type=int,
+        default=50,
+        help="Events per call in the synthesized capture (default: 50)",
+    )
+    parser.add_argument(
+        "--capture",
+        type=Path,
+        help="Replay this ESL capture instead of synthesizing one",
+    )
+    parser.add_argument(
+        "--record",
+        type=Path,
+        help="Write the synthesized capture to this file and exit",
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=3,
+        help="Parse rounds; the best is reported (default: 3)",
+    )
+    parser.add_argument(
+        "--slow-channel-ms",
+        type=float,
+        default=20.0,
+        help="Handler time per event of the slow channel (default: 20)",
+    )
+    parser.add_argument(
+        "--suite",
+        choices=["all", "parse", "dispatch"],
+        default="all",
+        help="Benchmark suite to run (default: all)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print machine-readable JSON instead of a table",
+    )
+    args = parser.parse_args()
+
+    if args.capture:
+        capture = args.capture.read_bytes()
+    else:
+        capture = synthesize_capture(args.channels, args.events)
+    if args.record:
+        args.record.write_bytes(capture)
+        print(f"Wrote {len(capture) / 1e6:.1f} MB to {args.record}")
+        return
+
+    parse = bench_parse(capture, args.rounds) if args.suite in ("all", "parse") else []
+    dispatch = (
+        bench_dispatch(capture, args.slow_channel_ms)
+        if args.suite in ("all", "dispatch") else []
+    )
+
+    if args.json:
+        print(json.dumps({
+            "parse": [r.to_dict() for r in parse],
+            "dispatch": [r.to_dict() for r in dispatch],
+        }, indent=2))
+    else:
+        print_results(parse, dispatch, args.slow_channel_ms)
+
+
+if __name__ == "__main__":
+    main()
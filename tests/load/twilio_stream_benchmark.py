@@ -0,0 +1,363 @@
+"""Twilio Media Streams handler benchmark: streams per core.
+
+Replays Twilio media messages (base64 μ-law JSON, one per 20 ms) for
+many concurrent streams and measures the CPU cost per second of call
+audio in each direction:
+
+- inbound: JSON parse, base64 and μ-law decode, 8 -> 16 kHz resampling
+  and the audio callback. The previous handler did all of it per
+  20 ms message with an FFT resampler; the current one uses one
+  streaming resampler per stream and calls back per window.
+- outbound: 16 -> 8 kHz resampling, μ-law encode and the media events.
+  The previous handler built a resampler per response and sent the
+  whole response as one event; the current one sends paced 20 ms
+  events followed by a mark.
+
+The current handler is measured with orjson (when installed) and with
+the standard library json module. Streams per core is 1000 divided by
+the CPU milliseconds per second of call audio, both directions.
+
+Run with:
+    python tests/load/twilio_stream_benchmark.py --streams 100 --seconds 10
+    python tests/load/twilio_stream_benchmark.py --window-ms 200 --json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from itf_shared import setup_logging
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from phone_agent.telephony import websocket_audio  # noqa: E402
+from phone_agent.telephony.codecs import AudioResampler, MuLawCodec  # noqa: E402
+from phone_agent.telephony.websocket_audio import (  # noqa: E402
+    TwilioMediaStreamHandler,
+    TwilioStreamConfig,
+)
+
+RESPONSE_SECONDS = 2.0  # Length of one synthesized response
+
+
+@dataclass
+class StreamResult:
+    """CPU cost of one implementation and direction."""
+    name: str
+    direction: str
+    streams: int
+    audio_seconds: float  # Call audio over all streams
+    cpu_seconds: float
+    messages: int  # WebSocket messages received or sent
+
+    @property
+    def cpu_ms_per_audio_second(self) -> float:
+        """CPU milliseconds per second of call audio."""
+        return self.cpu_seconds * 1000 / self.audio_seconds
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["cpu_ms_per_audio_second"] = round(self.cpu_ms_per_audio_second, 4)
+        return data
+
+
+# =============================================================================
+# Messages
+# =============================================================================
+
+
+def caller_audio(seconds: float, seed: int) -> np.ndarray:
+    """Speech-like 8 kHz PCM: voiced harmonics with pauses and noise."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * 8000)) / 8000
+    f0 = 110 + 40 * np.sin(2 * np.pi * 0.7 * t)
+    voiced = sum(np.sin(2 * np.pi * k * np.cumsum(f0) / 8000) / k for k in range(1, 6))
+    envelope = (np.sin(2 * np.pi * 0.4 * t) > -0.3).astype(np.float64)
+    audio = 6000 * voiced * envelope + rng.normal(0, 200, len(t))
+    return np.clip(audio, -32768, 32767).astype(np.int16)
+
+
+def media_messages(stream_sid: str, seconds: float, seed: int) -> list[str]:
+    """JSON texts Twilio sends for one stream: start, media, stop."""
+    mulaw = MuLawCodec().encode(caller_audio(seconds, seed))
+    media_format = {"encoding": "audio/x-mulaw", "sampleRate": 8000, "channels": 1}
+    messages = [json.dumps({
+        "event": "start",
+        "sequenceNumber": "1",
+        "streamSid": stream_sid,
+        "start": {
+            "streamSid": stream_sid,
+            "callSid": f"CA{seed:032d}",
+            "tracks": ["inbound"],
+            "mediaFormat": media_format,
+        },
+    })]
+    for chunk, offset in enumerate(range(0, len(mulaw), 160), start=1):
+        messages.append(json.dumps({
+            "event": "media",
+            "sequenceNumber": str(chunk + 1),
+            "streamSid": stream_sid,
+            "media": {
+                "track": "inbound",
+                "chunk": str(chunk),
+                "timestamp": str(chunk * 20),
+                "payload": base64.b64encode(mulaw[offset:offset + 160]).decode(),
+            },
+        }))
+    messages.append(json.dumps({"event": "stop", "streamSid": stream_sid}))
+    return messages
+
+
+class ReplaySocket:
+    """WebSocket stand-in replaying recorded texts and counting sends."""
+
+    def __init__(self, messages: list[str] | None = None) -> None:
+        self._messages = iter(messages or [])
+        self.sent = 0
+
+    async def receive_text(self) -> str:
+        return next(self._messages)
+
+    async def receive_json(self) -> Any:
+        return json.loads(next(self._messages))
+
+    async def send_text(self, text: str) -> None:
+        self.sent += 1
+
+    async def send_json(self, data: Any) -> None:
+        json.dumps(data)  # What starlette does before sending
+        self.sent += 1
+
+    async def close(self) -> None:
+        pass
+
+
+# =============================================================================
+# Legacy handler (per-message decode, FFT resampling, one-shot sends)
+# =============================================================================
+
+
+class LegacyTwilioHandler:
+    """The handler before per-stream state, for comparison."""
+
+    def __init__(self) -> None:
+        self._codec = MuLawCodec()
+        self._resampler = AudioResampler(8000, 16000)
+        self._audio_callback: Callable[[str, np.ndarray], Any] | None = None
+
+    async def serve(self, websocket: ReplaySocket) -> None:
+        stream_sid = None
+        while True:
+            message = await websocket.receive_json()
+            event = message.get("event")
+            if event == "start":
+                stream_sid = message.get("streamSid")
+            elif event == "media":
+                if stream_sid:
+                    await self._handle_media(stream_sid, message)
+            elif event == "stop":
+                break
+
+    async def _handle_media(self, stream_sid: str, message: dict) -> None:
+        payload = message.get("media", {}).get("payload", "")
+        pcm = self._codec.decode(base64.b64decode(payload))
+        audio = self._resampler.resample(pcm).astype(np.float32) / 32768.0
+        if self._audio_callback:
+            self._audio_callback(stream_sid, audio)
+
+    async def send_audio(self, websocket: ReplaySocket, stream_sid: str,
+                         audio: np.ndarray) -> None:
+        resampler = AudioResampler(16000, 8000)
+        audio_8k = resampler.resample((audio * 32767).astype(np.int16))
+        payload = base64.b64encode(self._codec.encode(audio_8k)).decode("utf-8")
+        await websocket.send_json(
+            {"event": "media", "streamSid": stream_sid, "media": {"payload": payload}}
+        )
+
+    def on_audio(self, callback: Callable[[str, np.ndarray], Any]) -> None:
+        self._audio_callback = callback
+
+
+# =============================================================================
+# Benchmarks
+# =============================================================================
+
+
+def _implementations(window_ms: int) -> list[tuple[str, Callable[[], Any], Callable]]:
+    """(name, handler factory, json loads) per implementation."""
+    def current() -> TwilioMediaStreamHandler:
+        return TwilioMediaStreamHandler(TwilioStreamConfig(window_ms=window_ms))
+
+    fast_loads = websocket_audio._json_loads
+    implementations: list[tuple[str, Callable[[], Any], Callable]] = [
+        ("legacy per-message FFT", LegacyTwilioHandler, json.loads),
+    ]
+    if fast_loads is not json.loads:
+        implementations.append(
+            (f"windowed {window_ms} ms + orjson", current, fast_loads)
+        )
+    implementations.append((f"windowed {window_ms} ms + json", current, json.loads))
+    return implementations
+
+
+def bench_inbound(streams: int, seconds: float, window_ms: int) -> list[StreamResult]:
+    """CPU per second of caller audio for each implementation."""
+    recorded = [media_messages(f"MZ{i:032d}", seconds, i) for i in range(streams)]
+    results = []
+    original_loads = websocket_audio._json_loads
+    for name, factory, loads in _implementations(window_ms):
+
+        async def run() -> int:
+            handler = factory()
+            handler.on_audio(lambda stream_sid, audio: None)
+            for messages in recorded:
+                await handler.serve(ReplaySocket(messages))
+            return sum(len(m) for m in recorded)
+
+        websocket_audio._json_loads = loads
+        try:
+            start = time.process_time()
+            messages = asyncio.run(run())
+            cpu = time.process_time() - start
+        finally:
+            websocket_audio._json_loads = original_loads
+        results.append(
+            StreamResult(name, "inbound", streams, streams * seconds, cpu, messages)
+        )
+    return results
+
+
+def bench_outbound(streams: int, seconds: float, window_ms: int) -> list[StreamResult]:
+    """CPU per second of response audio; all streams play concurrently.
+
+    The current handler paces its events in real time, so this suite
+    takes about ``seconds`` of wall time and includes the timer wakeups.
+    """
+    t = np.arange(int(RESPONSE_SECONDS * 16000)) / 16000
+    response = (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+    responses = max(1, round(seconds / RESPONSE_SECONDS))
+    results = []
+    for name, factory, _ in _implementations(window_ms)[:2]:
+
+        async def run() -> int:
+            sockets = [ReplaySocket() for _ in range(streams)]
+            handler = factory()
+            for i, socket in enumerate(sockets):
+                for _ in range(responses):
+                    await handler.send_audio(socket, f"MZ{i:032d}", response)
+            if isinstance(handler, TwilioMediaStreamHandler):
+                playing = [handler.get_stream(f"MZ{i:032d}") for i in range(streams)]
+                await asyncio.gather(*(stream.playout.wait() for stream in playing))
+                await asyncio.gather(*(stream.close() for stream in playing))
+            return sum(socket.sent for socket in sockets)
+
+        start = time.process_time()
+        messages = asyncio.run(run())
+        cpu = time.process_time() - start
+        audio_seconds = streams * responses * RESPONSE_SECONDS
+        results.append(StreamResult(
+            name.replace(f"windowed {window_ms} ms", "paced 20 ms events"),
+            "outbound", streams, audio_seconds, cpu, messages,
+        ))
+    return results
+
+
+def streams_per_core(results: list[StreamResult]) -> dict[str, float]:
+    """Streams one core sustains, inbound plus outbound, per implementation."""
+    inbound = [r for r in results if r.direction == "inbound"]
+    outbound = [r for r in results if r.direction == "outbound"]
+    totals = {}
+    for index, result in enumerate(inbound[:len(outbound)]):
+        cost = result.cpu_ms_per_audio_second + outbound[index].cpu_ms_per_audio_second
+        totals[result.name] = 1000 / cost if cost > 0 else float("inf")
+    return totals
+
+
+def print_results(results: list[StreamResult]) -> None:
+    """Print formatted benchmark results."""
+    print("\n" + "=" * 78)
+    print("TWILIO MEDIA STREAMS BENCHMARK RESULTS")
+    print("=" * 78)
+    for direction in ("inbound", "outbound"):
+        rows = [r for r in results if r.direction == direction]
+        if not rows:
+            continue
+        print(f"\n{direction} - {rows[0].streams} streams, "
+              f"{rows[0].audio_seconds:g} s of call audio")
+        print(f"  {'Implementation':<36} {'CPU ms/audio s':>15} {'Messages':>12}")
+        for r in rows:
+            print(f"  {r.name:<36} {r.cpu_ms_per_audio_second:>15.3f} "
+                  f"{r.messages:>12,}")
+    totals = streams_per_core(results)
+    if totals:
+        print("\nstreams per core (inbound + outbound)")
+        for name, streams in totals.items():
+            print(f"  {name:<36} {streams:>15,.0f}")
+    print("=" * 78)
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Twilio Media Streams handler benchmark"
+    )
+    parser.add_argument(
+        "--streams",
+        type=int,
+        default=100,
+        help="Concurrent streams (default: 100)",
+    )
+    parser.add_argument(
+        "--seconds",
+        type=float,
+        default=10.0,
+        help="Call audio per stream and direction (default: 10)",
+    )
+    parser.add_argument(
+        "--window-ms",
+        type=int,
+        default=100,
+        help="Receive window of the current handler (default: 100)",
+    )
+    parser.add_argument(
+        "--suite",
+        choices=["all", "inbound", "outbound"],
+        default="all",
+        help="Benchmark suite to run (default: all)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print machine-readable JSON instead of a table",
+    )
+    args = parser.parse_args()
+    setup_logging(level="WARNING")  # No per-stream start/stop lines
+
+    results: list[StreamResult] = []
+    if args.suite in ("all", "inbound"):
+        results += bench_inbound(args.streams, args.seconds, args.window_ms)
+    if args.suite in ("all", "outbound"):
+        results += bench_outbound(args.streams, args.seconds, args.window_ms)
+
+    if args.json:
+        per_core = {k: round(v) for k, v in streams_per_core(results).items()}
+        print(json.dumps({
+            "results": [r.to_dict() for r in results],
+            "streams_per_core": per_core,
+        }, indent=2))
+    else:
+        print_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""Voice activity detection benchmark: calls per core at 32 ms frames.
+
+Feeds every call one 512-sample (32 ms at 16 kHz) window per tick, the
+way the audio bridge does under load, and measures the CPU time needed
+per second of call audio for:
+
+- torch SileroVAD, one model per call (previous setup)
+- ONNX Silero, one forward pass per call and window
+- ONNX Silero through VADService, one batched pass for all calls
+
+Run with:
+    python tests/load/vad_benchmark.py --calls 50 --seconds 10
+    python tests/load/vad_benchmark.py --model-path models/vad/silero_vad.onnx --json
+
+Requirements:
+    pip install numpy onnxruntime   # ONNX backends
+    pip install torch               # torch baseline (optional)
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+import json
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from phone_agent.ai.vad_service import (  # noqa: E402
+    SILERO_SAMPLE_RATE,
+    SILERO_WINDOW,
+    OnnxSileroBackend,
+    VADService,
+    VADServiceConfig,
+)
+
+FRAME_SECONDS = SILERO_WINDOW / SILERO_SAMPLE_RATE
+
+
+@dataclass
+class BenchmarkResult:
+    """CPU cost of one VAD setup."""
+    name: str
+    calls: int
+    audio_seconds: float
+    cpu_seconds: float
+    extra: dict = field(default_factory=dict)
+
+    @property
+    def cpu_ms_per_audio_second(self) -> float:
+        """CPU milliseconds needed per second of call audio."""
+        return self.cpu_seconds / self.audio_seconds * 1000
+
+    @property
+    def calls_per_core(self) -> float:
+        """Calls one core could sustain for VAD alone."""
+        if self.cpu_seconds <= 0:
+            return float("inf")
+        return self.audio_seconds / self.cpu_seconds
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["cpu_ms_per_audio_second"] = round(self.cpu_ms_per_audio_second, 3)
+        data["calls_per_core"] = round(self.calls_per_core, 1)
+        return data
+
+
+def make_call_audio(calls: int, seconds: float) -> list[np.ndarray]:
+    """Generate 16 kHz float32 audio alternating speech-like bursts and silence."""
+    rng = np.random.default_rng(42)
+    rate = SILERO_SAMPLE_RATE
+    t = np.arange(int(seconds * rate)) / rate
+    audio = []
+    for _ in range(calls):
+        f0 = rng.uniform(90, 220)
+        signal = sum(np.sin(2 * np.pi * f0 * k * t) / k for k in range(1, 8))
+        gate = (np.sin(2 * np.pi * rng.uniform(0.2, 0.5) * t) > 0).astype(np.float64)
+        signal = signal * gate + rng.standard_normal(len(t)) * 0.01
+        audio.append((signal / np.abs(signal).max() * 0.4).astype(np.float32))
+    return audio
+
+
+def frames_of(audio: list[np.ndarray]) -> int:
+    return len(audio[0]) // SILERO_WINDOW
+
+
+def run_per_call(
+    name: str,
+    audio: list[np.ndarray],
+    make_vad: Callable[[], Callable[[np.ndarray], object]],
+) -> BenchmarkResult:
+    """Classify each call's window in turn, one model call per window."""
+    vads = [make_vad() for _ in audio]
+    frames = frames_of(audio)
+
+    start = time.process_time()
+    for i in range(frames):
+        offset = i * SILERO_WINDOW
+        for classify, samples in zip(vads, audio):
+            classify(samples[offset:offset + SILERO_WINDOW])
+    cpu = time.process_time() - start
+
+    return BenchmarkResult(
+        name=name,
+        calls=len(audio),
+        audio_seconds=len(audio) * frames * FRAME_SECONDS,
+        cpu_seconds=cpu,
+    )
+
+
+def bench_torch(audio: list[np.ndarray], model_path: str) -> BenchmarkResult | None:
+    """Previous setup: a stateful torch SileroVAD per call."""
+    try:
+        import torch  # noqa: F401
+    except ImportError:
+        print("Skipping torch SileroVAD: torch not installed", file=sys.stderr)
+        return None
+    from phone_agent.ai.vad import SileroVAD
+
+    base = SileroVAD()
+    base.load()
+
+    def make_vad():
+        vad = SileroVAD()
+        vad._model = copy.deepcopy(base._model)  # Separate LSTM state per call
+        vad._loaded = True
+        return vad.is_speech
+
+    return run_per_call("torch SileroVAD (per call)", audio, make_vad)
+
+
+def bench_onnx_unbatched(
+    audio: list[np.ndarray], model_path: str
+) -> BenchmarkResult | None:
+    """ONNX model, one forward pass per call and window."""
+    backend = load_backend(model_path)
+    if backend is None:
+        return None
+    service = VADService(backend)
+    result = run_per_call(
+        "ONNX Silero (batch 1)", audio, lambda: service.open_stream().is_speech
+    )
+    service.shutdown()
+    return result
+
+
+def bench_onnx_batched(
+    audio: list[np.ndarray], model_path: str
+) -> BenchmarkResult | None:
+    """ONNX model through VADService, all calls in one pass per tick."""
+    backend = load_backend(model_path)
+    if backend is None:
+        return None
+    service = VADService(backend, VADServiceConfig(batch_wait_ms=0.0))
+    streams = [service.open_stream() for _ in audio]
+    frames = frames_of(audio)
+
+    async def run() -> None:
+        for i in range(frames):
+            offset = i * SILERO_WINDOW
+            await asyncio.gather(*(
+                stream.probabilities(samples[offset:offset + SILERO_WINDOW])
+                for stream, samples in zip(streams, audio)
+            ))
+
+    start = time.process_time()
+    asyncio.run(run())
+    cpu = time.process_time() - start
+    service.shutdown()
+
+    return BenchmarkResult(
+        name="ONNX Silero via VADService (batched)",
+        calls=len(audio),
+        audio_seconds=len(audio) * frames * FRAME_SECONDS,
+        cpu_seconds=cpu,
+        extra=service.statistics,
+    )
+
+
+def load_backend(model_path: str) -> OnnxSileroBackend | None:
+    try:
+        return OnnxSileroBackend(model_path)
+    except (ImportError, FileNotFoundError) as e:
+        print(f"Skipping ONNX backend: {e}", file=sys.stderr)
+        return None
+
+
+BENCHMARKS = [bench_torch, bench_onnx_unbatched, bench_onnx_batched]
+
+
+def print_results(results: list[BenchmarkResult]) -> None:
+    """Print formatted benchmark results."""
+    print("\n" + "=" * 78)
+    print("VAD BENCHMARK RESULTS (32 ms frames)")
+    print("=" * 78)
+    if not results:
+        print("No backend available (install onnxruntime and/or torch)")
+    else:
+        first = results[0]
+        print(
+            f"{first.calls} calls, {first.audio_seconds / first.calls:.0f}s audio each"
+        )
+        print(f"  {'Setup':<40} {'CPU ms/audio s':>15} {'Calls/core':>12}")
+        for result in results:
+            print(
+                f"  {result.name:<40} {result.cpu_ms_per_audio_second:>15.3f} "
+                f"{result.calls_per_core:>12.0f}"
+            )
+            if result.extra:
+                print(f"    batches: {result.extra}")
+    print("=" * 78)
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Voice activity detection benchmark")
+    parser.add_argument(
+        "-c", "--calls",
+        type=int,
+        default=50,
+        help="Number of concurrent calls (default: 50)",
+    )
+    parser.add_argument(
+        "-s", "--seconds",
+        type=float,
+        default=10.0,
+        help="Seconds of audio per call (default: 10)",
+    )
+    parser.add_argument(
+        "--model-path",
+        default=VADServiceConfig.model_path,
+        help=f"Silero VAD ONNX model (default: {VADServiceConfig.model_path})",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print machine-readable JSON instead of a table",
+    )
+    args = parser.parse_args()
+
+    audio = make_call_audio(args.calls, args.seconds)
+    results = [
+        result
+        for bench in BENCHMARKS
+        if (result := bench(audio, args.model_path)) is not None
+    ]
+
+    if args.json:
+        print(json.dumps([r.to_dict() for r in results], indent=2))
+    else:
+        print_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,372 @@
+"""Tests for the call handler's per-call registry and admission control."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import numpy as np
+import pytest
+
+from phone_agent.core import CallCapacityError, CallHandler, CallState
+from phone_agent.core.exceptions import CallNotFoundError
+
+
+class FakeConversationEngine:
+    """Conversation engine stand-in that echoes the conversation ID."""
+
+    def __init__(self):
+        self.ended = []
+
+    def start_conversation(self):
+        return SimpleNamespace(id=uuid4())
+
+    def end_conversation(self, conversation_id):
+        self.ended.append(conversation_id)
+
+    async def generate_greeting(self, conversation_id):
+        return "Guten Tag", b"greeting"
+
+    async def process_audio(self, audio, conversation_id):
+        await asyncio.sleep(0.01)
+        return f"reply {conversation_id}", b"response"
+
+
+def make_handler(max_calls=2):
+    """Create a handler whose calls play audio into a list."""
+    handler = CallHandler(
+        conversation_engine=FakeConversationEngine(),
+        max_concurrent_calls=max_calls,
+        audio_pipeline_factory=lambda call: None,
+    )
+    played = []
+
+    async def play(call, audio):
+        played.append((call.call_id, audio))
+
+    handler.on_play_audio(play)
+    return handler, played
+
+
+def make_bridged_service(config):
+    """Telephony service whose bridge records audio instead of playing it."""
+    from phone_agent.telephony.service import TelephonyService
+
+    service = TelephonyService(config)
+    service.call_handler.conversation_engine = FakeConversationEngine()
+    service.audio_bridge.on_connection(service._on_audio_connection)
+    service.audio_bridge.on_disconnection(service._on_audio_disconnection)
+    sent = []
+
+    async def send_audio(connection_id, audio):
+        sent.append((connection_id, audio))
+        return True
+
+    async def wait_for_playout(connection_id):
+        return None
+
+    service.audio_bridge.send_audio = send_audio
+    service.audio_bridge.wait_for_playout = wait_for_playout
+    return service, sent
+
+
+@asynccontextmanager
+async def bridge_server(service):
+    """Serve the service's audio bridge on a free local port."""
+    server = await asyncio.start_server(
+        service.audio_bridge._handle_connection, "127.0.0.1", 0
+    )
+    try:
+        yield server.sockets[0].getsockname()[1]
+    finally:
+        server.close()
+        await service.audio_bridge.stop()
+        await server.wait_closed()
+
+
+async def connect_channel(port, channel_id):
+    """Open an audio socket and answer the bridge's connect for a channel."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    assert await reader.readuntil(b"\n\n") == b"connect\n\n"
+    reply = f"Channel-Unique-ID: {channel_id}\n" if channel_id else ""
+    writer.write(f"Content-Type: command/reply\n{reply}\n".encode())
+    await writer.drain()
+    return reader, writer
+
+
+async def bound_connections(service, *calls):
+    """Bridge connections of webhook calls, once all of them are bound."""
+    call_ids = [UUID(call["internal_call_id"]) for call in calls]
+    for _ in range(100):
+        if all(call_id in service._call_connections for call_id in call_ids):
+            break
+        await asyncio.sleep(0.01)
+    return [service._call_connections[call_id] for call_id in call_ids]
+
+
+async def start_call(handler, caller_id):
+    call = await handler.handle_incoming_call(caller_id=caller_id)
+    await handler.answer_call(call.call_id)
+    return call
+
+
+class TestCallRegistry:
+    """Test concurrent calls with independent state."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_are_isolated(self):
+        """Each call gets its own conversation and state machine."""
+        handler, played = make_handler()
+        first = await start_call(handler, "+491111")
+        second = await start_call(handler, "+492222")
+
+        assert handler.active_call_count == 2
+        assert first.conversation.id != second.conversation.id
+        assert first.state == second.state == CallState.LISTENING
+        assert [p[0] for p in played] == [first.call_id, second.call_id]
+
+        audio = np.zeros(1600, dtype=np.float32)
+        replies = await asyncio.gather(
+            handler.handle_utterance(first.call_id, audio),
+            handler.handle_utterance(second.call_id, audio),
+        )
+        assert replies == [
+            f"reply {first.conversation.id}",
+            f"reply {second.conversation.id}",
+        ]
+        assert first.state == second.state == CallState.LISTENING
+
+    @pytest.mark.asyncio
+    async def test_hangup_ends_only_that_call(self):
+        """Hanging up one call leaves the other running."""
+        handler, _ = make_handler()
+        first = await start_call(handler, "+491111")
+        second = await start_call(handler, "+492222")
+
+        ended = await handler.hangup(first.call_id)
+
+        assert ended is first
+        assert first.state == CallState.ENDED
+        assert second.state == CallState.LISTENING
+        assert handler.get_call(first.call_id) is None
+        assert handler.current_call is second
+        assert handler.active_calls == [second]
+
+    @pytest.mark.asyncio
+    async def test_unknown_call_raises(self):
+        """Utterances for unknown calls are rejected."""
+        handler, _ = make_handler()
+
+        with pytest.raises(CallNotFoundError):
+            await handler.handle_utterance(uuid4(), np.zeros(160, dtype=np.float32))
+        assert await handler.hangup(uuid4()) is None
+
+
+class TestAdmissionControl:
+    """Test max concurrent calls."""
+
+    @pytest.mark.asyncio
+    async def test_rejects_call_over_capacity(self):
+        """A call beyond the limit is refused until a slot frees up."""
+        handler, _ = make_handler(max_calls=1)
+        first = await start_call(handler, "+491111")
+        assert not handler.can_accept_call
+
+        with pytest.raises(CallCapacityError) as exc_info:
+            await handler.handle_incoming_call(caller_id="+492222")
+        assert exc_info.value.status_code == 503
+        assert handler.active_call_count == 1
+
+        await handler.hangup(first.call_id)
+        assert handler.can_accept_call
+        second = await handler.handle_incoming_call(caller_id="+492222")
+        assert second.state == CallState.RINGING
+
+
+class TestServiceRouting:
+    """Test TelephonyService pairing bridge connections with calls."""
+
+    @pytest.mark.asyncio
+    async def test_connections_route_to_their_calls(self):
+        """Each bridge connection drives its own call; over capacity is rejected."""
+        from phone_agent.telephony.service import TelephonyServiceConfig
+
+        service, sent = make_bridged_service(
+            TelephonyServiceConfig(max_concurrent_calls=2)
+        )
+
+        first = await service.handle_webhook_incoming("ext-1", "+491111", "+49800")
+        second = await service.handle_webhook_incoming("ext-2", "+492222", "+49800")
+        third = await service.handle_webhook_incoming("ext-3", "+493333", "+49800")
+        assert third["action"] == "reject"
+
+        async with bridge_server(service) as port:
+            _, writer_a = await connect_channel(port, "ext-1")
+            _, writer_b = await connect_channel(port, "ext-2")
+            conn_a, conn_b = await bound_connections(service, first, second)
+            # Greetings held until each call's connection arrived
+            assert sorted(sent) == sorted(
+                [(conn_a, b"greeting"), (conn_b, b"greeting")]
+            )
+
+            await service._on_audio_received(conn_b, np.zeros(1600, dtype=np.float32))
+            assert sent[-1] == (conn_b, b"response")
+
+            await service._on_audio_disconnection(conn_a)
+            handler = service.call_handler
+            assert handler.get_call(UUID(first["internal_call_id"])) is None
+            assert (
+                handler.get_call(UUID(second["internal_call_id"])).state
+                == CallState.LISTENING
+            )
+            writer_a.close()
+            writer_b.close()
+
+    @pytest.mark.asyncio
+    async def test_connections_bind_by_channel_not_order(self):
+        """Sockets connecting in reverse call order still reach their own calls."""
+        from phone_agent.telephony.service import TelephonyServiceConfig
+
+        service, sent = make_bridged_service(
+            TelephonyServiceConfig(max_concurrent_calls=2)
+        )
+        first = await service.handle_webhook_incoming("chan-1", "+491111", "+49800")
+        second = await service.handle_webhook_incoming("chan-2", "+492222", "+49800")
+
+        async with bridge_server(service) as port:
+            _, writer_b = await connect_channel(port, "chan-2")
+            await bound_connections(service, second)
+            _, writer_a = await connect_channel(port, "chan-1")
+            conn_a, conn_b = await bound_connections(service, first, second)
+
+            bridge = service.audio_bridge
+            assert bridge.get_connection(conn_a).channel_id == "chan-1"
+            assert bridge.get_connection(conn_b).channel_id == "chan-2"
+            assert service._awaiting_audio == {}
+            assert sent == [(conn_b, b"greeting"), (conn_a, b"greeting")]
+            writer_a.close()
+            writer_b.close()
+
+    @pytest.mark.asyncio
+    async def test_websocket_trunk_call_never_takes_a_socket(self):
+        """A pending Twilio call is not queued; unmatched sockets are closed."""
+        from phone_agent.telephony.service import TelephonyServiceConfig
+
+        service, sent = make_bridged_service(
+            TelephonyServiceConfig(max_concurrent_calls=2)
+        )
+        twilio = await service.handle_webhook_incoming(
+            "CA123", "+491111", "+49800", provider="twilio"
+        )
+        assert twilio["action"] == "answer" and "audio_bridge" not in twilio
+        assert service._awaiting_audio == {}
+
+        async with bridge_server(service) as port:
+            # Claims the Twilio call, then names no channel at all
+            for channel in ("CA123", None):
+                reader, writer = await connect_channel(port, channel)
+                assert await asyncio.wait_for(reader.read(), timeout=1.0) == b""
+                writer.close()
+
+            bridged = await service.handle_webhook_incoming(
+                "ext-1", "+492222", "+49800"
+            )
+            _, writer = await connect_channel(port, "ext-1")
+            (conn,) = await bound_connections(service, bridged)
+            assert UUID(twilio["internal_call_id"]) not in service._call_connections
+            assert sent == [(conn, b"greeting")]
+            writer.close()
+
+    @pytest.mark.asyncio
+    async def test_rtp_trunk_uses_media_engine(self):
+        """Calls from an RTP trunk get an RTP session; others the audio socket."""
+        from phone_agent.telephony.service import (
+            TelephonyService,
+            TelephonyServiceConfig,
+        )
+
+        service = TelephonyService(TelephonyServiceConfig(
+            trunk_media={"carrier": "rtp"}, rtp_host="127.0.0.1", rtp_port=0,
+        ))
+        service.call_handler.conversation_engine = FakeConversationEngine()
+        engine = service.rtp_engine
+        sent = []
+
+        async def send_audio(connection_id, audio):
+            sent.append((connection_id, audio))
+            return True
+
+        async def wait_for_playout(connection_id):
+            return None
+
+        engine.send_audio = send_audio
+        engine.wait_for_playout = wait_for_playout
+        await engine.listen()
+
+        direct = await service.handle_webhook_incoming(
+            "ext-1", "+491111", "+49800", provider="carrier",
+            metadata={"rtp_remote_host": "127.0.0.1", "rtp_remote_port": 40000},
+        )
+        bridged = await service.handle_webhook_incoming("ext-2", "+492222", "+49800")
+
+        assert direct["rtp"]["port"] == engine.port
+        assert "audio_bridge" in bridged and "rtp" not in bridged
+        (session_id,) = engine._streams
+        assert engine.session_info(session_id)["remote"] == ["127.0.0.1", 40000]
+        # Signalled address: the greeting goes to the session once bound
+        assert sent == []
+        await asyncio.sleep(0.01)
+        assert sent == [(session_id, b"greeting")]
+
+        await service.handle_webhook_hangup("ext-1")
+        assert engine.active_sessions == 0
+        await engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_rtp_greeting_waits_for_media(self):
+        """Without a signalled port the greeting plays once the trunk's RTP latches."""
+        from phone_agent.telephony.rtp_config import RTPHeader, RTPPacket
+        from phone_agent.telephony.service import (
+            TelephonyService,
+            TelephonyServiceConfig,
+        )
+
+        service = TelephonyService(TelephonyServiceConfig(
+            trunk_media={"carrier": "rtp"}, rtp_host="127.0.0.1", rtp_port=0,
+        ))
+        service.call_handler.conversation_engine = FakeConversationEngine()
+        engine = service.rtp_engine
+        sent = []
+
+        async def send_audio(connection_id, audio):
+            sent.append((connection_id, audio))
+            return True
+
+        engine.send_audio = send_audio
+        await engine.listen()
+
+        response = await service.handle_webhook_incoming(
+            "ext-1", "+491111", "+49800", provider="carrier",
+            metadata={"rtp_remote_host": "127.0.0.1"},
+        )
+        (session_id,) = engine._streams
+        await asyncio.sleep(0.05)
+        assert response["action"] == "answer" and sent == []
+
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(
+            asyncio.DatagramProtocol, local_addr=("127.0.0.1", 0)
+        )
+        header = RTPHeader(2, False, False, 0, False, 8, 0, 0, 555)
+        transport.sendto(
+            RTPPacket(header, bytes(160)).to_bytes(), ("127.0.0.1", engine.port)
+        )
+        await asyncio.sleep(0.05)
+        assert sent == [(session_id, b"greeting")]
+        assert engine.session_info(session_id)["remote"] == list(
+            transport.get_extra_info("sockname")
+        )
+
+        transport.close()
+        await service.handle_webhook_hangup("ext-1")
+        await engine.stop()
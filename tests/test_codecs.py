@@ -0,0 +1,267 @@
+"""Tests for telephony codecs and resampling."""
+
+import numpy as np
+import pytest
+
+from phone_agent.telephony.codecs import (
+    ALawCodec,
+    AudioResampler,
+    CodecPipeline,
+    CodecType,
+    G722Codec,
+    MuLawCodec,
+    StreamingResampler,
+)
+
+RATIOS = [(8000, 16000), (16000, 8000), (22050, 8000), (24000, 8000)]
+
+
+def _noise(n: int, seed: int = 0) -> np.ndarray:
+    """Generate reproducible int16-scale test noise."""
+    rng = np.random.default_rng(seed)
+    return (rng.standard_normal(n) * 3000).astype(np.float32)
+
+
+ALL_PCM = np.arange(65536, dtype=np.uint16).view(np.int16)
+ALL_CODES = bytes(range(256))
+
+
+class TestG711:
+    """Test G.711 table codecs against ITU-T reference values."""
+
+    @pytest.mark.parametrize("pcm,code", [
+        (0, 0xFF), (-1, 0x7F), (32767, 0x80), (-32768, 0x00),
+        (1000, 0xCE), (-1000, 0x4E), (8000, 0xA0), (-8000, 0x20),
+    ])
+    def test_mulaw_encode_reference(self, pcm, code):
+        """μ-law encoding matches ITU-T G.191 ulaw_compress."""
+        assert MuLawCodec().encode(np.array([pcm], dtype=np.int16)) == bytes([code])
+
+    @pytest.mark.parametrize("pcm,code", [
+        (0, 0xD5), (-1, 0x55), (32767, 0xAA), (-32768, 0x2A),
+        (1000, 0xFA), (-1000, 0x7A), (8000, 0x8A), (-8000, 0x0A),
+    ])
+    def test_alaw_encode_reference(self, pcm, code):
+        """A-law encoding matches ITU-T G.191 alaw_compress."""
+        assert ALawCodec().encode(np.array([pcm], dtype=np.int16)) == bytes([code])
+
+    @pytest.mark.parametrize("code,pcm", [
+        (0xFF, 0), (0x80, 32124), (0x00, -32124), (0xCE, 988), (0x4E, -988),
+    ])
+    def test_mulaw_decode_reference(self, code, pcm):
+        """μ-law decoding matches the G.711 expansion table."""
+        assert MuLawCodec().decode(bytes([code]))[0] == pcm
+
+    @pytest.mark.parametrize("code,pcm", [
+        (0xD5, 8), (0x55, -8), (0xAA, 32256), (0x2A, -32256), (0xFA, 1008),
+    ])
+    def test_alaw_decode_reference(self, code, pcm):
+        """A-law decoding matches the G.711 expansion table."""
+        assert ALawCodec().decode(bytes([code]))[0] == pcm
+
+    def test_alaw_round_trip_all_codes(self):
+        """Every A-law code survives decode -> encode."""
+        codec = ALawCodec()
+        assert codec.encode(codec.decode(ALL_CODES)) == ALL_CODES
+
+    def test_mulaw_round_trip_all_codes(self):
+        """Every μ-law code except negative zero survives decode -> encode."""
+        codec = MuLawCodec()
+        encoded = codec.encode(codec.decode(ALL_CODES))
+        mismatches = [i for i in range(256) if encoded[i] != i]
+        assert mismatches == [0x7F]  # -0 encodes as +0 (0xFF)
+
+    @pytest.mark.parametrize("codec_cls", [MuLawCodec, ALawCodec])
+    def test_sign_symmetry(self, codec_cls):
+        """G.191 companding is symmetric under one's complement."""
+        encoded = np.frombuffer(codec_cls().encode(ALL_PCM), dtype=np.uint8)
+        complement = np.frombuffer(codec_cls().encode(~ALL_PCM), dtype=np.uint8)
+        np.testing.assert_array_equal(encoded ^ complement, 0x80)
+
+    @pytest.mark.parametrize("codec_cls", [MuLawCodec, ALawCodec])
+    def test_quantization_error_bounded(self, codec_cls):
+        """Reconstruction error stays within half a quantization step."""
+        codec = codec_cls()
+        decoded = codec.decode(codec.encode(ALL_PCM)).astype(np.int32)
+        error = np.abs(decoded - ALL_PCM.astype(np.int32))
+        # Top segment quantization step is 1024 for both laws
+        assert error.max() <= 1024
+        small = np.abs(ALL_PCM.astype(np.int32)) < 256
+        assert error[small].max() <= 16
+
+    def test_tables_shared(self):
+        """Lookup tables are built once and shared across instances."""
+        assert MuLawCodec()._MULAW_ENCODE_TABLE is MuLawCodec()._MULAW_ENCODE_TABLE
+        assert ALawCodec._ALAW_ENCODE_TABLE.shape == (65536,)
+
+    @pytest.mark.parametrize("codec_cls", [MuLawCodec, ALawCodec])
+    def test_decode_into_buffer(self, codec_cls):
+        """Decoding can write into a caller-provided buffer."""
+        codec = codec_cls()
+        out = np.empty(256, dtype=np.int16)
+        result = codec.decode(ALL_CODES, out=out)
+        assert result is out
+        np.testing.assert_array_equal(out, codec.decode(ALL_CODES))
+
+
+class TestG722:
+    """Test the native SB-ADPCM G.722 codec."""
+
+    TONE = (np.sin(2 * np.pi * 1000 * np.arange(320) / 16000) * 10000).astype(np.int16)
+
+    def test_encode_reference(self):
+        """Encoded 1 kHz tone matches the ITU-T reference implementation."""
+        encoded = G722Codec().encode(self.TONE)
+        assert len(encoded) == 160
+        assert encoded[:24].hex() == "fa92238d2393a0a020b0cac8cedced69ebfad1ced1dfeeea"
+        assert (
+            encoded[100:124].hex() == "d6bf73f1f27e97d5d7bcf3f273fed8d39affb46ff5fa5695"
+        )
+
+    def test_decode_reference(self):
+        """Decoded samples match the ITU-T reference implementation."""
+        decoded = G722Codec().decode(G722Codec().encode(self.TONE))
+        assert len(decoded) == 320
+        assert decoded[200:216].tolist() == [
+            7089, 9083, 9851, 9273, 7215, 3889, -27, -3912,
+            -7224, -9439, -10093, -9148, -6974, -3880, -99, 3831,
+        ]
+
+    def test_chunked_matches_single_pass(self):
+        """Encoder and decoder state carries across odd-sized frames."""
+        audio = _noise(4000, seed=3).astype(np.int16)
+        whole = G722Codec().encode(audio)
+
+        codec = G722Codec()
+        chunked = b"".join(
+            codec.encode(audio[i:i + 321]) for i in range(0, len(audio), 321)
+        )
+        assert chunked == whole
+
+        decoder = G722Codec()
+        parts = [decoder.decode(whole[i:i + 160]) for i in range(0, len(whole), 160)]
+        np.testing.assert_array_equal(np.concatenate(parts), G722Codec().decode(whole))
+
+    def test_round_trip_snr(self):
+        """Wideband speech-range tone survives coding with high SNR."""
+        t = np.arange(16000) / 16000
+        audio = 6000 * np.sin(2 * np.pi * 440 * t) + 2000 * np.sin(2 * np.pi * 5000 * t)
+        audio = audio.astype(np.int16)
+        codec = G722Codec()
+        decoded = codec.decode(codec.encode(audio)).astype(np.float64)
+
+        delay = 22  # QMF analysis + synthesis group delay
+        reference = audio[1000:-delay].astype(np.float64)
+        error = reference - decoded[1000 + delay:]
+        snr = 10 * np.log10(np.sum(reference**2) / np.sum(error**2))
+        assert snr > 25
+
+    def test_reset(self):
+        """Reset restores the initial encoder state."""
+        codec = G722Codec()
+        first = codec.encode(self.TONE)
+        codec.encode(_noise(800).astype(np.int16))
+        codec.reset()
+        assert codec.encode(self.TONE) == first
+
+
+class TestStreamingResampler:
+    """Test the stateful polyphase resampler."""
+
+    @pytest.mark.parametrize("input_rate,output_rate", RATIOS)
+    def test_chunked_matches_single_pass(self, input_rate, output_rate):
+        """Chunk boundaries must not change the output."""
+        audio = _noise(input_rate)
+
+        whole = StreamingResampler(input_rate, output_rate).process(audio)
+
+        resampler = StreamingResampler(input_rate, output_rate)
+        chunks = []
+        for start in range(0, len(audio), 333):
+            chunks.append(resampler.process(audio[start:start + 333]))
+        chunked = np.concatenate(chunks)
+
+        assert len(chunked) == len(whole) == output_rate
+        np.testing.assert_allclose(chunked, whole, atol=1e-3)
+
+    @pytest.mark.parametrize("input_rate,output_rate", RATIOS)
+    def test_block_matches_resample_poly(self, input_rate, output_rate):
+        """One-shot resampling matches scipy's polyphase reference."""
+        signal = pytest.importorskip("scipy.signal")
+        audio = _noise(input_rate // 2)
+        g = np.gcd(input_rate, output_rate)
+
+        expected = signal.resample_poly(
+            audio.astype(np.float64), output_rate // g, input_rate // g
+        )
+        actual = AudioResampler(input_rate, output_rate)._resample_block(audio)
+
+        assert len(actual) == len(expected)
+        np.testing.assert_allclose(actual, expected, atol=0.05)
+
+    def test_telephony_frame_lengths(self):
+        """20 ms frames at 8 kHz become 20 ms frames at 16 kHz."""
+        resampler = StreamingResampler(8000, 16000)
+        for _ in range(10):
+            assert len(resampler.process(np.zeros(160, dtype=np.int16))) == 320
+
+    def test_same_rate_passthrough(self):
+        """Equal rates return the input unchanged."""
+        audio = _noise(160)
+        resampler = StreamingResampler(16000, 16000)
+        assert resampler.passthrough
+        np.testing.assert_array_equal(resampler.process(audio), audio)
+
+    def test_reset_clears_history(self):
+        """After reset the resampler behaves like a fresh instance."""
+        audio = _noise(800)
+        resampler = StreamingResampler(8000, 16000)
+        first = resampler.process(audio)
+        resampler.process(_noise(800, seed=1))
+        resampler.reset()
+        np.testing.assert_array_equal(resampler.process(audio), first)
+
+    def test_streaming_audio_resampler(self):
+        """AudioResampler(streaming=True) returns int16 chunks."""
+        resampler = AudioResampler(8000, 16000, streaming=True)
+        out = resampler.resample(np.zeros(160, dtype=np.int16))
+        assert out.dtype == np.int16
+        assert len(out) == 320
+
+
+class TestCodecPipeline:
+    """Test the telephony <-> AI codec pipeline."""
+
+    def test_decode_for_ai(self):
+        """G.711 frames decode to normalized float32 at 16 kHz."""
+        pipeline = CodecPipeline(CodecType.PCMA)
+        audio = pipeline.decode_for_ai(bytes([0xD5]) * 800)
+
+        assert audio.dtype == np.float32
+        assert len(audio) == 1600
+        assert np.abs(audio).max() <= 1.0
+
+    def test_encode_for_telephony(self):
+        """Float32 audio at 16 kHz encodes to one byte per 8 kHz sample."""
+        pipeline = CodecPipeline(CodecType.PCMU)
+        encoded = pipeline.encode_for_telephony(np.zeros(3200, dtype=np.float32))
+        assert len(encoded) == 1600
+
+    def test_tone_survives_round_trip(self):
+        """A 440 Hz tone keeps its frequency through decode/encode."""
+        pipeline = CodecPipeline(CodecType.PCMA)
+        t = np.arange(16000) / 16000
+        tone = (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+        encoded = b"".join(
+            pipeline.encode_for_telephony(tone[i:i + 320])
+            for i in range(0, len(tone), 320)
+        )
+        decoded = np.concatenate([
+            pipeline.decode_for_ai(encoded[i:i + 160])
+            for i in range(0, len(encoded), 160)
+        ])
+
+        spectrum = np.abs(np.fft.rfft(decoded))
+        peak_hz = np.argmax(spectrum) * 16000 / len(decoded)
+        assert abs(peak_hz - 440) < 2
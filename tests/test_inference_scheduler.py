@@ -0,0 +1,171 @@
+"""Tests for the shared inference scheduler."""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from phone_agent.ai import (
+    InferencePriority,
+    InferenceScheduler,
+    SchedulerConfig,
+    SpeechToText,
+)
+
+
+@pytest.fixture
+def scheduler():
+    """Single-worker scheduler so queueing order is observable."""
+    sched = InferenceScheduler(SchedulerConfig(max_workers=1))
+    yield sched
+    sched.shutdown(wait=False)
+
+
+async def occupy_worker(scheduler):
+    """Block the only worker until the returned event is set."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+        return "blocked"
+
+    task = asyncio.create_task(scheduler.submit(block))
+    while not started.is_set():
+        await asyncio.sleep(0.001)
+    return release, task
+
+
+class TestInferenceScheduler:
+    """Test prioritization, batching and accounting."""
+
+    def test_pool_sized_to_cores(self):
+        """Default worker count divides cores by per-call threads."""
+        config = SchedulerConfig(threads_per_worker=1)
+        assert config.resolve_workers() >= 1
+        assert SchedulerConfig(max_workers=3).resolve_workers() == 3
+
+    @pytest.mark.asyncio
+    async def test_runs_function(self, scheduler):
+        """Submitted calls return their result."""
+        assert await scheduler.submit(lambda a, b=0: a + b, 2, b=3) == 5
+        assert scheduler.statistics["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_live_requests_jump_the_queue(self, scheduler):
+        """Queued live work runs before earlier batch work."""
+        release, blocker = await occupy_worker(scheduler)
+        order = []
+
+        batch = asyncio.create_task(scheduler.submit(
+            order.append, "batch", priority=InferencePriority.BATCH
+        ))
+        live = asyncio.create_task(scheduler.submit(
+            order.append, "live", priority=InferencePriority.LIVE
+        ))
+        await asyncio.sleep(0.01)
+        assert scheduler.queue_depth == 2
+
+        release.set()
+        await asyncio.gather(blocker, batch, live)
+        assert order == ["live", "batch"]
+
+    @pytest.mark.asyncio
+    async def test_micro_batches_queued_requests(self, scheduler):
+        """Batchable requests waiting together share one backend call."""
+        release, blocker = await occupy_worker(scheduler)
+        batches = []
+
+        def batch_fn(items):
+            batches.append(list(items))
+            return [item * 10 for item in items]
+
+        requests = [
+            asyncio.create_task(
+                scheduler.submit_batchable(batch_fn, i, batch_key="stt")
+            )
+            for i in range(3)
+        ]
+        other = asyncio.create_task(
+            scheduler.submit_batchable(batch_fn, 7, batch_key="other")
+        )
+        await asyncio.sleep(0.01)
+
+        release.set()
+        results = await asyncio.gather(*requests, other, blocker)
+
+        assert results[:4] == [0, 10, 20, 70]
+        assert batches == [[0, 1, 2], [7]]
+        stats = scheduler.statistics
+        assert stats["batches"] == 1
+        assert stats["batched_requests"] == 3
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate(self, scheduler):
+        """Exceptions from the worker reach the caller."""
+        def fail():
+            raise ValueError("model failed")
+
+        with pytest.raises(ValueError, match="model failed"):
+            await scheduler.submit(fail)
+        assert scheduler.statistics["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_request_is_skipped(self, scheduler):
+        """A request cancelled while queued never runs."""
+        release, blocker = await occupy_worker(scheduler)
+        ran = []
+
+        task = asyncio.create_task(scheduler.submit(ran.append, "x"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        release.set()
+        await blocker
+        await asyncio.sleep(0.01)
+        assert ran == []
+        assert scheduler.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_recorded(self, scheduler):
+        """Queue wait is tracked per priority."""
+        release, blocker = await occupy_worker(scheduler)
+        waiting = asyncio.create_task(scheduler.submit(
+            lambda: None, priority=InferencePriority.BATCH
+        ))
+        await asyncio.sleep(0.02)
+        release.set()
+        await asyncio.gather(blocker, waiting)
+
+        waits = scheduler.statistics["queue_wait"]
+        assert waits["LIVE"]["count"] == 1
+        assert waits["BATCH"]["max_ms"] >= 15
+
+
+class TestSTTScheduling:
+    """Test STT submitting to the scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_transcribe_async_uses_scheduler(self, scheduler):
+        """Async transcription runs on the scheduler's workers."""
+        threads = []
+
+        def fake_transcribe(audio, **kwargs):
+            threads.append(threading.current_thread().name)
+            segments = [SimpleNamespace(text=" Hallo ")]
+            return segments, SimpleNamespace(language="de", language_probability=0.9)
+
+        stt = SpeechToText(scheduler=scheduler)
+        stt._model = SimpleNamespace(transcribe=fake_transcribe)
+        stt._loaded = True
+
+        text = await stt.transcribe_async(np.zeros(1600, dtype=np.float32))
+
+        assert text == "Hallo"
+        assert threads[0].startswith("inference")
+        assert scheduler.statistics["completed"] == 1
@@ -0,0 +1,168 @@
+"""Tests for LLM prompt state caching."""
+
+from types import SimpleNamespace
+
+from phone_agent.ai.llm import LanguageModel, PromptStateCache
+
+
+class FakeLlama:
+    """Mimics llama-cpp-python's prefix cache handling.
+
+    Tokens are characters of a simple chat template ending in the
+    assistant generation prompt, so a turn's prompt plus completion is a
+    prefix of the next turn's prompt. A completion restores
+    the cached state with the longest shared prefix when it beats the
+    current context and evaluates only the remaining prompt tokens.
+    """
+
+    def __init__(self):
+        self.cache = None
+        self.context: list[int] = []
+        self.evaluated: list[int] = []  # Prompt tokens evaluated per call
+
+    def set_cache(self, cache):
+        self.cache = cache
+
+    def create_chat_completion(self, messages, max_tokens=256, **kwargs):
+        turns = "".join(f"<{m['role']}>{m['content']}</>" for m in messages)
+        text = turns + "<assistant>"
+        prompt = [ord(c) for c in text]
+        if self.cache:
+            try:
+                state = self.cache[prompt]
+                cached = state.tokens
+                if _prefix(cached, prompt) > _prefix(self.context, prompt):
+                    self.context = list(cached)
+            except KeyError:
+                pass
+
+        reused = _prefix(self.context, prompt)
+        self.evaluated.append(len(prompt) - reused)
+        completion = [ord(c) for c in "ok"][:max_tokens]
+        self.context = prompt + completion
+
+        if self.cache:
+            self.cache[prompt + completion] = SimpleNamespace(
+                tokens=tuple(self.context),
+                llama_state_size=len(self.context) * 100,
+            )
+        return {"choices": [{"message": {"content": "ok"}}]}
+
+
+def _prefix(a, b):
+    n = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        n += 1
+    return n
+
+
+def make_llm(capacity=10**9):
+    llm = LanguageModel(prompt_cache_bytes=capacity)
+    llm._llm = FakeLlama()
+    llm._llm.set_cache(llm.prompt_cache)
+    llm.prompt_cache.context_tokens = lambda: llm._llm.context
+    llm._loaded = True
+    return llm
+
+
+SYSTEM = "Du bist ein freundlicher Telefonassistent für eine Arztpraxis. " * 5
+
+
+class TestPromptStateCache:
+    """Test prefix reuse across turns and conversations."""
+
+    def test_interleaved_conversations_reuse_their_history(self):
+        """Switching conversations restores each one's own state."""
+        llm = make_llm()
+        fake = llm._llm
+        a = [
+            {"role": "system", "content": SYSTEM},
+            {"role": "user", "content": "Termin bitte"},
+        ]
+        b = [
+            {"role": "system", "content": SYSTEM},
+            {"role": "user", "content": "Rezept bitte"},
+        ]
+
+        llm.generate_with_history(a)
+        llm.generate_with_history(b)
+        a += [
+            {"role": "assistant", "content": "ok"},
+            {"role": "user", "content": "Morgen"},
+        ]
+        llm.generate_with_history(a)
+
+        # Third call only evaluates the new turn, not system prompt + history
+        assert fake.evaluated[2] == len("</><user>Morgen</><assistant>")
+        stats = llm.cache_statistics
+        # B only shared the system prompt, which was still in the context
+        assert stats["hits"] == 1
+        assert stats["reused_tokens"] == len("Termin bitte</><assistant>ok")
+        assert stats["entries"] == 2  # A's first turn was superseded
+
+    def test_distinct_conversations_are_not_hits(self):
+        """Prompts sharing only the system prompt and template count as misses."""
+        llm = make_llm()
+        fake = llm._llm
+        for caller in ("Termin bitte", "Rezept bitte", "Befund bitte", "Absage bitte"):
+            llm.generate_with_history([
+                {"role": "system", "content": SYSTEM},
+                {"role": "user", "content": caller},
+            ])
+
+        stats = llm.cache_statistics
+        assert stats["lookups"] == 4
+        assert stats["hits"] == 0 and stats["hit_rate"] == 0.0
+        assert stats["reused_tokens"] == 0
+        assert all(n == len(f"{caller}</><assistant>") for n, caller in zip(
+            fake.evaluated[1:], ("Rezept bitte", "Befund bitte", "Absage bitte")
+        ))
+
+        # A fresh context restores the shared prefix without a hit
+        fake.context = []
+        llm.generate_with_history([
+            {"role": "system", "content": SYSTEM},
+            {"role": "user", "content": "Frage"},
+        ])
+        stats = llm.cache_statistics
+        assert stats["hits"] == 0
+        assert stats["reused_tokens"] == len(f"<system>{SYSTEM}</><user>")
+
+    def test_primed_system_prompt_is_reused_and_pinned(self):
+        """New conversations start from the primed system prompt."""
+        llm = make_llm(capacity=1)  # Every unpinned entry gets evicted
+        fake = llm._llm
+
+        llm.prime_prompt(SYSTEM)
+        primed = llm.prompt_cache.last_key
+        fake.context = []  # Another conversation ran in between
+        llm.generate_with_history([
+            {"role": "system", "content": SYSTEM},
+            {"role": "user", "content": "Hallo"},
+        ])
+
+        assert fake.evaluated[-1] <= len("<user>Hallo</><assistant>")
+        llm.generate_with_history([{"role": "user", "content": "Andere Praxis"}])
+        assert primed in llm.prompt_cache
+        assert llm.cache_statistics["evictions"] >= 1
+
+    def test_lru_eviction_by_bytes(self):
+        """The least recently used state goes first."""
+        cache = PromptStateCache(capacity_bytes=250)
+        state = SimpleNamespace(llama_state_size=100)
+        cache[(1, 2)] = state
+        cache[(3, 4)] = state
+        cache[(1, 5)]  # touch (1, 2)
+        cache[(6, 7)] = state
+
+        assert (3, 4) not in cache
+        assert (1, 2) in cache
+        assert cache.cache_size == 200
+
+    def test_disabled_cache(self):
+        """A zero budget turns caching off."""
+        llm = LanguageModel(prompt_cache_bytes=0)
+        assert llm.prompt_cache is None
+        assert llm.cache_statistics == {"enabled": False}
@@ -0,0 +1,177 @@
+"""Tests for the startup model warm pool and readiness gating."""
+
+import asyncio
+import time
+
+import pytest
+
+from phone_agent.ai import DialectAwareSTT, ModelStatus, ModelWarmPool
+from phone_agent.ai.status import get_model_registry, reset_registry
+from phone_agent.core import ServiceNotReadyError
+
+
+@pytest.fixture(autouse=True)
+def registry():
+    """Fresh global model registry per test."""
+    reset_registry()
+    yield get_model_registry()
+    reset_registry()
+
+
+@pytest.fixture
+def engine(fake_engine):
+    """Fake engine whose models take 100 ms each to load."""
+    for model in (fake_engine.stt, fake_engine.llm, fake_engine.tts):
+        model.load_seconds = 0.1
+    return fake_engine
+
+
+class TestModelWarmPool:
+    """Test loading and warming models at startup."""
+
+    @pytest.mark.asyncio
+    async def test_engine_models_warmed_in_parallel(self, engine, registry):
+        """Models load concurrently and each runs a dummy inference."""
+        pool = ModelWarmPool.for_engine(engine, voices=["tr"])
+
+        start = time.monotonic()
+        results = await pool.run()
+
+        assert time.monotonic() - start < 0.25
+        assert all(r.ok for r in results)
+        assert engine.stt.calls == ["load", ("transcribe", 16000)]
+        assert engine.llm.calls == ["load", "prime", ("generate", 1)]
+        assert engine.tts.calls == [
+            "load", ("voices", ["tr"]), ("synthesize", "de"), ("synthesize", "tr")
+        ]
+        assert registry.readiness == "ready"
+        assert registry.stt.load_seconds >= 0.1
+        models = registry.get_detailed_status()["models"]
+        assert models["llm"]["warmup_seconds"] is not None
+
+    @pytest.mark.asyncio
+    async def test_failure_recorded_per_model(self, registry):
+        """A failing model is marked as an error; the others still warm."""
+
+        def broken():
+            raise RuntimeError("model file missing")
+
+        pool = ModelWarmPool()
+        pool.add("stt", "stt", lambda: None)
+        pool.add("llm", "llm", broken)
+        pool.add("tts", "tts", lambda: None)
+
+        results = await pool.run()
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert registry.llm.status == ModelStatus.ERROR
+        assert registry.llm.error_message == "model file missing"
+        assert registry.readiness == "error"
+
+    @pytest.mark.asyncio
+    async def test_shared_models_share_registry_slots(self, engine, registry):
+        """A slot holding the API and engine models is ready once both are."""
+        release = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def slow_warm():
+            asyncio.run_coroutine_threadsafe(release.wait(), loop).result()
+
+        pool = ModelWarmPool()
+        pool.add("stt", "api-stt", lambda: None, slow_warm)
+        pool.add_engine(engine)
+        task = pool.start()
+        await asyncio.sleep(0.3)
+
+        assert engine.stt.calls == ["load", ("transcribe", 16000)]
+        assert registry.stt.status == ModelStatus.WARMING
+        assert registry.llm.status == ModelStatus.LOADED
+        assert registry.readiness == "warming"
+
+        release.set()
+        results = await task
+        assert [r.model for r in results if r.name == "stt"] == [
+            "api-stt",
+            "fake-whisper",
+        ]
+        assert registry.readiness == "ready"
+
+    @pytest.mark.asyncio
+    async def test_readiness_while_warming(self, registry):
+        """Readiness is "warming" until every model is warm."""
+        release = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def slow_warm():
+            asyncio.run_coroutine_threadsafe(release.wait(), loop).result()
+
+        assert registry.readiness == "lazy"
+        pool = ModelWarmPool()
+        for name in ("stt", "llm", "tts"):
+            pool.add(name, name, lambda: None, slow_warm)
+        task = pool.start()
+        await asyncio.sleep(0.05)
+
+        assert registry.readiness == "warming"
+        assert registry.stt.status == ModelStatus.WARMING
+        assert await registry.wait_until_ready(0.05) == "warming"
+
+        release.set()
+        assert await registry.wait_until_ready(1.0) == "ready"
+        await task
+
+
+class TestReadinessGating:
+    """Test the telephony service holding calls during warmup."""
+
+    @pytest.fixture
+    def service(self):
+        from phone_agent.telephony.service import (
+            TelephonyService,
+            TelephonyServiceConfig,
+        )
+
+        return TelephonyService(
+            TelephonyServiceConfig(preload_models=False, model_warmup_wait_s=0.05)
+        )
+
+    @pytest.mark.asyncio
+    async def test_calls_refused_while_warming(self, service, registry):
+        """Calls are rejected when the warmup outlasts the wait."""
+        registry.warmup_enabled = True
+        registry.update_status("stt", ModelStatus.LOADING)
+
+        with pytest.raises(ServiceNotReadyError):
+            await service._check_ready()
+        response = await service.handle_webhook_incoming("ext-1", "+491111", "+49800")
+
+        assert response == {
+            "action": "reject",
+            "reason": "AI models are still warming up",
+        }
+
+    @pytest.mark.asyncio
+    async def test_lazy_mode_admits_calls(self, service, registry):
+        """Without startup warmup calls are never held."""
+        await service._check_ready()
+        assert registry.readiness == "lazy"
+
+
+class TestDialectRouterLoad:
+    """Test preloading the dialect-aware STT router."""
+
+    def test_load_uses_language_default_model(self, monkeypatch):
+        """load() preloads the model serving the current language."""
+        router = DialectAwareSTT()
+        loaded = []
+        monkeypatch.setattr(router, "preload_model", loaded.append)
+
+        router.load()
+        router.set_language("tr")
+        router.load()
+
+        assert loaded == [
+            "primeline/whisper-large-v3-german",
+            "openai/whisper-large-v3",
+        ]
+        assert not router.is_loaded
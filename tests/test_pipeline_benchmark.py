@@ -0,0 +1,181 @@
+"""Tests for the offline pipeline benchmark."""
+
+import json
+
+import numpy as np
+import pytest
+
+from phone_agent.core.benchmark import (
+    BenchmarkConfig,
+    PipelineBenchmark,
+    Utterance,
+    compare_reports,
+    format_report,
+    load_corpus,
+    read_wav,
+    write_wav,
+)
+
+
+def utterance(key, language="de", seconds=1.0):
+    return Utterance(
+        id=key,
+        language=language,
+        audio=np.zeros(int(16000 * seconds), dtype=np.float32),
+        sample_rate=16000,
+    )
+
+
+class TestCorpus:
+    """Test corpus loading and synthesis."""
+
+    def test_missing_audio_synthesized_and_cached(self, tmp_path, fake_tts):
+        """Utterances without a recording are synthesized once and written back."""
+        (tmp_path / "manifest.json").write_text(json.dumps({"utterances": [
+            {"id": "de-1", "language": "de", "text": "Hallo.", "audio": "de/1.wav"},
+            {"id": "tr-1", "language": "tr", "text": "Merhaba.", "audio": "tr/1.wav"},
+        ]}))
+
+        first = load_corpus(tmp_path, languages=["de"], tts=fake_tts)
+        again = load_corpus(tmp_path, languages=["de"])
+
+        assert [u.id for u in first] == ["de-1"]
+        assert first[0].source == "tts"
+        assert again[0].source == "recorded"
+        np.testing.assert_allclose(again[0].audio, first[0].audio, atol=1 / 32768)
+
+    def test_noise_fallback_deterministic(self, tmp_path):
+        """Without TTS the same corpus always yields the same audio."""
+        entry = {
+            "id": "ru-1",
+            "language": "ru",
+            "text": "Здравствуйте, я хотел бы записаться.",
+        }
+        (tmp_path / "manifest.json").write_text(json.dumps({"utterances": [entry]}))
+
+        first, second = load_corpus(tmp_path), load_corpus(tmp_path)
+
+        assert first[0].source == "noise"
+        assert first[0].duration >= 1.0
+        np.testing.assert_array_equal(first[0].audio, second[0].audio)
+
+    def test_wav_roundtrip(self, tmp_path):
+        """Written WAVs read back at the same rate and level."""
+        audio = np.linspace(-0.5, 0.5, 800, dtype=np.float32)
+        write_wav(tmp_path / "a.wav", audio, 8000)
+        loaded, rate = read_wav(tmp_path / "a.wav")
+        assert rate == 8000
+        np.testing.assert_allclose(loaded, audio, atol=1 / 16384)
+
+
+class TestPipelineBenchmark:
+    """Test running the benchmark on fake models."""
+
+    @pytest.mark.asyncio
+    async def test_reports_stages_per_level(self, fake_engine):
+        """Each level reports traced stages, time-to-first-audio and RTF."""
+        corpus = [utterance("a"), utterance("b", seconds=2.0)]
+        bench = PipelineBenchmark(
+            lambda language: fake_engine, BenchmarkConfig(concurrency=[1, 2], passes=2)
+        )
+
+        report = (await bench.run(corpus)).to_dict()
+
+        assert [level["concurrency"] for level in report["levels"]] == [1, 2]
+        level = report["levels"][0]
+        assert level["turns"] == 4 and level["errors"] == 0
+        stages = level["stages_ms"]
+        for stage in (
+            "stt",
+            "llm.generate",
+            "tts.first_chunk",
+            "time_to_first_audio",
+            "turn",
+        ):
+            assert stages[stage]["count"] == 4
+        first_audio = stages["time_to_first_audio"]["p50"]
+        assert stages["stt"]["p50"] <= first_audio <= stages["turn"]["p99"]
+        assert level["realtime_factor"]["tts"]["p50"] > 0
+        assert level["resources"]["cpu_s"] >= 0
+        assert report["corpus"]["utterances"] == 2
+        assert "time_to_first_audio" in format_report(report)
+
+    @pytest.mark.asyncio
+    async def test_cold_mode_reloads_models(self, fake_engine):
+        """Cold mode loads the models before every level."""
+        bench = PipelineBenchmark(
+            lambda language: fake_engine,
+            BenchmarkConfig(concurrency=[1, 1, 1], passes=1, mode="cold"),
+        )
+        report = await bench.run([utterance("a")])
+
+        assert fake_engine.stt.loads == 3
+        assert report.model_load.count == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_turns_counted(self, fake_engine):
+        """A failing turn is counted as an error, not a crash."""
+
+        async def broken(audio, sample_rate=16000):
+            raise RuntimeError("stt crashed")
+
+        fake_engine.stt.transcribe_async = broken
+        bench = PipelineBenchmark(
+            lambda language: fake_engine, BenchmarkConfig(warmup_turns=0)
+        )
+
+        report = (await bench.run([utterance("a")])).to_dict()
+
+        assert report["levels"][0]["errors"] == 2
+        assert report["levels"][0]["turns"] == 0
+
+
+def make_report(turn_p95=100.0, errors=0, fingerprint="abc", mode="warm"):
+    stage = {"p50": 50.0, "p95": turn_p95, "p99": turn_p95, "mean": 60.0, "count": 10}
+    return {
+        "corpus": {"fingerprint": fingerprint},
+        "config": {"mode": mode},
+        "levels": [{
+            "concurrency": 1,
+            "errors": errors,
+            "stages_ms": {"turn": stage},
+            "realtime_factor": {"stt": {"p95": 0.2}, "tts": {"p95": 0.1}},
+            "resources": {"cpu_s_per_audio_s": 0.3},
+        }],
+    }
+
+
+class TestCompareReports:
+    """Test regression detection against a baseline."""
+
+    def test_within_tolerance(self):
+        """Small slowdowns pass."""
+        regressions = compare_reports(
+            make_report(110.0), make_report(100.0), tolerance=0.15
+        )
+        assert regressions == []
+
+    def test_regression_detected(self):
+        """Percentiles over the tolerance are regressions."""
+        regressions = compare_reports(
+            make_report(130.0), make_report(100.0), tolerance=0.15
+        )
+        assert {r.metric for r in regressions} == {"turn.p95_ms", "turn.p99_ms"}
+        assert regressions[0].change == pytest.approx(0.3)
+
+    def test_small_absolute_change_ignored(self):
+        """Jitter on fast stages below min_delta_ms is not a regression."""
+        regressions = compare_reports(
+            make_report(3.0), make_report(2.0), min_delta_ms=5.0
+        )
+        assert regressions == []
+
+    def test_new_errors_are_regressions(self):
+        """Any additional failed turn fails the comparison."""
+        regressions = compare_reports(make_report(errors=1), make_report())
+        assert [r.metric for r in regressions] == ["errors"]
+
+    def test_different_corpus_rejected(self):
+        """Reports from different corpora cannot be compared."""
+        with pytest.raises(ValueError, match="fingerprint"):
+            compare_reports(make_report(fingerprint="new"), make_report())
@@ -0,0 +1,251 @@
+"""Tests for the Prometheus metrics exposition."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from phone_agent.core import prometheus
+from phone_agent.core.metrics import get_metrics, reset_metrics
+from phone_agent.core.prometheus import (
+    LATENCY_BUCKETS,
+    MetricsWriter,
+    collect,
+    export_bridge,
+    export_circuit_breakers,
+    export_latency,
+    export_llm_prompt_cache,
+    export_rtp_engine,
+    register_collector,
+    unregister_collector,
+)
+
+
+def samples(text: str) -> dict[str, float]:
+    """Parse exposition text into {series: value}."""
+    result = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            series, value = line.rsplit(" ", 1)
+            result[series] = float(value)
+    return result
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    reset_metrics()
+    yield
+    reset_metrics()
+
+
+class TestMetricsWriter:
+    """Test the text format."""
+
+    def test_families_and_labels(self):
+        """HELP/TYPE appear once per family; constant labels on every sample."""
+        writer = MetricsWriter({"tenant": "praxis-1", "industry": "gesundheit"})
+        writer.counter("calls", "Calls handled", 3, {"direction": "in"})
+        writer.counter("calls", "Calls handled", 1, {"direction": "out"})
+        writer.gauge("queue", 'Queue "depth"', 0.5)
+
+        text = writer.render()
+
+        assert text.count("# TYPE phone_agent_calls_total counter") == 1
+        sample = (
+            'phone_agent_calls_total{tenant="praxis-1",industry="gesundheit",'
+            'direction="out"} 1'
+        )
+        assert sample in text
+        assert 'phone_agent_queue{tenant="praxis-1",industry="gesundheit"} 0.5' in text
+
+    def test_label_values_escaped(self):
+        """Quotes and backslashes in label values are escaped."""
+        writer = MetricsWriter()
+        writer.gauge("x", "x", 1, {"name": 'a"b\\c'})
+        assert 'phone_agent_x{name="a\\"b\\\\c"} 1' in writer.render()
+
+
+class TestExporters:
+    """Test individual exporters."""
+
+    def test_latency_histogram(self):
+        """Component latencies become cumulative histograms."""
+        metrics = get_metrics()
+        for duration in (0.004, 0.02, 0.3, 0.3, 4.0):
+            metrics.record("stt", duration)
+
+        writer = MetricsWriter()
+        export_latency(writer)
+        values = samples(writer.render())
+
+        bucket = 'phone_agent_latency_seconds_bucket{component="stt",le='
+        assert values[bucket + '"0.005"}'] == 1
+        assert values[bucket + '"0.5"}'] == 4
+        assert values[bucket + '"+Inf"}'] == 5
+        assert values['phone_agent_latency_seconds_count{component="stt"}'] == 5
+        total = values['phone_agent_latency_seconds_sum{component="stt"}']
+        assert total == pytest.approx(4.624)
+        key = (
+            'phone_agent_latency_recent_seconds'
+            '{component="stt",window="1m",quantile="0.5"}'
+        )
+        assert values[key] == pytest.approx(0.3, rel=0.02)
+        # Unused standard components are not exported
+        assert not any('component="llm"' in series for series in values)
+
+    def test_bucket_count_bounded(self):
+        """Each component exports a fixed number of buckets."""
+        metrics = get_metrics()
+        for i in range(1000):
+            metrics.record("vad", i / 1000)
+
+        writer = MetricsWriter()
+        export_latency(writer)
+        buckets = [s for s in samples(writer.render()) if "latency_seconds_bucket" in s]
+        assert len(buckets) == len(LATENCY_BUCKETS) + 1
+
+    def test_bridge_aggregates_calls(self):
+        """Per-call ingest queues are summed, not exported per call."""
+        from phone_agent.telephony.audio_bridge import AudioBridge
+
+        bridge = AudioBridge()
+        bridge._stats.frames_received = 42
+        writer = MetricsWriter()
+        export_bridge(writer, bridge)
+        values = samples(writer.render())
+
+        assert values["phone_agent_bridge_frames_received_total"] == 42
+        assert values["phone_agent_bridge_connections_active"] == 0
+        assert values["phone_agent_bridge_ingest_queue_depth"] == 0
+
+    def test_rtp_engine_source_counters(self):
+        """Rejected packets and expired sessions are exported."""
+        from phone_agent.telephony.rtp_engine import RTPMediaEngine
+
+        engine = RTPMediaEngine()
+        engine.rtp_statistics.packets_rejected = 3
+        engine.rtp_statistics.sessions_expired = 1
+        writer = MetricsWriter()
+        export_rtp_engine(writer, engine)
+        values = samples(writer.render())
+
+        assert values["phone_agent_rtp_packets_rejected_total"] == 3
+        assert values["phone_agent_rtp_sessions_expired_total"] == 1
+        assert values["phone_agent_rtp_sessions_active"] == 0
+
+    def test_llm_prompt_cache(self, monkeypatch):
+        """The API model's prefix hits and saved tokens are exported."""
+        from phone_agent import dependencies
+        from phone_agent.ai.llm import LanguageModel
+
+        llm = LanguageModel(prompt_cache_bytes=1024)
+        llm.prompt_cache.stats.lookups = 4
+        llm.prompt_cache.stats.hits = 3
+        llm.prompt_cache.stats.reused_tokens = 120
+        monkeypatch.setattr(dependencies, "_llm_instance", llm)
+        values = samples(collect({}))
+
+        assert values['phone_agent_llm_prompt_cache_hits_total{engine="api"}'] == 3
+        assert values['phone_agent_llm_prompt_cache_lookups_total{engine="api"}'] == 4
+        reused = 'phone_agent_llm_prompt_cache_reused_tokens_total{engine="api"}'
+        assert values[reused] == 120
+        assert values['phone_agent_llm_prompt_cache_bytes{engine="api"}'] == 0
+
+        writer = MetricsWriter()
+        export_llm_prompt_cache(writer, LanguageModel(prompt_cache_bytes=0))
+        assert writer.render() == "\n"
+
+    def test_tts_phrase_cache(self, monkeypatch):
+        """The API voice's phrase cache hit ratio and bytes saved are exported."""
+        from phone_agent import dependencies
+        from phone_agent.ai import TextToSpeech, TTSCache
+
+        cache = TTSCache()
+        cache.put("greeting", b"pcm-audio")
+        cache.get("greeting")
+        cache.get("missing")
+        monkeypatch.setattr(dependencies, "_tts_instance", TextToSpeech(cache=cache))
+        values = samples(collect({}))
+
+        assert values['phone_agent_tts_cache_lookups_total{engine="api"}'] == 2
+        hits = 'phone_agent_tts_cache_hits_total{engine="api",tier="memory"}'
+        assert values[hits] == 1
+        assert values['phone_agent_tts_cache_bytes_saved_total{engine="api"}'] == 9
+        assert values['phone_agent_tts_cache_hit_ratio{engine="api"}'] == 0.5
+        assert values['phone_agent_tts_cache_bytes{engine="api",tier="memory"}'] == 9
+
+    def test_circuit_breaker_states(self):
+        """Each breaker reports one active state."""
+        from phone_agent.core.retry import get_circuit_breaker
+
+        get_circuit_breaker("prometheus-test")
+        writer = MetricsWriter()
+        export_circuit_breakers(writer)
+        values = samples(writer.render())
+
+        prefix = 'phone_agent_circuit_breaker_state{breaker="prometheus-test"'
+        assert values[f'{prefix},state="closed"}}'] == 1
+        assert values[f'{prefix},state="open"}}'] == 0
+
+
+class TestCollect:
+    """Test the collector registry and endpoint."""
+
+    def test_failing_collector_skipped(self):
+        """One broken collector does not break the scrape."""
+
+        def broken(writer):
+            raise RuntimeError("boom")
+
+        register_collector("broken", broken)
+        register_collector("custom", lambda w: w.gauge("custom", "Custom", 7))
+        try:
+            values = samples(collect({}))
+        finally:
+            unregister_collector("broken")
+            unregister_collector("custom")
+
+        assert values["phone_agent_custom"] == 7
+        assert values["phone_agent_up"] == 1
+
+    def test_singletons_reported_once_created(self):
+        """Scrapes report the shared executors without creating them."""
+        from phone_agent.ai import (
+            get_inference_scheduler,
+            peek_inference_scheduler,
+            reset_inference_scheduler,
+        )
+
+        reset_inference_scheduler()
+        try:
+            assert "executor_workers" not in collect({})
+            assert peek_inference_scheduler() is None
+
+            workers = get_inference_scheduler().statistics["workers"]
+            values = samples(collect({}))
+        finally:
+            reset_inference_scheduler()
+
+        assert values['phone_agent_executor_workers{executor="inference"}'] == workers
+
+    def test_endpoint(self, monkeypatch):
+        """GET /metrics returns the exposition with deployment labels."""
+        from phone_agent.main import create_app
+
+        monkeypatch.setattr(
+            prometheus,
+            "deployment_labels",
+            lambda: {"tenant": "t1", "industry": "handwerk"},
+        )
+        get_metrics().record("llm", 0.8)
+        client = TestClient(create_app(), raise_server_exceptions=False)
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        sample = (
+            'phone_agent_latency_seconds_count{tenant="t1",industry="handwerk",'
+            'component="llm"} 1'
+        )
+        assert sample in response.text
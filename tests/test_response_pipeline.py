@@ -0,0 +1,142 @@
+"""Tests for the overlapped LLM / TTS / playout response pipeline."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from phone_agent.core import PipelineConfig, ResponsePipeline
+
+
+class SlowLLM:
+    """Blocking token generator, like llama-cpp's streaming API."""
+
+    def __init__(self, tokens, delay=0.01, fail_after=None):
+        self.tokens = tokens
+        self.delay = delay
+        self.fail_after = fail_after
+        self.threads = set()
+
+    def generate_stream_with_history(self, messages):
+        for i, token in enumerate(self.tokens):
+            if self.fail_after is not None and i == self.fail_after:
+                raise RuntimeError("llm crashed")
+            self.threads.add(threading.current_thread())
+            time.sleep(self.delay)  # Blocks its thread, not the loop
+            yield token
+
+
+class RecordingTTS:
+    """Streaming TTS stand-in logging when each sentence is synthesized."""
+
+    sample_rate = 16000
+
+    def __init__(self, events, delay=0.02):
+        self.events = events
+        self.delay = delay
+
+    async def synthesize_stream_async(self, text, language=None):
+        self.events.append(("tts_start", text))
+        for _ in range(2):
+            await asyncio.sleep(self.delay)
+            yield b"\x00\x01" * 160
+        self.events.append(("tts_end", text))
+
+
+TOKENS = ["Guten ", "Tag. ", "Was ", "kann ", "ich ", "tun? ", "Bis ", "bald."]
+
+
+class TestResponsePipeline:
+    """Test stage overlap, timings and error handling."""
+
+    @pytest.mark.asyncio
+    async def test_next_sentence_synthesized_while_previous_plays(self):
+        """TTS for sentence N+1 runs while sentence N is being played."""
+        events = []
+        pipeline = ResponsePipeline(SlowLLM(TOKENS), RecordingTTS(events))
+
+        async def play(sentence, wav):
+            events.append(("play_start", sentence))
+            await asyncio.sleep(0.1)
+            events.append(("play_end", sentence))
+
+        result = await pipeline.run([], on_sentence_ready=play)
+
+        assert result.text == "".join(TOKENS)
+        assert result.timings.sentences == 3
+        first_play_end = events.index(("play_end", "Guten Tag."))
+        assert events.index(("tts_start", "Was kann ich tun?")) < first_play_end
+        assert events.index(("tts_end", "Was kann ich tun?")) < first_play_end
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self):
+        """Token generation does not block other coroutines."""
+        llm = SlowLLM(TOKENS, delay=0.03)
+        pipeline = ResponsePipeline(llm, RecordingTTS([]))
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await pipeline.run([])
+        task.cancel()
+
+        assert ticks > 20
+        assert threading.main_thread() not in llm.threads
+
+    @pytest.mark.asyncio
+    async def test_timings_reported_per_stage(self):
+        """Each stage's timing is filled in and ordered sensibly."""
+        chunks = []
+
+        async def on_chunk(chunk):
+            chunks.append(chunk)
+
+        result = await ResponsePipeline(SlowLLM(TOKENS), RecordingTTS([])).run(
+            [], on_audio_chunk=on_chunk
+        )
+        timings = result.timings
+
+        assert len(chunks) == 6 and chunks == result.pcm_chunks
+        assert 0 < timings.first_token <= timings.first_sentence <= timings.first_audio
+        assert timings.first_audio < timings.llm <= timings.total
+        assert timings.tts > 0
+        expected = {"first_audio_ms", "llm_ms", "tts_ms", "total_ms"}
+        assert set(timings.to_dict()) >= expected
+
+    @pytest.mark.asyncio
+    async def test_bounded_queue_limits_read_ahead(self):
+        """A stalled consumer stops the TTS from running far ahead."""
+        events = []
+        tokens = [f"Satz Nummer {i}. " for i in range(10)]
+        pipeline = ResponsePipeline(
+            SlowLLM(tokens, delay=0),
+            RecordingTTS(events, delay=0),
+            PipelineConfig(sentence_queue_size=1, audio_queue_chunks=2),
+        )
+        release = asyncio.Event()
+
+        async def play(sentence, wav):
+            await release.wait()
+
+        task = asyncio.create_task(pipeline.run([], on_sentence_ready=play))
+        await asyncio.sleep(0.1)
+        started = sum(1 for kind, _ in events if kind == "tts_start")
+        assert started <= 3
+
+        release.set()
+        result = await task
+        assert result.timings.sentences == 10
+
+    @pytest.mark.asyncio
+    async def test_stage_error_cancels_pipeline(self):
+        """An LLM failure surfaces to the caller instead of hanging."""
+        pipeline = ResponsePipeline(SlowLLM(TOKENS, fail_after=3), RecordingTTS([]))
+
+        with pytest.raises(RuntimeError, match="llm crashed"):
+            await asyncio.wait_for(pipeline.run([]), timeout=2)
@@ -3,19 +3,28 @@
 Tests sentence extraction, streaming TTS, and the process_audio_streaming method.
 """
 
-import pytest
-from unittest.mock import MagicMock, AsyncMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+import numpy as np
+import pytest
+
 from phone_agent.core.conversation import (
+    SENTENCE_END_PATTERN,
     ConversationEngine,
     ConversationState,
     TurnRole,
     extract_complete_sentence,
-    SENTENCE_END_PATTERN,
 )
 
 
+async def fake_pcm_stream(text, language=None):
+    """Streaming TTS stand-in yielding two PCM chunks per sentence."""
+    yield b"\x01\x00" * 160
+    yield b"\x02\x00" * 160
+
+
 class TestSentenceExtraction:
     """Test the sentence extraction helper function."""
 
@@ -148,7 +157,10 @@ class TestStreamingPipelineMocked:
 
             mock_tts_instance = MagicMock()
             mock_tts_instance.is_loaded = True
-            mock_tts_instance.synthesize_async = AsyncMock(return_value=b"audio_chunk")
+            mock_tts_instance.sample_rate = 22050
+            mock_tts_instance.synthesize_stream_async = MagicMock(
+                side_effect=fake_pcm_stream
+            )
             mock_tts.return_value = mock_tts_instance
 
             engine = ConversationEngine()
@@ -174,7 +186,7 @@ class TestStreamingPipelineMocked:
         # Should have received at least one sentence
         assert len(sentences_received) >= 1
         # TTS should have been called for each sentence
-        assert mock_tts.synthesize_async.call_count >= 1
+        assert mock_tts.synthesize_stream_async.call_count == len(sentences_received)
 
     @pytest.mark.asyncio
     async def test_process_text_streaming_returns_full_response(self, mock_engine):
@@ -221,6 +233,86 @@ class TestStreamingPipelineMocked:
         assert state.turns[-1].role == TurnRole.ASSISTANT
 
 
+    @pytest.mark.asyncio
+    async def test_pcm_chunks_forwarded_before_sentence_completes(self, mock_engine):
+        """Raw PCM reaches the caller chunk by chunk, ahead of the sentence callback."""
+        engine, _, _, _ = mock_engine
+        conversation = engine.start_conversation()
+        events = []
+
+        async def on_chunk(chunk: bytes):
+            events.append(("chunk", chunk))
+
+        async def on_sentence(sentence: str, audio: bytes):
+            events.append(("sentence", audio))
+
+        _, full_audio = await engine.process_text_streaming(
+            "Hallo",
+            conversation.id,
+            on_sentence_ready=on_sentence,
+            on_audio_chunk=on_chunk,
+        )
+
+        assert [kind for kind, _ in events[:3]] == ["chunk", "chunk", "sentence"]
+        assert not events[0][1].startswith(b"RIFF")
+        assert events[2][1].startswith(b"RIFF")
+
+        # The full response is one WAV container around all PCM
+        import io
+        import wave
+
+        pcm = b"".join(data for kind, data in events if kind == "chunk")
+        with wave.open(io.BytesIO(full_audio)) as wav:
+            assert wav.getframerate() == 22050
+            assert wav.readframes(wav.getnframes()) == pcm
+        assert full_audio.count(b"RIFF") == 1
+
+    @pytest.mark.asyncio
+    async def test_audio_streaming_triage_runs_inline(self, mock_engine):
+        """Triage runs on the event loop, not queued on the inference scheduler."""
+        import threading
+
+        engine, mock_stt, _, _ = mock_engine
+        mock_stt._last_dialect = None
+        conversation = engine.start_conversation()
+        completed = engine.scheduler.statistics["completed"]
+        triaged = []
+
+        def perform_triage(text):
+            triaged.append((text, threading.get_ident()))
+
+        engine._industry_adapter.perform_triage = perform_triage
+
+        user_text, _, _ = await engine.process_audio_streaming(
+            np.zeros(16000, dtype=np.float32), conversation.id
+        )
+
+        assert triaged == [(user_text, threading.get_ident())]
+        assert engine.scheduler.statistics["completed"] == completed
+
+
+    @pytest.mark.asyncio
+    async def test_audio_streaming_first_audio_from_turn_start(self, mock_engine):
+        """Time to first audio includes the work between STT and the pipeline."""
+        import time
+
+        engine, mock_stt, _, _ = mock_engine
+        mock_stt._last_dialect = None
+        conversation = engine.start_conversation()
+        engine._industry_adapter.perform_triage = lambda text: time.sleep(0.05)
+        metrics = MagicMock()
+
+        with patch("phone_agent.core.conversation.get_metrics", return_value=metrics):
+            await engine.process_audio_streaming(
+                np.zeros(16000, dtype=np.float32), conversation.id
+            )
+
+        recorded = metrics.record_turn.call_args.kwargs
+        timings = engine.get_conversation(conversation.id).turns[-1].metadata["timings"]
+        assert timings["pipeline_start_ms"] >= 50
+        assert recorded["first_byte_time"] >= 0.05 + recorded["stt_time"]
+        assert recorded["total_time"] >= timings["pipeline_start_ms"] / 1000
+
 class TestStreamingWithHistory:
     """Test that streaming maintains conversation history."""
 
@@ -244,7 +336,10 @@ class TestStreamingWithHistory:
 
             mock_tts_instance = MagicMock()
             mock_tts_instance.is_loaded = True
-            mock_tts_instance.synthesize_async = AsyncMock(return_value=b"audio")
+            mock_tts_instance.sample_rate = 22050
+            mock_tts_instance.synthesize_stream_async = MagicMock(
+                side_effect=fake_pcm_stream
+            )
             mock_tts.return_value = mock_tts_instance
 
             engine = ConversationEngine()
@@ -305,3 +400,298 @@ class TestStreamingEdgeCases:
         """Test that streaming works with minimal callback."""
         # This is more of a smoke test to ensure basic functionality
         pass
+
+
+class FakePiperVoice:
+    """Piper voice stand-in producing one chunk per word."""
+
+    def __init__(self):
+        self.produced = 0
+
+    def synthesize(self, text):
+        from types import SimpleNamespace
+
+        for _ in text.split():
+            self.produced += 1
+            yield SimpleNamespace(audio_int16_bytes=b"\x00\x10" * 441)
+
+
+class TestStreamingTTS:
+    """Test raw PCM streaming from the TTS engine."""
+
+    def make_tts(self):
+        from phone_agent.ai import TextToSpeech
+
+        tts = TextToSpeech()
+        voice = FakePiperVoice()
+        tts._voice_cache[tts.voices["de"]] = voice
+        return tts, voice
+
+    def test_stream_yields_raw_pcm_per_chunk(self):
+        """Each Piper chunk is yielded as produced, without a container."""
+        tts, voice = self.make_tts()
+
+        stream = tts.synthesize_stream("Guten Tag zusammen")
+        first = next(stream)
+        assert voice.produced == 1  # Rest of the sentence not synthesized yet
+        assert len(first) == 882 and not first.startswith(b"RIFF")
+        assert len(list(stream)) == 2
+
+    def test_stream_matches_raw_synthesis(self):
+        """Streamed PCM equals the raw output of synthesize()."""
+        tts, _ = self.make_tts()
+        assert b"".join(tts.synthesize_stream("Guten Tag")) == tts.synthesize(
+            "Guten Tag", output_format="raw"
+        )
+
+    def test_stream_through_phrase_cache(self):
+        """A completed stream is cached; an interrupted one is not."""
+        from phone_agent.ai import TTSCache
+
+        tts, voice = self.make_tts()
+        tts.cache = TTSCache()
+
+        next(tts.synthesize_stream("Einen Moment bitte"))  # Barge-in after one chunk
+        assert list(tts.synthesize_stream("Einen Moment bitte"))
+        produced = voice.produced
+        assert b"".join(tts.synthesize_stream("Einen Moment bitte")) == tts.synthesize(
+            "Einen Moment bitte", output_format="raw"
+        )
+        assert voice.produced == produced
+
+    @pytest.mark.asyncio
+    async def test_async_stream_keeps_loop_free(self):
+        """Chunks arrive on the loop while synthesis runs on a thread."""
+        import threading
+
+        tts, _ = self.make_tts()
+        threads = set()
+        original = tts._stream_pcm
+
+        def tracking(text, language):
+            for chunk in original(text, language):
+                threads.add(threading.current_thread())
+                yield chunk
+
+        tts._stream_pcm = tracking
+        chunks = [c async for c in tts.synthesize_stream_async("eins zwei drei")]
+
+        assert len(chunks) == 3
+        assert threading.main_thread() not in threads
+
+
+class TestIterateInThread:
+    """Test the blocking-generator bridge."""
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_consumer(self):
+        """An exception in the generator is raised in the caller."""
+        from phone_agent.ai import iterate_in_thread
+
+        def failing():
+            yield 1
+            raise RuntimeError("voice failed")
+
+        received = []
+        with pytest.raises(RuntimeError, match="voice failed"):
+            async for item in iterate_in_thread(failing):
+                received.append(item)
+        assert received == [1]
+
+    @pytest.mark.asyncio
+    async def test_early_close_stops_producer(self):
+        """Closing the iterator stops a producer blocked on a full queue."""
+        import threading
+
+        from phone_agent.ai import iterate_in_thread
+
+        finished = threading.Event()
+
+        def endless():
+            try:
+                i = 0
+                while True:
+                    yield i
+                    i += 1
+            finally:
+                finished.set()
+
+        stream = iterate_in_thread(endless, max_pending=2)
+        assert await stream.__anext__() == 0
+        await stream.aclose()
+
+        for _ in range(50):
+            if finished.is_set():
+                break
+            await asyncio.sleep(0.02)
+        assert finished.is_set()
+
+
+class FakeWhisper:
+    """Whisper stand-in reading stream time from the audio samples.
+
+    Each sample holds its own stream time / 100, so a decode knows which
+    span of the scripted speech it was given. The word still being spoken
+    at the end of the window comes back misrecognized, like a real
+    decoder guessing at a cut-off word.
+    """
+
+    def __init__(self, script):
+        self.script = script  # [(start, end, word)] in stream seconds
+        self.prompts = []
+
+    def transcribe(self, audio, initial_prompt=None, **kwargs):
+        from types import SimpleNamespace
+
+        self.prompts.append(initial_prompt)
+        start = float(audio[0]) * 100
+        end = start + len(audio) / 16000
+        words = []
+        for w_start, w_end, text in self.script:
+            if w_start < start - 0.05 or w_start >= end:
+                continue
+            if w_end > end:
+                text = text[:2] + "?"
+            word_end = min(w_end, end) - start
+            words.append(
+                SimpleNamespace(start=w_start - start, end=word_end, word=" " + text)
+            )
+        info = SimpleNamespace(language="de", language_probability=0.99)
+        return [SimpleNamespace(words=words, text="")], info
+
+
+def make_streaming_stt(script):
+    from phone_agent.ai import SpeechToText
+
+    stt = SpeechToText(language="de")
+    stt._model = FakeWhisper(script)
+    stt._loaded = True
+    return stt
+
+
+def scripted_audio(seconds):
+    import numpy as np
+
+    ramp = np.arange(int(seconds * 16000), dtype=np.float64) / 16000 / 100
+    return ramp.astype(np.float32)
+
+
+class TestStreamingSTT:
+    """Test incremental transcription with partial results."""
+
+    SCRIPT = [
+        (0.1 + i * 0.4, 0.45 + i * 0.4, word)
+        for i, word in enumerate(
+            "ich habe seit gestern starke Zahnschmerzen "
+            "und brauche bitte heute einen Termin".split()
+        )
+    ]
+
+    def test_partials_commit_stable_prefix(self):
+        """Committed text only grows and the final has every word."""
+        from phone_agent.ai import StreamingConfig
+
+        stt = make_streaming_stt(self.SCRIPT)
+        stream = stt.open_stream(config=StreamingConfig(step_seconds=0.5))
+        audio = scripted_audio(5.0)
+
+        committed = []
+        partials = 0
+        for offset in range(0, len(audio), 4000):
+            hypothesis = stream.feed(audio[offset:offset + 4000])
+            if hypothesis is not None:
+                partials += 1
+                if committed:
+                    assert hypothesis.committed.startswith(committed[-1])
+                committed.append(hypothesis.committed)
+                assert "?" not in hypothesis.committed
+
+        final = stream.finish()
+        expected = " ".join(word for _, _, word in self.SCRIPT)
+        assert final.is_final
+        assert final.text == expected
+        assert final.text.startswith(committed[-1])
+        assert partials == 10
+        assert committed[-1]  # words were committed before end of turn
+
+    def test_window_is_bounded(self):
+        """Trimming keeps decode cost bounded and carries the prompt over."""
+        from phone_agent.ai import StreamingConfig
+
+        stt = make_streaming_stt(self.SCRIPT)
+        stream = stt.open_stream(
+            config=StreamingConfig(step_seconds=0.5, window_seconds=1.5)
+        )
+        audio = scripted_audio(5.0)
+
+        for offset in range(0, len(audio), 4000):
+            stream.feed(audio[offset:offset + 4000])
+            assert stream.buffered_seconds <= 2.0
+
+        final = stream.finish()
+        assert final.text == " ".join(word for _, _, word in self.SCRIPT)
+        assert any(stt._model.prompts)
+
+    @pytest.mark.asyncio
+    async def test_feed_async_uses_scheduler(self):
+        """Async feeding decodes on the inference scheduler."""
+        from phone_agent.ai import InferenceScheduler, SchedulerConfig
+
+        scheduler = InferenceScheduler(SchedulerConfig(max_workers=1))
+        stt = make_streaming_stt(self.SCRIPT)
+        stt.scheduler = scheduler
+        stream = stt.open_stream()
+        audio = scripted_audio(2.5)
+
+        results = [
+            await stream.feed_async(audio[i:i + 8000])
+            for i in range(0, len(audio), 8000)
+        ]
+        final = await stream.finish_async()
+
+        assert all(r is not None for r in results)
+        assert final.text == "ich habe seit gestern starke Zahnschmerzen"
+        assert scheduler.statistics["completed"] == 6
+        scheduler.shutdown(wait=False)
+
+    @pytest.mark.asyncio
+    async def test_websocket_sends_partial_and_final_transcripts(self):
+        """The WebSocket handler surfaces partials, then the final on stop."""
+        import json
+
+        from phone_agent.ai import InferenceScheduler, SchedulerConfig
+        from phone_agent.telephony.websocket_audio import (
+            AudioFrame,
+            WebSocketAudioHandler,
+            WebSocketSession,
+        )
+
+        scheduler = InferenceScheduler(SchedulerConfig(max_workers=1))
+        stt = make_streaming_stt(self.SCRIPT)
+        stt.scheduler = scheduler
+        handler = WebSocketAudioHandler(stt=stt)
+        websocket = MagicMock()
+        websocket.send_json = AsyncMock()
+        session = WebSocketSession(session_id=uuid4(), websocket=websocket)
+        handler._sessions[session.session_id] = session
+        hypotheses = []
+        handler.on_transcript(lambda session_id, h: hypotheses.append(h))
+
+        audio = scripted_audio(2.5)
+        for offset in range(0, len(audio), 8000):
+            await handler._process_audio(
+                session, AudioFrame.from_numpy(audio[offset:offset + 8000])
+            )
+            await asyncio.gather(*session.transcript_tasks)
+        await handler._handle_text_message(session, json.dumps({"type": "stop"}))
+
+        transcripts = [
+            call.args[0] for call in websocket.send_json.call_args_list
+            if call.args[0]["type"] == "transcript"
+        ]
+        assert not transcripts[0]["is_final"]
+        assert transcripts[-1]["is_final"]
+        assert transcripts[-1]["text"].startswith("ich habe seit gestern")
+        assert hypotheses[-1].is_final
+        assert session.transcript_stream is None
+        scheduler.shutdown(wait=False)
@@ -1,12 +1,22 @@
 """Tests for telephony components."""
 
 import asyncio
+import time
+from collections import deque
+from types import SimpleNamespace
 from uuid import uuid4
 
+import numpy as np
 import pytest
 
 from phone_agent.telephony.sip_client import SIPClient, SIPConfig, SIPCallState
-from phone_agent.telephony.audio_bridge import AudioBridge, AudioBridgeConfig
+from phone_agent.telephony.audio_bridge import (
+    AudioBridge,
+    AudioBridgeConfig,
+    ConnectionStatistics,
+    IngestDropPolicy,
+)
+from phone_agent.telephony.playout import PlayoutScheduler
 
 
 class TestSIPClient:
@@ -197,6 +207,1028 @@ class TestAudioBridge:
         # Callback is registered (actual test would need socket connection)
         assert bridge._on_audio_received is not None
 
+    @staticmethod
+    def _endpointed_conn(bridge, playout=None):
+        return SimpleNamespace(
+            call_id=uuid4(),
+            endpointer=bridge._create_endpointer(),
+            utterances=asyncio.Queue(),
+            turn_traces=deque(),
+            playout=playout,
+            response_generation=0,
+            responding=False,
+        )
+
+    @staticmethod
+    def _utterance_audio():
+        rng = np.random.default_rng(0)
+        return np.concatenate([
+            np.zeros(16000, dtype=np.float32),
+            (rng.standard_normal(16000) * 0.3).astype(np.float32),
+            np.zeros(16000, dtype=np.float32),
+        ])
+
+    @pytest.mark.asyncio
+    async def test_endpointing_delivers_utterances(self, bridge_config):
+        """Only complete utterances are queued for the turn task."""
+        bridge = AudioBridge(bridge_config)
+        conn = self._endpointed_conn(bridge)
+
+        audio = self._utterance_audio()
+        for start in range(0, len(audio), 320):
+            await bridge._deliver_audio(conn, audio[start:start + 320])
+
+        assert conn.utterances.qsize() == 1
+        assert 1.0 <= len(conn.utterances.get_nowait()) / 16000 < 2.0
+        assert bridge._stats.utterances_detected == 1
+        assert bridge._stats.silence_seconds_skipped > 0.5
+
+    @pytest.mark.asyncio
+    async def test_endpointing_disabled(self, bridge_config):
+        """Without endpointing every chunk is passed through."""
+        bridge_config.endpointing_enabled = False
+        bridge = AudioBridge(bridge_config)
+        received = []
+        bridge.on_audio_received(lambda call_id, audio: received.append(audio))
+        conn = SimpleNamespace(call_id=uuid4(), endpointer=bridge._create_endpointer())
+
+        assert conn.endpointer is None
+        await bridge._deliver_audio(conn, np.zeros(320, dtype=np.float32))
+        assert len(received) == 1
+
+    @pytest.mark.asyncio
+    async def test_barge_in_stops_playout(self, bridge_config):
+        """Caller speech during playout cancels it immediately."""
+        bridge = AudioBridge(bridge_config)
+        writer = FakeWriter()
+        playout = PlayoutScheduler(writer, frame_bytes=640)
+        conn = self._endpointed_conn(bridge, playout=playout)
+
+        playout.enqueue(bytes(640 * 250))  # 5 seconds of response audio
+        audio = self._utterance_audio()
+        for start in range(0, 24000, 320):
+            await bridge._deliver_audio(conn, audio[start:start + 320])
+
+        result = await playout.wait()
+        assert result.interrupted
+        assert result.played_ms < 1000
+        assert bridge._stats.barge_ins == 1
+        await playout.close()
+
+    @pytest.mark.asyncio
+    async def test_barge_in_drops_rest_of_turn(self, bridge_config):
+        """After a barge-in, the interrupted turn's later sentences are not queued."""
+        bridge = AudioBridge(bridge_config)
+        writer = FakeWriter()
+        conn = bridge._create_connection(uuid4(), None, writer)
+        bridge._connections[conn.call_id] = conn
+        first_sent = asyncio.Event()
+        resume = asyncio.Event()
+        sends = []
+
+        async def turn(call_id, audio):
+            sends.append(await bridge.send_audio(call_id, bytes(640 * 100)))
+            first_sent.set()
+            await resume.wait()  # Second sentence still being synthesized
+            sends.append(await bridge.send_audio(call_id, bytes(640 * 100)))
+
+        bridge.on_audio_received(turn)
+        turns = asyncio.create_task(bridge._run_turns(conn))
+        conn.utterances.put_nowait(np.zeros(1600, dtype=np.float32))
+        await first_sent.wait()
+
+        audio = self._utterance_audio()
+        for start in range(0, 24000, 320):
+            await bridge._deliver_audio(conn, audio[start:start + 320])
+        assert bridge._stats.barge_ins == 1
+        written = len(writer.frames)
+
+        resume.set()
+        await asyncio.sleep(0.1)
+        assert sends == [True, False]
+        assert not conn.playout.playing and len(writer.frames) == written
+        assert bridge._stats.responses_dropped == 1
+
+        # The turn answering the interruption speaks again
+        async def next_turn(call_id, audio):
+            sends.append(await bridge.send_audio(call_id, bytes(640)))
+
+        bridge.on_audio_received(next_turn)
+        conn.utterances.put_nowait(np.zeros(1600, dtype=np.float32))
+        conn.utterances.put_nowait(None)
+        await turns
+        assert sends == [True, False, True]
+        await conn.playout.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("policy,expected", [
+        (IngestDropPolicy.DROP_OLDEST, [b"2", b"3"]),
+        (IngestDropPolicy.DROP_NEWEST, [b"0", b"1"]),
+    ])
+    async def test_ingest_drop_policy(self, bridge_config, policy, expected):
+        """A full ingest queue drops frames according to the policy."""
+        bridge_config.ingest_queue_frames = 2
+        bridge_config.ingest_drop_policy = policy
+        bridge = AudioBridge(bridge_config)
+        conn = SimpleNamespace(
+            call_id=uuid4(),
+            frame_queue=asyncio.Queue(maxsize=2),
+            stats=ConnectionStatistics(),
+        )
+
+        for frame in (b"0", b"1", b"2", b"3"):
+            await bridge._enqueue_frame(conn, frame)
+
+        assert [conn.frame_queue.get_nowait() for _ in range(2)] == expected
+        assert conn.stats.frames_dropped == 2
+        assert conn.stats.queue_high_watermark == 2
+        assert bridge._stats.frames_dropped == 2
+
+    @pytest.mark.asyncio
+    async def test_block_policy_waits_for_consumer(self, bridge_config):
+        """The block policy stops the reader instead of dropping audio."""
+        bridge_config.ingest_drop_policy = IngestDropPolicy.BLOCK
+        bridge = AudioBridge(bridge_config)
+        conn = SimpleNamespace(
+            call_id=uuid4(),
+            frame_queue=asyncio.Queue(maxsize=1),
+            stats=ConnectionStatistics(),
+        )
+
+        await bridge._enqueue_frame(conn, b"0")
+        blocked = asyncio.create_task(bridge._enqueue_frame(conn, b"1"))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        conn.frame_queue.get_nowait()
+        await asyncio.wait_for(blocked, timeout=1.0)
+        assert conn.stats.frames_dropped == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_callback_does_not_stall_socket(self, bridge_config):
+        """The socket keeps being read while the AI callback is busy."""
+        bridge_config.endpointing_enabled = False
+        bridge_config.buffer_chunks = 1
+        bridge_config.ingest_queue_frames = 4
+        bridge = AudioBridge(bridge_config)
+
+        release = asyncio.Event()
+        calls = 0
+
+        async def slow_callback(call_id, audio):
+            nonlocal calls
+            calls += 1
+            await release.wait()
+
+        bridge.on_audio_received(slow_callback)
+        server = await asyncio.start_server(bridge._handle_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            frame = np.zeros(bridge_config.chunk_size, dtype=np.int16).tobytes()
+            for _ in range(20):
+                writer.write(frame)
+                await writer.drain()
+                await asyncio.sleep(0.005)
+
+            for _ in range(100):
+                if bridge.statistics.frames_received >= 20:
+                    break
+                await asyncio.sleep(0.01)
+
+            stats = bridge.statistics
+            assert stats.frames_received >= 20
+            assert stats.frames_dropped > 0
+            assert calls == 1
+            (call_stats,) = stats.calls.values()
+            assert call_stats["queue_depth"] <= 4
+            assert call_stats["frames_dropped"] == stats.frames_dropped
+
+            release.set()
+            writer.close()
+        finally:
+            server.close()
+            await server.wait_closed()
+
+
+    @pytest.mark.asyncio
+    async def test_stream_end_answers_last_utterance(self, bridge_config):
+        """Queued frames and the utterance cut off by EOF still get their turn."""
+        bridge = AudioBridge(bridge_config)
+        events = []
+        closed = asyncio.Event()
+
+        async def on_audio(call_id, audio):
+            await asyncio.sleep(0.05)  # Turn still running when the stream ends
+            events.append(("turn", len(audio) / 16000))
+
+        def on_disconnection(call_id):
+            events.append(("closed", None))
+            closed.set()
+
+        bridge.on_audio_received(on_audio)
+        bridge.on_disconnection(on_disconnection)
+        server = await asyncio.start_server(bridge._handle_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            # Caller still speaking when the stream ends: no trailing silence
+            speech = self._utterance_audio()[:32000]
+            writer.write((speech * 32767).astype(np.int16).tobytes())
+            await writer.drain()
+            writer.close()
+
+            await asyncio.wait_for(closed.wait(), timeout=2.0)
+            (turn, closed_event) = events
+            assert turn[0] == "turn" and 0.9 <= turn[1] < 1.5
+            assert closed_event[0] == "closed"
+            assert bridge.statistics.utterances_detected == 1
+        finally:
+            server.close()
+            await server.wait_closed()
+
+
+class FakeWriter:
+    """Stream writer stand-in recording frames and write times."""
+
+    def __init__(self):
+        self.frames: list[bytes] = []
+        self.times: list[float] = []
+
+    def write(self, data: bytes) -> None:
+        self.frames.append(data)
+        self.times.append(time.monotonic())
+
+    async def drain(self) -> None:
+        pass
+
+
+class TestPlayoutScheduler:
+    """Test paced outbound playout."""
+
+    @pytest.mark.asyncio
+    async def test_frames_paced_in_real_time(self):
+        """Frames are written one per 20 ms and completion is reported."""
+        writer = FakeWriter()
+        playout = PlayoutScheduler(writer, frame_bytes=160, lead_ms=0)
+
+        start = time.monotonic()
+        playout.enqueue(bytes(160 * 10))
+        assert playout.playing
+        result = await playout.wait()
+        elapsed = time.monotonic() - start
+
+        assert [len(f) for f in writer.frames] == [160] * 10
+        assert 0.18 <= elapsed < 0.5
+        assert writer.times[-1] - writer.times[0] >= 0.17
+        assert result.queued_ms == pytest.approx(200)
+        assert result.played_ms == pytest.approx(200)
+        assert not result.interrupted
+        assert not playout.playing
+        await playout.close()
+
+    @pytest.mark.asyncio
+    async def test_cancel_interrupts(self):
+        """Cancel discards queued audio and reports the heard position."""
+        writer = FakeWriter()
+        playout = PlayoutScheduler(writer, frame_bytes=160)
+
+        playout.enqueue(bytes(160 * 100))  # 2 seconds
+        await asyncio.sleep(0.1)
+        assert 40 <= playout.position_ms <= 200
+
+        result = playout.cancel()
+        assert result.interrupted
+        assert 40 <= result.played_ms <= 200
+        assert result.queued_ms == pytest.approx(2000)
+        assert await playout.wait() == result
+
+        await asyncio.sleep(0.05)
+        assert len(writer.frames) < 20
+        await playout.close()
+
+    @pytest.mark.asyncio
+    async def test_enqueue_appends_to_current_playback(self):
+        """Audio queued while playing extends the same playback."""
+        writer = FakeWriter()
+        playout = PlayoutScheduler(writer, frame_bytes=160, lead_ms=0)
+
+        playout.enqueue(bytes(160 * 2))
+        playout.enqueue(bytes(160 * 3))
+        result = await playout.wait()
+        assert result.queued_ms == pytest.approx(100)
+        assert len(writer.frames) == 5
+        await playout.close()
+
+
+def rtp_packet(seq, payload=bytes(160), payload_type=8, received=None, timestamp=None):
+    """RTP packet that arrived ``received`` (default: 1 s ago, so it is due)."""
+    from phone_agent.telephony.rtp_config import RTPHeader, RTPPacket
+
+    header = RTPHeader(
+        version=2, padding=False, extension=False, csrc_count=0, marker=False,
+        payload_type=payload_type, sequence=seq & 0xFFFF,
+        timestamp=(seq * 160 if timestamp is None else timestamp) & 0xFFFFFFFF, ssrc=1,
+    )
+    if received is None:
+        received = time.monotonic() - 1.0
+    return RTPPacket(header=header, payload=payload, received_time=received)
+
+
+def tone_frames(count, freq=200.0, rate=8000, samples=160):
+    """Consecutive frames of a sine tone."""
+    t = np.arange(count * samples) / rate
+    audio = (8000 * np.sin(2 * np.pi * freq * t)).astype(np.int16)
+    return [audio[i * samples:(i + 1) * samples] for i in range(count)]
+
+
+class TestJitterBuffer:
+    """Test RTP reordering, decoding and loss concealment."""
+
+    def test_reorder_duplicate_and_late(self):
+        """Packets play out in sequence order; duplicates and late ones are dropped."""
+        from phone_agent.telephony.rtp_config import JitterBuffer
+
+        buffer = JitterBuffer()
+        for seq in (1, 3, 2, 3):
+            buffer.put(rtp_packet(seq))
+
+        assert [buffer.get().header.sequence for _ in range(3)] == [1, 2, 3]
+        buffer.put(rtp_packet(0))
+        assert buffer.get() is None
+        assert buffer.stats["packets_duplicate"] == 1
+        assert buffer.stats["packets_late"] == 1
+
+    def test_sequence_wrap_and_overflow(self):
+        """Sequence numbers wrap; packets beyond capacity push the oldest out."""
+        from phone_agent.telephony.rtp_config import JitterBuffer, JitterBufferConfig
+
+        buffer = JitterBuffer(JitterBufferConfig(capacity=4))
+        for seq in (65534, 65535, 0, 1, 2):
+            buffer.put(rtp_packet(seq))
+
+        assert [buffer.get().header.sequence for _ in range(4)] == [65535, 0, 1, 2]
+        assert buffer.stats["packets_dropped"] == 1
+
+    def test_wrap_with_larger_capacity(self):
+        """Reordered packets across the wrap keep their slots at another capacity."""
+        from phone_agent.telephony.rtp_config import JitterBuffer, JitterBufferConfig
+
+        buffer = JitterBuffer(JitterBufferConfig(capacity=256))
+        sequences = [(65500 + i) & 0xFFFF for i in range(200)]
+        order = sequences[:]
+        for i in range(1, len(order) - 1, 2):  # The first packet starts playout
+            order[i], order[i + 1] = order[i + 1], order[i]
+        arrived = time.monotonic() - 10.0  # All due
+        for seq in order:
+            buffer.put(rtp_packet(seq, received=arrived))
+
+        assert [buffer.get().header.sequence for _ in range(200)] == sequences
+        assert buffer.stats["packets_dropped"] == 0
+        assert buffer.stats["packets_lost"] == 0
+
+    @pytest.mark.parametrize("capacity", [0, 48, 100, 131072])
+    def test_capacity_must_divide_sequence_space(self, capacity):
+        """Capacities that break slot indexing at the wrap are rejected."""
+        from phone_agent.telephony.rtp_config import JitterBufferConfig
+
+        with pytest.raises(ValueError, match="power of two"):
+            JitterBufferConfig(capacity=capacity)
+
+    def test_decodes_payload_codec(self):
+        """G.711 payloads are decoded, not read as raw PCM."""
+        from phone_agent.telephony.codecs import ALawCodec, MuLawCodec
+        from phone_agent.telephony.rtp_config import JitterBuffer
+
+        frame = tone_frames(1)[0]
+        for codec, payload_type in ((ALawCodec(), 8), (MuLawCodec(), 0)):
+            buffer = JitterBuffer()
+            buffer.put(rtp_packet(10, codec.encode(frame), payload_type))
+            audio = buffer.get_audio()
+
+            assert len(audio) == 160
+            assert np.abs(audio.astype(np.int32) - frame).max() < 300
+
+    def test_loss_concealed_with_attenuated_repetition(self):
+        """A lost frame repeats the last pitch period; long losses fade out."""
+        from phone_agent.telephony.codecs import ALawCodec
+        from phone_agent.telephony.rtp_config import JitterBuffer
+
+        codec = ALawCodec()
+        frames = tone_frames(12)
+        buffer = JitterBuffer()
+        for seq in (0, 1, 2, 3, 4, 5, 11):  # 6-10 lost
+            buffer.put(rtp_packet(seq, codec.encode(frames[seq])))
+
+        audio = [buffer.get_audio() for _ in range(12)]
+
+        concealed = audio[6]
+        assert np.abs(concealed[:80]).max() > 6000  # Full level for the first 10 ms
+        # 200 Hz has a 40-sample period: the repetition continues the tone
+        assert np.abs(concealed[:80].astype(np.int32) - frames[6][:80]).max() < 600
+        assert np.abs(audio[7]).max() < np.abs(concealed).max()
+        assert not audio[9].any() and not audio[10].any()  # Silent after 60 ms
+        assert np.abs(audio[11]).max() > 6000
+        assert buffer.stats["packets_concealed"] == 5
+        assert buffer.stats["packets_lost"] == 5
+
+    def test_delay_follows_interarrival_jitter(self):
+        """The RFC 3550 estimate drives the playout delay."""
+        from phone_agent.telephony.rtp_config import JitterBuffer
+
+        steady = JitterBuffer()
+        jittery = JitterBuffer()
+        start = time.monotonic() - 10.0
+        for seq in range(200):
+            steady.put(rtp_packet(seq, received=start + seq * 0.02))
+            jittery.put(
+                rtp_packet(seq, received=start + seq * 0.02 + 0.025 * (seq % 2))
+            )
+
+        assert steady.jitter == 0
+        assert steady.stats["buffer_delay_ms"] == 40  # min_delay_ms
+        assert jittery.jitter_ms == pytest.approx(25.0, rel=0.05)
+        assert jittery.jitter == pytest.approx(200, rel=0.05)  # Timestamp units
+        assert jittery.stats["buffer_delay_ms"] == pytest.approx(100.0, rel=0.05)
+
+    def test_waits_for_playout_delay(self):
+        """Nothing plays out before the buffer delay has passed."""
+        from phone_agent.telephony.rtp_config import JitterBuffer
+
+        buffer = JitterBuffer()
+        buffer.put(rtp_packet(0, received=time.monotonic()))
+        assert buffer.get_audio() is None
+        assert buffer.stats["buffer_size"] == 1
+
+
+class UdpPeer(asyncio.DatagramProtocol):
+    """Far end of an RTP (or RTCP) flow recording what it receives."""
+
+    def __init__(self):
+        self.datagrams: list[bytes] = []
+        self.received = asyncio.Event()
+
+    def datagram_received(self, data, addr):
+        self.datagrams.append(data)
+        self.received.set()
+
+    @classmethod
+    async def open(cls, port=0):
+        transport, peer = await asyncio.get_running_loop().create_datagram_endpoint(
+            cls, local_addr=("127.0.0.1", port)
+        )
+        peer.transport = transport
+        peer.address = transport.get_extra_info("sockname")
+        return peer
+
+
+class TestRTPMediaEngine:
+    """Test direct RTP media for concurrent calls on one port."""
+
+    @pytest.fixture
+    async def engine(self):
+        from phone_agent.telephony.rtp_engine import RTPMediaEngine
+
+        engine = RTPMediaEngine(AudioBridgeConfig(
+            host="127.0.0.1", port=0, endpointing_enabled=False, buffer_chunks=1,
+            jitter_buffer_min_ms=20, rtcp_interval_s=0.05, playout_lead_ms=0,
+        ))
+        await engine.listen()
+        yield engine
+        await engine.stop()
+
+    def send_tone(self, peer, engine, ssrc, frames=5):
+        from phone_agent.telephony.codecs import ALawCodec
+        from phone_agent.telephony.rtp_config import RTPHeader, RTPPacket
+
+        codec = ALawCodec()
+        for seq, frame in enumerate(tone_frames(frames)):
+            header = RTPHeader(2, False, False, 0, False, 8, seq, seq * 160, ssrc)
+            peer.transport.sendto(
+                RTPPacket(header, codec.encode(frame)).to_bytes(),
+                ("127.0.0.1", engine.port),
+            )
+
+    @pytest.mark.asyncio
+    async def test_sessions_demultiplexed_by_source(self, engine):
+        """Two calls on one port reach their own sessions, decoded and resampled."""
+        caller_a, caller_b = await UdpPeer.open(), await UdpPeer.open()
+        session_a = engine.open_session(caller_a.address)
+        session_b = engine.open_session(caller_b.address)
+        received: dict = {}
+        engine.on_audio_received(
+            lambda session, audio: received.setdefault(session, []).append(audio)
+        )
+
+        self.send_tone(caller_a, engine, ssrc=111)
+        self.send_tone(caller_b, engine, ssrc=222, frames=3)
+        await asyncio.sleep(0.3)
+
+        assert sum(len(a) for a in received[session_a]) == 5 * 320  # 16 kHz
+        assert sum(len(a) for a in received[session_b]) == 3 * 320
+        assert np.abs(np.concatenate(received[session_a])).max() > 0.1
+        assert engine.session_info(session_a)["remote_ssrc"] == 111
+        assert engine.rtp_statistics.packets_received == 8
+        caller_a.transport.close()
+        caller_b.transport.close()
+
+    @pytest.mark.asyncio
+    async def test_unknown_source_latches_and_gets_replies(self, engine):
+        """A session without a remote address answers the first expected source."""
+        from phone_agent.telephony.rtp_config import RTPPacket
+        from phone_agent.telephony.rtp_engine import ExpectedSource
+
+        caller = await UdpPeer.open()
+        session = engine.open_session(expected=ExpectedSource("127.0.0.1"))
+        self.send_tone(caller, engine, ssrc=333, frames=1)
+        await asyncio.sleep(0.05)
+
+        assert await engine.send_audio(session, np.zeros(16000 // 10, dtype=np.float32))
+        await engine.wait_for_playout(session)
+
+        packets = [RTPPacket.parse(d) for d in caller.datagrams]
+        assert len(packets) == 5  # 100 ms in 20 ms frames
+        assert packets[0].header.marker and not packets[1].header.marker
+        assert {p.header.payload_type for p in packets} == {8}
+        assert {p.header.ssrc for p in packets} == {
+            engine.session_info(session)["ssrc"]
+        }
+        assert [len(p.payload) for p in packets] == [160] * 5
+        caller.transport.close()
+
+    @pytest.mark.asyncio
+    async def test_foreign_source_cannot_take_media(self, engine):
+        """Unexpected sources neither latch nor redirect a session by its SSRC."""
+        from phone_agent.telephony.rtp_engine import ExpectedSource
+
+        caller, intruder = await UdpPeer.open(), await UdpPeer.open()
+        port = caller.address[1]
+        session = engine.open_session(expected=ExpectedSource("127.0.0.1", port, port))
+
+        self.send_tone(intruder, engine, ssrc=666, frames=2)
+        await asyncio.sleep(0.05)
+        assert engine.session_info(session)["remote"] is None
+        assert engine.rtp_statistics.packets_unknown_source == 2
+
+        self.send_tone(caller, engine, ssrc=777, frames=2)
+        assert await asyncio.wait_for(engine.wait_latched(session), 1.0)
+        assert engine.session_info(session)["remote"] == list(caller.address)
+
+        # Spoofed SSRC from elsewhere: rejected, the session stays put
+        self.send_tone(intruder, engine, ssrc=777, frames=3)
+        await asyncio.sleep(0.05)
+        assert engine.session_info(session)["remote"] == list(caller.address)
+        assert engine.rtp_statistics.packets_rejected == 3
+        caller.transport.close()
+        intruder.transport.close()
+
+    @pytest.mark.asyncio
+    async def test_relatch_needs_consecutive_packets(self, engine):
+        """A known SSRC moves to a new address only after several packets in a row."""
+        caller, moved = await UdpPeer.open(), await UdpPeer.open()
+        session = engine.open_session(caller.address)
+        self.send_tone(caller, engine, ssrc=888, frames=1)
+        await asyncio.sleep(0.02)
+
+        self.send_tone(moved, engine, ssrc=888, frames=4)
+        self.send_tone(caller, engine, ssrc=888, frames=1)  # Resets the count
+        self.send_tone(moved, engine, ssrc=888, frames=4)
+        await asyncio.sleep(0.05)
+        assert engine.session_info(session)["remote"] == list(caller.address)
+
+        self.send_tone(moved, engine, ssrc=888, frames=5)
+        await asyncio.sleep(0.05)
+        assert engine.session_info(session)["remote"] == list(moved.address)
+        caller.transport.close()
+        moved.transport.close()
+
+    @pytest.mark.asyncio
+    async def test_pending_sessions_latch_their_own_source(self, engine):
+        """Two pending sessions each latch the source their signalling named."""
+        from phone_agent.telephony.rtp_engine import ExpectedSource
+
+        caller_a, caller_b = await UdpPeer.open(), await UdpPeer.open()
+        port_a, port_b = caller_a.address[1], caller_b.address[1]
+        session_a = engine.open_session(
+            expected=ExpectedSource("127.0.0.1", port_a, port_a)
+        )
+        session_b = engine.open_session(
+            expected=ExpectedSource("127.0.0.1", port_b, port_b)
+        )
+
+        # The second call's media arrives first: it must not land on the oldest
+        self.send_tone(caller_b, engine, ssrc=222, frames=1)
+        assert await asyncio.wait_for(engine.wait_latched(session_b), 1.0)
+        assert engine.session_info(session_a)["remote"] is None
+
+        self.send_tone(caller_a, engine, ssrc=111, frames=1)
+        assert await asyncio.wait_for(engine.wait_latched(session_a), 1.0)
+        assert engine.session_info(session_a)["remote"] == list(caller_a.address)
+        assert engine.session_info(session_b)["remote"] == list(caller_b.address)
+        caller_a.transport.close()
+        caller_b.transport.close()
+
+    @pytest.mark.asyncio
+    async def test_unlatched_session_expires(self):
+        """A session whose expected source never sends ends after the latch timeout."""
+        from phone_agent.telephony.rtp_engine import ExpectedSource, RTPMediaEngine
+
+        engine = RTPMediaEngine(
+            AudioBridgeConfig(
+                host="127.0.0.1",
+                port=0,
+                endpointing_enabled=False,
+                rtp_latch_timeout_s=0.1,
+            )
+        )
+        await engine.listen()
+        ended = asyncio.Event()
+        engine.on_disconnection(lambda session_id: ended.set())
+
+        session = engine.open_session(expected=ExpectedSource("127.0.0.1"))
+        assert not await asyncio.wait_for(engine.wait_latched(session), 1.0)
+        await asyncio.wait_for(ended.wait(), 1.0)
+        assert engine.session_info(session) is None
+        assert engine.rtp_statistics.sessions_expired == 1
+        with pytest.raises(ValueError):
+            engine.open_session()
+        await engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_rtcp_reports_and_bye(self, engine):
+        """Receiver reports carry reception stats and the last SR; BYE ends the call."""
+        from phone_agent.telephony.rtp_config import RTCPPacket, RTCPType, ntp_timestamp
+
+        caller = await UdpPeer.open()
+        caller_rtcp = await UdpPeer.open(caller.address[1] + 1)
+        session = engine.open_session(caller.address)
+        ended = asyncio.Event()
+        engine.on_disconnection(lambda session_id: ended.set())
+
+        self.send_tone(caller, engine, ssrc=444, frames=4)
+        sr = RTCPPacket(RTCPType.SR, 444, ntp_timestamp=ntp_timestamp(time.time()))
+        caller_rtcp.transport.sendto(sr.to_bytes(), ("127.0.0.1", engine.port + 1))
+        await asyncio.sleep(0.15)
+
+        reports = [
+            p for d in caller_rtcp.datagrams for p in RTCPPacket.parse_compound(d)
+        ]
+        block = reports[-1].reports[0]
+        assert reports[-1].packet_type == RTCPType.RR
+        assert block.ssrc == 444 and block.highest_seq == 3
+        assert block.cumulative_lost == 0
+        assert block.last_sr_timestamp == (sr.ntp_timestamp >> 16) & 0xFFFFFFFF
+
+        # RTCP naming the session from another host is ignored
+        bye = RTCPPacket(RTCPType.BYE, 444)
+        rejected = engine.rtp_statistics.packets_rejected
+        engine._on_rtcp(sr.to_bytes() + bye.to_bytes(), ("203.0.113.9", 5001))
+        assert engine.rtp_statistics.packets_rejected == rejected + 2
+        assert engine._streams[session].rtcp_remote == caller_rtcp.address
+        assert not ended.is_set()
+
+        caller_rtcp.transport.sendto(bye.to_bytes(), ("127.0.0.1", engine.port + 1))
+        await asyncio.wait_for(ended.wait(), 1.0)
+        assert engine.session_info(session) is None
+        assert RTCPType.BYE in [
+            p.packet_type for p in RTCPPacket.parse_compound(caller_rtcp.datagrams[-1])
+        ]
+        caller.transport.close()
+        caller_rtcp.transport.close()
+
+
+class TwilioSocket:
+    """WebSocket stand-in replaying Twilio messages and recording sends."""
+
+    def __init__(self, messages=()):
+        self.incoming: asyncio.Queue = asyncio.Queue()
+        for message in messages:
+            self.incoming.put_nowait(message)
+        self.sent: list[dict] = []
+        self.closed_with = None
+
+    async def accept(self):
+        pass
+
+    async def close(self, code=1000, reason=""):
+        self.closed_with = code
+
+    async def receive_text(self):
+        import json
+
+        return json.dumps(await self.incoming.get())
+
+    async def send_text(self, text):
+        import json
+
+        self.sent.append(json.loads(text))
+
+    def events(self, name):
+        return [m for m in self.sent if m["event"] == name]
+
+
+class TestTwilioMediaStream:
+    """Test windowed receive and paced, marked sends on Twilio streams."""
+
+    def media_messages(self, frames):
+        import base64
+
+        from phone_agent.telephony.codecs import MuLawCodec
+
+        codec = MuLawCodec()
+        messages = [{"event": "start", "streamSid": "MZ1", "start": {"callSid": "CA1"}}]
+        for seq, frame in enumerate(frames):
+            payload = base64.b64encode(codec.encode(frame)).decode()
+            messages.append(
+                {
+                    "event": "media",
+                    "sequenceNumber": str(seq + 2),
+                    "streamSid": "MZ1",
+                    "media": {
+                        "track": "inbound",
+                        "chunk": str(seq + 1),
+                        "payload": payload,
+                    },
+                }
+            )
+        return messages + [{"event": "stop", "streamSid": "MZ1"}]
+
+    @pytest.mark.asyncio
+    async def test_frames_grouped_into_windows(self):
+        """Twelve 20 ms frames arrive as two 100 ms windows plus the tail."""
+        from phone_agent.telephony.codecs import MuLawCodec, StreamingResampler
+        from phone_agent.telephony.websocket_audio import TwilioMediaStreamHandler
+
+        frames = tone_frames(12)
+        handler = TwilioMediaStreamHandler()
+        windows = []
+        handler.on_audio(lambda stream_sid, audio: windows.append((stream_sid, audio)))
+
+        await handler.serve(TwilioSocket(self.media_messages(frames)))
+
+        assert [sid for sid, _ in windows] == ["MZ1"] * 3
+        assert [len(audio) for _, audio in windows] == [1600, 1600, 640]
+        # One resampler per stream: identical to resampling the call in one piece
+        codec = MuLawCodec()
+        whole = StreamingResampler(8000, 16000).process(
+            codec.decode(codec.encode(np.concatenate(frames)))
+        ) / 32768.0
+        np.testing.assert_allclose(
+            np.concatenate([a for _, a in windows]), whole, atol=1e-6
+        )
+        assert handler.get_stream("MZ1") is None
+
+    @pytest.mark.asyncio
+    async def test_response_paced_and_marked(self):
+        """A response goes out as 20 ms media events, then a mark."""
+        from phone_agent.telephony.websocket_audio import TwilioMediaStreamHandler
+
+        handler = TwilioMediaStreamHandler()
+        socket = TwilioSocket([{"event": "start", "streamSid": "MZ1", "start": {}}])
+        serving = asyncio.create_task(handler.serve(socket))
+        await asyncio.sleep(0)
+
+        start = time.monotonic()
+        mark = await handler.send_audio(socket, "MZ1", np.zeros(3200, dtype=np.float32))
+        await handler.get_stream("MZ1").playout.wait()
+
+        assert time.monotonic() - start >= 0.09  # 200 ms, 60 ms lead
+        media = socket.events("media")
+        assert len(media) == 10
+        mark_event = {"event": "mark", "streamSid": "MZ1", "mark": {"name": mark}}
+        assert socket.sent[-1] == mark_event
+
+        socket.incoming.put_nowait(mark_event)
+        assert await handler.wait_for_playback("MZ1", mark, timeout=1.0)
+        socket.incoming.put_nowait({"event": "stop"})
+        await serving
+
+    @pytest.mark.asyncio
+    async def test_clear_stops_playout(self):
+        """Barge-in clears Twilio's buffer and releases the pending mark."""
+        from phone_agent.telephony.websocket_audio import TwilioMediaStreamHandler
+
+        handler = TwilioMediaStreamHandler()
+        socket = TwilioSocket([{"event": "start", "streamSid": "MZ1", "start": {}}])
+        serving = asyncio.create_task(handler.serve(socket))
+        await asyncio.sleep(0)
+
+        mark = await handler.send_audio(
+            socket, "MZ1", np.zeros(16000, dtype=np.float32)
+        )
+        await asyncio.sleep(0.1)
+        await handler.clear("MZ1")
+
+        assert await handler.wait_for_playback("MZ1", mark, timeout=0.1)
+        assert socket.sent[-1]["event"] == "clear"
+        assert len(socket.events("media")) < 20
+        assert not socket.events("mark")
+        socket.incoming.put_nowait({"event": "stop"})
+        await serving
+
+    @pytest.mark.asyncio
+    async def test_endpoint_routes_utterances_to_its_call(self, monkeypatch):
+        """The media endpoint runs its call's turns and plays them on the stream."""
+        import base64
+
+        from phone_agent import dependencies
+        from phone_agent.api.webhooks import twilio_media_stream
+        from phone_agent.telephony.codecs import MuLawCodec
+        from phone_agent.telephony.service import (
+            TelephonyService,
+            TelephonyServiceConfig,
+        )
+
+        turns = []
+
+        class Engine:
+            def start_conversation(self):
+                return SimpleNamespace(id=uuid4())
+
+            def end_conversation(self, conversation_id):
+                pass
+
+            async def generate_greeting(self, conversation_id):
+                return "Guten Tag.", np.full(800, 0.25, dtype=np.float32)
+
+            async def process_audio(self, audio, conversation_id):
+                turns.append((len(audio), conversation_id))
+                return "Gern.", np.zeros(1600, dtype=np.float32)
+
+        class EchoingSocket(TwilioSocket):
+            async def send_text(self, text):
+                await super().send_text(text)
+                if self.sent[-1]["event"] == "mark":  # Twilio echoes played marks
+                    self.incoming.put_nowait(self.sent[-1])
+
+        service = TelephonyService(TelephonyServiceConfig(preload_models=False))
+        service.call_handler.conversation_engine = Engine()
+        handled = []
+        handle_utterance = service.call_handler.handle_utterance
+
+        async def spy(call_id, audio):
+            handled.append(call_id)
+            return await handle_utterance(call_id, audio)
+
+        monkeypatch.setattr(service.call_handler, "handle_utterance", spy)
+        # The endpointer follows the shared bridge settings
+        service.audio_bridge.config.endpoint_max_utterance_ms = 400
+        monkeypatch.setattr(dependencies, "_telephony_service_instance", service)
+        call_sid = "CA" + "1" * 32
+        await service.handle_webhook_incoming(
+            call_sid, "+491111", "+49800", provider="twilio"
+        )
+        call = service.get_external_call(call_sid)
+
+        # Unknown call: rejected before accepting
+        stranger = TwilioSocket()
+        await twilio_media_stream(stranger, "CA" + "2" * 32)
+        assert stranger.closed_with == 4004
+
+        async def until(condition):
+            for _ in range(100):
+                if condition():
+                    return
+                await asyncio.sleep(0.02)
+
+        # The held greeting plays once the stream's first window arrives
+        silence = [np.zeros(160, dtype=np.int16)]
+        audio = silence * 5 + tone_frames(30) + silence * 50
+        messages = self.media_messages(audio)[:-1]
+        socket = EchoingSocket(messages[:6])
+        serving = asyncio.create_task(twilio_media_stream(socket, call_sid))
+        await until(lambda: socket.events("mark"))
+        first = base64.b64decode(socket.events("media")[0]["media"]["payload"])
+        assert np.abs(MuLawCodec().decode(first)).mean() > 1000
+        assert len(socket.events("mark")) == 1
+
+        # Speech longer than the bridge's 400 ms limit is cut into turns
+        for message in messages[6:]:
+            socket.incoming.put_nowait(message)
+        await until(lambda: len(turns) >= 2)
+
+        assert handled[:2] == [call.call_id] * 2
+        conversations = [conversation for _, conversation in turns[:2]]
+        assert conversations == [call.conversation.id] * 2
+        assert all(length / 16000 <= 0.4 for length, _ in turns)
+        socket.incoming.put_nowait({"event": "stop"})
+        await asyncio.wait_for(serving, 2.0)
+        assert service.get_external_call(call_sid) is None
+
+
+class AudioSocket:
+    """Binary WebSocket stand-in replaying frames and recording sends."""
+
+    def __init__(self, frames=()):
+        self.incoming: asyncio.Queue = asyncio.Queue()
+        for frame in frames:
+            self.incoming.put_nowait(frame)
+        self.sent: list[bytes] = []
+        self.closed_with = None
+
+    async def accept(self):
+        pass
+
+    async def close(self, code=1000, reason=""):
+        self.closed_with = code
+
+    async def receive_bytes(self):
+        from fastapi import WebSocketDisconnect
+
+        frame = await self.incoming.get()
+        if frame is None:
+            raise WebSocketDisconnect()
+        return frame
+
+    async def send_bytes(self, data):
+        self.sent.append(data)
+
+
+class TestAudioSocketStreams:
+    """Test the sipgate and generic audio WebSocket endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_keep_their_audio(self, monkeypatch):
+        """Two sipgate calls each hear only answers to their own caller."""
+        from phone_agent import dependencies
+        from phone_agent.api.webhooks import sipgate_audio_stream
+        from phone_agent.telephony.codecs import ALawCodec
+        from phone_agent.telephony.service import (
+            TelephonyService,
+            TelephonyServiceConfig,
+        )
+
+        turns = []
+        levels = {}
+
+        class Engine:
+            def start_conversation(self):
+                conversation = SimpleNamespace(id=uuid4())
+                levels[conversation.id] = 0.1 * (len(levels) + 1)
+                return conversation
+
+            def end_conversation(self, conversation_id):
+                pass
+
+            async def generate_greeting(self, conversation_id):
+                return "Guten Tag.", np.zeros(320, dtype=np.float32)
+
+            async def process_audio(self, audio, conversation_id):
+                spectrum = np.abs(np.fft.rfft(audio))
+                freq = np.argmax(spectrum) * 16000 / len(audio)
+                turns.append((conversation_id, freq))
+                return "Gern.", np.full(1600, levels[conversation_id], dtype=np.float32)
+
+        service = TelephonyService(TelephonyServiceConfig(preload_models=False))
+        service.call_handler.conversation_engine = Engine()
+        monkeypatch.setattr(dependencies, "_telephony_service_instance", service)
+        for call_id in ("sg-a", "sg-b"):
+            await service.handle_webhook_incoming(
+                call_id, "+491111", "+49800", provider="sipgate"
+            )
+        calls = {c: service.get_external_call(c) for c in ("sg-a", "sg-b")}
+
+        # Unknown call: rejected before accepting
+        stranger = AudioSocket()
+        await sipgate_audio_stream(stranger, "sg-unknown")
+        assert stranger.closed_with == 4004
+
+        codec = ALawCodec()
+        silence = [np.zeros(160, dtype=np.int16)]
+
+        def frames(freq):
+            speech = silence * 5 + tone_frames(30, freq) + silence * 40
+            return [codec.encode(frame) for frame in speech]
+
+        sockets = {
+            "sg-a": AudioSocket(frames(200.0)),
+            "sg-b": AudioSocket(frames(500.0)),
+        }
+        serving = [
+            asyncio.create_task(sipgate_audio_stream(socket, call_id))
+            for call_id, socket in sockets.items()
+        ]
+        for _ in range(100):
+            if all(len(socket.sent) >= 2 for socket in sockets.values()):
+                break
+            await asyncio.sleep(0.02)
+
+        heard = {conversation: round(freq, -2) for conversation, freq in turns}
+        assert heard == {
+            calls["sg-a"].conversation.id: 200.0,
+            calls["sg-b"].conversation.id: 500.0,
+        }
+        for call_id, socket in sockets.items():
+            greeting, response = socket.sent[:2]
+            level = np.abs(codec.decode(response)).mean() / 32768
+            assert abs(level - levels[calls[call_id].conversation.id]) < 0.01
+            socket.incoming.put_nowait(None)
+        await asyncio.wait_for(asyncio.gather(*serving), 2.0)
+        assert service.get_external_call("sg-a") is None
+        assert service.get_external_call("sg-b") is None
+
 
 class TestFreeSwitchClient:
     """Test FreeSWITCH client functionality."""
@@ -244,6 +1276,234 @@ Channel-State: CS_ROUTING
         assert len(client._event_handlers["CHANNEL_CREATE"]) == 1
 
 
+class FakeEventSocket:
+    """Minimal FreeSWITCH event socket: auth, subscribe and bgapi jobs.
+
+    Each bgapi job answers after ``delays[command]`` seconds (never, if
+    the delay is None), so results can arrive out of order.
+    """
+
+    def __init__(self, delays=None):
+        self.delays = delays or {}
+        self.commands = []
+        self.writer = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    def close(self):
+        self.server.close()
+
+    def send(self, headers, body=""):
+        head = "".join(f"{key}: {value}\n" for key, value in headers.items())
+        if body:
+            head += f"Content-Length: {len(body.encode())}\n"
+        self.writer.write((head + "\n" + body).encode())
+
+    def send_event(self, event_headers, event_body=""):
+        body = "".join(f"{key}: {value}\n" for key, value in event_headers.items())
+        if event_body:
+            body += f"Content-Length: {len(event_body.encode())}\n\n{event_body}"
+        self.send({"Content-Type": "text/event-plain"}, body)
+
+    async def _serve(self, reader, writer):
+        self.writer = writer
+        self.send({"Content-Type": "auth/request"})
+        while True:
+            try:
+                request = await reader.readuntil(b"\n\n")
+            except (asyncio.IncompleteReadError, ConnectionError):
+                return
+            lines = request.decode().strip().split("\n")
+            command = lines[0]
+            if command.startswith("bgapi "):
+                job_uuid = lines[1].split(": ", 1)[1]
+                api = command[len("bgapi "):]
+                self.commands.append(api)
+                self.send(
+                    {
+                        "Content-Type": "command/reply",
+                        "Reply-Text": f"+OK Job-UUID: {job_uuid}",
+                        "Job-UUID": job_uuid,
+                    }
+                )
+                delay = self.delays.get(api.split()[0], 0.0)
+                if delay is not None:
+                    asyncio.get_running_loop().call_later(
+                        delay, self.send_event,
+                        {"Event-Name": "BACKGROUND_JOB", "Job-UUID": job_uuid},
+                        f"+OK {api}\n",
+                    )
+            elif command.startswith("api "):
+                self.commands.append(command[len("api "):])
+                self.send({"Content-Type": "api/response"}, "+OK\n")
+            else:
+                self.send(
+                    {"Content-Type": "command/reply", "Reply-Text": "+OK accepted"}
+                )
+
+
+class TestFreeSwitchMultiplexing:
+    """Test concurrent ESL commands over one connection."""
+
+    @pytest.fixture
+    async def esl(self):
+        from phone_agent.telephony.freeswitch import FreeSwitchClient, FreeSwitchConfig
+
+        clients = []
+
+        async def connect(delays=None, command_timeout=2.0):
+            server = FakeEventSocket(delays)
+            port = await server.start()
+            client = FreeSwitchClient(FreeSwitchConfig(
+                port=port, reconnect=False, command_timeout=command_timeout,
+            ))
+            assert await client.connect()
+            clients.append((client, server))
+            return client, server
+
+        yield connect
+        for client, server in clients:
+            await client.disconnect()
+            server.close()
+
+    @pytest.mark.asyncio
+    async def test_bgapi_results_matched_by_job_uuid(self, esl):
+        """Concurrent commands complete together, whatever order results arrive in."""
+        client, server = await esl({"uuid_answer": 0.2, "uuid_kill": 0.0})
+
+        start = time.monotonic()
+        answered, hung_up, status = await asyncio.gather(
+            client.answer("chan-a"), client.hangup("chan-b"), client.api("status")
+        )
+
+        assert answered and hung_up and status == "+OK\n"
+        assert time.monotonic() - start < 0.35
+        assert set(server.commands) == {
+            "uuid_answer chan-a",
+            "uuid_kill chan-b NORMAL_CLEARING",
+            "status",
+        }
+        assert client.statistics.commands_completed == 3
+        assert client.commands_in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, esl):
+        """A job whose result never comes times out and is counted."""
+        client, _ = await esl({"uuid_dump": None}, command_timeout=0.1)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await client.bgapi("uuid_dump chan-a")
+        assert await client.get_channel_info("chan-a") is None
+
+        assert client.statistics.commands_timed_out == 2
+        assert client.commands_in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_handler_can_await_commands(self, esl):
+        """Event handlers run apart from the reader, so their commands complete."""
+        client, server = await esl()
+        answered = asyncio.Event()
+
+        @client.on_event("CHANNEL_PARK")
+        async def on_park(event):
+            assert event.caller_id_name == "Max Mustermann"
+            if await client.answer(event.channel_uuid):
+                answered.set()
+
+        server.send_event({
+            "Event-Name": "CHANNEL_PARK",
+            "Unique-ID": "chan-a",
+            "Caller-Caller-ID-Name": "Max%20Mustermann",
+        })
+
+        await asyncio.wait_for(answered.wait(), 1.0)
+
+    @pytest.mark.asyncio
+    async def test_connection_loss_fails_pending(self, esl):
+        """Commands in flight fail when the socket closes."""
+        client, server = await esl({"uuid_answer": None})
+
+        pending = asyncio.create_task(client.bgapi("uuid_answer chan-a"))
+        await asyncio.sleep(0.05)
+        server.writer.close()
+
+        with pytest.raises(ConnectionError):
+            await pending
+        assert not client.is_connected
+
+
+class TestEslParser:
+    """Test incremental ESL frame parsing and ordered dispatch."""
+
+    MESSAGES = (
+        b"Content-Type: command/reply\nReply-Text: +OK Job-UUID: job-1\n\n"
+        b"Content-Type: api/response\nContent-Length: 4\n\n+OK\n"
+        b"Content-Length: 101\nContent-Type: text/event-plain\n\n"
+        b"Event-Name: BACKGROUND_JOB\nJob-UUID: job-1\n"
+        b"Caller-Caller-ID-Name: M%C3%BCller\n"
+        b"Content-Length: 4\n\n+OK\n"
+    )
+
+    def test_frames_split_at_any_boundary(self):
+        """Messages come out whole whatever the chunking."""
+        from phone_agent.telephony.esl import EslParser
+
+        for size in (1, 2, 7, 50, len(self.MESSAGES)):
+            parser = EslParser()
+            frames = []
+            for i in range(0, len(self.MESSAGES), size):
+                frames.extend(parser.feed(self.MESSAGES[i:i + size]))
+
+            assert [f.content_type for f in frames] == [
+                "command/reply", "api/response", "text/event-plain"
+            ]
+            assert frames[0].reply_text == "+OK Job-UUID: job-1"
+            assert frames[1].body == "+OK\n"
+            assert parser.buffered == 0
+
+    def test_event_headers_decoded_on_access(self):
+        """Event headers are URL-decoded lazily and the event body split off."""
+        from phone_agent.telephony.esl import EslParser
+
+        frame = EslParser().feed(self.MESSAGES)[2]
+        headers, body = frame.event_parts()
+
+        assert headers._cache == {}
+        assert headers["Caller-Caller-ID-Name"] == "Müller"
+        assert "Job-UUID" in headers and "Missing" not in headers
+        assert set(headers._cache) == {"Caller-Caller-ID-Name", "Job-UUID", "Missing"}
+        assert dict(headers)["Event-Name"] == "BACKGROUND_JOB"
+        assert body == "+OK\n"
+
+    @pytest.mark.asyncio
+    async def test_slow_channel_does_not_block_others(self):
+        """Keys run concurrently, items of one key in order."""
+        from phone_agent.telephony.esl import OrderedDispatcher
+
+        handled = []
+
+        async def handle(item):
+            key, n = item
+            if key == "slow":
+                await asyncio.sleep(0.1)
+            handled.append(item)
+
+        dispatcher = OrderedDispatcher(handle)
+        for n in range(3):
+            dispatcher.submit("slow", ("slow", n))
+            dispatcher.submit("fast", ("fast", n))
+        await asyncio.sleep(0.05)
+
+        assert handled == [("fast", 0), ("fast", 1), ("fast", 2)]
+        assert dispatcher.pending == 2
+
+        await dispatcher.join()
+        assert [n for key, n in handled if key == "slow"] == [0, 1, 2]
+        assert dispatcher.dispatched == 6 and dispatcher.active_keys == 0
+
+
 class TestWebhooks:
     """Test webhook handlers."""
 
@@ -0,0 +1,193 @@
+"""Tests for per-turn tracing."""
+
+import json
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from phone_agent.ai import InferenceScheduler, SchedulerConfig
+from phone_agent.core import PipelineConfig, ResponsePipeline
+from phone_agent.core.tracing import (
+    JsonLinesExporter,
+    Tracer,
+    TracingConfig,
+    current_trace,
+    record_span,
+    set_tracer,
+    span,
+)
+
+
+@pytest.fixture
+def tracer():
+    """Global tracer that keeps every trace in memory and exports nothing."""
+    tracer = Tracer(TracingConfig(sample_rate=0.0, slow_turn_ms=60_000))
+    set_tracer(tracer)
+    yield tracer
+    set_tracer(None)
+
+
+def spans_by_name(trace):
+    return {s.name: s for s in trace.spans}
+
+
+class TestSpans:
+    """Test span recording on the current trace."""
+
+    def test_nesting(self, tracer):
+        """Spans opened inside a span become its children."""
+        with tracer.turn(call_id="c1") as trace:
+            with span("llm") as outer:
+                with span("llm.generate", tokens=3) as inner:
+                    pass
+            record_span("encode", outer.start)
+
+        assert trace.end is not None
+        assert inner.parent_id == outer.span_id
+        assert inner.attributes == {"tokens": 3}
+        assert spans_by_name(trace)["encode"].parent_id is None
+        assert tracer.recent == [trace]
+
+    def test_noop_without_trace(self, tracer):
+        """Instrumented code runs untraced outside a turn."""
+        with span("stt") as record:
+            record_span("encode", 0.0)
+        assert record is None
+        assert current_trace() is None
+        assert tracer.recent == []
+
+    def test_turn_joins_active_trace(self, tracer):
+        """A nested turn() records into the enclosing trace."""
+        with tracer.turn(call_id="c1") as outer:
+            with tracer.turn(call_id="c1") as inner:
+                with span("stt"):
+                    pass
+            assert outer.end is None
+
+        assert inner is outer
+        assert [t.name for t in tracer.recent] == ["turn"]
+
+    def test_disabled(self):
+        """A disabled tracer creates no traces."""
+        tracer = Tracer(TracingConfig(enabled=False))
+        with tracer.turn(call_id="c1") as trace:
+            with span("stt") as record:
+                pass
+        assert trace is None and record is None
+
+    def test_span_limit(self, tracer):
+        """Spans beyond max_spans are counted and dropped."""
+        tracer.config.max_spans = 2
+        with tracer.turn() as trace:
+            for _ in range(5):
+                with span("tts"):
+                    pass
+        assert len(trace.spans) == 2
+        assert trace.dropped_spans == 3
+
+
+class TestExport:
+    """Test exporting sampled and slow traces."""
+
+    def test_slow_turn_exported(self, tmp_path):
+        """Turns over the threshold are written as one JSON line each."""
+        path = tmp_path / "traces" / "turns.jsonl"
+        tracer = Tracer(
+            TracingConfig(sample_rate=0.0, slow_turn_ms=0.0),
+            exporter=JsonLinesExporter(path),
+        )
+        with tracer.turn(call_id="c1", industry="handwerk"):
+            with span("stt"):
+                with span("stt.compute"):
+                    pass
+
+        record = json.loads(path.read_text().strip())
+        assert record["call_id"] == "c1"
+        assert record["attributes"] == {"industry": "handwerk"}
+        assert [s["name"] for s in record["spans"]] == ["stt", "stt.compute"]
+        assert record["spans"][1]["parent_id"] == record["spans"][0]["span_id"]
+        assert tracer.exported == 1
+
+    def test_fast_unsampled_turn_not_exported(self, tmp_path):
+        """Fast turns are exported only when sampled."""
+        path = tmp_path / "turns.jsonl"
+        tracer = Tracer(
+            TracingConfig(sample_rate=0.0, slow_turn_ms=60_000, export_path=str(path))
+        )
+        with tracer.turn():
+            pass
+        assert not path.exists()
+
+        tracer.config.sample_rate = 1.0
+        with tracer.turn():
+            pass
+        assert len(path.read_text().splitlines()) == 1
+
+
+class TestInstrumentation:
+    """Test spans recorded by pipeline components."""
+
+    @pytest.mark.asyncio
+    async def test_scheduler_spans_cross_threads(self, tracer):
+        """Queue wait and compute are recorded for requests from a traced turn."""
+        scheduler = InferenceScheduler(SchedulerConfig(max_workers=1))
+        try:
+            with tracer.turn() as trace:
+                with span("stt") as stt:
+                    await scheduler.submit(lambda: "text", kind="stt")
+        finally:
+            scheduler.shutdown(wait=False)
+
+        spans = spans_by_name(trace)
+        assert spans["stt.queue_wait"].parent_id == stt.span_id
+        assert spans["stt.compute"].parent_id == stt.span_id
+        compute = spans["stt.compute"]
+        assert compute.attributes == {"batch_size": 1}
+        assert stt.start <= compute.start <= compute.end <= stt.end
+
+    @pytest.mark.asyncio
+    async def test_response_pipeline_spans(self, tracer, fake_llm, fake_tts):
+        """The streaming pipeline splits LLM and TTS into their stages."""
+        pipeline = ResponsePipeline(fake_llm, fake_tts, PipelineConfig())
+
+        with tracer.turn() as trace:
+            await pipeline.run([])
+
+        names = [s.name for s in trace.spans]
+        assert names.count("tts") == 2
+        assert names.count("tts.first_chunk") == 1
+        spans = spans_by_name(trace)
+        assert spans["llm.generate"].attributes["tokens"] == 4
+        assert spans["llm.prompt_eval"].end <= spans["llm.generate"].end
+
+    @pytest.mark.asyncio
+    async def test_bridge_starts_trace_at_endpoint(self, tracer):
+        """The audio bridge opens a turn trace when an utterance ends."""
+        from phone_agent.telephony.audio_bridge import AudioBridge, AudioConnection
+
+        bridge = AudioBridge()
+        conn = AudioConnection(
+            call_id=uuid4(),
+            reader=None,
+            writer=None,
+            config=bridge.config,
+            codec_pipeline=None,
+            endpointer=bridge._create_endpointer(),
+        )
+        rng = np.random.default_rng(0)
+        audio = np.concatenate([
+            np.zeros(16000, dtype=np.float32),
+            (rng.standard_normal(16000) * 0.3).astype(np.float32),
+            np.zeros(16000, dtype=np.float32),
+        ])
+        for start in range(0, len(audio), 320):
+            await bridge._deliver_audio(conn, audio[start:start + 320])
+
+        trace, detected = conn.turn_traces[0]
+        endpoint = spans_by_name(trace)["vad_endpoint"]
+        assert trace.call_id == str(conn.call_id)
+        assert endpoint.end == detected
+        assert endpoint.duration == pytest.approx(
+            conn.endpointer.config.hangover_ms / 1000
+        )
@@ -0,0 +1,180 @@
+"""Tests for the phrase-level TTS audio cache."""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from phone_agent.ai import TextToSpeech, TTSCache, TTSCacheConfig
+
+
+class FakeVoice:
+    """Piper voice stand-in producing one chunk of PCM per character."""
+
+    def __init__(self):
+        self.calls = []
+
+    def synthesize(self, text):
+        self.calls.append(text)
+        samples = np.full(len(text), 1000, dtype=np.int16)
+        yield SimpleNamespace(audio_int16_bytes=samples.tobytes())
+
+
+def make_tts(cache):
+    """TextToSpeech with its German voice already 'loaded'."""
+    tts = TextToSpeech(cache=cache)
+    voice = FakeVoice()
+    tts._voice_cache[tts.voices["de"]] = voice
+    return tts, voice
+
+
+def key(cache, text, voice="v1", fmt="wav"):
+    return cache.make_key(voice, "de", text, fmt)
+
+
+class TestTTSCache:
+    """Test lookups, keys and eviction."""
+
+    def test_hit_after_store(self):
+        """Stored audio is returned and counted as saved."""
+        cache = TTSCache()
+        cache.put(key(cache, "Guten Tag"), b"audio")
+
+        assert cache.get(key(cache, "Guten Tag")) == b"audio"
+        assert cache.get(key(cache, "Auf Wiederhören")) is None
+        stats = cache.statistics
+        assert stats["hits"] == 1
+        assert stats["hit_ratio"] == 0.5
+        assert stats["bytes_saved"] == 5
+
+    def test_key_normalizes_text_but_not_voice_or_format(self):
+        """Whitespace differences share an entry; voice and format do not."""
+        cache = TTSCache()
+        assert key(cache, "Guten  Tag ") == key(cache, "Guten Tag")
+        assert key(cache, "Guten Tag", voice="v2") != key(cache, "Guten Tag")
+        assert key(cache, "Guten Tag", fmt="raw") != key(cache, "Guten Tag")
+
+    def test_memory_lru_bounded_by_bytes(self):
+        """The least recently used entry is evicted first."""
+        cache = TTSCache(TTSCacheConfig(memory_bytes=10))
+        cache.put("a", b"aaaa")
+        cache.put("b", b"bbbb")
+        cache.get("a")
+        cache.put("c", b"cccc")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"aaaa"
+        assert cache.memory_size == 8
+        assert cache.statistics["evictions"] == 1
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        """A new cache on the same directory serves earlier audio."""
+        config = TTSCacheConfig(disk_path=tmp_path)
+        TTSCache(config).put("k", b"pcm-data")
+
+        restarted = TTSCache(config)
+        assert restarted.get("k") == b"pcm-data"
+        assert restarted.statistics["disk_hits"] == 1
+        assert restarted.get("k") == b"pcm-data"
+        assert restarted.statistics["memory_hits"] == 1
+
+    def test_disk_tier_trimmed_to_budget(self, tmp_path):
+        """Disk files beyond the budget are removed."""
+        cache = TTSCache(TTSCacheConfig(disk_path=tmp_path, disk_bytes=10))
+        for name in ("a", "b", "c"):
+            cache.put(name, b"12345")
+
+        assert len(list(tmp_path.glob("*.audio"))) == 2
+        assert cache.statistics["disk_bytes"] == 10
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_disk_tier_evicts_least_recently_read(self, tmp_path):
+        """Disk reads refresh recency, also for files from a previous run."""
+        config = TTSCacheConfig(disk_path=tmp_path, disk_bytes=10, memory_bytes=0)
+        first = TTSCache(config)
+        first.put("a", b"12345")
+        first.put("b", b"12345")
+
+        restarted = TTSCache(config)
+        assert restarted.statistics["disk_bytes"] == 10
+        assert restarted.get("a") == b"12345"
+        restarted.put("c", b"12345")
+
+        assert sorted(p.stem for p in tmp_path.glob("*.audio")) == ["a", "c"]
+        assert restarted.statistics["disk_bytes"] == 10
+
+
+class TestCachedSynthesis:
+    """Test TextToSpeech consulting the cache."""
+
+    def test_repeated_phrase_synthesized_once(self):
+        """Repeats are served from cache, in each format separately."""
+        cache = TTSCache()
+        tts, voice = make_tts(cache)
+
+        first = tts.synthesize("Vielen Dank für Ihren Anruf.")
+        again = tts.synthesize("Vielen Dank für  Ihren Anruf.")
+        raw = tts.synthesize("Vielen Dank für Ihren Anruf.", output_format="raw")
+
+        assert first == again
+        assert first.startswith(b"RIFF") and not raw.startswith(b"RIFF")
+        assert len(voice.calls) == 2
+        assert tts.get_stats()["phrase_cache"]["hits"] == 1
+
+    def test_long_text_not_cached(self):
+        """Texts over the length limit bypass storage."""
+        cache = TTSCache(TTSCacheConfig(max_text_length=10))
+        tts, voice = make_tts(cache)
+
+        tts.synthesize("Dies ist ein langer Satz.")
+        tts.synthesize("Dies ist ein langer Satz.")
+        assert len(voice.calls) == 2
+
+    def test_prewarm_counts_new_phrases(self):
+        """Prewarming synthesizes each distinct phrase once."""
+        cache = TTSCache()
+        tts, voice = make_tts(cache)
+
+        warmed = cache.prewarm(tts, ["Hallo", "Hallo ", "Tschüss", ""])
+        assert warmed == 2
+        assert cache.prewarm(tts, ["Hallo"]) == 0
+        assert cache.statistics["lookups"] == 0  # Warming is not traffic
+
+        tts.synthesize("Tschüss")
+        assert voice.calls == ["Hallo", "Tschüss"]
+        assert cache.statistics["lookups"] == 1
+        assert cache.statistics["hit_ratio"] == 1.0
+
+    def test_engine_warms_greetings_and_prompts(self):
+        """The conversation engine pre-synthesizes its fixed phrases."""
+        from phone_agent.core.conversation import REPEAT_PROMPT, ConversationEngine
+
+        cache = TTSCache()
+        tts, voice = make_tts(cache)
+        engine = ConversationEngine(
+            stt=SimpleNamespace(), llm=SimpleNamespace(), tts=tts, industry="gastro"
+        )
+
+        warmed = engine.warm_tts_cache()
+
+        assert warmed > 5
+        assert REPEAT_PROMPT in voice.calls
+        assert engine.greeting_text("Abend") in voice.calls
+        assert "Vielen Dank für Ihren Anruf und bis bald!" in voice.calls
+
+    def test_streamed_prewarmed_phrase_hits_memory(self):
+        """Warmed phrases are also cached in the raw format streaming uses."""
+        from phone_agent.core.conversation import REPEAT_PROMPT, ConversationEngine
+
+        cache = TTSCache()
+        tts, voice = make_tts(cache)
+        engine = ConversationEngine(
+            stt=SimpleNamespace(), llm=SimpleNamespace(), tts=tts, industry="gastro"
+        )
+        engine.warm_tts_cache()
+        calls = len(voice.calls)
+
+        streamed = b"".join(tts.synthesize_stream(REPEAT_PROMPT))
+
+        assert streamed == np.full(len(REPEAT_PROMPT), 1000, dtype=np.int16).tobytes()
+        assert len(voice.calls) == calls
+        assert cache.statistics["memory_hits"] == 1
@@ -5,7 +5,9 @@ import pytest
 import time
 
 from phone_agent.ai.vad import (
+    EndpointerConfig,
     SimpleVAD,
+    SpeechEndpointer,
     VADSegment,
     VADFrame,
     VADFactory,
@@ -14,6 +16,7 @@ from phone_agent.ai.vad import (
 from phone_agent.core.metrics import (
     LatencyMetrics,
     ComponentMetrics,
+    LatencyHistogram,
     TurnMetrics,
     get_metrics,
     reset_metrics,
@@ -72,6 +75,79 @@ class TestSimpleVAD:
         assert vad._silence_frames == 0
 
 
+class TestSpeechEndpointer:
+    """Tests for VAD-driven utterance endpointing."""
+
+    FRAME = 512
+
+    @staticmethod
+    def _speech(frames: int) -> np.ndarray:
+        rng = np.random.default_rng(0)
+        return (rng.standard_normal(frames * 512) * 0.3).astype(np.float32)
+
+    @staticmethod
+    def _silence(frames: int) -> np.ndarray:
+        return np.zeros(frames * 512, dtype=np.float32)
+
+    @pytest.fixture
+    def endpointer(self):
+        """Endpointer with 2-frame onset, 4-frame hangover, 20-frame cap."""
+        config = EndpointerConfig(
+            min_speech_ms=64, hangover_ms=128, preroll_ms=64, max_utterance_ms=640
+        )
+        return SpeechEndpointer(SimpleVAD(threshold=0.02), config)
+
+    def test_silence_emits_nothing(self, endpointer):
+        """Silence never reaches the caller and is counted as discarded."""
+        assert endpointer.feed(self._silence(50)) == []
+        assert not endpointer.in_speech
+        assert endpointer.samples_discarded > 0
+
+    def test_utterance_emitted_after_hangover(self, endpointer):
+        """An utterance is emitted once, after the hangover silence."""
+        assert endpointer.feed(self._silence(10)) == []
+        assert endpointer.feed(self._speech(8)) == []
+        assert endpointer.in_speech
+        assert endpointer.feed(self._silence(3)) == []
+
+        utterances = endpointer.feed(self._silence(5))
+        assert len(utterances) == 1
+        # Pre-roll (2) + speech (8) + hangover (4) frames
+        assert len(utterances[0]) == 14 * self.FRAME
+        assert not endpointer.in_speech
+
+    def test_odd_chunk_sizes(self, endpointer):
+        """Chunking of the input does not change the result."""
+        audio = np.concatenate([self._silence(10), self._speech(8), self._silence(10)])
+        utterances = []
+        for start in range(0, len(audio), 333):
+            utterances.extend(endpointer.feed(audio[start:start + 333]))
+        assert [len(u) for u in utterances] == [14 * self.FRAME]
+
+    def test_short_noise_ignored(self, endpointer):
+        """A single loud frame does not start an utterance."""
+        audio = np.concatenate([self._silence(5), self._speech(1), self._silence(10)])
+        assert endpointer.feed(audio) == []
+        assert endpointer.utterances == 0
+
+    def test_max_utterance_length(self, endpointer):
+        """Long speech is split at the maximum utterance length."""
+        utterances = endpointer.feed(self._speech(45))
+        assert len(utterances) == 2
+        assert all(len(u) == 20 * self.FRAME for u in utterances)
+        assert endpointer.forced_endpoints == 2
+        assert endpointer.in_speech
+
+    def test_flush_returns_partial(self, endpointer):
+        """Flush hands back speech in progress and resets state."""
+        endpointer.feed(self._speech(5))
+        partial = endpointer.flush()
+        assert partial is not None
+        assert len(partial) == 5 * self.FRAME
+        assert not endpointer.in_speech
+        assert endpointer.flush() is None
+
+
 class TestVADFactory:
     """Tests for VADFactory."""
 
@@ -132,7 +208,7 @@ class TestComponentMetrics:
 
         assert metrics.total_calls == 3
         assert metrics.total_time == 3.0
-        assert len(metrics.samples) == 3
+        assert metrics.histogram.count == 3
 
     def test_mean(self):
         """Test mean calculation."""
@@ -149,7 +225,7 @@ class TestComponentMetrics:
         for i in [1, 2, 3, 4, 5]:
             metrics.record(float(i))
 
-        assert metrics.median == 3.0
+        assert metrics.median == pytest.approx(3.0, rel=0.02)
 
     def test_percentiles(self):
         """Test percentile calculations."""
@@ -157,8 +233,8 @@ class TestComponentMetrics:
         for i in range(100):
             metrics.record(float(i))
 
-        assert metrics.p90 == 90.0
-        assert metrics.p99 == 99.0
+        assert metrics.p90 == pytest.approx(90.0, rel=0.02)
+        assert metrics.p99 == pytest.approx(99.0, rel=0.02)
 
     def test_min_max(self):
         """Test min and max."""
@@ -181,14 +257,71 @@ class TestComponentMetrics:
         assert "mean_ms" in d
         assert "p90_ms" in d
 
-    def test_sample_limit(self):
-        """Test that samples are limited to 1000."""
+    def test_constant_memory(self):
+        """Test that repeated samples share histogram buckets."""
         metrics = ComponentMetrics(name="test")
         for i in range(1500):
             metrics.record(1.0)
 
-        assert len(metrics.samples) == 1000
+        assert len(metrics.histogram.counts) == 1
         assert metrics.total_calls == 1500
+        assert metrics.p99 == 1.0  # Clamped to the exact min/max
+
+    def test_rolling_windows(self):
+        """Test that old samples leave the short windows."""
+        now = [0.0]
+        metrics = ComponentMetrics(name="test", clock=lambda: now[0])
+        metrics.record(2.0)
+        now[0] = 120.0
+        metrics.record(0.1)
+
+        assert metrics.window("1m").count == 1
+        assert metrics.window("1m").max == 0.1
+        assert metrics.window("5m").count == 2
+        assert metrics.window("1h").count == 2
+        now[0] = 3 * 3600.0
+        assert metrics.window("1h").count == 0
+        assert metrics.total_calls == 2
+        assert metrics.to_dict()["windows"]["5m"]["calls"] == 0
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_percentile_accuracy(self):
+        """Test percentiles stay within bucket precision across scales."""
+        rng = np.random.default_rng(0)
+        values = rng.lognormal(mean=-3, sigma=1.5, size=5000)
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(float(value))
+
+        for q in (0.5, 0.9, 0.99):
+            exact = np.sort(values)[int(len(values) * q)]
+            assert histogram.percentile(q) == pytest.approx(exact, rel=0.02)
+        assert histogram.mean == pytest.approx(values.mean())
+        assert histogram.stddev == pytest.approx(values.std(ddof=1))
+
+    def test_merge_and_serialize(self):
+        """Test merging histograms shipped from another worker."""
+        a, b = LatencyHistogram(), LatencyHistogram()
+        for i in range(1, 51):
+            a.record(i / 1000)
+        for i in range(51, 101):
+            b.record(i / 1000)
+
+        a.merge(LatencyHistogram.from_dict(b.to_dict()))
+
+        assert a.count == 100
+        assert a.min == 0.001 and a.max == 0.1
+        assert a.percentile(0.5) == pytest.approx(0.051, rel=0.02)
+
+    def test_empty(self):
+        """Test empty histogram reports zeros."""
+        histogram = LatencyHistogram()
+        assert histogram.percentile(0.99) == 0.0
+        assert histogram.mean == 0.0
+        assert LatencyHistogram.from_dict(histogram.to_dict()).count == 0
 
 
 class TestTurnMetrics:
@@ -317,6 +450,26 @@ class TestLatencyMetrics:
 
         assert metrics.get_component("stt").total_calls == 0
 
+    def test_merge_workers(self, metrics):
+        """Test merging another worker's collector."""
+        other = LatencyMetrics()
+        metrics.record("stt", 0.5)
+        other.record("stt", 0.7)
+        other.record("vad_frame", 0.001)
+
+        metrics.merge(other)
+
+        assert metrics.get_component("stt").total_calls == 2
+        assert metrics.get_component("vad_frame").total_calls == 1
+
+    def test_get_stats(self, metrics):
+        """Test per-component statistics only include used components."""
+        metrics.record("llm", 1.0)
+
+        stats = metrics.get_stats()
+        assert list(stats) == ["llm"]
+        assert stats["llm"]["windows"]["1m"]["calls"] == 1
+
 
 class TestGlobalMetrics:
     """Tests for global metrics instance."""
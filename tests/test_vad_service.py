@@ -0,0 +1,196 @@
+"""Tests for the batched, per-call VAD service."""
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from phone_agent.ai import (
+    EndpointerConfig,
+    SpeechEndpointer,
+    VADBackend,
+    VADService,
+    VADServiceConfig,
+)
+from phone_agent.ai.vad_service import SILERO_CONTEXT, SILERO_WINDOW
+
+
+class FakeSileroBackend(VADBackend):
+    """Silero stand-in: probability from loudness, state counts windows.
+
+    Each stream's state grows by one per evaluated window, so mixed-up
+    states between calls show up as wrong counts.
+    """
+
+    def __init__(self):
+        self.batches = []
+        self.inputs = []
+
+    def infer(self, inputs, state):
+        assert inputs.shape[1] == SILERO_CONTEXT + SILERO_WINDOW
+        assert state.shape == (2, len(inputs), 128)
+        self.batches.append(len(inputs))
+        self.inputs.append(inputs.copy())
+        rms = np.sqrt(np.mean(inputs[:, SILERO_CONTEXT:] ** 2, axis=1))
+        probs = np.minimum(rms * 5, 1.0)
+        return probs, state + 1
+
+
+def make_service(wait_ms=5.0, **config):
+    backend = FakeSileroBackend()
+    service = VADService(backend, VADServiceConfig(batch_wait_ms=wait_ms, **config))
+    return service, backend
+
+
+def windows_seen(stream):
+    return int(stream.state[0, 0, 0])
+
+
+class TestVADStream:
+    """Test per-stream windowing and state."""
+
+    def test_exact_windows_with_carry_over(self):
+        """Input is sliced into 512-sample windows; the rest waits."""
+        service, backend = make_service()
+        stream = service.open_stream()
+
+        assert len(stream.windows(np.ones(800, dtype=np.float32))) == 1
+        windows = stream.windows(np.ones(224, dtype=np.float32))
+        assert len(windows) == 1 and len(windows[0]) == SILERO_WINDOW
+
+    def test_100ms_chunk_fully_evaluated(self):
+        """No part of a long chunk is truncated away."""
+        service, backend = make_service()
+        stream = service.open_stream()
+        chunk = np.concatenate([np.zeros(1024), np.full(576, 0.5)]).astype(np.float32)
+
+        speech, prob = stream.is_speech(chunk)
+
+        assert speech and prob == 1.0  # Speech at the end of the chunk counted
+        assert windows_seen(stream) == 3
+
+    def test_resamples_telephony_audio(self):
+        """8 kHz input yields 16 kHz windows (one per 16 ms of input)."""
+        service, _ = make_service()
+        stream = service.open_stream()
+
+        windows = stream.windows(np.zeros(8000, dtype=np.float32), sample_rate=8000)
+        assert len(windows) in (30, 31)  # Resampler group delay
+
+    def test_context_carries_previous_window(self):
+        """Each input starts with the last 64 samples of the previous window."""
+        service, backend = make_service()
+        stream = service.open_stream()
+        first = np.arange(SILERO_WINDOW, dtype=np.float32) / 1000
+
+        stream.is_speech(first)
+        stream.is_speech(np.zeros(SILERO_WINDOW, dtype=np.float32))
+
+        np.testing.assert_array_equal(
+            backend.inputs[1][0, :SILERO_CONTEXT], first[-SILERO_CONTEXT:]
+        )
+
+
+class TestVADService:
+    """Test batched evaluation across calls."""
+
+    @pytest.mark.asyncio
+    async def test_calls_share_one_forward_pass(self):
+        """Concurrent windows from all calls go through one batch."""
+        service, backend = make_service()
+        streams = [service.open_stream() for _ in range(5)]
+        audio = np.zeros(SILERO_WINDOW, dtype=np.float32)
+
+        results = await asyncio.gather(*(s.probabilities(audio) for s in streams))
+
+        assert results == [[0.0]] * 5
+        assert backend.batches == [5]
+        assert service.statistics["mean_batch"] == 5.0
+        service.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_state_stays_per_call(self):
+        """Streams with different amounts of audio keep separate state."""
+        service, backend = make_service()
+        short, long = service.open_stream(), service.open_stream()
+
+        await asyncio.gather(
+            short.probabilities(np.zeros(SILERO_WINDOW, dtype=np.float32)),
+            long.probabilities(np.zeros(3 * SILERO_WINDOW, dtype=np.float32)),
+        )
+
+        assert windows_seen(short) == 1
+        assert windows_seen(long) == 3
+        assert backend.batches == [2, 1, 1]  # Windows of one call stay in order
+        service.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_batch_size_limit(self):
+        """Large ticks are split into passes of at most max_batch_size."""
+        service, backend = make_service(max_batch_size=4)
+        streams = [service.open_stream() for _ in range(10)]
+        audio = np.zeros(SILERO_WINDOW, dtype=np.float32)
+
+        await asyncio.gather(*(s.probabilities(audio) for s in streams))
+
+        assert backend.batches == [4, 4, 2]
+        service.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run_now_waits_for_running_tick(self):
+        """Immediate classification never overlaps a tick's forward passes."""
+        service, backend = make_service(wait_ms=0.0)
+        active, overlaps = [0], []
+        infer = backend.infer
+
+        def slow_infer(inputs, state):
+            active[0] += 1
+            overlaps.append(active[0])
+            time.sleep(0.005)
+            try:
+                return infer(inputs, state)
+            finally:
+                active[0] -= 1
+
+        backend.infer = slow_infer
+        batched = [service.open_stream() for _ in range(4)]
+        immediate = service.open_stream()
+        audio = np.zeros(5 * SILERO_WINDOW, dtype=np.float32)
+
+        def classify():
+            for _ in range(10):
+                immediate.is_speech(np.zeros(SILERO_WINDOW, dtype=np.float32))
+
+        thread = threading.Thread(target=classify)
+        thread.start()
+        await asyncio.gather(*(s.probabilities(audio) for s in batched))
+        thread.join()
+
+        assert max(overlaps) == 1
+        assert windows_seen(immediate) == 10
+        assert all(windows_seen(s) == 5 for s in batched)
+        assert service.statistics["windows"] == 30
+        service.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_endpointer_uses_batched_stream(self):
+        """SpeechEndpointer.feed_async classifies a chunk in one request."""
+        service, backend = make_service()
+        stream = service.open_stream(threshold=0.5)
+        endpointer = SpeechEndpointer(
+            stream, EndpointerConfig(min_speech_ms=64, hangover_ms=128, preroll_ms=0)
+        )
+        rng = np.random.default_rng(0)
+        speech = (rng.standard_normal(10 * SILERO_WINDOW) * 0.3).astype(np.float32)
+        silence = np.zeros(6 * SILERO_WINDOW, dtype=np.float32)
+
+        assert await endpointer.feed_async(speech) == []
+        utterances = await endpointer.feed_async(silence)
+
+        assert len(utterances) == 1
+        assert service.statistics["ticks"] == 2  # One request per fed chunk
+        stream.close()
+        assert service.active_streams == 0
+        service.shutdown()